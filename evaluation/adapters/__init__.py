@@ -0,0 +1,5 @@
+"""도메인 어댑터
+
+evaluation.engine.ExperimentEngine에 도메인별 케이스 로더, 프롬프트 생성, 평가를 제공합니다.
+템플릿 임포트 비용을 줄이기 위해 어댑터는 evaluation.engine.adapter_class로 필요할 때만 로드합니다.
+"""
@@ -0,0 +1,512 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+비즈니스 문서 어댑터 (Business Document Adapter)
+================================================================================
+
+## 이 모듈의 목적
+비즈니스 이메일/보고서 실험의 도메인 부분만 담습니다. 실행 루프, 토큰 계산, 결과 기록은
+evaluation.engine.ExperimentEngine이 맡습니다.
+
+## 제공 항목
+- load_cases: evaluation.business_test_cases 전체 (이메일 54 + 보고서 54)
+- build_prompt: V1.0 ~ V4.0 프롬프트 (templates.business)
+- score: 필수 요소 포함율 + 구조화 + 전문적 어조 (1-10점)
+
+## 버전
+| 버전 | 핵심 |
+|------|------|
+| v1 | 기본 템플릿 |
+| v2 | 독자 중심 글쓰기 + 피라미드 원칙, expected_elements 명시 |
+| v3 | 보고서만 동적 섹션 생성 (이메일은 V2.0 유지) |
+| v4 | 동적 체크리스트 + 5단계 CoT |
+================================================================================
+"""
+
+from typing import Any, Dict, List
+
+from evaluation.business_test_cases import BusinessTestCase, get_all_business_test_cases
+from evaluation.engine import DomainAdapter
+# V1.0 프롬프트
+from templates.business.email_writing import (
+    get_formal_email_prompt,
+    get_apology_email_prompt,
+    get_proposal_email_prompt,
+    get_follow_up_email_prompt
+)
+from templates.business.report_writing import (
+    get_weekly_report_prompt,
+    get_analysis_report_prompt,
+    get_meeting_minutes_prompt,
+    get_project_proposal_prompt
+)
+# V2.0 프롬프트
+from templates.business.email_writing_v2 import (
+    get_formal_email_prompt_v2,
+    get_apology_email_prompt_v2,
+    get_proposal_email_prompt_v2,
+    get_follow_up_email_prompt_v2
+)
+from templates.business.report_writing_v2 import (
+    get_weekly_report_prompt_v2,
+    get_analysis_report_prompt_v2,
+    get_meeting_minutes_prompt_v2,
+    get_project_proposal_prompt_v2
+)
+# V3.0 보고서 프롬프트 (동적 섹션 생성)
+from templates.business.report_writing_v3 import (
+    get_weekly_report_prompt_v3,
+    get_analysis_report_prompt_v3,
+    get_meeting_minutes_prompt_v3,
+    get_project_proposal_prompt_v3
+)
+# V4.0 프롬프트 (동적 체크리스트 생성)
+from templates.business.business_prompts_v4 import (
+    get_formal_email_prompt_v4,
+    get_apology_email_prompt_v4,
+    get_proposal_email_prompt_v4,
+    get_follow_up_email_prompt_v4,
+    get_weekly_report_prompt_v4,
+    get_analysis_report_prompt_v4,
+    get_meeting_minutes_prompt_v4,
+    get_project_proposal_prompt_v4
+)
+
+
+VERSION_NOTES = {
+    "v2": [
+        "  V2.0 핵심: 독자 중심 글쓰기 + 피라미드 원칙",
+        "  - 4단계 STEP 구조 (분석 → 설계 → 작성 → 검토)",
+        "  - expected_elements를 프롬프트에 명시",
+        "  - So What? 검증 단계 포함",
+    ],
+    "v3": [
+        "  V3.0 핵심: 동적 섹션 생성 (보고서 V3.0 + 이메일 V2.0)",
+        "  - expected_elements → 출력 섹션 제목으로 직접 변환",
+        "  - '중요: 다음 섹션을 반드시 포함' 강제 지시",
+        "  - 섹션별 체크리스트로 검증",
+    ],
+    "v4": [
+        "  V4.0 핵심: 동적 체크리스트 생성 + 5단계 CoT",
+        "  - expected_elements → 분석 체크리스트로 변환",
+        "  - 5단계 구조 (분석 → 설계 → 작성 → 검증 → 출력)",
+        "  - 요소 검증 단계로 100% 포함율 목표",
+    ],
+}
+
+
+class BusinessAdapter(DomainAdapter):
+    """비즈니스 문서 프롬프트 어댑터 (이메일/보고서)"""
+
+    domain = "business"
+    versions = ("v1", "v2", "v3", "v4")
+    results_prefix = "business_experiments"
+    default_limit = 108
+
+    @property
+    def title(self) -> str:
+        return f"비즈니스 문서 프롬프트 실험 ({self.version.upper()})"
+
+    def notes(self) -> List[str]:
+        return VERSION_NOTES.get(self.version, [])
+
+    def load_cases(self) -> List[BusinessTestCase]:
+        return get_all_business_test_cases()
+
+    def case_fields(self, test_case: BusinessTestCase) -> Dict[str, Any]:
+        return {
+            "scenario": test_case.scenario,
+            "industry": test_case.industry,
+            "difficulty": test_case.difficulty,
+        }
+
+    def score(self, test_case: BusinessTestCase, response: str) -> Dict[str, Any]:
+        return self.evaluate_response_quality(response, test_case.expected_elements)
+
+    def evaluate_response_quality(self, response: str, expected_elements: List[str]) -> Dict:
+        """
+        응답 품질 평가
+
+        Args:
+            response: LLM 응답
+            expected_elements: 예상되는 필수 요소 리스트
+
+        Returns:
+            Dict: 평가 결과
+        """
+        # 필수 요소 포함율 계산
+        found_elements = 0
+        for element in expected_elements:
+            # 요소의 핵심 키워드로 매칭
+            keywords = element.lower().replace(" ", "")
+            if any(kw in response.lower() for kw in [keywords, element.lower()]):
+                found_elements += 1
+
+        element_coverage = found_elements / len(expected_elements) if expected_elements else 0
+
+        # 구조화된 형식 여부 확인
+        has_structure = any([
+            "##" in response,
+            "|" in response,  # 표 형식
+            "1." in response or "- " in response,  # 목록
+        ])
+
+        # 전문적 어조 확인
+        professional_markers = [
+            "드립니다", "감사합니다", "검토", "확인",
+            "말씀", "부탁", "안내", "요청"
+        ]
+        professionalism = sum(1 for marker in professional_markers if marker in response)
+
+        # 종합 점수 (1-10)
+        quality_score = 0
+        quality_score += min(element_coverage * 4, 4)  # 최대 4점
+        quality_score += 3 if has_structure else 0  # 구조화 3점
+        quality_score += min(professionalism * 0.5, 3)  # 전문성 최대 3점
+
+        return {
+            "quality_score": round(quality_score, 2),
+            "element_coverage": round(element_coverage * 100, 1),
+            "has_structure": has_structure,
+            "professionalism_score": professionalism,
+            "found_elements": found_elements,
+            "total_elements": len(expected_elements)
+        }
+
+    def build_prompt(self, test_case: BusinessTestCase) -> str:
+        """테스트 케이스에 맞는 프롬프트 생성"""
+        # V4.0 프롬프트 (동적 체크리스트 생성)
+        if self.version == "v4":
+            return self._generate_v4_prompt(test_case)
+        # V3.0 프롬프트 (보고서만 V3.0, 이메일은 V2.0 유지)
+        if self.version == "v3":
+            return self._generate_v3_prompt(test_case)
+        # V2.0 프롬프트 사용
+        if self.version == "v2":
+            return self._generate_v2_prompt(test_case)
+        # V1.0 (기본)
+        return self._generate_v1_prompt(test_case)
+
+    def _generate_v1_prompt(self, test_case: BusinessTestCase) -> str:
+        """V1.0 프롬프트 생성"""
+        if test_case.category == "email":
+            if test_case.subcategory == "formal":
+                return get_formal_email_prompt(
+                    sender_name="김철수",
+                    sender_position="과장",
+                    recipient_name="이영희",
+                    recipient_position="부장",
+                    relationship="업무 관계",
+                    email_purpose=test_case.scenario,
+                    main_content=test_case.input_context,
+                    desired_action="검토 및 회신"
+                )
+            elif test_case.subcategory == "apology":
+                return get_apology_email_prompt(
+                    sender_name="김철수",
+                    sender_position="팀장",
+                    recipient_type="고객",
+                    issue_description=test_case.input_context,
+                    cause="내부 프로세스 문제",
+                    current_action="즉시 조치 중",
+                    prevention_plan="프로세스 개선"
+                )
+            elif test_case.subcategory == "proposal":
+                return get_proposal_email_prompt(
+                    sender_intro="ABC 회사 사업개발팀",
+                    recipient_info=test_case.industry + " 담당자",
+                    proposal_content=test_case.input_context,
+                    value_proposition="업무 효율 향상",
+                    our_qualifications="관련 분야 10년 경험",
+                    collaboration_type="파트너십"
+                )
+            else:  # follow_up
+                return get_follow_up_email_prompt(
+                    previous_interaction=test_case.input_context,
+                    interaction_date="지난 주",
+                    follow_up_purpose=test_case.scenario,
+                    new_information="추가 정보",
+                    requested_action="검토 및 회신"
+                )
+        else:  # report
+            if test_case.subcategory == "weekly":
+                return get_weekly_report_prompt(
+                    reporter_name="김철수 과장",
+                    department=test_case.industry,
+                    report_to="팀장",
+                    period_start="2024-01-15",
+                    period_end="2024-01-19",
+                    raw_content=test_case.input_context,
+                    achievements="주요 업무 완료",
+                    issues="특별 이슈 없음",
+                    next_plans="다음 주 계획"
+                )
+            elif test_case.subcategory == "analysis":
+                return get_analysis_report_prompt(
+                    analysis_type=test_case.scenario,
+                    analysis_purpose="전략 수립",
+                    analysis_target=test_case.industry,
+                    collected_data=test_case.input_context,
+                    background_info="시장 환경 변화"
+                )
+            elif test_case.subcategory == "meeting":
+                return get_meeting_minutes_prompt(
+                    meeting_title=test_case.scenario,
+                    meeting_datetime="2024-01-20 14:00",
+                    meeting_location="회의실 A",
+                    attendees="관련 팀원",
+                    meeting_purpose="업무 논의",
+                    meeting_content=test_case.input_context,
+                    discussion_points="주요 안건",
+                    decisions="결정 사항"
+                )
+            else:  # project
+                return get_project_proposal_prompt(
+                    project_name=test_case.scenario,
+                    project_type=test_case.industry,
+                    background=test_case.input_context,
+                    objectives="목표 달성",
+                    current_situation="현재 상황",
+                    proposal_details="제안 내용",
+                    expected_benefits="기대 효과",
+                    budget="예산 미정",
+                    resources="인력 배정 예정",
+                    timeline="3개월",
+                    risks="리스크 관리 필요"
+                )
+
+    def _generate_v2_prompt(self, test_case: BusinessTestCase) -> str:
+        """V2.0 프롬프트 생성 - expected_elements 포함"""
+        if test_case.category == "email":
+            if test_case.subcategory == "formal":
+                return get_formal_email_prompt_v2(
+                    sender_name="김철수",
+                    sender_position="과장",
+                    recipient_name="이영희",
+                    recipient_position="부장",
+                    relationship="업무 관계",
+                    email_purpose=test_case.scenario,
+                    main_content=test_case.input_context,
+                    desired_action="검토 및 회신",
+                    expected_elements=test_case.expected_elements
+                )
+            elif test_case.subcategory == "apology":
+                return get_apology_email_prompt_v2(
+                    sender_name="김철수",
+                    sender_position="팀장",
+                    recipient_type="고객",
+                    issue_description=test_case.input_context,
+                    cause="내부 프로세스 문제",
+                    current_action="즉시 조치 중",
+                    prevention_plan="프로세스 개선",
+                    expected_elements=test_case.expected_elements
+                )
+            elif test_case.subcategory == "proposal":
+                return get_proposal_email_prompt_v2(
+                    sender_intro="ABC 회사 사업개발팀",
+                    recipient_info=test_case.industry + " 담당자",
+                    proposal_content=test_case.input_context,
+                    value_proposition="업무 효율 향상",
+                    our_qualifications="관련 분야 10년 경험",
+                    collaboration_type="파트너십",
+                    expected_elements=test_case.expected_elements
+                )
+            else:  # follow_up
+                return get_follow_up_email_prompt_v2(
+                    previous_interaction=test_case.input_context,
+                    interaction_date="지난 주",
+                    follow_up_purpose=test_case.scenario,
+                    new_information="추가 정보",
+                    requested_action="검토 및 회신",
+                    expected_elements=test_case.expected_elements
+                )
+        else:  # report
+            if test_case.subcategory == "weekly":
+                return get_weekly_report_prompt_v2(
+                    reporter_name="김철수 과장",
+                    department=test_case.industry,
+                    report_to="팀장",
+                    period_start="2024-01-15",
+                    period_end="2024-01-19",
+                    raw_content=test_case.input_context,
+                    achievements="주요 업무 완료",
+                    issues="특별 이슈 없음",
+                    next_plans="다음 주 계획",
+                    expected_elements=test_case.expected_elements
+                )
+            elif test_case.subcategory == "analysis":
+                return get_analysis_report_prompt_v2(
+                    analysis_type=test_case.scenario,
+                    analysis_purpose="전략 수립",
+                    analysis_target=test_case.industry,
+                    collected_data=test_case.input_context,
+                    background_info="시장 환경 변화",
+                    expected_elements=test_case.expected_elements
+                )
+            elif test_case.subcategory == "meeting":
+                return get_meeting_minutes_prompt_v2(
+                    meeting_title=test_case.scenario,
+                    meeting_datetime="2024-01-20 14:00",
+                    meeting_location="회의실 A",
+                    attendees="관련 팀원",
+                    meeting_purpose="업무 논의",
+                    meeting_content=test_case.input_context,
+                    discussion_points="주요 안건",
+                    decisions="결정 사항",
+                    expected_elements=test_case.expected_elements
+                )
+            else:  # project
+                return get_project_proposal_prompt_v2(
+                    project_name=test_case.scenario,
+                    project_type=test_case.industry,
+                    background=test_case.input_context,
+                    objectives="목표 달성",
+                    current_situation="현재 상황",
+                    proposal_details="제안 내용",
+                    expected_benefits="기대 효과",
+                    budget="예산 미정",
+                    resources="인력 배정 예정",
+                    timeline="3개월",
+                    risks="리스크 관리 필요",
+                    expected_elements=test_case.expected_elements
+                )
+
+    def _generate_v3_prompt(self, test_case: BusinessTestCase) -> str:
+        """V3.0 프롬프트 생성 - 보고서는 V3.0, 이메일은 V2.0 유지"""
+        # 이메일은 V2.0 사용 (이미 성공적)
+        if test_case.category == "email":
+            return self._generate_v2_prompt(test_case)
+
+        # 보고서는 V3.0 사용 (동적 섹션 생성)
+        if test_case.subcategory == "weekly":
+            return get_weekly_report_prompt_v3(
+                reporter_name="김철수 과장",
+                department=test_case.industry,
+                report_to="팀장",
+                period_start="2024-01-15",
+                period_end="2024-01-19",
+                report_period="주간",
+                raw_content=test_case.input_context,
+                achievements="주요 업무 완료",
+                issues="특별 이슈 없음",
+                next_plans="다음 주 계획",
+                expected_elements=test_case.expected_elements
+            )
+        elif test_case.subcategory == "analysis":
+            return get_analysis_report_prompt_v3(
+                analysis_title=test_case.scenario,
+                analyst_name="김철수 과장",
+                analysis_period="2024년 1월",
+                analysis_scope=test_case.industry,
+                background="시장 환경 변화",
+                objectives="전략 수립",
+                data_sources="내부 데이터, 시장 조사",
+                analysis_results=test_case.input_context,
+                expected_elements=test_case.expected_elements
+            )
+        elif test_case.subcategory == "meeting":
+            return get_meeting_minutes_prompt_v3(
+                meeting_title=test_case.scenario,
+                meeting_datetime="2024-01-20 14:00",
+                meeting_location="회의실 A",
+                attendees="관련 팀원",
+                absentees="없음",
+                meeting_purpose="업무 논의",
+                recorder="김철수",
+                meeting_content=test_case.input_context,
+                discussion_points="주요 안건",
+                decisions="결정 사항",
+                expected_elements=test_case.expected_elements
+            )
+        else:  # project
+            return get_project_proposal_prompt_v3(
+                project_title=test_case.scenario,
+                proposer_name="김철수",
+                proposer_department=test_case.industry,
+                background=test_case.input_context,
+                current_situation="현재 상황",
+                proposal_details="제안 내용",
+                expected_benefits="기대 효과",
+                required_resources="인력 배정 예정",
+                timeline="3개월",
+                expected_elements=test_case.expected_elements
+            )
+
+    def _generate_v4_prompt(self, test_case: BusinessTestCase) -> str:
+        """V4.0 프롬프트 생성 - 동적 체크리스트 + 5단계 CoT"""
+        if test_case.category == "email":
+            if test_case.subcategory == "formal":
+                return get_formal_email_prompt_v4(
+                    sender_info="김철수 과장 (영업팀)",
+                    recipient_info="이영희 부장 (구매팀)",
+                    email_purpose=test_case.scenario,
+                    main_content=test_case.input_context,
+                    expected_elements=test_case.expected_elements,
+                    desired_action="검토 및 회신",
+                    additional_context=test_case.industry
+                )
+            elif test_case.subcategory == "apology":
+                return get_apology_email_prompt_v4(
+                    sender_info="김철수 팀장",
+                    recipient_info="고객/파트너",
+                    incident_description=test_case.input_context,
+                    expected_elements=test_case.expected_elements,
+                    cause_analysis="내부 프로세스 문제",
+                    corrective_action="즉시 조치 및 재발 방지"
+                )
+            elif test_case.subcategory == "proposal":
+                return get_proposal_email_prompt_v4(
+                    sender_info="김철수 (사업개발팀)",
+                    recipient_info=f"{test_case.industry} 담당자",
+                    proposal_summary=test_case.input_context,
+                    expected_elements=test_case.expected_elements,
+                    benefits="업무 효율 향상 및 비용 절감",
+                    call_to_action="미팅 일정 조율"
+                )
+            else:  # follow_up
+                return get_follow_up_email_prompt_v4(
+                    sender_info="김철수 과장",
+                    recipient_info="이영희 부장",
+                    previous_context=test_case.input_context,
+                    expected_elements=test_case.expected_elements,
+                    follow_up_purpose=test_case.scenario,
+                    next_steps="검토 후 회신 요청"
+                )
+        else:  # report
+            if test_case.subcategory == "weekly":
+                return get_weekly_report_prompt_v4(
+                    reporter_info="김철수 과장 (" + test_case.industry + ")",
+                    period="2024-01-15 ~ 2024-01-19",
+                    achievements=test_case.input_context,
+                    expected_elements=test_case.expected_elements,
+                    issues="특별 이슈 없음",
+                    next_plans="다음 주 계획 진행"
+                )
+            elif test_case.subcategory == "analysis":
+                return get_analysis_report_prompt_v4(
+                    analyst_info="김철수 과장 (기획팀)",
+                    analysis_subject=test_case.scenario,
+                    data_summary=test_case.input_context,
+                    expected_elements=test_case.expected_elements,
+                    methodology="정량/정성 분석",
+                    findings="주요 발견사항"
+                )
+            elif test_case.subcategory == "meeting":
+                return get_meeting_minutes_prompt_v4(
+                    recorder_info="김철수 과장",
+                    meeting_info=test_case.scenario + " (2024-01-20 14:00)",
+                    attendees="관련 팀원 5명",
+                    expected_elements=test_case.expected_elements,
+                    agenda=test_case.scenario,
+                    discussions=test_case.input_context
+                )
+            else:  # project
+                return get_project_proposal_prompt_v4(
+                    proposer_info="김철수 과장 (" + test_case.industry + ")",
+                    project_name=test_case.scenario,
+                    project_summary=test_case.input_context,
+                    expected_elements=test_case.expected_elements,
+                    objectives="목표 달성 및 효율화",
+                    resources="인력 3명, 예산 미정"
+                )
+
@@ -0,0 +1,481 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+데이터 분석 어댑터 (Data Analysis Adapter, LLM-as-a-Judge)
+================================================================================
+
+## 이 모듈의 목적
+데이터 분석 실험의 도메인 부분만 담습니다. 실행 루프, 토큰 계산, 결과 기록은
+evaluation.engine.ExperimentEngine이 맡습니다.
+
+## 제공 항목
+- load_cases: evaluation.data_analysis_test_cases 전체
+- build_prompt: 카테고리별 프롬프트 (templates.data_analysis), 카테고리별 데이터 모드 적용
+- 평가: 평가용 LLM(temperature 0.1)이 5개 차원(Accuracy, Completeness, Coherence,
+  Actionability, Clarity)을 1-10점으로 채점, Judge는 항상 원본 데이터로 평가
+- 요약: 차원별 통계, 카테고리별 데이터 모드/입력 토큰 절감률/생성 시간,
+  --baseline 대비 카테고리별 변화(category_deltas)
+
+## 데이터 모드
+raw(원본 표) / digest(열별 통계 요약) / digest+sample(요약 + 샘플 행)
+================================================================================
+"""
+
+import json
+import re
+import time
+from typing import Any, Dict, List
+
+from evaluation.bootstrap import format_interval, summary_confidence_intervals
+from evaluation.data_analysis_test_cases import DataAnalysisTestCase, get_all_data_analysis_test_cases
+from evaluation.engine import DomainAdapter, LLMCall
+from templates.data_analysis.data_analysis_prompts import get_prompt_by_category
+from templates.data_analysis.data_digest import DATA_MODES
+
+
+DIMENSIONS = ["accuracy", "completeness", "coherence", "actionability", "clarity"]
+
+# =============================================================================
+# LLM-as-a-Judge 평가 프롬프트
+# =============================================================================
+
+LLM_JUDGE_PROMPT = """당신은 데이터 분석 품질을 평가하는 전문 평가자입니다.
+
+아래 5가지 기준으로 분석 결과를 1-10점으로 평가하세요.
+
+## 평가 기준
+
+1. **Accuracy (정확성)**: 분석 결과가 제공된 데이터에 기반하여 정확한가?
+   - 10점: 모든 계산과 해석이 데이터와 일치
+   - 7점: 대부분 정확하나 사소한 오류 있음
+   - 4점: 일부 중요한 오류 존재
+   - 1점: 데이터와 맞지 않는 분석
+
+2. **Completeness (완전성)**: 요청된 분석 항목이 모두 포함되었는가?
+   - 요청 항목: {expected_elements}
+   - 10점: 모든 요청 항목 포함
+   - 7점: 대부분 포함 (80% 이상)
+   - 4점: 절반 정도 포함
+   - 1점: 대부분 누락
+
+3. **Coherence (논리적 일관성)**: 분석이 논리적으로 일관성 있는가?
+   - 10점: 완벽한 논리적 흐름
+   - 7점: 대체로 일관적
+   - 4점: 일부 논리적 비약
+   - 1점: 논리적 모순 다수
+
+4. **Actionability (실행가능성)**: 권고사항이 구체적이고 실행 가능한가?
+   - 10점: 즉시 실행 가능한 구체적 제안
+   - 7점: 대체로 구체적
+   - 4점: 추상적인 제안
+   - 1점: 실행 불가능하거나 권고 없음
+
+5. **Clarity (명확성)**: 설명이 이해하기 쉬운가?
+   - 10점: 매우 명확하고 잘 구조화됨
+   - 7점: 대체로 이해하기 쉬움
+   - 4점: 일부 불명확한 부분 있음
+   - 1점: 이해하기 어려움
+
+---
+
+## 분석 요청 (원본)
+**시나리오**: {scenario}
+**데이터**:
+```
+{raw_data}
+```
+
+---
+
+## 분석 결과 (평가 대상)
+```
+{response}
+```
+
+---
+
+## 평가 출력 형식
+
+반드시 아래 JSON 형식으로만 응답하세요. 다른 텍스트 없이 JSON만 출력하세요.
+
+```json
+{{
+  "accuracy": <1-10>,
+  "completeness": <1-10>,
+  "coherence": <1-10>,
+  "actionability": <1-10>,
+  "clarity": <1-10>,
+  "total": <평균>,
+  "feedback": "<한 줄 피드백>"
+}}
+```
+"""
+
+
+def parse_data_modes(value: str) -> Dict[str, str]:
+    """
+    --data-mode 인자 해석
+
+    "digest" → 모든 카테고리에 적용
+    "interpretation=digest,insight=digest+sample" → 카테고리별 지정 (나머지는 raw)
+    """
+    modes = {}
+    for item in value.split(","):
+        category, _, mode = item.strip().rpartition("=")
+        if mode not in DATA_MODES:
+            raise ValueError(f"지원하지 않는 데이터 모드: {mode} (가능: {', '.join(DATA_MODES)})")
+        modes[category or "*"] = mode
+    return modes
+
+
+def format_data_modes(data_modes: Dict[str, str]) -> str:
+    """데이터 모드 설정을 출력용 문자열로 변환"""
+    if not data_modes:
+        return "raw"
+    return ", ".join(f"{cat}={mode}" if cat != "*" else mode for cat, mode in data_modes.items())
+
+
+def compare_category_stats(current: Dict, baseline: Dict) -> Dict:
+    """
+    두 실행의 카테고리별 입력 토큰/생성 시간/Judge 점수 차이 계산
+
+    Args:
+        current: 현재 실행의 category_stats
+        baseline: 기준 실행(예: raw 모드)의 category_stats
+
+    Returns:
+        Dict: {카테고리: {input_tokens_delta, generation_time_delta, quality_delta}}
+    """
+    deltas = {}
+    for cat, stats in current.items():
+        base = baseline.get(cat)
+        if not base or "avg_input_tokens" not in base:
+            continue
+        timed = stats["avg_generation_time"] is not None and base.get("avg_generation_time") is not None
+        deltas[cat] = {
+            "input_tokens_delta": round(stats["avg_input_tokens"] - base["avg_input_tokens"], 1),
+            "generation_time_delta": (round(stats["avg_generation_time"] - base["avg_generation_time"], 2)
+                                      if timed else None),  # 응답 캐시 적중만 있으면 측정 없음
+            "quality_delta": round(stats["avg_quality"] - base["avg_quality"], 2)
+        }
+    return deltas
+
+
+
+
+class DataAnalysisAdapter(DomainAdapter):
+    """데이터 분석 프롬프트 어댑터 - LLM-as-a-Judge 버전"""
+
+    domain = "data_analysis"
+    versions = ("v2",)  # 데이터 분석 프롬프트는 단일 버전 (매니페스트 버전 식별자)
+    title = "데이터 분석 프롬프트 실험 (V2.1 - LLM-as-a-Judge)"
+    results_prefix = "data_analysis_llm_judge"
+    results_key = "results"
+    default_limit = 80
+    baseline_key = "category_stats"
+
+    def __init__(self, version: str = None, data_modes: Dict[str, str] = None):
+        """
+        Args:
+            version: 프롬프트 버전 (v2만 지원)
+            data_modes: 카테고리별 데이터 모드 ({"*": 기본 모드, "interpretation": "digest", ...})
+        """
+        super().__init__(version)
+        self.data_modes = data_modes or {}
+        self.judge_llm = None
+        self.engine = None
+
+    @classmethod
+    def add_arguments(cls, parser):
+        parser.add_argument("--data-mode", type=str, default="raw",
+                            help="데이터 모드: raw, digest, digest+sample "
+                                 "(카테고리별: interpretation=digest,insight=digest+sample)")
+
+    @classmethod
+    def options_from_args(cls, parser, args) -> Dict[str, Any]:
+        try:
+            data_modes = parse_data_modes(args.data_mode)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.manifest and set(data_modes.values()) != {"raw"}:
+            parser.error("--data-mode는 --manifest와 함께 사용할 수 없습니다 (매니페스트 프롬프트는 이미 렌더링됨)")
+        return {"data_modes": data_modes}
+
+    def options(self) -> Dict[str, Any]:
+        return {"data_modes": dict(self.data_modes)}
+
+    def setup(self, engine):
+        self.judge_llm = engine.create_llm(0.1)  # 평가용 LLM (낮은 temperature)
+        self.engine = engine  # Judge 호출도 생성 호출과 같은 동시 호출 한도/호출 정책을 사용
+
+    def data_mode_for(self, category: str) -> str:
+        """카테고리에 적용할 데이터 모드"""
+        return self.data_modes.get(category, self.data_modes.get("*", "raw"))
+
+    def info_lines(self) -> List[str]:
+        return [
+            "평가 방식: LLM-as-a-Judge (5개 차원)",
+            f"데이터 모드: {format_data_modes(self.data_modes)}",
+        ]
+
+    def load_cases(self) -> List[DataAnalysisTestCase]:
+        return get_all_data_analysis_test_cases()
+
+    def build_prompt(self, test_case: DataAnalysisTestCase, data_mode: str = None) -> str:
+        """테스트 케이스에 맞는 프롬프트 생성 (data_mode 미지정 시 카테고리 설정 사용)"""
+        return get_prompt_by_category(
+            category=test_case.category,
+            scenario=test_case.scenario,
+            industry=test_case.industry,
+            data_description=test_case.data_description,
+            raw_data=test_case.raw_data,
+            expected_elements=test_case.expected_elements,
+            data_mode=data_mode or self.data_mode_for(test_case.category)
+        )
+
+    def score(self, test_case: DataAnalysisTestCase, response: str) -> Dict[str, Any]:
+        if not response:
+            return self._default_evaluation("생성 실패")
+        return self.evaluate_with_llm_judge(
+            response=response,
+            scenario=test_case.scenario,
+            raw_data=test_case.raw_data,
+            expected_elements=test_case.expected_elements
+        )
+
+    def make_result(self, test_case: DataAnalysisTestCase, call: LLMCall, engine) -> Dict[str, Any]:
+        """생성 결과를 Judge로 평가 (생성/평가 시간을 나눠 기록, 응답 미리보기 없음)"""
+        eval_start = time.time()
+        quality_eval = self.score(test_case, call.response) if call.success else self._default_evaluation("생성 실패")
+        eval_time = time.time() - eval_start
+
+        data_mode = self.data_mode_for(test_case.category)
+        raw_input_tokens = call.input_tokens
+        if data_mode != "raw":
+            raw_input_tokens = engine.count_tokens(self.build_prompt(test_case, data_mode="raw"))
+
+        return {
+            "test_case_id": test_case.id,
+            "category": test_case.category,
+            "subcategory": test_case.subcategory,
+            "scenario": test_case.scenario,
+            "success": call.success,
+            "error": call.error,
+            "generation_time": round(call.elapsed, 2),
+            "evaluation_time": round(eval_time, 2),
+            "total_time": round(call.elapsed + eval_time, 2),
+            "data_mode": data_mode,
+            "input_tokens": call.input_tokens,
+            "raw_input_tokens": raw_input_tokens,
+            "output_tokens": call.output_tokens,
+            "total_tokens": call.input_tokens + call.output_tokens,
+            "quality_evaluation": quality_eval
+        }
+
+    def progress(self, result: Dict[str, Any]) -> str:
+        eval_data = result["quality_evaluation"]
+        return (f"총점: {eval_data['quality_score']}/10 "
+                f"(A:{eval_data['accuracy']} C:{eval_data['completeness']} "
+                f"H:{eval_data['coherence']} X:{eval_data['actionability']} "
+                f"L:{eval_data['clarity']})")
+
+    # ---- Judge 평가 ----
+
+    def evaluate_with_llm_judge(
+        self,
+        response: str,
+        scenario: str,
+        raw_data: str,
+        expected_elements: List[str]
+    ) -> Dict:
+        """LLM-as-a-Judge 방식으로 응답 품질 평가"""
+
+        judge_prompt = LLM_JUDGE_PROMPT.format(
+            expected_elements=", ".join(expected_elements),
+            scenario=scenario,
+            raw_data=raw_data[:1500],  # 토큰 제한
+            response=response[:2000]   # 토큰 제한
+        )
+
+        try:
+            judge_response = self.engine.invoke(judge_prompt, self.judge_llm, span="judge")
+
+            # JSON 추출 (```json ... ``` 또는 { ... } 형태)
+            json_match = re.search(r'\{[^{}]*\}', judge_response, re.DOTALL)
+            if json_match:
+                scores = json.loads(json_match.group())
+
+                # 점수 유효성 검사
+                for key in ["accuracy", "completeness", "coherence", "actionability", "clarity"]:
+                    if key not in scores or not isinstance(scores[key], (int, float)):
+                        scores[key] = 5  # 기본값
+
+                # 총점 계산 (평균)
+                dimension_scores = [
+                    scores["accuracy"],
+                    scores["completeness"],
+                    scores["coherence"],
+                    scores["actionability"],
+                    scores["clarity"]
+                ]
+                scores["total"] = round(sum(dimension_scores) / len(dimension_scores), 2)
+
+                return {
+                    "quality_score": scores["total"],
+                    "accuracy": scores.get("accuracy", 5),
+                    "completeness": scores.get("completeness", 5),
+                    "coherence": scores.get("coherence", 5),
+                    "actionability": scores.get("actionability", 5),
+                    "clarity": scores.get("clarity", 5),
+                    "feedback": scores.get("feedback", ""),
+                    "judge_raw": judge_response[:500]
+                }
+            else:
+                # JSON 파싱 실패 시 기본값
+                return self._default_evaluation("JSON 파싱 실패")
+
+        except Exception as e:
+            return self._default_evaluation(f"평가 오류: {str(e)}")
+
+    def _default_evaluation(self, reason: str) -> Dict:
+        """평가 실패 시 기본값 반환"""
+        return {
+            "quality_score": 5.0,
+            "accuracy": 5,
+            "completeness": 5,
+            "coherence": 5,
+            "actionability": 5,
+            "clarity": 5,
+            "feedback": reason,
+            "judge_raw": ""
+        }
+
+
+    def summarize(self, results, engine) -> Dict[str, Any]:
+        """실험 결과 요약 (차원별/카테고리별 Judge 점수)"""
+        successful = [r for r in results if r["success"]]
+
+        if not successful:
+            return {"error": "성공한 실험이 없습니다"}
+
+        # 차원별 통계
+        dimensions = DIMENSIONS
+        dimension_stats = {}
+        for dim in dimensions:
+            scores = [r["quality_evaluation"].get(dim, 5) for r in successful]
+            dimension_stats[dim] = {
+                "avg": round(sum(scores) / len(scores), 2),
+                "min": min(scores),
+                "max": max(scores)
+            }
+
+        # 카테고리별 통계
+        category_stats = {}
+        for r in successful:
+            cat = r["category"]
+            if cat not in category_stats:
+                category_stats[cat] = {
+                    "count": 0,
+                    "data_mode": r.get("data_mode", "raw"),
+                    "scores": [],
+                    "dimension_scores": {dim: [] for dim in dimensions},
+                    "input_tokens": 0,
+                    "raw_input_tokens": 0,
+                    "generation_time": 0
+                }
+            stats = category_stats[cat]
+            stats["count"] += 1
+            stats["scores"].append(r["quality_evaluation"].get("quality_score", 5))
+            for dim in dimensions:
+                stats["dimension_scores"][dim].append(r["quality_evaluation"].get(dim, 5))
+            stats["input_tokens"] += r["input_tokens"]
+            stats["raw_input_tokens"] += r.get("raw_input_tokens", r["input_tokens"])
+            if r["generation_time"] is None:  # 응답 캐시 적중 (시간 측정 없음)
+                stats["untimed"] = stats.get("untimed", 0) + 1
+            else:
+                stats["generation_time"] += r["generation_time"]
+
+        for cat, stats in category_stats.items():
+            n = stats["count"]
+            stats["avg_quality"] = round(sum(stats["scores"]) / n, 2)
+            stats["dimension_avgs"] = {
+                dim: round(sum(stats["dimension_scores"][dim]) / n, 2)
+                for dim in dimensions
+            }
+            stats["avg_input_tokens"] = round(stats["input_tokens"] / n, 1)
+            timed = n - stats.get("untimed", 0)
+            stats["avg_generation_time"] = round(stats["generation_time"] / timed, 2) if timed else None
+            stats["token_saving_rate"] = round(
+                (1 - stats["input_tokens"] / stats["raw_input_tokens"]) * 100, 1
+            ) if stats["raw_input_tokens"] else 0.0
+
+        total_quality = sum(r["quality_evaluation"].get("quality_score", 5) for r in successful)
+        times = [r["total_time"] for r in successful if r["total_time"] is not None]
+
+        summary = {
+            "evaluation_method": "LLM-as-a-Judge",
+            "dimensions": dimensions,
+            "data_modes": self.data_modes or {"*": "raw"},
+            "total_experiments": len(results),
+            "successful": len(successful),
+            "success_rate": round(len(successful) / len(results) * 100, 1),
+            "avg_quality": round(total_quality / len(successful), 2),
+            "avg_time": round(sum(times) / len(times), 2) if times else None,
+            "dimension_stats": dimension_stats,
+            "category_stats": category_stats,
+            "confidence_intervals": summary_confidence_intervals(
+                successful,
+                {
+                    "quality_score": lambda r: r["quality_evaluation"].get("quality_score", 5),
+                    "total_tokens": lambda r: r["total_tokens"],
+                    "generation_time": lambda r: r["generation_time"]
+                },
+                resamples=engine.bootstrap_resamples,
+                seed=engine.bootstrap_seed
+            )
+        }
+
+        if self.baseline:
+            summary["category_deltas"] = compare_category_stats(category_stats, self.baseline)
+
+        return summary
+
+    def print_summary(self, summary: Dict[str, Any]):
+        print("=" * 70)
+        print("실험 결과 요약 (LLM-as-a-Judge)")
+        print("=" * 70)
+        print(f"총 실험: {summary['total_experiments']}회")
+        print(f"성공률: {summary['success_rate']}%")
+        overall_ci = (summary.get("confidence_intervals") or {}).get("overall", {})
+        print(f"평균 품질 점수: {summary['avg_quality']}/10{format_interval(overall_ci.get('quality_score'))}")
+        print()
+
+        print("차원별 점수:")
+        dim_names = {
+            "accuracy": "정확성(A)",
+            "completeness": "완전성(C)",
+            "coherence": "일관성(H)",
+            "actionability": "실행가능성(X)",
+            "clarity": "명확성(L)"
+        }
+        for dim, stats in summary.get("dimension_stats", {}).items():
+            print(f"  {dim_names.get(dim, dim)}: {stats['avg']}/10 (min:{stats['min']}, max:{stats['max']})")
+        print()
+
+        print("카테고리별 결과:")
+        for cat, stats in summary.get("category_stats", {}).items():
+            cat_ci = (summary.get("confidence_intervals") or {}).get("by_category", {}).get(cat, {})
+            print(f"  {cat}: {stats['avg_quality']}/10{format_interval(cat_ci.get('quality_score'))} "
+                  f"[{stats['data_mode']}] 입력 토큰 {stats['avg_input_tokens']} "
+                  f"(절감 {stats['token_saving_rate']}%), 생성 {stats['avg_generation_time']}초")
+            for dim, avg in stats.get("dimension_avgs", {}).items():
+                print(f"    - {dim}: {avg}")
+
+        if summary.get("category_deltas"):
+            print()
+            print("기준 실행 대비 변화 (카테고리별):")
+            for cat, delta in summary["category_deltas"].items():
+                time_delta = delta["generation_time_delta"]
+                print(f"  {cat}: 입력 토큰 {delta['input_tokens_delta']:+.1f}, "
+                      f"생성 시간 {'-' if time_delta is None else f'{time_delta:+.2f}초'}, "
+                      f"Judge 점수 {delta['quality_delta']:+.2f}")
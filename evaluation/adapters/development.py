@@ -0,0 +1,557 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+개발자 어댑터 (Development Adapter)
+================================================================================
+
+## 이 모듈의 목적
+코드 리뷰/문서화 실험의 도메인 부분만 담습니다. 실행 루프, 토큰 계산, 결과 기록은
+evaluation.engine.ExperimentEngine이 맡습니다.
+
+## 제공 항목
+- load_cases: evaluation.development_test_cases 전체 (코드 리뷰 54 + 문서화 54)
+- build_prompt: V1.0 / V2.0 프롬프트 (templates.development), --minify 시 코드 스니펫 축소
+- score: 동의어 기반 이슈 탐지율 + 코드 블록/구조화/구체성 (1-10점)
+- 요약 추가 항목: 카테고리별 코드 블록 포함율, 언어별 통계(language_stats),
+  --baseline 대비 언어별 변화(language_deltas)
+
+## 코드 스니펫 축소 (minify)
+- 코드 리뷰: 주석/docstring/빈 줄 제거 + 공백 축소 (templates/development/code_minifier.py)
+- 문서화: 주석이 곧 정보이므로 빈 줄/줄 끝 공백만 제거
+- 결과에 원본 대비 입력 토큰(raw_input_tokens) 기록, 응답의 라인 참조는 원본 기준으로 복원
+================================================================================
+"""
+
+from dataclasses import replace
+from typing import Any, Dict, List
+
+from evaluation.development_test_cases import DevelopmentTestCase, get_all_development_test_cases
+from evaluation.engine import DomainAdapter, LLMCall
+from templates.development.code_review import (
+    get_code_review_prompt,
+    get_security_review_prompt,
+    get_performance_review_prompt,
+    get_refactoring_prompt
+)
+from templates.development.documentation import (
+    get_api_documentation_prompt,
+    get_readme_prompt,
+    get_code_comments_prompt,
+    get_architecture_doc_prompt
+)
+
+# V2.0 프롬프트 임포트
+from templates.development.code_review_v2 import (
+    get_code_review_prompt_v2,
+    get_security_review_prompt_v2,
+    get_performance_review_prompt_v2,
+    get_refactoring_prompt_v2
+)
+from templates.development.documentation_v2 import (
+    get_api_documentation_prompt_v2,
+    get_readme_prompt_v2,
+    get_code_comments_prompt_v2,
+    get_architecture_doc_prompt_v2
+)
+from templates.development.code_minifier import minify_code, collapse_whitespace, MinifiedCode
+
+
+# ============================================================================
+# 이슈 탐지용 동의어 사전 (V2.0 개선)
+# ============================================================================
+
+ISSUE_SYNONYMS = {
+    # 코드 품질 관련
+    "PEP8 네이밍 위반": ["PEP8", "pep8", "네이밍", "명명", "snake_case", "camelCase", "CamelCase", "컨벤션"],
+    "None 비교는 is 사용": ["None", "is None", "== None", "!= None", "is not None"],
+    "enumerate 미사용": ["enumerate", "range(len", "인덱스"],
+    "리스트 컴프리헨션 가능": ["컴프리헨션", "comprehension", "리스트 내포", "[x for"],
+    "클래스명 PascalCase 아님": ["PascalCase", "클래스명", "class 이름", "대문자"],
+    "메서드명 snake_case 아님": ["snake_case", "메서드명", "함수명", "소문자"],
+    "타입 힌트 없음": ["타입 힌트", "type hint", "타입 주석", ": str", ": int", "-> "],
+    "docstring 없음": ["docstring", "문서화", "주석", '"""', "'''"],
+    "context manager 미사용": ["context manager", "with 문", "with open", "컨텍스트"],
+    "리소스 누수 위험": ["리소스", "누수", "close()", "메모리", "파일 핸들"],
+    "예외 처리 없음": ["예외", "exception", "try", "except", "에러 처리", "오류"],
+    "pathlib 미사용": ["pathlib", "Path", "os.path"],
+
+    # 보안 관련
+    "SQL 인젝션": ["SQL 인젝션", "SQL injection", "인젝션", "파라미터화", "prepared statement", "쿼리"],
+    "명령어 인젝션": ["명령어 인젝션", "command injection", "os.system", "subprocess", "shell"],
+    "XSS 취약점": ["XSS", "크로스 사이트", "스크립팅", "innerHTML", "escape", "sanitize"],
+    "SSTI 취약점": ["SSTI", "템플릿 인젝션", "template injection", "render_template"],
+    "입력값 검증 없음": ["입력값", "검증", "validation", "유효성", "필터"],
+    "MD5 취약한 해시": ["MD5", "취약한 해시", "bcrypt", "argon2", "sha256", "해싱"],
+    "솔트 미사용": ["솔트", "salt", "해시", "레인보우"],
+    "약한 시크릿 키": ["시크릿", "secret", "키", "하드코딩", "환경변수"],
+    "토큰 만료 없음": ["만료", "expire", "exp", "TTL", "유효기간"],
+    "경로 순회 취약점": ["경로 순회", "path traversal", "../", "디렉토리"],
+    "평문 비밀번호": ["평문", "비밀번호", "암호화", "해시"],
+    "오픈 리다이렉트": ["리다이렉트", "redirect", "URL 검증"],
+    "Pickle 역직렬화 취약점": ["Pickle", "역직렬화", "deserialization", "RCE"],
+    "민감정보 로깅": ["민감정보", "로깅", "logging", "카드", "CVV", "마스킹"],
+    "XXE 취약점": ["XXE", "외부 엔티티", "XML", "DTD"],
+    "파일명 검증 없음": ["파일명", "filename", "업로드", "확장자"],
+    "unsafe YAML load": ["yaml.load", "yaml.safe_load", "YAML"],
+
+    # 성능 관련
+    "O(n^2) 복잡도": ["O(n²)", "O(n^2)", "이중 루프", "중첩 루프", "복잡도"],
+    "set 활용 가능": ["set", "집합", "중복", "O(1)"],
+    "전체 파일 메모리 로드": ["메모리", "전체 파일", "f.read()", "대용량"],
+    "라인 단위 읽기 권장": ["라인 단위", "줄 단위", "readline", "제너레이터"],
+    "N+1 쿼리 문제": ["N+1", "쿼리", "벌크", "배치", "IN 절"],
+    "매번 패턴 컴파일": ["re.compile", "정규식", "패턴 컴파일"],
+    "반복적 DOM 조작": ["DOM", "appendChild", "리플로우", "DocumentFragment"],
+    "concat 반복 비효율": ["concat", "flat", "flatMap", "배열"],
+    "Promise.all 미사용": ["Promise.all", "병렬", "동시", "순차"],
+    "String 연결 비효율": ["String 연결", "StringBuilder", "문자열 연결", "+="],
+    "Stream API 활용 가능": ["Stream", "스트림", "filter", "map", "collect"],
+    "슬라이스 용량 미지정": ["용량", "capacity", "make", "슬라이스"],
+    "지수적 시간 복잡도": ["지수", "피보나치", "재귀", "메모이제이션"],
+    "iterrows 비효율": ["iterrows", "벡터화", "apply", "pandas"],
+
+    # 리팩토링 관련
+    "중첩 조건문": ["중첩", "조건문", "if-else", "분기"],
+    "전략 패턴 적용": ["전략 패턴", "Strategy", "디자인 패턴"],
+    "매직 넘버": ["매직 넘버", "magic number", "상수", "하드코딩"],
+    "중복 코드": ["중복", "DRY", "반복"],
+    "긴 매개변수 목록": ["매개변수", "파라미터", "인자", "DTO"],
+    "단일 책임 위반": ["단일 책임", "SRP", "책임"],
+    "God 클래스": ["God 클래스", "큰 클래스", "거대"],
+    "메서드 추출": ["메서드 추출", "Extract Method", "함수 분리"],
+    "의존성 주입": ["의존성 주입", "DI", "Dependency Injection", "의존성"],
+    "팩토리 패턴 적용": ["팩토리", "Factory", "생성"],
+    "OCP 위반": ["OCP", "개방-폐쇄", "확장"],
+
+    # 문서화 관련
+    "엔드포인트 설명": ["엔드포인트", "endpoint", "API", "경로"],
+    "요청 파라미터": ["요청", "파라미터", "request", "parameter"],
+    "응답 형식": ["응답", "response", "형식", "JSON"],
+    "에러 케이스": ["에러", "error", "예외", "실패"],
+    "프로젝트 설명": ["프로젝트", "설명", "개요", "목적"],
+    "설치 방법": ["설치", "install", "설정", "setup"],
+    "사용 예시": ["예시", "example", "사용법", "usage"],
+    "함수 docstring": ["docstring", "문서화", "설명"],
+    "파라미터 설명": ["파라미터", "인자", "argument", "매개변수"],
+    "반환값 설명": ["반환", "return", "결과"],
+}
+
+
+def compare_language_stats(current: Dict, baseline: Dict) -> Dict:
+    """
+    두 실행의 언어별 이슈 탐지율/입력 토큰 차이 계산
+
+    Args:
+        current: 현재 실행의 language_stats
+        baseline: 기준 실행(예: 축소 미사용)의 language_stats
+
+    Returns:
+        Dict: {언어: {issue_detection_delta, input_tokens_delta}} - 양쪽에 모두 있는 언어만
+    """
+    deltas = {}
+    for lang, stats in current.items():
+        if lang not in baseline:
+            continue
+        base = baseline[lang]
+        deltas[lang] = {
+            "issue_detection_delta": round(stats["avg_issue_detection"] - base["avg_issue_detection"], 1),
+            "input_tokens_delta": round(stats["avg_input_tokens"] - base["avg_input_tokens"], 1)
+        }
+    return deltas
+
+class DevelopmentAdapter(DomainAdapter):
+    """개발자 프롬프트 어댑터 (코드 리뷰/문서화)"""
+
+    domain = "development"
+    versions = ("v1", "v2")
+    results_prefix = "development_experiments"
+    default_limit = 108
+    coverage_metric = "issue_detection_rate"
+    coverage_label = "이슈 탐지율"
+    baseline_key = "language_stats"
+
+    def __init__(self, version: str = None, minify: bool = False):
+        """
+        Args:
+            version: 프롬프트 버전 ("v1" 또는 "v2")
+            minify: 코드 스니펫 축소 여부 (prefill 토큰 절감)
+        """
+        super().__init__(version)
+        self.minify = minify
+
+    @classmethod
+    def add_arguments(cls, parser):
+        parser.add_argument("--minify", action="store_true",
+                            help="코드 스니펫 축소 (주석/docstring/공백 제거로 입력 토큰 절감)")
+
+    @classmethod
+    def options_from_args(cls, parser, args) -> Dict[str, Any]:
+        if args.minify and args.manifest:
+            parser.error("--minify는 --manifest와 함께 사용할 수 없습니다 (매니페스트 프롬프트는 이미 렌더링됨)")
+        return {"minify": args.minify}
+
+    def options(self) -> Dict[str, Any]:
+        return {"minify": self.minify}
+
+    @property
+    def title(self) -> str:
+        return f"개발자 프롬프트 108회 실험 ({self.version.upper()})"
+
+    def info_lines(self) -> List[str]:
+        return [
+            f"프롬프트 버전: {self.version.upper()}",
+            f"코드 축소: {'사용' if self.minify else '미사용'}",
+        ]
+
+    def load_cases(self) -> List[DevelopmentTestCase]:
+        return get_all_development_test_cases()
+
+    def score(self, test_case: DevelopmentTestCase, response: str) -> Dict[str, Any]:
+        return self.evaluate_response_quality(response, test_case.expected_issues, test_case.category)
+
+    def make_result(self, test_case: DevelopmentTestCase, call: LLMCall, engine) -> Dict[str, Any]:
+        """축소 시 원본 프롬프트 토큰을 함께 기록하고 응답 라인 참조를 원본 기준으로 복원"""
+        response = call.response
+        raw_input_tokens = call.input_tokens
+        if self.minify:
+            raw_input_tokens = engine.count_tokens(self.build_prompt(test_case, minify=False))
+            response = self.minify_snippet(test_case).remap_line_numbers(response)
+
+        return {
+            "test_case_id": test_case.id,
+            "category": test_case.category,
+            "subcategory": test_case.subcategory,
+            "language": test_case.language,
+            "difficulty": test_case.difficulty,
+            "success": call.success,
+            "error": call.error,
+            "minified": self.minify,
+            "input_tokens": call.input_tokens,
+            "raw_input_tokens": raw_input_tokens,
+            "output_tokens": call.output_tokens,
+            "total_tokens": call.input_tokens + call.output_tokens,
+            "response_time": round(call.elapsed, 2),
+            "quality_evaluation": self.score(test_case, response) if call.success else {},
+            "response_preview": response[:500] if response else ""
+        }
+
+    # ---- 요약 ----
+
+    def init_category_stats(self) -> Dict[str, Any]:
+        stats = super().init_category_stats()
+        stats["code_block_count"] = 0
+        return stats
+
+    def accumulate_category(self, stats: Dict[str, Any], result: Dict[str, Any]):
+        super().accumulate_category(stats, result)
+        if result["quality_evaluation"].get("has_code_block", False):
+            stats["code_block_count"] += 1
+
+    def finalize_category(self, stats: Dict[str, Any]):
+        super().finalize_category(stats)
+        stats["code_block_rate"] = round(stats["code_block_count"] / stats["count"] * 100, 1)
+
+    def experiment_info_extra(self) -> Dict[str, Any]:
+        return {"minify": self.minify}
+
+    def extra_sections(self, successful: List) -> Dict[str, Any]:
+        """언어별 통계 (토큰 절감률, 이슈 탐지율)"""
+        language_stats = {}
+        for r in successful:
+            stats = language_stats.setdefault(r["language"], {
+                "count": 0,
+                "total_quality": 0,
+                "total_issue_detection": 0,
+                "input_tokens": 0,
+                "raw_input_tokens": 0
+            })
+            stats["count"] += 1
+            stats["total_quality"] += r["quality_evaluation"].get("quality_score", 0)
+            stats["total_issue_detection"] += r["quality_evaluation"].get("issue_detection_rate", 0)
+            stats["input_tokens"] += r["input_tokens"]
+            stats["raw_input_tokens"] += r.get("raw_input_tokens", r["input_tokens"])
+
+        for lang, stats in language_stats.items():
+            n = stats["count"]
+            stats["avg_quality"] = round(stats.pop("total_quality") / n, 2)
+            stats["avg_issue_detection"] = round(stats.pop("total_issue_detection") / n, 1)
+            stats["avg_input_tokens"] = round(stats["input_tokens"] / n, 1)
+            stats["token_saving_rate"] = round(
+                (1 - stats["input_tokens"] / stats["raw_input_tokens"]) * 100, 1
+            ) if stats["raw_input_tokens"] else 0.0
+
+        return {"language_stats": language_stats}
+
+    def baseline_deltas(self, summary: Dict[str, Any]) -> Dict[str, Any]:
+        return {"language_deltas": compare_language_stats(summary["language_stats"], self.baseline)}
+
+    def category_lines(self, stats: Dict[str, Any], ci: Dict[str, Any]) -> List[str]:
+        lines = super().category_lines(stats, ci)
+        lines.insert(2, f"    - 코드 블록 포함율: {stats['code_block_rate']}%")
+        return lines
+
+    def print_extra(self, summary: Dict[str, Any]):
+        print()
+        print("언어별 결과:")
+        for lang, stats in summary.get("language_stats", {}).items():
+            print(f"  {lang} ({stats['count']}건): 이슈 탐지율 {stats['avg_issue_detection']}%, "
+                  f"평균 입력 토큰 {stats['avg_input_tokens']}, 토큰 절감률 {stats['token_saving_rate']}%")
+        if summary.get("language_deltas"):
+            print()
+            print("기준 실행 대비 변화 (언어별):")
+            for lang, delta in summary["language_deltas"].items():
+                print(f"  {lang}: 이슈 탐지율 {delta['issue_detection_delta']:+.1f}%p, "
+                      f"입력 토큰 {delta['input_tokens_delta']:+.1f}")
+
+    # ---- 프롬프트/평가 ----
+
+    def _check_issue_with_synonyms(self, issue: str, response_lower: str) -> bool:
+        """
+        동의어를 사용하여 이슈 탐지 (V2.0 개선)
+
+        4단계 매칭 로직:
+        1. 정확한 이슈 문자열 매칭
+        2. 동의어 사전 기반 매칭 (2개 이상 동의어)
+        3. 이슈 단어 분리 후 AND 매칭
+        4. 핵심 키워드 any 매칭 (fallback)
+        """
+        issue_lower = issue.lower()
+
+        # 1단계: 정확한 매칭
+        if issue_lower in response_lower:
+            return True
+
+        # 2단계: 동의어 사전 매칭
+        if issue in ISSUE_SYNONYMS:
+            synonyms = ISSUE_SYNONYMS[issue]
+            matched_count = sum(1 for syn in synonyms if syn.lower() in response_lower)
+            if matched_count >= 2:
+                return True
+
+        # 3단계: 이슈 단어 분리 후 AND 매칭 (공백으로 분리된 모든 키워드)
+        keywords = [kw for kw in issue_lower.split() if len(kw) > 1]
+        if len(keywords) >= 2:
+            if all(kw in response_lower for kw in keywords):
+                return True
+
+        # 4단계: any 매칭 (fallback)
+        if any(kw in response_lower for kw in keywords if len(kw) > 2):
+            return True
+
+        return False
+
+    def evaluate_response_quality(self, response: str, expected_issues: List[str], category: str) -> Dict:
+        """
+        응답 품질 평가 (V2.0 개선: 동의어 기반 탐지)
+
+        Args:
+            response: LLM 응답
+            expected_issues: 예상되는 이슈/요소 리스트
+            category: 테스트 카테고리
+
+        Returns:
+            Dict: 평가 결과
+        """
+        # 이슈/요소 발견율 계산 (V2.0: 동의어 기반)
+        found_issues = 0
+        response_lower = response.lower()
+
+        for issue in expected_issues:
+            if self._check_issue_with_synonyms(issue, response_lower):
+                found_issues += 1
+
+        issue_detection_rate = found_issues / len(expected_issues) if expected_issues else 0
+
+        # 코드 블록 포함 여부
+        has_code_block = "```" in response
+
+        # 구조화된 형식 여부
+        has_structure = any([
+            "##" in response,
+            "|" in response,  # 표 형식
+            "라인" in response or "Line" in response.lower(),  # 라인 참조
+            "STEP" in response,  # V2.0 단계별 구조
+        ])
+
+        # 구체적 제안 포함 여부
+        has_specific_suggestions = any([
+            "변경" in response or "수정" in response,
+            "->" in response or "=>" in response,
+            "대신" in response or "권장" in response,
+            "개선" in response or "최적화" in response,  # V2.0 추가
+        ])
+
+        # 종합 점수 (1-10)
+        quality_score = 0
+        quality_score += min(issue_detection_rate * 4, 4)  # 최대 4점
+        quality_score += 2 if has_code_block else 0  # 코드 블록 2점
+        quality_score += 2 if has_structure else 0  # 구조화 2점
+        quality_score += 2 if has_specific_suggestions else 0  # 구체성 2점
+
+        return {
+            "quality_score": round(quality_score, 2),
+            "issue_detection_rate": round(issue_detection_rate * 100, 1),
+            "has_code_block": has_code_block,
+            "has_structure": has_structure,
+            "has_specific_suggestions": has_specific_suggestions,
+            "found_issues": found_issues,
+            "total_issues": len(expected_issues)
+        }
+
+    def minify_snippet(self, test_case: DevelopmentTestCase) -> MinifiedCode:
+        """
+        테스트 케이스의 코드 스니펫 축소
+
+        코드 리뷰는 주석/docstring까지 제거하고,
+        문서화는 주석이 설명 자체인 경우가 많아 공백만 정리합니다.
+        """
+        if test_case.category == "code_review":
+            return minify_code(test_case.code_snippet, test_case.language)
+        return collapse_whitespace(test_case.code_snippet)
+
+    def build_prompt(self, test_case: DevelopmentTestCase, minify: bool = None) -> str:
+        """
+        테스트 케이스에 맞는 프롬프트 생성 (버전에 따라 분기)
+
+        Args:
+            test_case: 테스트 케이스
+            minify: 코드 스니펫 축소 여부 (기본: 어댑터 설정)
+        """
+        if self.minify if minify is None else minify:
+            test_case = replace(test_case, code_snippet=self.minify_snippet(test_case).code)
+
+        if self.version == "v2":
+            return self._generate_v2_prompt(test_case)
+        return self._generate_v1_prompt(test_case)
+
+    def _generate_v1_prompt(self, test_case: DevelopmentTestCase) -> str:
+        """V1.0 프롬프트 생성"""
+        if test_case.category == "code_review":
+            if test_case.subcategory == "general":
+                return get_code_review_prompt(
+                    code=test_case.code_snippet,
+                    language=test_case.language,
+                    filename="example." + test_case.language.lower()[:2],
+                    code_purpose="일반 코드"
+                )
+            elif test_case.subcategory == "security":
+                return get_security_review_prompt(
+                    code=test_case.code_snippet,
+                    language=test_case.language,
+                    app_type="웹 애플리케이션"
+                )
+            elif test_case.subcategory == "performance":
+                return get_performance_review_prompt(
+                    code=test_case.code_snippet,
+                    language=test_case.language
+                )
+            else:  # refactoring
+                return get_refactoring_prompt(
+                    code=test_case.code_snippet,
+                    language=test_case.language
+                )
+        else:  # documentation
+            if test_case.subcategory == "api":
+                return get_api_documentation_prompt(
+                    api_name="API 엔드포인트",
+                    endpoint="/api/example",
+                    http_method="POST",
+                    api_purpose="데이터 처리",
+                    request_params="JSON 본문",
+                    response_format="JSON 응답"
+                )
+            elif test_case.subcategory == "readme":
+                return get_readme_prompt(
+                    project_name="Example Project",
+                    one_liner="예제 프로젝트입니다",
+                    main_features="주요 기능",
+                    tech_stack=test_case.language,
+                    installation="pip install 또는 npm install",
+                    usage_example=test_case.code_snippet
+                )
+            elif test_case.subcategory == "comments":
+                return get_code_comments_prompt(
+                    code=test_case.code_snippet,
+                    language=test_case.language
+                )
+            else:  # architecture
+                return get_architecture_doc_prompt(
+                    system_name="Example System",
+                    system_purpose="시스템 설명",
+                    main_features="주요 기능",
+                    tech_stack=test_case.language,
+                    components=test_case.code_snippet
+                )
+
+    def _generate_v2_prompt(self, test_case: DevelopmentTestCase) -> str:
+        """
+        V2.0 프롬프트 생성
+
+        핵심 개선: expected_issues를 동적 체크리스트로 변환하여 프롬프트에 직접 포함
+        """
+        if test_case.category == "code_review":
+            if test_case.subcategory == "general":
+                return get_code_review_prompt_v2(
+                    code=test_case.code_snippet,
+                    language=test_case.language,
+                    expected_issues=test_case.expected_issues,
+                    filename="example." + test_case.language.lower()[:2],
+                    code_purpose="일반 코드"
+                )
+            elif test_case.subcategory == "security":
+                return get_security_review_prompt_v2(
+                    code=test_case.code_snippet,
+                    language=test_case.language,
+                    expected_issues=test_case.expected_issues,
+                    app_type="웹 애플리케이션"
+                )
+            elif test_case.subcategory == "performance":
+                return get_performance_review_prompt_v2(
+                    code=test_case.code_snippet,
+                    language=test_case.language,
+                    expected_issues=test_case.expected_issues
+                )
+            else:  # refactoring
+                return get_refactoring_prompt_v2(
+                    code=test_case.code_snippet,
+                    language=test_case.language,
+                    expected_issues=test_case.expected_issues
+                )
+        else:  # documentation
+            if test_case.subcategory == "api":
+                return get_api_documentation_prompt_v2(
+                    api_name="API 엔드포인트",
+                    endpoint="/api/example",
+                    http_method="POST",
+                    api_purpose="데이터 처리",
+                    expected_elements=test_case.expected_issues,
+                    request_params="JSON 본문",
+                    response_format="JSON 응답",
+                    language=test_case.language
+                )
+            elif test_case.subcategory == "readme":
+                return get_readme_prompt_v2(
+                    project_name="Example Project",
+                    one_liner="예제 프로젝트입니다",
+                    main_features="주요 기능",
+                    tech_stack=test_case.language,
+                    expected_elements=test_case.expected_issues,
+                    code_snippet=test_case.code_snippet,
+                    language=test_case.language
+                )
+            elif test_case.subcategory == "comments":
+                return get_code_comments_prompt_v2(
+                    code=test_case.code_snippet,
+                    language=test_case.language,
+                    expected_elements=test_case.expected_issues
+                )
+            else:  # architecture
+                return get_architecture_doc_prompt_v2(
+                    system_name="Example System",
+                    system_purpose="시스템 설명",
+                    main_features="주요 기능",
+                    tech_stack=test_case.language,
+                    components=test_case.code_snippet,
+                    expected_elements=test_case.expected_issues,
+                    language=test_case.language
+                )
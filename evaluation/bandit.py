@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+버전 배분 밴딧 (Multi-Armed Bandit over Prompt Versions)
+================================================================================
+
+## 이 모듈의 목적
+프롬프트 버전을 팔(arm)로 보고, 생성 1회마다 **다음에 어느 버전을 실행할지** 고릅니다.
+유망한 버전에 생성을 더 쓰고 나쁜 버전은 일찍 덜 실행하여, 전체 실행보다 적은 호출로
+가장 좋은 버전에 수렴합니다.
+
+## 왜 필요한가?
+- 비즈니스 v1~v4, 취업 준비 v3/v3.5/v4를 버전마다 108회씩 모두 실행
+- 버전 간 차이가 큰데도 확실히 나쁜 버전에 같은 예산을 씀
+- 순차 검정(evaluation.sequential)은 모든 버전을 같은 케이스에 실행하고, 밴딧은 호출 자체를 배분
+
+## 보상
+quality_score - token_penalty × (total_tokens / 1000) - latency_penalty × latency(초)
+실패한 생성은 품질 0으로 계산합니다 (실패가 잦은 버전이 선택되지 않도록).
+
+## 전략
+- thompson: 팔마다 평균 보상의 정규 근사 사후분포 N(mean, var/n)에서 표본을 뽑아 최댓값 선택
+- ucb: mean + c · std · sqrt(2 ln t / n) 최댓값 선택 (표준편차로 보상 척도 보정)
+- 두 전략 모두 처음에 팔마다 warmup회 실행하고, 분산은 prior_std² 이상으로 둠 (초반 과신 방지)
+
+## 멈춤 조건
+- 예산(호출 수) 소진
+- 최고 버전일 확률 P(best) ≥ stop_prob (사후분포 몬테카를로 추정)
+
+모든 난수는 seed 하나에서 나오므로 같은 seed와 같은 보상이면 같은 배분 기록(trace)이 재현됩니다.
+================================================================================
+"""
+
+import math
+import random
+from typing import Dict, List, Optional, Sequence
+
+from evaluation.stats import RunningStats
+
+
+STRATEGIES = ("thompson", "ucb")
+
+DEFAULT_STOP_PROB = 0.95
+DEFAULT_WARMUP = 3
+DEFAULT_PRIOR_STD = 1.0   # 보상 표준편차 하한 (품질 점수 단위)
+DEFAULT_UCB_C = 1.0
+_PROB_BEST_DRAWS = 2000
+
+
+def reward_of(row: Dict, token_penalty: float = 0.0, latency_penalty: float = 0.0) -> float:
+    """
+    정규화된 케이스 행(evaluation.result_io.normalize_result)의 보상
+
+    Args:
+        row: 정규화된 케이스 행
+        token_penalty: 1000토큰당 감점
+        latency_penalty: 1초당 감점
+
+    Returns:
+        float: 보상 (실패하면 품질 0 기준)
+    """
+    quality = row["quality_score"] if row["success"] is not False and row["quality_score"] is not None else 0.0
+    reward = quality
+    if token_penalty and row["total_tokens"]:
+        reward -= token_penalty * row["total_tokens"] / 1000
+    if latency_penalty and row["latency"]:
+        reward -= latency_penalty * row["latency"]
+    return reward
+
+
+class VersionBandit:
+    """
+    프롬프트 버전 밴딧
+
+    Attributes:
+        versions: 팔(버전) 목록
+        strategy: "thompson" 또는 "ucb"
+        rewards: 버전 → 보상 RunningStats
+        pulls: 총 실행 수
+    """
+
+    def __init__(
+        self,
+        versions: Sequence[str],
+        strategy: str = "thompson",
+        seed: int = 42,
+        warmup: int = DEFAULT_WARMUP,
+        prior_std: float = DEFAULT_PRIOR_STD,
+        ucb_c: float = DEFAULT_UCB_C
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"지원하지 않는 전략: {strategy} (가능: {', '.join(STRATEGIES)})")
+        if len(versions) < 2 or len(set(versions)) != len(versions):
+            raise ValueError(f"서로 다른 버전이 2개 이상 필요합니다: {list(versions)}")
+        self.versions = list(versions)
+        self.strategy = strategy
+        self.warmup = max(1, warmup)
+        self.prior_std = prior_std
+        self.ucb_c = ucb_c
+        self.rewards = {version: RunningStats() for version in self.versions}
+        self.pulls = 0
+        self._rng = random.Random(f"bandit:{seed}")
+
+    def _std(self, version: str) -> float:
+        return max(self.rewards[version].std, self.prior_std)
+
+    def _sample_mean(self, version: str) -> float:
+        stats = self.rewards[version]
+        return self._rng.gauss(stats.mean, self._std(version) / math.sqrt(stats.n))
+
+    def choose(self, exclude: Sequence[str] = ()) -> Optional[str]:
+        """
+        다음에 실행할 버전
+
+        Args:
+            exclude: 고르지 않을 버전 (케이스를 모두 쓴 버전 등)
+
+        Returns:
+            버전 (고를 수 있는 버전이 없으면 None)
+        """
+        candidates = [v for v in self.versions if v not in exclude]
+        if not candidates:
+            return None
+        for version in candidates:  # warmup: 적게 실행된 버전부터 순서대로
+            if self.rewards[version].n < self.warmup:
+                return min(candidates, key=lambda v: self.rewards[v].n)
+
+        if self.strategy == "thompson":
+            return max(candidates, key=self._sample_mean)
+        log_t = math.log(max(self.pulls, 2))
+        return max(candidates, key=lambda v: self.rewards[v].mean
+                   + self.ucb_c * self._std(v) * math.sqrt(2 * log_t / self.rewards[v].n))
+
+    def update(self, version: str, reward: float):
+        """실행 결과 보상 반영"""
+        self.rewards[version].add(reward)
+        self.pulls += 1
+
+    def prob_best(self, draws: int = _PROB_BEST_DRAWS) -> Dict[str, float]:
+        """버전별 최고 버전일 확률 (정규 근사 사후분포 몬테카를로, 실행 안 된 버전이 있으면 균등)"""
+        if any(stats.n == 0 for stats in self.rewards.values()):
+            return {version: 1.0 / len(self.versions) for version in self.versions}
+        params = [(self.rewards[v].mean, self._std(v) / math.sqrt(self.rewards[v].n)) for v in self.versions]
+        gauss = self._rng.gauss
+        wins = [0] * len(params)
+        for _ in range(draws):
+            samples = [gauss(mean, sd) for mean, sd in params]
+            wins[samples.index(max(samples))] += 1
+        return {version: count / draws for version, count in zip(self.versions, wins)}
+
+    def summary(self) -> List[Dict]:
+        """버전별 실행 수와 평균 보상 (평균 보상 내림차순)"""
+        rows = [
+            {
+                "version": version,
+                "pulls": stats.n,
+                "mean_reward": round(stats.mean, 4) if stats.n else None,
+                "std_reward": round(stats.std, 4) if stats.n > 1 else None,
+            }
+            for version, stats in self.rewards.items()
+        ]
+        return sorted(rows, key=lambda r: -math.inf if r["mean_reward"] is None else r["mean_reward"], reverse=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="밴딧 배분 시뮬레이션 (버전별 정규 분포 보상)")
+    parser.add_argument("--means", type=float, nargs="+", default=[6.5, 7.0, 7.8, 8.0],
+                        help="버전별 실제 평균 품질")
+    parser.add_argument("--std", type=float, default=1.5, help="품질 표준편차")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="thompson")
+    parser.add_argument("--budget", type=int, default=216, help="최대 호출 수")
+    parser.add_argument("--stop-prob", type=float, default=DEFAULT_STOP_PROB)
+    parser.add_argument("--trials", type=int, default=50, help="반복 횟수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    versions = [f"v{i + 1}" for i in range(len(args.means))]
+    best = versions[max(range(len(args.means)), key=lambda i: args.means[i])]
+    noise = random.Random(args.seed)
+    correct, calls = 0, 0
+    for trial in range(args.trials):
+        bandit = VersionBandit(versions, args.strategy, seed=args.seed + trial)
+        while bandit.pulls < args.budget:
+            version = bandit.choose()
+            bandit.update(version, noise.gauss(args.means[versions.index(version)], args.std))
+            if bandit.pulls >= bandit.warmup * len(versions) and max(bandit.prob_best(500).values()) >= args.stop_prob:
+                break
+        correct += bandit.summary()[0]["version"] == best
+        calls += bandit.pulls
+
+    full = args.budget // len(versions) * len(versions)
+    print(f"{args.strategy}: 평균 {calls / args.trials:.1f}회 호출 (버전별 균등 {full}회 대비), "
+          f"최고 버전({best}) 선택 {correct / args.trials:.0%}")
@@ -0,0 +1,532 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+LLM 호출 정책 (Call Policy: 타임아웃 / 재시도 / 헤지)
+================================================================================
+
+## 이 모듈의 목적
+모든 LLM 호출(생성, Judge 평가, PromptEvaluator)을 같은 정책으로 감쌉니다.
+
+| 정책 | 동작 |
+|------|------|
+| 호출 기한 (timeout) | 시도 1회가 기한을 넘기면 LLMTimeoutError로 포기 (멈춘 요청이 실행 전체를 막지 않음) |
+| 재시도 (retries) | 일시적 오류(타임아웃, 연결 오류, HTTP 429/5xx)만 지수 백오프 + full jitter 후 재시도 |
+| 재시도 예산 (retry_budget) | 실행 전체의 재시도 총 횟수 상한 (서버가 죽었을 때 모든 케이스가 재시도로 버티지 않도록) |
+| 헤지 (hedge) | 응답이 p95 지연(또는 지정한 초)을 넘기면 같은 프롬프트를 헤지 백엔드에 한 번 더 보내고 먼저 끝난 응답 사용 |
+
+헤지 요청은 원래 요청과 별도로 동시 호출 한도(limiter)의 자리를 하나 더 받아야 보냅니다. 자리가 없으면
+(이미 서버가 한도까지 바쁘면) 그 시도는 헤지하지 않고 건너뛴 수만 기록합니다. 느린 서버에 같은 요청을
+한 번 더 보내면 부하만 두 배가 되므로 헤지 백엔드(--hedge-backend 또는 --hedge-url)는 필수입니다.
+
+재시도하지 않는 오류: 녹화에 없는 프롬프트(LookupError), 잘못된 인자(ValueError) 등 다시 보내도 같은 결과인 오류
+
+## 기본값은 기존 동작 그대로
+타임아웃/재시도/헤지를 하나도 지정하지 않으면 호출 스레드에서 바로 invoke합니다
+(결과, 응답 시간, 트레이스가 정책 도입 전과 같음).
+
+## 결과에 남는 값
+- 케이스 결과: "retries"(재시도 수), "hedged"(헤지 요청을 보냈는지) - 정책을 켠 실행만
+- 실행 요약의 "call_policy": 설정 + 호출/시도/재시도/타임아웃/헤지/헤지 승리/헤지 생략/실패 수, 예산 소진 수, p95 지연
+- 트레이스: 재시도 대기 구간 "retry_backoff", 두 번째 이후 시도의 llm_call 구간에 attempt 속성
+
+## 사용 예시
+
+```python
+from evaluation.call_policy import CallPolicy, LLMCallError
+
+policy = CallPolicy(timeout=120, retries=2, retry_budget=50, hedge="p95", hedge_backend="ollama",
+                    hedge_options={"base_url": "http://gpu-2:11434"})
+try:
+    result = policy.invoke(llm, prompt, limiter=limiter, span="llm_call")
+    print(result.text, result.retries, result.hedged)
+except LLMCallError as e:
+    print(e, e.result.retries)  # 원래 오류 메시지, 실패까지의 재시도 수
+```
+
+```bash
+python scripts/run_business_experiments.py v4 --timeout 120 --retries 2
+python -m evaluation.engine career --concurrency auto --hedge p95 --hedge-url http://gpu-2:11434
+python scripts/run_all_experiments.py --timeout 60 --retries 3 --retry-budget 20
+```
+================================================================================
+"""
+
+import math
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+from evaluation import tracing
+from evaluation.llm_backends import BACKENDS, LIVE_BACKENDS, create_chat_model
+
+
+DEFAULT_RETRY_BUDGET = 50
+DEFAULT_BACKOFF_BASE = 1.0  # 첫 재시도 전 최대 대기 (초)
+DEFAULT_BACKOFF_MAX = 30.0  # 재시도 대기 상한 (초)
+HEDGE_MIN_SAMPLES = 20  # hedge="p95"가 헤지를 시작하기 전에 필요한 성공 호출 수
+LATENCY_SAMPLES = 500  # p95 계산에 쓰는 최근 성공 호출 수
+TRANSIENT_STATUS = frozenset({408, 425, 429})  # 5xx 외에 재시도하는 HTTP 상태
+
+
+class LLMTimeoutError(TimeoutError):
+    """시도 1회가 호출 기한을 넘김"""
+
+
+class LLMCallError(RuntimeError):
+    """
+    재시도/헤지 후에도 실패한 호출
+
+    메시지는 마지막 원래 오류의 메시지 그대로입니다 (결과의 "error" 값이 정책 도입 전과 같도록).
+
+    Attributes:
+        error: 마지막 원래 오류
+        result: 실패까지의 시도/재시도/헤지 기록 (CallResult)
+    """
+
+    def __init__(self, error: BaseException, result: "CallResult"):
+        super().__init__(str(error))
+        self.error = error
+        self.result = result
+
+
+@dataclass
+class CallResult:
+    """정책을 거친 호출 1회의 결과"""
+    text: str = ""
+    elapsed: float = 0.0  # 마지막 시도 시간 (초, 한도 대기/재시도 대기 제외)
+    attempts: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    hedged: bool = False  # 헤지 요청을 보냈는지
+    hedge_won: bool = False  # 헤지 응답을 사용했는지
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    다시 보내면 성공할 수 있는 오류인지
+
+    Args:
+        error: 호출에서 발생한 예외
+
+    Returns:
+        bool: 타임아웃, 연결 오류, HTTP 408/425/429/5xx면 True
+    """
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status in TRANSIENT_STATUS or status >= 500
+    try:
+        import httpx  # ollama/ChatOllama 전송 계층 (설치되어 있을 때만 확인)
+    except ImportError:
+        return False
+    return isinstance(error, httpx.TransportError)
+
+
+def _start_thread(func, *args) -> Future:
+    """
+    func(*args)를 데몬 스레드에서 실행
+
+    기한을 넘긴 요청은 기다리지 않고 버리므로, 멈춘 요청이 종료나 실행기 종료를 막지 않도록
+    스레드 풀 대신 데몬 스레드를 씁니다.
+    """
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+
+    def run():
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="llm-attempt", daemon=True).start()
+    return future
+
+
+class CallPolicy:
+    """
+    LLM 호출 타임아웃/재시도/헤지 정책 (실행 1회에 하나, 스레드 안전)
+
+    Attributes:
+        timeout: 시도 1회의 기한 (초, None이면 무제한)
+        retries: 호출 1회당 최대 재시도 수
+        retry_budget: 실행 전체의 재시도 총 횟수 상한 (None이면 무제한)
+        hedge: None, "p95"(관측한 p95 지연 후 헤지) 또는 초
+        hedge_backend: 헤지 요청을 보낼 백엔드 (hedge를 켜면 필수)
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        retries: int = 0,
+        retry_budget: Optional[int] = DEFAULT_RETRY_BUDGET,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        hedge: Union[str, float, None] = None,
+        hedge_backend: Optional[str] = None,
+        hedge_options: Optional[Dict[str, Any]] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            timeout: 시도 1회의 기한 (초, None이면 무제한)
+            retries: 호출 1회당 최대 재시도 수 (일시적 오류만)
+            retry_budget: 실행 전체의 재시도 총 횟수 상한 (None이면 무제한)
+            backoff_base: 첫 재시도 대기 상한 (초, 이후 2배씩)
+            backoff_max: 재시도 대기 상한 (초)
+            hedge: None(끔), "p95", 또는 헤지까지 기다릴 초
+            hedge_backend: 헤지 백엔드 이름 (hedge를 켜면 필수 - 같은 서버에 다시 보내지 않음)
+            hedge_options: 헤지 모델 생성 인자 (예: {"base_url": ...})
+            seed: 백오프 jitter 시드 (재현용)
+        """
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"timeout은 0보다 커야 합니다: {timeout}")
+        if retries < 0 or (retry_budget is not None and retry_budget < 0):
+            raise ValueError("retries와 retry_budget은 0 이상이어야 합니다")
+        if hedge is not None and hedge != "p95" and (isinstance(hedge, str) or hedge <= 0):
+            raise ValueError(f"hedge는 p95 또는 0보다 큰 초여야 합니다: {hedge}")
+        if hedge is not None and hedge_backend is None:
+            raise ValueError("hedge에는 hedge_backend가 필요합니다 (같은 서버에 다시 보내면 부하만 두 배)")
+        if hedge_backend is not None and hedge_backend not in BACKENDS:
+            raise ValueError(f"지원하지 않는 헤지 백엔드: {hedge_backend} (가능: {', '.join(BACKENDS)})")
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_budget = retry_budget
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.hedge = hedge
+        self.hedge_backend = hedge_backend
+        self.hedge_options = dict(hedge_options or {})
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=LATENCY_SAMPLES)
+        self._hedge_models: Dict[tuple, Any] = {}
+        self.calls = 0
+        self.attempts = 0
+        self.retried = 0
+        self.timeouts = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.hedges_skipped = 0  # 헤지 시점에 limiter 자리가 없어 보내지 않은 수
+        self.failures = 0
+        self.budget_exhausted = 0  # 예산이 없어 재시도하지 못한 호출 수
+
+    @property
+    def active(self) -> bool:
+        """기본 동작(바로 invoke)과 다른 정책이 하나라도 켜졌는지"""
+        return self.timeout is not None or self.retries > 0 or self.hedge is not None
+
+    # ---- 호출 ----
+
+    def invoke(self, llm, prompt: Any, limiter=None, span: Optional[str] = None) -> CallResult:
+        """
+        정책을 적용해 llm.invoke(prompt) 호출
+
+        시도마다 limiter 자리를 새로 받고(재시도 대기 중에는 자리를 내놓음), 응답 시간에는
+        한도 대기 시간을 넣지 않습니다.
+
+        Args:
+            llm: invoke(prompt).content 를 제공하는 채팅 모델
+            prompt: 프롬프트
+            limiter: 동시 호출 한도 (evaluation.concurrency.AdaptiveLimiter, None이면 제한 없음)
+            span: 시도마다 기록할 트레이스 구간 이름 (None이면 기록하지 않음)
+
+        Returns:
+            CallResult: 응답 텍스트와 시도/재시도/헤지 기록
+
+        Raises:
+            LLMCallError: 재시도하지 않는 오류, 재시도 소진, 또는 재시도 예산 소진
+        """
+        result = CallResult()
+        while True:
+            result.attempts += 1
+            start = time.perf_counter()
+            try:
+                with limiter.slot() if limiter is not None else nullcontext():
+                    start = time.perf_counter()
+                    with tracing.span(span, cat="llm") if span else nullcontext() as call_span:
+                        if result.attempts > 1 and call_span is not None:
+                            call_span.set(attempt=result.attempts)
+                        result.text = self._attempt(llm, prompt, result, limiter)
+                result.elapsed = time.perf_counter() - start
+                self._finish(result, ok=True)
+                return result
+            except Exception as error:
+                result.elapsed = time.perf_counter() - start
+                if isinstance(error, LLMTimeoutError):
+                    result.timeouts += 1
+                if not (result.retries < self.retries and is_transient(error) and self._take_budget()):
+                    self._finish(result, ok=False)
+                    raise LLMCallError(error, result) from error
+                result.retries += 1
+                delay = self.backoff_delay(result.retries)
+                with tracing.span("retry_backoff", cat="llm", attempt=result.attempts, delay=round(delay, 3)):
+                    time.sleep(delay)
+
+    def _attempt(self, llm, prompt: Any, result: CallResult, limiter=None) -> str:
+        """시도 1회 (기한/헤지가 없으면 현재 스레드에서 바로 호출, 헤지는 limiter 자리가 있을 때만)"""
+        hedge_after = self.hedge_delay()
+        if self.timeout is None and hedge_after is None:
+            return llm.invoke(prompt).content
+
+        start = time.perf_counter()
+        deadline = start + self.timeout if self.timeout is not None else None
+        pending = {_start_thread(llm.invoke, prompt)}
+        hedge_future = None
+        hedge_tried = False
+        error: Optional[BaseException] = None
+        while pending:
+            now = time.perf_counter()
+            waits = []
+            if deadline is not None:
+                waits.append(deadline - now)
+            if not hedge_tried and hedge_after is not None:
+                waits.append(start + hedge_after - now)
+            done, pending = wait(pending, timeout=max(min(waits), 0.0) if waits else None,
+                                 return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    result.hedge_won = future is hedge_future
+                    return future.result().content
+                error = future.exception()
+            if not pending:
+                break
+
+            now = time.perf_counter()
+            if not hedge_tried and hedge_after is not None and now - start >= hedge_after:
+                hedge_tried = True
+                if limiter is None or limiter.try_acquire():
+                    hedge_future = _start_thread(self._hedge_call, self.hedge_model(llm), prompt, limiter)
+                    pending.add(hedge_future)
+                    result.hedged = True
+                    tracing.counter("hedge", sent=1)
+                else:
+                    with self._lock:
+                        self.hedges_skipped += 1
+                    tracing.counter("hedge", skipped=1)
+            if deadline is not None and now >= deadline:
+                # 남은 요청은 버림 (데몬 스레드가 응답을 받으면 그대로 사라짐)
+                raise LLMTimeoutError(f"LLM 호출이 {self.timeout:g}초 안에 끝나지 않았습니다")
+        raise error
+
+    @staticmethod
+    def _hedge_call(model, prompt: Any, limiter=None):
+        """헤지 요청 (try_acquire로 받은 limiter 자리를 끝날 때 반납, 버려진 요청도 끝까지 자리 차지)"""
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = model.invoke(prompt)
+            ok = True
+            return response
+        finally:
+            if limiter is not None:
+                limiter.release(time.perf_counter() - start, ok)
+
+    def _take_budget(self) -> bool:
+        """재시도 예산 1회 사용 (예산이 없으면 False)"""
+        with self._lock:
+            if self.retry_budget is not None and self.retried >= self.retry_budget:
+                self.budget_exhausted += 1
+                return False
+            self.retried += 1
+            return True
+
+    def _finish(self, result: CallResult, ok: bool):
+        with self._lock:
+            self.calls += 1
+            self.attempts += result.attempts
+            self.timeouts += result.timeouts
+            self.hedged += result.hedged
+            self.hedge_wins += result.hedge_won
+            if ok:
+                self._latencies.append(result.elapsed)
+            else:
+                self.failures += 1
+
+    # ---- 백오프 / 헤지 ----
+
+    def backoff_delay(self, retry: int) -> float:
+        """
+        retry번째 재시도 전 대기 시간 (지수 백오프 + full jitter)
+
+        Args:
+            retry: 1부터 시작하는 재시도 번호
+
+        Returns:
+            float: 0 ~ min(backoff_max, backoff_base × 2^(retry-1)) 사이의 균등 난수 (초)
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (retry - 1))
+        with self._lock:
+            return self._rng.uniform(0, ceiling)
+
+    def latency_p95(self) -> Optional[float]:
+        """최근 성공 호출의 p95 지연 (초, 표본이 없으면 None)"""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, math.ceil(len(samples) * 0.95) - 1)]
+
+    def hedge_delay(self) -> Optional[float]:
+        """헤지 요청까지 기다릴 시간 (초, 헤지를 하지 않으면 None)"""
+        if self.hedge is None:
+            return None
+        if self.hedge != "p95":
+            return float(self.hedge)
+        if len(self._latencies) < HEDGE_MIN_SAMPLES:
+            return None  # p95를 추정할 표본이 모일 때까지는 헤지하지 않음
+        return self.latency_p95()
+
+    def hedge_model(self, llm):
+        """llm과 같은 모델/온도의 헤지 백엔드 모델 (모델/온도별로 1번만 생성)"""
+        key = (getattr(llm, "model", None), getattr(llm, "temperature", None))
+        with self._lock:
+            model = self._hedge_models.get(key)
+            if model is None:
+                model = create_chat_model(
+                    self.hedge_backend, model=key[0], temperature=key[1], **self.hedge_options
+                )
+                self._hedge_models[key] = model
+        return model
+
+    # ---- 지표 ----
+
+    def snapshot(self) -> Dict[str, Any]:
+        """설정과 누적 지표 (실행 요약의 "call_policy")"""
+        p95 = self.latency_p95()
+        with self._lock:
+            return {
+                "timeout": self.timeout,
+                "retries": self.retries,
+                "retry_budget": self.retry_budget,
+                "hedge": self.hedge,
+                "hedge_backend": self.hedge_backend,
+                "calls": self.calls,
+                "attempts": self.attempts,
+                "retried": self.retried,
+                "timeouts": self.timeouts,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "hedges_skipped": self.hedges_skipped,
+                "failures": self.failures,
+                "budget_exhausted": self.budget_exhausted,
+                "latency_p95": round(p95, 4) if p95 is not None else None
+            }
+
+
+def describe_call_policy(snapshot: Dict[str, Any]) -> str:
+    """호출 정책 지표 한 줄 (실행 로그용)"""
+    budget = "무제한" if snapshot["retry_budget"] is None else f"{snapshot['retried']}/{snapshot['retry_budget']}"
+    line = (f"호출 {snapshot['calls']:,}회, 재시도 {snapshot['retried']}회 (예산 {budget}), "
+            f"타임아웃 {snapshot['timeouts']}회, 실패 {snapshot['failures']}회")
+    if snapshot["hedge"] is not None:
+        line += f", 헤지 {snapshot['hedged']}회 (먼저 응답 {snapshot['hedge_wins']}회, 한도로 생략 {snapshot['hedges_skipped']}회)"
+    return line
+
+
+def parse_hedge(value: Optional[str]) -> Union[str, float, None]:
+    """--hedge 값 (p95 또는 0보다 큰 초)"""
+    if value is None or value == "p95":
+        return value
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise ValueError(f"--hedge는 p95 또는 초여야 합니다: {value}")
+    if seconds <= 0:
+        raise ValueError(f"--hedge는 0보다 커야 합니다: {value}")
+    return seconds
+
+
+def add_call_policy_arguments(parser):
+    """실행기 CLI에 호출 정책 옵션 추가 (--timeout, --retries, --retry-budget, --hedge, --hedge-backend, --hedge-url)"""
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="LLM 호출 1회의 기한 (초, 넘기면 실패/재시도, 기본: 무제한)")
+    parser.add_argument("--retries", type=int, default=0,
+                        help="일시적 오류(타임아웃, 연결 오류, 429/5xx)의 호출당 최대 재시도 수 (기본: 0)")
+    parser.add_argument("--retry-budget", type=int, default=DEFAULT_RETRY_BUDGET,
+                        help=f"실행 전체의 재시도 총 횟수 상한 (기본: {DEFAULT_RETRY_BUDGET})")
+    parser.add_argument("--hedge", type=str, default=None,
+                        help="느린 호출을 헤지 백엔드에 한 번 더 보낼 시점: p95(관측 지연의 p95) 또는 초 "
+                             "(기본: 끔, --hedge-url 또는 --hedge-backend 필요)")
+    parser.add_argument("--hedge-backend", choices=BACKENDS, default=None,
+                        help="헤지 요청 백엔드 (기본: --hedge-url이 있으면 ollama)")
+    parser.add_argument("--hedge-url", type=str, default=None,
+                        help="헤지 요청을 보낼 ollama/record 서버 주소 (예: 두 번째 GPU 서버)")
+
+
+def parse_call_policy_arguments(parser, args) -> Dict[str, Any]:
+    """
+    호출 정책 옵션 검증
+
+    Returns:
+        Dict: 실행기 생성자 키워드 인자 {"call_policy": CallPolicy 또는 None(기본 동작)}
+    """
+    try:
+        hedge = parse_hedge(args.hedge)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.timeout is not None and args.timeout <= 0:
+        parser.error("--timeout은 0보다 커야 합니다")
+    if args.retries < 0 or args.retry_budget < 0:
+        parser.error("--retries와 --retry-budget은 0 이상이어야 합니다")
+    hedge_backend = args.hedge_backend or ("ollama" if args.hedge_url else None)
+    if (hedge_backend or args.hedge_url) and hedge is None:
+        parser.error("--hedge-backend/--hedge-url은 --hedge와 함께 사용해야 합니다")
+    if hedge is not None and hedge_backend is None:
+        parser.error("--hedge는 --hedge-url(두 번째 서버) 또는 --hedge-backend와 함께 사용해야 합니다 "
+                     "(같은 서버에 다시 보내면 부하만 두 배)")
+    if args.hedge_url and hedge_backend not in LIVE_BACKENDS:
+        parser.error("--hedge-url은 --hedge-backend ollama/record에서만 사용할 수 있습니다")
+
+    policy = CallPolicy(
+        timeout=args.timeout, retries=args.retries, retry_budget=args.retry_budget, hedge=hedge,
+        hedge_backend=hedge_backend, hedge_options={"base_url": args.hedge_url} if args.hedge_url else None
+    )
+    return {"call_policy": policy if policy.active else None}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from evaluation.llm_backends import MockChatModel, MockMessage
+
+    parser = argparse.ArgumentParser(description="불안정한 모의 서버로 타임아웃/재시도/헤지 동작 확인")
+    parser.add_argument("--calls", type=int, default=200, help="호출 수 (기본: 200)")
+    parser.add_argument("--fail-rate", type=float, default=0.1, help="연결 오류 비율 (기본: 0.1)")
+    parser.add_argument("--hang-rate", type=float, default=0.03, help="응답이 멈추는 비율 (기본: 0.03)")
+    parser.add_argument("--latency", type=float, default=0.02, help="정상 응답 시간 (초, 기본: 0.02)")
+    add_call_policy_arguments(parser)
+    parser.set_defaults(timeout=1.0, retries=2, hedge="p95", hedge_backend="mock")  # 헤지: 정상 모의 서버
+    args = parser.parse_args()
+    policy = parse_call_policy_arguments(parser, args)["call_policy"] or CallPolicy()
+    policy.backoff_base = 0.01
+
+    class FlakyModel(MockChatModel):
+        """일부 호출은 연결 오류, 일부는 멈춤(꼬리 지연)"""
+
+        def invoke(self, prompt):
+            roll = rng.random()
+            if roll < args.fail_rate:
+                raise ConnectionError("모의 서버 연결 끊김")
+            time.sleep(args.latency * (1 + rng.random()) * (100 if roll > 1 - args.hang_rate else 1))
+            return MockMessage(f"응답: {prompt}")
+
+    rng = random.Random(0)
+    llm = FlakyModel()
+    start = time.perf_counter()
+    failed = 0
+    for i in range(args.calls):
+        try:
+            policy.invoke(llm, f"질문 {i}")
+        except LLMCallError:
+            failed += 1
+    print(f"{args.calls}회 호출, {time.perf_counter() - start:.1f}초, 최종 실패 {failed}회")
+    print(describe_call_policy(policy.snapshot()))
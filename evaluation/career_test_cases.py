@@ -38,8 +38,10 @@
 from typing import Dict, List
 from dataclasses import dataclass, field
 
+from evaluation.records import intern_fields
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CareerTestCase:
     """취업 준비 테스트 케이스"""
     id: str
@@ -52,6 +54,10 @@ class CareerTestCase:
     expected_issues: List[str]  # 예상되는 문제점
     difficulty: str  # easy, medium, hard
 
+    def __post_init__(self):
+        # 값 종류가 적은 범주형 필드는 intern하여 케이스 간 공유
+        intern_fields(self, ("category", "subcategory", "job_position", "experience_level", "company_type", "difficulty"))
+
 
 # ============================================================================
 # 이력서 테스트 케이스 (36개)
@@ -617,22 +623,26 @@ def get_all_career_test_cases() -> List[CareerTestCase]:
 
 def get_resume_test_cases() -> List[CareerTestCase]:
     """이력서 테스트 케이스만 반환"""
-    return [c for c in get_all_career_test_cases() if c.category == "resume"]
+    from evaluation.catalog import get_catalog
+    return get_catalog().query(domain="career", category="resume")
 
 
 def get_cover_letter_test_cases() -> List[CareerTestCase]:
     """자기소개서 테스트 케이스만 반환"""
-    return [c for c in get_all_career_test_cases() if c.category == "cover_letter"]
+    from evaluation.catalog import get_catalog
+    return get_catalog().query(domain="career", category="cover_letter")
 
 
 def get_interview_test_cases() -> List[CareerTestCase]:
     """면접 테스트 케이스만 반환"""
-    return [c for c in get_all_career_test_cases() if c.category == "interview"]
+    from evaluation.catalog import get_catalog
+    return get_catalog().query(domain="career", category="interview")
 
 
 def get_test_cases_by_difficulty(difficulty: str) -> List[CareerTestCase]:
     """난이도별 테스트 케이스 반환"""
-    return [c for c in get_all_career_test_cases() if c.difficulty == difficulty]
+    from evaluation.catalog import get_catalog
+    return get_catalog().query(domain="career", difficulty=difficulty)
 
 
 # ============================================================================
@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+테스트 케이스 카탈로그 (Test Case Catalog)
+================================================================================
+
+## 이 모듈의 목적
+네 도메인(business, career, development, data_analysis)과 기초 스위트(basic)의
+테스트 케이스를 하나의 카탈로그로 모으고, **속성별 해시 인덱스를 한 번만 만들어**
+복합 조건 조회를 빠르게 처리합니다.
+
+## 왜 필요한가?
+- 기존 getter는 호출할 때마다 모듈 리스트를 이어 붙이고 전체를 선형 탐색
+- 도메인마다 지원하는 필터가 달라 "개발 도메인의 hard 난이도 python 케이스" 같은
+  복합 조회를 하려면 직접 루프를 작성해야 함
+
+## 인덱스 구조
+- 인덱스 필드: domain, category, subcategory, difficulty, industry, language
+- 필드 → 값 → 케이스 위치 목록 (추가 순서 유지)
+- 복합 조회는 가장 작은 위치 목록에서 시작해 나머지 조건을 레코드 키로 확인
+- 같은 조건의 반복 조회는 결과 캐시에서 바로 반환 (케이스 추가 시 캐시 무효화,
+  최근 사용 순으로 QUERY_CACHE_SIZE개까지만 보관)
+
+## 사용 예시
+
+```python
+from evaluation.catalog import get_catalog
+
+catalog = get_catalog()
+cases = catalog.query(domain="development", difficulty="hard", language="python")
+emails = catalog.query(domain="business", subcategory=["formal", "apology"])
+print(catalog.values("industry"))
+```
+
+## 대용량 벤치마크
+```bash
+python -m evaluation.catalog --bench 100000
+```
+================================================================================
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+
+INDEX_FIELDS = ("domain", "category", "subcategory", "difficulty", "industry", "language")
+
+# 기초 스위트(TestSuite) 케이스의 도메인 이름
+BASIC_DOMAIN = "basic"
+
+# 조회 결과 캐시 최대 항목 수 (넘으면 가장 오래 쓰이지 않은 조건부터 제거)
+QUERY_CACHE_SIZE = 1024
+
+
+class CaseCatalog:
+    """
+    속성별 해시 인덱스를 가진 테스트 케이스 모음
+
+    Attributes:
+        cases: 추가된 케이스 (추가 순서)
+        index_fields: 인덱스를 만드는 속성 이름
+        query_cache_size: 조회 결과 캐시 최대 항목 수 (0이면 캐시 안 함)
+    """
+
+    def __init__(self, index_fields: Sequence[str] = INDEX_FIELDS, query_cache_size: int = QUERY_CACHE_SIZE):
+        self.index_fields = tuple(index_fields)
+        self.query_cache_size = query_cache_size
+        self.cases: List[Any] = []
+        self._keys: List[Tuple] = []  # 케이스별 인덱스 필드 값 (index_fields 순서)
+        self._index: Dict[str, Dict[Any, List[int]]] = {field: {} for field in self.index_fields}
+        self._by_id: Dict[str, int] = {}
+        self._query_cache: "OrderedDict[FrozenSet, List[Any]]" = OrderedDict()
+
+    def __len__(self):
+        return len(self.cases)
+
+    # ------------------------------------------------------------------
+    # 추가
+    # ------------------------------------------------------------------
+
+    def add(self, case: Any, domain: Optional[str] = None) -> int:
+        """
+        케이스 1개 추가
+
+        Args:
+            case: 테스트 케이스 (속성이 없는 필드는 None으로 색인)
+            domain: 도메인 이름 (케이스에 domain 속성이 없을 때 사용)
+
+        Returns:
+            int: 카탈로그 내 위치
+        """
+        pos = len(self.cases)
+        key = tuple(
+            domain if field == "domain" and domain is not None else getattr(case, field, None)
+            for field in self.index_fields
+        )
+
+        self.cases.append(case)
+        self._keys.append(key)
+        for field, value in zip(self.index_fields, key):
+            self._index[field].setdefault(value, []).append(pos)
+
+        case_id = getattr(case, "id", None)
+        if case_id is not None:
+            self._by_id[f"{key[0]}:{case_id}" if "domain" in self.index_fields else case_id] = pos
+
+        self._query_cache.clear()
+        return pos
+
+    def add_many(self, cases: Iterable[Any], domain: Optional[str] = None) -> int:
+        """여러 케이스 추가, 추가된 개수 반환"""
+        count = 0
+        for case in cases:
+            self.add(case, domain=domain)
+            count += 1
+        return count
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _positions(self, field: str, value: Any) -> List[int]:
+        """단일 조건의 위치 목록 (값이 목록이면 OR)"""
+        postings = self._index[field]
+        if isinstance(value, (list, tuple, set, frozenset)):
+            merged = [pos for v in value for pos in postings.get(v, ())]
+            return sorted(set(merged)) if len(value) > 1 else merged
+        return postings.get(value, [])
+
+    def query(self, **criteria) -> List[Any]:
+        """
+        복합 조건 조회 (모든 조건 AND, 한 조건 안의 여러 값은 OR)
+
+        Args:
+            **criteria: 인덱스 필드 = 값 또는 값 목록
+                        (예: domain="business", difficulty=["medium", "hard"])
+
+        Returns:
+            List: 조건을 만족하는 케이스 (추가 순서)
+        """
+        for field in criteria:
+            if field not in self._index:
+                raise KeyError(f"인덱스가 없는 필드: {field} (가능: {', '.join(self.index_fields)})")
+
+        # 값 목록은 OR이라 순서/중복이 무관하므로 frozenset (정렬하지 않아 타입이 섞여도 됨)
+        cache_key = frozenset(
+            (field, frozenset(value) if isinstance(value, (list, tuple, set, frozenset)) else value)
+            for field, value in criteria.items()
+        )
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            self._query_cache.move_to_end(cache_key)
+            return list(cached)
+
+        if not criteria:
+            result = list(self.cases)
+        else:
+            # 가장 선택도가 높은(목록이 짧은) 조건에서 시작
+            candidates = sorted(
+                ((self._positions(field, value), field, value) for field, value in criteria.items()),
+                key=lambda item: len(item[0])
+            )
+            positions, _, _ = candidates[0]
+            checks = []
+            for _, field, value in candidates[1:]:
+                allowed = set(value) if isinstance(value, (list, tuple, set, frozenset)) else {value}
+                checks.append((self.index_fields.index(field), allowed))
+
+            result = [
+                self.cases[pos] for pos in positions
+                if all(self._keys[pos][i] in allowed for i, allowed in checks)
+            ]
+
+        if self.query_cache_size > 0:
+            self._query_cache[cache_key] = result
+            if len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+        return list(result)
+
+    def count(self, **criteria) -> int:
+        """조건을 만족하는 케이스 수"""
+        if len(criteria) == 1:
+            (field, value), = criteria.items()
+            if field in self._index and not isinstance(value, (list, tuple, set, frozenset)):
+                return len(self._index[field].get(value, ()))
+        return len(self.query(**criteria))
+
+    def values(self, field: str) -> List[Any]:
+        """인덱스 필드의 고유값 목록 (None 제외, 처음 등장한 순서)"""
+        return [value for value in self._index[field] if value is not None]
+
+    def get(self, case_id: str, domain: Optional[str] = None) -> Optional[Any]:
+        """ID로 케이스 조회 (domain 인덱스가 있으면 domain 필요)"""
+        key = f"{domain}:{case_id}" if "domain" in self.index_fields else case_id
+        pos = self._by_id.get(key)
+        return self.cases[pos] if pos is not None else None
+
+
+# ============================================================================
+# 전체 코퍼스 카탈로그 (최초 호출 시 1회 구성)
+# ============================================================================
+
+_CATALOG: Optional[CaseCatalog] = None
+
+
+def build_catalog() -> CaseCatalog:
+    """네 도메인 + 기초 스위트의 모든 케이스로 카탈로그 구성"""
+    from evaluation.business_test_cases import EMAIL_TEST_CASES, REPORT_TEST_CASES
+    from evaluation.career_test_cases import get_all_career_test_cases
+    from evaluation.development_test_cases import CODE_REVIEW_TEST_CASES, DOCUMENTATION_TEST_CASES
+    from evaluation.data_analysis_test_cases import get_all_data_analysis_test_cases
+    from evaluation.test_cases import get_all_test_suites
+
+    catalog = CaseCatalog()
+    catalog.add_many(EMAIL_TEST_CASES + REPORT_TEST_CASES, domain="business")
+    catalog.add_many(get_all_career_test_cases(), domain="career")
+    catalog.add_many(CODE_REVIEW_TEST_CASES + DOCUMENTATION_TEST_CASES, domain="development")
+    catalog.add_many(get_all_data_analysis_test_cases(), domain="data_analysis")
+    for suite in get_all_test_suites().values():
+        catalog.add_many(suite.cases, domain=BASIC_DOMAIN)
+    return catalog
+
+
+def get_catalog() -> CaseCatalog:
+    """전체 코퍼스 카탈로그 (프로세스당 1회 구성 후 재사용)"""
+    global _CATALOG
+    if _CATALOG is None:
+        _CATALOG = build_catalog()
+    return _CATALOG
+
+
+def reset_catalog():
+    """카탈로그 캐시 초기화 (모듈 리스트를 직접 수정한 경우)"""
+    global _CATALOG
+    _CATALOG = None
+
+
+# ============================================================================
+# 대용량 벤치마크
+# ============================================================================
+
+def run_benchmark(n_cases: int = 100_000, seed: int = 42, repeat: int = 200):
+    """합성 케이스 n개로 구성/조회 시간을 선형 탐색과 비교"""
+    import random
+    import time
+    from types import SimpleNamespace
+
+    rng = random.Random(seed)
+    domains = ["business", "career", "development", "data_analysis"]
+    categories = [f"cat{i}" for i in range(12)]
+    subcategories = [f"sub{i}" for i in range(40)]
+    difficulties = ["easy", "medium", "hard"]
+    industries = [f"industry{i}" for i in range(25)]
+    languages = ["python", "javascript", "go", "java", "rust", "typescript", None]
+
+    cases = [
+        SimpleNamespace(
+            id=f"SYN-{i:07d}",
+            domain=rng.choice(domains),
+            category=rng.choice(categories),
+            subcategory=rng.choice(subcategories),
+            difficulty=rng.choice(difficulties),
+            industry=rng.choice(industries),
+            language=rng.choice(languages),
+        )
+        for i in range(n_cases)
+    ]
+
+    start = time.perf_counter()
+    catalog = CaseCatalog()
+    catalog.add_many(cases)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    queries = [
+        {"domain": rng.choice(domains), "difficulty": rng.choice(difficulties), "language": rng.choice(languages[:-1])}
+        for _ in range(repeat)
+    ]
+
+    def linear(criteria):
+        return [c for c in cases if all(getattr(c, f) == v for f, v in criteria.items())]
+
+    start = time.perf_counter()
+    for q in queries[:20]:
+        expected = linear(q)
+    linear_ms = (time.perf_counter() - start) * 1000 / 20
+
+    catalog._query_cache.clear()
+    start = time.perf_counter()
+    for q in queries:
+        result = catalog.query(**q)
+    indexed_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    start = time.perf_counter()
+    for q in queries:
+        catalog.query(**q)
+    cached_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    assert catalog.query(**queries[-1]) == linear(queries[-1])
+
+    print("=" * 60)
+    print(f"카탈로그 벤치마크 (합성 케이스 {n_cases:,}개)")
+    print("=" * 60)
+    print(f"인덱스 구성: {build_ms:,.1f}ms")
+    print(f"복합 조회 (domain+difficulty+language):")
+    print(f"  - 선형 탐색: {linear_ms:.2f}ms/회")
+    print(f"  - 인덱스 조회: {indexed_ms:.3f}ms/회 (마지막 결과 {len(result):,}개)")
+    print(f"  - 캐시 적중: {cached_ms:.4f}ms/회")
+
+
+def print_catalog_stats():
+    """전체 코퍼스 카탈로그 통계 출력"""
+    catalog = get_catalog()
+    print("=" * 60)
+    print(f"테스트 케이스 카탈로그: 총 {len(catalog)}개")
+    print("=" * 60)
+    for domain in catalog.values("domain"):
+        print(f"[{domain}] {catalog.count(domain=domain)}개")
+        for field in ("category", "difficulty"):
+            counts = {value: catalog.count(domain=domain, **{field: value}) for value in catalog.values(field)}
+            print(f"  {field}: {{{', '.join(f'{k}: {v}' for k, v in counts.items() if v)}}}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="테스트 케이스 카탈로그")
+    parser.add_argument("--bench", type=int, default=None, help="합성 케이스 N개로 벤치마크")
+    args = parser.parse_args()
+
+    if args.bench:
+        run_benchmark(args.bench)
+    else:
+        print_catalog_stats()
@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+적응형 동시 호출 제어 (Adaptive Concurrency Limiter)
+================================================================================
+
+## 이 모듈의 목적
+모든 LLM 호출 앞에서 **동시에 진행 중인 요청 수(in-flight)**를 제한하고,
+관측한 응답 지연/처리량/오류로 한도를 자동 조절합니다.
+
+## 왜 필요한가?
+- 고정 동시성이 너무 낮으면: 서버가 놀고 실행이 길어짐
+- 너무 높으면: Ollama 큐 대기, 컨텍스트 교체(thrash), CPU 서버에서 타임아웃
+- 적정값은 모델/서버/프롬프트 길이마다 다르고 실행 중에도 바뀜
+
+## 조절 방식 (AIMD + 지연 기울기)
+호출이 window개(최소 현재 한도의 2배) 끝날 때마다 평균 지연과 처리량을 계산합니다.
+
+| 관측 | 조치 |
+|------|------|
+| 오류 발생 | 곱셈 감소 (한도 × backoff) - 창을 기다리지 않고 즉시 |
+| 평균 지연 > 무부하 지연 × tolerance | 기울기 감소 (한도 × 무부하 지연 × tolerance / 평균 지연, 최소 1 감소) |
+| 한도까지 채워 호출했고 처리량이 min_gain 이상 증가 | 덧셈 증가 (한도 + 1) |
+| 그 외 (처리량 정체, 한도까지 채우지 못함) | 유지 |
+
+무부하 지연은 관측한 창 평균 지연의 최솟값이며, 한도가 최소일 때의 창으로 다시 측정합니다
+(프롬프트가 길어지는 등 기준 자체가 바뀌는 경우).
+
+## 노출하는 지표
+- snapshot(): 현재/최대 한도, 호출/오류 수, 평균/최대 대기 시간, 무부하 지연, 한도 변경 기록
+- 실행 요약의 "concurrency" 항목 (동시성 > 1일 때)
+- 트레이스: 대기 구간 "queue_wait" + 한도/진행 중 호출 카운터 "concurrency"
+
+## 사용 예시
+
+```python
+from evaluation.concurrency import create_limiter, ordered_map
+
+limiter = create_limiter("auto", max_concurrency=8)
+
+def run(case):
+    with limiter.slot():
+        return llm.invoke(build_prompt(case)).content
+
+for response in ordered_map(run, cases, limiter.max_limit):
+    ...
+print(limiter.snapshot()["limit"])
+```
+
+```bash
+python scripts/run_business_experiments.py v4 --concurrency auto --max-concurrency 6
+python -m evaluation.engine career --concurrency 4
+```
+================================================================================
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from evaluation import tracing
+
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_WINDOW = 8
+DEFAULT_TOLERANCE = 1.5
+DEFAULT_BACKOFF = 0.7
+DEFAULT_MIN_GAIN = 0.05
+HISTORY_LIMIT = 200  # snapshot에 남길 최근 한도 변경 수
+
+
+class AdaptiveLimiter:
+    """
+    지연/처리량/오류 기반 동시 호출 한도
+
+    min_limit == max_limit이면 조절하지 않는 고정 한도로 동작합니다 (대기/지표 기록은 동일).
+
+    Attributes:
+        limit: 현재 동시 호출 한도
+        min_limit / max_limit: 한도 범위
+        in_flight: 진행 중인 호출 수
+        calls / errors: 끝난 호출 수 / 그중 예외로 끝난 수
+        history: 한도 변경 기록 [{"calls", "limit", "reason"}] (최근 HISTORY_LIMIT개)
+    """
+
+    def __init__(
+        self,
+        initial: int = 1,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_MAX_CONCURRENCY,
+        window: int = DEFAULT_WINDOW,
+        tolerance: float = DEFAULT_TOLERANCE,
+        backoff: float = DEFAULT_BACKOFF,
+        min_gain: float = DEFAULT_MIN_GAIN
+    ):
+        """
+        Args:
+            initial: 시작 한도
+            min_limit: 최소 한도 (1 이상)
+            max_limit: 최대 한도 (동시 실행 워커 수)
+            window: 조절 판단에 쓰는 최소 호출 수 (실제 창은 max(window, 한도 × 2))
+            tolerance: 무부하 지연 대비 허용 배율 (넘으면 감소)
+            backoff: 오류 시 곱셈 감소 비율
+            min_gain: 증가를 계속할 최소 처리량 개선 비율
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(f"한도 범위가 올바르지 않습니다: {min_limit}~{max_limit}")
+        if tolerance <= 1 or not 0 < backoff < 1:
+            raise ValueError("tolerance는 1보다 크고 backoff는 0과 1 사이여야 합니다")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = min(max(initial, min_limit), max_limit)
+        self.window = window
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.min_gain = min_gain
+
+        self.in_flight = 0
+        self.calls = 0
+        self.errors = 0
+        self.peak_limit = self.limit
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.history: deque = deque(maxlen=HISTORY_LIMIT)
+        self._baseline: Optional[float] = None  # 무부하 지연 추정 (초)
+        self._last_throughput: Optional[float] = None
+        self._cond = threading.Condition()
+        self._reset_window(time.perf_counter())
+
+    @property
+    def adaptive(self) -> bool:
+        """한도를 조절하는지 (False면 고정 한도)"""
+        return self.min_limit < self.max_limit
+
+    def _reset_window(self, now: float):
+        self._w_start = now
+        self._w_count = 0
+        self._w_errors = 0
+        self._w_latency = 0.0
+        self._w_peak = self.in_flight  # 창 동안 최대 진행 중 호출 수 (한도까지 채웠는지)
+
+    # ---- 호출 감싸기 ----
+
+    def acquire(self) -> float:
+        """
+        한도 안에 자리가 날 때까지 대기 후 호출 1개 시작
+
+        Returns:
+            float: 대기 시간 (초)
+        """
+        start = time.perf_counter()
+        with tracing.span("queue_wait", cat="llm") as span, self._cond:
+            while self.in_flight >= self.limit:
+                self._cond.wait()
+            self.in_flight += 1
+            if self.in_flight > self._w_peak:
+                self._w_peak = self.in_flight
+            waited = time.perf_counter() - start
+            self.total_wait += waited
+            if waited > self.max_wait:
+                self.max_wait = waited
+            span.set(limit=self.limit, in_flight=self.in_flight)
+        return waited
+
+    def try_acquire(self) -> bool:
+        """
+        자리가 있으면 기다리지 않고 호출 1개 시작 (헤지처럼 자리가 없으면 보내지 않는 추가 요청용)
+
+        Returns:
+            bool: 자리를 받았는지 (True면 끝날 때 release 호출 필요)
+        """
+        with self._cond:
+            if self.in_flight >= self.limit:
+                return False
+            self.in_flight += 1
+            if self.in_flight > self._w_peak:
+                self._w_peak = self.in_flight
+            return True
+
+    def release(self, latency: float, ok: bool = True):
+        """
+        호출 1개 종료 기록 (창이 차거나 오류면 한도 조절)
+
+        Args:
+            latency: 호출 시간 (초, 대기 시간 제외)
+            ok: 예외 없이 끝났는지
+        """
+        with self._cond:
+            self.in_flight -= 1
+            self.calls += 1
+            self._w_count += 1
+            self._w_latency += latency
+            if not ok:
+                self.errors += 1
+                self._w_errors += 1
+            if self.adaptive and (not ok or self._w_count >= max(self.window, self.limit * 2)):
+                self._adjust(time.perf_counter())
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """with 블록 = LLM 호출 1개 (대기 → 호출 → 지연/오류 기록)"""
+        self.acquire()
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.release(time.perf_counter() - start, ok)
+
+    # ---- 한도 조절 ----
+
+    def _adjust(self, now: float):
+        """창 1개의 관측으로 한도 조절 (self._cond 안에서 호출)"""
+        limit = self.limit
+        elapsed = max(now - self._w_start, 1e-9)
+        latency = self._w_latency / self._w_count
+        throughput = self._w_count / elapsed
+
+        if self._w_errors:
+            new_limit, reason = int(limit * self.backoff), "error"
+        else:
+            if self._baseline is None or latency < self._baseline or limit == self.min_limit:
+                self._baseline = latency
+            allowed = self._baseline * self.tolerance
+            if latency > allowed:
+                new_limit, reason = min(int(limit * allowed / latency), limit - 1), "latency"
+            elif self._w_peak >= limit and (
+                self._last_throughput is None or throughput >= self._last_throughput * (1 + self.min_gain)
+            ):
+                new_limit, reason = limit + 1, "throughput"
+            else:
+                new_limit, reason = limit, None
+
+        self._last_throughput = throughput
+        new_limit = min(max(new_limit, self.min_limit), self.max_limit)
+        if new_limit != limit:
+            self.limit = new_limit
+            self.peak_limit = max(self.peak_limit, new_limit)
+            self.history.append({"calls": self.calls, "limit": new_limit, "reason": reason})
+            tracing.counter("concurrency", limit=new_limit, in_flight=self.in_flight)
+        self._reset_window(now)
+
+    # ---- 지표 ----
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 한도와 누적 지표 (실행 요약에 기록)"""
+        with self._cond:
+            return {
+                "mode": "auto" if self.adaptive else "fixed",
+                "limit": self.limit,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "peak_limit": self.peak_limit,
+                "in_flight": self.in_flight,
+                "calls": self.calls,
+                "errors": self.errors,
+                "avg_queue_wait": round(self.total_wait / self.calls, 4) if self.calls else 0.0,
+                "max_queue_wait": round(self.max_wait, 4),
+                "latency_baseline": round(self._baseline, 4) if self._baseline is not None else None,
+                "history": list(self.history)
+            }
+
+
+def describe_limiter(snapshot: Dict[str, Any]) -> str:
+    """한도 요약 한 줄 (실행 로그용)"""
+    if snapshot["mode"] == "fixed":
+        head = f"고정 {snapshot['limit']}"
+    else:
+        head = (f"자동 {snapshot['min_limit']}~{snapshot['max_limit']}, 현재 {snapshot['limit']} "
+                f"(최대 {snapshot['peak_limit']}, 변경 {len(snapshot['history'])}회)")
+    return (f"{head}, 호출 {snapshot['calls']:,}회 (오류 {snapshot['errors']}), "
+            f"평균 대기 {snapshot['avg_queue_wait']:.2f}초")
+
+
+def create_limiter(concurrency: Union[int, str] = 1, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> AdaptiveLimiter:
+    """
+    동시성 설정으로 한도 생성
+
+    Args:
+        concurrency: 고정 동시 호출 수 (1이면 기존 순차 실행) 또는 "auto"
+        max_concurrency: "auto"일 때 최대 한도
+
+    Returns:
+        AdaptiveLimiter: "auto"면 1에서 시작해 1~max_concurrency 사이에서 조절, 정수면 고정
+    """
+    if concurrency == "auto":
+        return AdaptiveLimiter(initial=1, min_limit=1, max_limit=max_concurrency)
+    return AdaptiveLimiter(initial=concurrency, min_limit=concurrency, max_limit=concurrency)
+
+
+def ordered_map(func: Callable[[Any], Any], items: Iterable, workers: int = 1) -> Iterator:
+    """
+    items에 func를 적용한 결과를 입력 순서대로 반환 (workers > 1이면 스레드로 동시 실행)
+
+    미리 제출하는 작업은 workers × 2개로 제한하므로 합성 코퍼스처럼 큰 입력도 메모리에 쌓이지 않습니다.
+
+    Args:
+        func: 입력 1개를 처리하는 함수 (LLM 호출은 limiter.slot() 안에서)
+        items: 입력 (순서대로 소비)
+        workers: 동시 실행 스레드 수 (보통 limiter.max_limit)
+
+    Yields:
+        func(item) 결과 (입력 순서)
+    """
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm")
+    pending: deque = deque()
+    iterator = iter(items)
+    try:
+        for item in iterator:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)  # 중단/오류 시 대기 중인 작업은 취소
+
+
+def completion_map(func: Callable[[Any], Any], items: Iterable, workers: int = 1) -> Iterator[Tuple[int, Any]]:
+    """
+    items에 func를 적용한 결과를 끝난 순서대로 (입력 인덱스, 결과)로 반환
+
+    ordered_map처럼 미리 제출하는 작업은 workers × 2개로 제한하지만, 맨 앞의 오래 걸리는 작업을
+    기다리지 않고 하나가 끝날 때마다 다음 입력을 제출하므로 워커가 입력 순서대로 계속 배정됩니다
+    (evaluation.scheduling의 최장 예상 우선 순서를 그대로 유지).
+
+    Args:
+        func: 입력 1개를 처리하는 함수
+        items: 입력 (순서대로 제출)
+        workers: 동시 실행 스레드 수
+
+    Yields:
+        (입력 인덱스, func(item) 결과) - 끝난 순서 (동시에 끝나면 입력 순서)
+    """
+    if workers <= 1:
+        for index, item in enumerate(items):
+            yield index, func(item)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm")
+    pending: Dict[Future, int] = {}
+    try:
+        for index, item in enumerate(items):
+            pending[executor.submit(func, item)] = index
+            if len(pending) >= workers * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=pending.get):
+                    yield pending.pop(future), future.result()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=pending.get):
+                yield pending.pop(future), future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def parse_concurrency(value: str) -> Union[int, str]:
+    """--concurrency 값 ("auto" 또는 1 이상의 정수)"""
+    if value == "auto":
+        return value
+    try:
+        concurrency = int(value)
+    except ValueError:
+        raise ValueError(f"--concurrency는 auto 또는 정수여야 합니다: {value}")
+    if concurrency < 1:
+        raise ValueError(f"--concurrency는 1 이상이어야 합니다: {value}")
+    return concurrency
+
+
+def add_concurrency_arguments(parser):
+    """실행기 CLI에 동시 호출 옵션 추가 (--concurrency, --max-concurrency)"""
+    parser.add_argument("--concurrency", type=str, default="1",
+                        help="동시 LLM 호출 수: 정수(고정) 또는 auto(지연/처리량/오류로 자동 조절) (기본: 1, 순차 실행)")
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help=f"--concurrency auto의 최대 한도 (기본: {DEFAULT_MAX_CONCURRENCY})")
+
+
+def parse_concurrency_arguments(parser, args) -> Dict[str, Any]:
+    """
+    동시 호출 옵션 검증
+
+    Returns:
+        Dict: 실행기 생성자 키워드 인자 {"concurrency", "max_concurrency"}
+    """
+    try:
+        concurrency = parse_concurrency(args.concurrency)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.max_concurrency < 1:
+        parser.error("--max-concurrency는 1 이상이어야 합니다")
+    return {"concurrency": concurrency, "max_concurrency": args.max_concurrency}
+
+
+if __name__ == "__main__":
+    import argparse
+    import random
+
+    parser = argparse.ArgumentParser(description="모의 서버로 한도 조절 동작 확인 (병렬 처리 슬롯이 정해진 서버)")
+    parser.add_argument("--slots", type=int, default=3, help="모의 서버가 동시에 처리하는 요청 수 (기본: 3)")
+    parser.add_argument("--latency", type=float, default=0.05, help="요청 1개 처리 시간(초) (기본: 0.05)")
+    parser.add_argument("--calls", type=int, default=400, help="호출 수 (기본: 400)")
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY)
+    args = parser.parse_args()
+
+    server = threading.Semaphore(args.slots)  # 슬롯을 넘는 요청은 서버 안에서 큐 대기 (지연 증가)
+    limiter = create_limiter("auto", args.max_concurrency)
+
+    def call(i: int) -> float:
+        with limiter.slot():
+            with server:
+                time.sleep(args.latency * random.uniform(0.8, 1.2))
+        return limiter.limit
+
+    start = time.perf_counter()
+    limits: List[int] = list(ordered_map(call, range(args.calls), limiter.max_limit))
+    elapsed = time.perf_counter() - start
+    print(f"서버 슬롯 {args.slots}개, 호출 {args.calls}회, {elapsed:.2f}초 ({args.calls / elapsed:.1f}회/초)")
+    print(f"한도: {describe_limiter(limiter.snapshot())}")
+    print(f"한도 변화: {' → '.join(str(entry['limit']) for entry in limiter.history)}")
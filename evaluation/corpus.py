@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+테스트 케이스 코퍼스 로더 (Corpus Loader)
+================================================================================
+
+## 이 모듈의 목적
+도메인 테스트 케이스를 Python 리터럴 대신 **JSONL 데이터 파일**(evaluation/data/)로
+보관하고, 필요한 그룹만 처음 접근할 때 파싱합니다.
+
+## 왜 필요한가?
+- 기존 모듈은 import 시점에 모든 dataclass 인스턴스를 생성
+  (케이스 10개만 쓰는 실행도 수천 줄 리터럴을 전부 평가)
+- 케이스가 늘어나면 import 시간과 메모리가 코퍼스 크기에 비례해 증가
+
+## 파일 형식
+```
+{"format": 1, "groups": {"EMAIL_TEST_CASES": [0, 54], "REPORT_TEST_CASES": [54, 108]}}
+{"id": "EMAIL-001", "category": "email", ...}
+...
+```
+- 첫 줄은 헤더 (그룹 이름 → [시작, 끝) 레코드 범위)
+- 이후 한 줄에 레코드 1개 (그룹 순서대로 저장)
+- .jsonl.gz도 지원 (압축 해제 후 같은 방식으로 처리)
+
+## 지연 로딩
+- 파일은 첫 조회 때 열고, 줄 시작 위치만 색인 (레코드는 아직 파싱하지 않음)
+- MMAP_THRESHOLD 이상인 비압축 파일은 mmap으로 열어 필요한 줄만 페이지 인
+- 그룹을 처음 요청하면 해당 범위의 줄만 파싱하여 dataclass로 변환하고 캐시
+  (같은 그룹은 항상 같은 리스트 객체를 반환 → 기존 모듈 리스트와 동일한 동작)
+- 모든 그룹을 파싱하면 원본 버퍼(또는 mmap)를 해제
+- 속성 조회용 카탈로그(catalog)는 이 파일의 케이스만 색인 (다른 도메인 코퍼스는 로드하지 않음)
+
+## 사용 예시
+
+```python
+from evaluation.corpus import CorpusFile
+
+corpus = CorpusFile("business.jsonl", BusinessTestCase)
+emails = corpus.group("EMAIL_TEST_CASES")
+```
+
+## 코퍼스 통계
+```bash
+python -m evaluation.corpus
+```
+================================================================================
+"""
+
+import json
+import mmap
+import os
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from evaluation.catalog import CaseCatalog
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+CORPUS_FORMAT = 1
+
+# 이 크기 이상인 비압축 파일은 전체를 읽지 않고 mmap으로 연다
+MMAP_THRESHOLD = 1 << 20
+
+
+class CorpusFile:
+    """
+    그룹 단위로 지연 로딩되는 JSONL 코퍼스 파일
+
+    Attributes:
+        path: 데이터 파일 경로
+        factory: 레코드(dict) → 테스트 케이스 변환 함수 (보통 dataclass 자체)
+    """
+
+    def __init__(self, path: str, factory: Callable[..., Any]):
+        self.path = path if os.path.isabs(path) else os.path.join(DATA_DIR, path)
+        self.factory = factory
+        self._buffer = None      # bytes 또는 mmap
+        self._offsets: List[int] = []  # 레코드별 줄 시작 위치 (마지막은 끝 위치)
+        self._header: Optional[Dict] = None
+        self._groups: Dict[str, List[Any]] = {}
+        self._catalog: Optional[CaseCatalog] = None
+
+    # ------------------------------------------------------------------
+    # 파일 열기 / 색인
+    # ------------------------------------------------------------------
+
+    def _open(self):
+        """파일을 열고 헤더와 줄 위치만 읽음 (레코드 파싱 없음)"""
+        if self._header is not None:
+            return
+
+        if self.path.endswith(".gz"):
+            import gzip
+            with gzip.open(self.path, "rb") as f:
+                buffer = f.read()
+        elif os.path.getsize(self.path) >= MMAP_THRESHOLD:
+            with open(self.path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            with open(self.path, "rb") as f:
+                buffer = f.read()
+
+        header_end = buffer.find(b"\n")
+        header = json.loads(buffer[:header_end])
+        if header.get("format") != CORPUS_FORMAT:
+            raise ValueError(f"지원하지 않는 코퍼스 형식: {self.path} (format={header.get('format')})")
+
+        offsets = [header_end + 1]
+        pos = buffer.find(b"\n", header_end + 1)
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = buffer.find(b"\n", pos + 1)
+        if offsets[-1] < len(buffer):
+            offsets.append(len(buffer))  # 마지막 줄에 개행이 없는 경우
+
+        self._buffer = buffer
+        self._offsets = offsets
+        self._header = header
+
+    @property
+    def group_names(self) -> List[str]:
+        """파일에 저장된 그룹 이름 (저장 순서)"""
+        self._open()
+        return list(self._header["groups"])
+
+    def __len__(self):
+        self._open()
+        return max((end for _, end in self._header["groups"].values()), default=0)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _release(self):
+        """모든 그룹을 파싱한 뒤 원본 버퍼와 줄 위치 해제"""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = None
+        self._offsets = []
+
+    def record(self, position: int) -> Dict:
+        """레코드 1개를 dict로 파싱 (캐시하지 않음)"""
+        self._open()
+        if self._buffer is None:
+            raise RuntimeError(f"모든 그룹을 로드한 뒤에는 개별 레코드를 읽을 수 없음: {self.path}")
+        start, end = self._offsets[position], self._offsets[position + 1]
+        return json.loads(self._buffer[start:end])
+
+    def group(self, name: str) -> List[Any]:
+        """
+        그룹의 테스트 케이스 목록 (처음 요청할 때만 파싱)
+
+        Args:
+            name: 그룹 이름 (예: "EMAIL_TEST_CASES")
+
+        Returns:
+            List: 테스트 케이스 목록 (호출할 때마다 같은 리스트 객체)
+        """
+        cases = self._groups.get(name)
+        if cases is None:
+            self._open()
+            if name not in self._header["groups"]:
+                raise KeyError(f"{os.path.basename(self.path)}에 없는 그룹: {name}")
+            start, end = self._header["groups"][name]
+            cases = [self.factory(**self.record(pos)) for pos in range(start, end)]
+            self._groups[name] = cases
+            if len(self._groups) == len(self._header["groups"]):
+                self._release()
+        return cases
+
+    def all(self) -> List[Any]:
+        """모든 그룹을 저장 순서대로 이어 붙인 새 리스트"""
+        return [case for name in self.group_names for case in self.group(name)]
+
+    def catalog(self, domain: str) -> CaseCatalog:
+        """
+        이 파일의 케이스만 색인한 카탈로그 (처음 호출할 때 1회 구성)
+
+        서브카테고리/언어처럼 그룹과 일치하지 않는 속성 조회용입니다. 전체 코퍼스 카탈로그
+        (evaluation.catalog.get_catalog)와 달리 다른 도메인 파일과 기초 스위트는 로드하지 않습니다.
+
+        Args:
+            domain: 카탈로그에 기록할 도메인 이름
+
+        Returns:
+            CaseCatalog
+        """
+        if self._catalog is None:
+            catalog = CaseCatalog()
+            catalog.add_many(self.all(), domain=domain)
+            self._catalog = catalog
+        return self._catalog
+
+    def loaded_groups(self) -> List[str]:
+        """지금까지 파싱된 그룹 이름"""
+        return list(self._groups)
+
+
+# ============================================================================
+# 저장 (코퍼스 생성/갱신용)
+# ============================================================================
+
+def _to_record(case: Any) -> Dict:
+    if is_dataclass(case):
+        return asdict(case)
+    if isinstance(case, Mapping):
+        return dict(case)
+    return dict(vars(case))
+
+
+def write_corpus(path: str, groups: Mapping[str, Sequence[Any]]) -> int:
+    """
+    그룹별 테스트 케이스를 코퍼스 파일로 저장
+
+    Args:
+        path: 저장 경로 (상대 경로는 evaluation/data 기준, .gz로 끝나면 압축)
+        groups: 그룹 이름 → 테스트 케이스 목록 (dataclass, dict 등)
+
+    Returns:
+        int: 저장한 레코드 수
+    """
+    if not os.path.isabs(path):
+        path = os.path.join(DATA_DIR, path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # 범위는 목록 길이로 먼저 계산하고 레코드는 한 줄씩 기록 (합성 코퍼스처럼 큰 목록도 메모리에 모으지 않음)
+    ranges = {}
+    total = 0
+    for name, cases in groups.items():
+        ranges[name] = [total, total + len(cases)]
+        total += len(cases)
+    header = json.dumps({"format": CORPUS_FORMAT, "groups": ranges}, ensure_ascii=False)
+
+    if path.endswith(".gz"):
+        import gzip
+        opener = gzip.open
+    else:
+        opener = open
+    with opener(path, "wt", encoding="utf-8", newline="\n") as f:
+        f.write(header + "\n")
+        for cases in groups.values():
+            for case in cases:
+                f.write(json.dumps(_to_record(case), ensure_ascii=False) + "\n")
+    return total
+
+
+def print_corpus_stats():
+    """evaluation/data의 코퍼스 파일 통계 출력 (레코드는 파싱하지 않음)"""
+    print("=" * 60)
+    print("테스트 케이스 코퍼스 파일")
+    print("=" * 60)
+    for filename in sorted(os.listdir(DATA_DIR)):
+        if not filename.endswith((".jsonl", ".jsonl.gz")):
+            continue
+        corpus = CorpusFile(filename, dict)
+        size_kb = os.path.getsize(corpus.path) / 1024
+        print(f"{filename}: {len(corpus)}개, {size_kb:,.1f}KiB")
+        for name, (start, end) in corpus._header["groups"].items():
+            print(f"  - {name}: {end - start}개")
+
+
+if __name__ == "__main__":
+    print_corpus_stats()
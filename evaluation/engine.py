@@ -0,0 +1,1146 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+실험 엔진 (Experiment Engine)
+================================================================================
+
+## 이 모듈의 목적
+네 도메인(비즈니스/취업 준비/개발자/데이터 분석) 실험을 **하나의 실행 루프**로 돌립니다.
+엔진이 실행 계획, 모델 호출, 토큰 계산, 요약 신뢰 구간, 결과 기록을 맡고,
+도메인은 작은 어댑터(evaluation.adapters)만 제공합니다.
+
+## 왜 필요한가?
+- 도메인 실행기 4개가 같은 루프를 각자 구현
+  (__init__의 모델/토크나이저 생성, count_tokens, run_single_experiment의 시간 측정,
+   run_all_experiments 출력, _generate_summary, _save_results)
+- 처리량/메모리 개선(스트리밍 기록, 압축 레코드, 샤딩 등)을 매번 네 번씩 반영해야 함
+
+## 역할 분담
+| 엔진 (ExperimentEngine) | 어댑터 (DomainAdapter) |
+|------------------------|------------------------|
+| 실행 계획 (매니페스트/합성 코퍼스/층화 추출/샤드) | load_cases: 테스트 케이스 로드 |
+| 모델 호출 + 시간 측정 + 토큰 계산 (call_llm) | build_prompt: 프롬프트 생성 |
+| 결과 스트림 기록, 샤드 병합 | score / make_result: 품질 평가, 결과 dict |
+| 토크나이저 캐시 (프로세스당 1개) | summarize / print_summary: 도메인 요약 |
+| 단계별 트레이스 구간 (--trace, evaluation.tracing) | |
+| 단계별 CPU/할당 프로파일 (--profile, evaluation.profiling) | |
+| 동시 호출 한도 + 케이스 동시 실행 (--concurrency, evaluation.concurrency) | |
+| 호출 타임아웃/재시도/헤지 (--timeout, --retries, --hedge, evaluation.call_policy) | |
+| 실행 중 응답 캐시 (--response-cache, evaluation.response_cache) | |
+| 다중 노드 작업 큐 (--enqueue/--worker/--finalize, evaluation.work_queue) | options: 워커가 같은 어댑터를 만들 생성자 인자 |
+| 최장 예상 우선 스케줄 + makespan 보고 (--schedule, evaluation.scheduling) | |
+
+공통 요약(experiment_info, overall_stats, category_stats, confidence_intervals)은
+DomainAdapter.summarize가 제공하고, 도메인은 포함율 지표 이름과 추가 항목만 바꿉니다.
+
+## 사용 예시
+
+```bash
+python -m evaluation.engine business --version v4 --limit 108
+python -m evaluation.engine development --version v2 --minify --sample 20 --backend mock
+python -m evaluation.engine development --version v1 --backend mock --response-cache   # 생성 온도 0.3: 우회 수만 기록
+python -m evaluation.engine data_analysis --data-mode digest --baseline results/data_analysis_llm_judge_20260124_144943.json
+python -m evaluation.engine career --version v4 --merge results/career_experiments_*_shard*of3.summary.json
+```
+
+```python
+from evaluation.engine import create_engine
+
+engine = create_engine("career", "v4", backend="mock")
+summary = engine.run_all_experiments(sample=20, stratify=("category",))
+```
+
+scripts/run_*_experiments.py 는 기존 CLI를 유지하는 얇은 래퍼입니다.
+================================================================================
+"""
+
+import importlib
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import tiktoken
+
+from evaluation import profiling, tracing
+from evaluation.bootstrap import DEFAULT_BOOTSTRAP_SEED, DEFAULT_RESAMPLES, format_interval, summary_confidence_intervals
+from evaluation.call_policy import CallPolicy, LLMCallError, describe_call_policy
+from evaluation.concurrency import DEFAULT_MAX_CONCURRENCY, completion_map, create_limiter, describe_limiter, ordered_map
+from evaluation.llm_backends import LIVE_BACKENDS, create_chat_model
+from evaluation.manifest import iter_manifest_prompts
+from evaluation.partition import DEFAULT_SEED, describe_selection, merge_shard_results, select_plan
+from evaluation.records import ResultRecord
+from evaluation.response_cache import ResponseCache, describe_response_cache
+from evaluation.result_io import DEFAULT_FLUSH_EVERY, STREAM_ONLY_KEYS, TRACE_SUFFIX, ResultStreamWriter, export_legacy_json
+from evaluation.scheduling import (
+    DurationModel,
+    SchedulePlan,
+    describe_schedule,
+    describe_schedule_plan,
+    history_paths,
+    load_duration_model
+)
+from evaluation.synthetic import SyntheticCorpus, describe_throughput
+from evaluation.work_queue import (
+    DEFAULT_LEASE,
+    DEFAULT_MAX_ATTEMPTS,
+    WorkQueue,
+    check_engine,
+    default_worker_id,
+    describe_counts,
+    queue_config
+)
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MODEL = "qwen2.5:7b"
+# 생성 호출의 경과 시간에서 나온 결과 값 (응답 캐시 적중이면 None)
+_TIMING_KEYS = ("response_time", "generation_time", "total_time")
+
+# 도메인 → 어댑터 클래스 (사용하는 도메인의 템플릿만 임포트하도록 지연 로드)
+ADAPTERS = {
+    "business": "evaluation.adapters.business:BusinessAdapter",
+    "career": "evaluation.adapters.career:CareerAdapter",
+    "development": "evaluation.adapters.development:DevelopmentAdapter",
+    "data_analysis": "evaluation.adapters.data_analysis:DataAnalysisAdapter",
+}
+
+
+@lru_cache(maxsize=None)
+def _encoding(name: str = "cl100k_base"):
+    """토크나이저 (프로세스당 1번만 로드, 버전별 실행기가 여러 개여도 공유)"""
+    return tiktoken.get_encoding(name)
+
+
+@dataclass
+class LLMCall:
+    """모델 호출 1회의 결과 (응답, 성공 여부, 시간, 토큰)"""
+    prompt: str
+    response: str
+    success: bool
+    error: Optional[str]
+    elapsed: float
+    input_tokens: int
+    output_tokens: int
+    retries: int = 0  # 호출 정책의 재시도 수
+    hedged: bool = False  # 헤지 요청을 보냈는지
+    cached: bool = False  # 응답 캐시에서 가져왔는지 (elapsed는 새 측정이 아님)
+
+
+# ============================================================================
+# 도메인 어댑터
+# ============================================================================
+
+class DomainAdapter:
+    """
+    도메인 어댑터 기반 클래스
+
+    하위 클래스는 load_cases, build_prompt, score를 구현하고, 결과/요약 모양이 다르면
+    make_result, summarize, print_summary를 재정의합니다.
+
+    Attributes:
+        domain: 도메인 이름 (selection, 합성 코퍼스, 매니페스트에서 사용)
+        versions: 지원 프롬프트 버전
+        default_version: 버전을 지정하지 않았을 때 사용할 버전 (None이면 versions[0])
+        title: 실행 헤더 제목
+        results_prefix: 결과 파일 이름 접두어 (results/<prefix>_<시각>.jsonl)
+        results_key: 기존 단일 JSON 형식의 결과 목록 키
+        default_limit: 전체 실행 기본 케이스 수
+        temperature: 생성 모델 temperature
+        coverage_metric: 요약/신뢰 구간에 쓰는 포함율 지표 (quality_evaluation 키)
+        baseline_key: --baseline 결과 파일에서 비교 기준으로 읽을 summary 키 (None이면 미지원)
+    """
+
+    domain = ""
+    versions: Tuple[str, ...] = ()
+    default_version: Optional[str] = None
+    title = ""
+    results_prefix = ""
+    results_key = "detailed_results"
+    default_limit = 108
+    temperature = 0.3
+    coverage_metric = "element_coverage"
+    coverage_label = "필수 요소 포함율"
+    baseline_key: Optional[str] = None
+
+    def __init__(self, version: Optional[str] = None):
+        """
+        Args:
+            version: 프롬프트 버전 (기본: default_version)
+        """
+        version = version or self.default_version or self.versions[0]
+        if version not in self.versions:
+            raise ValueError(f"지원하지 않는 {self.domain} 버전: {version} (가능: {', '.join(self.versions)})")
+        self.version = version
+        self.baseline = None  # --baseline 결과 파일의 summary[baseline_key]
+
+    # ---- CLI ----
+
+    @classmethod
+    def add_arguments(cls, parser):
+        """엔진 CLI에 도메인 전용 인자 추가"""
+
+    @classmethod
+    def options_from_args(cls, parser, args) -> Dict[str, Any]:
+        """도메인 전용 인자를 어댑터 생성자 키워드 인자로 변환"""
+        return {}
+
+    def options(self) -> Dict[str, Any]:
+        """이 어댑터의 생성자 키워드 인자 (작업 큐 워커가 같은 어댑터를 다시 만들 때 사용, JSON 직렬화 가능)"""
+        return {}
+
+    # ---- 필수 구현 ----
+
+    def setup(self, engine: "ExperimentEngine"):
+        """엔진 생성 직후 호출 (평가용 모델 생성 등)"""
+
+    def load_cases(self) -> List:
+        """전체 테스트 케이스"""
+        raise NotImplementedError
+
+    def build_prompt(self, case) -> str:
+        """테스트 케이스의 프롬프트"""
+        raise NotImplementedError
+
+    def score(self, case, response: str) -> Dict[str, Any]:
+        """응답 품질 평가 (quality_evaluation)"""
+        raise NotImplementedError
+
+    # ---- 결과 ----
+
+    def case_fields(self, case) -> Dict[str, Any]:
+        """결과에 category/subcategory 다음으로 기록할 케이스 속성"""
+        return {}
+
+    def make_result(self, case, call: LLMCall, engine: "ExperimentEngine") -> Dict[str, Any]:
+        """
+        모델 호출 결과 → 케이스 결과 dict
+
+        Args:
+            case: 테스트 케이스
+            call: 엔진의 모델 호출 결과
+            engine: 실행 중인 엔진 (토큰 계산 등)
+
+        Returns:
+            Dict: 결과 파일에 기록할 케이스 결과
+        """
+        return {
+            "test_case_id": case.id,
+            "category": case.category,
+            "subcategory": case.subcategory,
+            **self.case_fields(case),
+            "success": call.success,
+            "error": call.error,
+            "input_tokens": call.input_tokens,
+            "output_tokens": call.output_tokens,
+            "total_tokens": call.input_tokens + call.output_tokens,
+            "response_time": round(call.elapsed, 2),
+            "quality_evaluation": self.score(case, call.response) if call.success else {},
+            "response_preview": call.response[:500] if call.response else ""
+        }
+
+    def progress(self, result: Dict[str, Any]) -> str:
+        """케이스 1건 진행 출력 (성공한 결과)"""
+        quality = result["quality_evaluation"].get("quality_score", 0)
+        elapsed = "캐시" if result["response_time"] is None else f"{result['response_time']}s"
+        return f"품질: {quality}/10, 토큰: {result['total_tokens']}, 시간: {elapsed}"
+
+    # ---- 출력/요약 ----
+
+    def info_lines(self) -> List[str]:
+        """실행 헤더의 도메인 설정 줄 (모델 다음)"""
+        return [f"프롬프트 버전: {self.version}"]
+
+    def notes(self) -> Optional[List[str]]:
+        """실행 헤더의 버전 설명 줄 (None이면 설명 구역 없음, 빈 목록이면 구분선만)"""
+        return None
+
+    def set_baseline(self, summary: Dict[str, Any]):
+        """--baseline 결과 파일의 summary에서 비교 기준 설정"""
+        self.baseline = summary.get(self.baseline_key, {})
+
+    def init_category_stats(self) -> Dict[str, Any]:
+        """카테고리별 누적 통계 초기값"""
+        return {
+            "count": 0,
+            "total_quality": 0,
+            "total_tokens": 0,
+            "total_time": 0,
+            self.coverage_list_key: []
+        }
+
+    @property
+    def coverage_list_key(self) -> str:
+        return {"element_coverage": "element_coverages"}.get(self.coverage_metric, self.coverage_metric + "s")
+
+    @property
+    def coverage_avg_key(self) -> str:
+        return {"element_coverage": "avg_element_coverage"}.get(self.coverage_metric, "avg_issue_detection")
+
+    def accumulate_category(self, stats: Dict[str, Any], result: Dict[str, Any]):
+        """카테고리 통계에 성공한 결과 1건 반영"""
+        stats["count"] += 1
+        stats["total_quality"] += result["quality_evaluation"].get("quality_score", 0)
+        stats["total_tokens"] += result["total_tokens"]
+        if result["response_time"] is None:  # 응답 캐시 적중 (시간 측정 없음)
+            stats["untimed"] = stats.get("untimed", 0) + 1
+        else:
+            stats["total_time"] += result["response_time"]
+        stats[self.coverage_list_key].append(result["quality_evaluation"].get(self.coverage_metric, 0))
+
+    def finalize_category(self, stats: Dict[str, Any]):
+        """카테고리 평균 계산"""
+        n = stats["count"]
+        stats["avg_quality"] = round(stats["total_quality"] / n, 2)
+        stats["avg_tokens"] = round(stats["total_tokens"] / n, 0)
+        timed = n - stats.get("untimed", 0)
+        stats["avg_time"] = round(stats["total_time"] / timed, 2) if timed else None
+        stats[self.coverage_avg_key] = round(sum(stats[self.coverage_list_key]) / n, 1)
+
+    def experiment_info_extra(self) -> Dict[str, Any]:
+        """experiment_info에 version 다음으로 기록할 설정"""
+        return {}
+
+    def extra_sections(self, successful: List) -> Dict[str, Any]:
+        """category_stats 다음에 넣을 도메인 요약 (예: 언어별 통계)"""
+        return {}
+
+    def baseline_deltas(self, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """--baseline 대비 변화 (summary 끝에 추가할 항목)"""
+        return {}
+
+    def summarize(self, results: Sequence, engine: "ExperimentEngine") -> Dict[str, Any]:
+        """
+        실험 결과 요약
+
+        Args:
+            results: 케이스 결과 목록 (ResultRecord 또는 dict)
+            engine: 실행 중인 엔진 (모델 이름, 부트스트랩 설정)
+
+        Returns:
+            Dict: experiment_info, overall_stats, category_stats, (도메인 항목), confidence_intervals
+        """
+        successful = [r for r in results if r["success"]]
+
+        if not successful:
+            return {"error": "성공한 실험이 없습니다"}
+
+        category_stats = {}
+        for r in successful:
+            stats = category_stats.get(r["category"])
+            if stats is None:
+                stats = category_stats[r["category"]] = self.init_category_stats()
+            self.accumulate_category(stats, r)
+        for stats in category_stats.values():
+            self.finalize_category(stats)
+
+        total_quality = sum(r["quality_evaluation"].get("quality_score", 0) for r in successful)
+        total_tokens = sum(r["total_tokens"] for r in successful)
+        times = [r["response_time"] for r in successful if r["response_time"] is not None]
+        total_time = sum(times)
+
+        summary = {
+            "experiment_info": {
+                "total_experiments": len(results),
+                "successful_experiments": len(successful),
+                "failed_experiments": len(results) - len(successful),
+                "success_rate": round(len(successful) / len(results) * 100, 1),
+                "model": engine.model,
+                "version": self.version,
+                **self.experiment_info_extra(),
+                "timestamp": datetime.now().isoformat()
+            },
+            "overall_stats": {
+                "avg_quality_score": round(total_quality / len(successful), 2),
+                "avg_tokens": round(total_tokens / len(successful), 0),
+                "avg_response_time": round(total_time / len(times), 2) if times else None,
+                "total_tokens_used": total_tokens,
+                "total_time_seconds": round(total_time, 1)
+            },
+            "category_stats": category_stats,
+            **self.extra_sections(successful),
+            "confidence_intervals": summary_confidence_intervals(
+                successful,
+                {
+                    "quality_score": lambda r: r["quality_evaluation"].get("quality_score", 0),
+                    self.coverage_metric: lambda r: r["quality_evaluation"].get(self.coverage_metric, 0),
+                    "total_tokens": lambda r: r["total_tokens"],
+                    "response_time": lambda r: r["response_time"]
+                },
+                resamples=engine.bootstrap_resamples,
+                seed=engine.bootstrap_seed
+            )
+        }
+        if self.baseline:
+            summary.update(self.baseline_deltas(summary))
+        return summary
+
+    def category_lines(self, stats: Dict[str, Any], ci: Dict[str, Any]) -> List[str]:
+        """카테고리별 결과 출력 줄"""
+        return [
+            f"    - 평균 품질: {stats['avg_quality']}/10{format_interval(ci.get('quality_score'))}",
+            f"    - {self.coverage_label}: {stats[self.coverage_avg_key]}%{format_interval(ci.get(self.coverage_metric))}",
+            f"    - 평균 토큰: {stats['avg_tokens']}",
+        ]
+
+    def print_extra(self, summary: Dict[str, Any]):
+        """카테고리별 결과 다음에 출력할 도메인 요약"""
+
+    def print_summary(self, summary: Dict[str, Any]):
+        """요약 출력"""
+        print("=" * 70)
+        print("실험 결과 요약")
+        print("=" * 70)
+        print(f"총 실험: {summary['experiment_info']['total_experiments']}회")
+        print(f"성공률: {summary['experiment_info']['success_rate']}%")
+        overall_ci = (summary.get("confidence_intervals") or {}).get("overall", {})
+        print(f"평균 품질 점수: {summary['overall_stats']['avg_quality_score']}/10{format_interval(overall_ci.get('quality_score'))}")
+        print(f"평균 토큰: {summary['overall_stats']['avg_tokens']}{format_interval(overall_ci.get('total_tokens'))}")
+        print(f"평균 응답 시간: {summary['overall_stats']['avg_response_time']}초{format_interval(overall_ci.get('response_time'))}")
+        print()
+        print("카테고리별 결과:")
+        for cat, stats in summary.get("category_stats", {}).items():
+            cat_ci = (summary.get("confidence_intervals") or {}).get("by_category", {}).get(cat, {})
+            print(f"  {cat}:")
+            for line in self.category_lines(stats, cat_ci):
+                print(line)
+        self.print_extra(summary)
+
+
+def adapter_class(domain: str) -> Type[DomainAdapter]:
+    """도메인 이름 → 어댑터 클래스"""
+    if domain not in ADAPTERS:
+        raise ValueError(f"지원하지 않는 도메인: {domain} (가능: {', '.join(ADAPTERS)})")
+    module_name, class_name = ADAPTERS[domain].split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def domain_versions() -> Dict[str, List[str]]:
+    """도메인별 지원 프롬프트 버전"""
+    return {domain: list(adapter_class(domain).versions) for domain in ADAPTERS}
+
+
+# ============================================================================
+# 실험 엔진
+# ============================================================================
+
+class ExperimentEngine:
+    """
+    도메인 공통 실험 실행기
+
+    Attributes:
+        adapter: 도메인 어댑터
+        llm: 생성 모델
+        model: 결과에 기록할 모델 이름 (mock/replay 백엔드는 "mock:<모델>"/"replay:<모델>")
+        results: 케이스 결과 (요약 계산용 압축 레코드)
+        selection: 표본 추출/샤드 정보 (summary에 기록)
+        limiter: 모든 LLM 호출(생성, Judge 평가) 앞의 동시 호출 한도
+        policy: 모든 LLM 호출의 타임아웃/재시도/헤지 정책 (기본: 바로 호출)
+        response_cache: 모든 LLM 호출 앞의 실행 중 응답 캐시 (None이면 캐시 안 함)
+        schedule: 케이스 실행 순서 ("lpt", "plan", None이면 계획 순서 그대로 - 예측/보고 없음)
+    """
+
+    def __init__(
+        self,
+        adapter: DomainAdapter,
+        model: str = DEFAULT_MODEL,
+        backend: str = "ollama",
+        bootstrap_resamples: int = DEFAULT_RESAMPLES,
+        bootstrap_seed: int = DEFAULT_BOOTSTRAP_SEED,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        legacy_json: bool = False,
+        trace: bool = False,
+        profile: Optional[str] = None,
+        concurrency: Union[int, str] = 1,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        call_policy: Optional[CallPolicy] = None,
+        schedule: Optional[str] = None,
+        history: Optional[Sequence[str]] = None,
+        response_cache: Optional[ResponseCache] = None
+    ):
+        """
+        Args:
+            adapter: 도메인 어댑터
+            model: 사용할 Ollama 모델
+            backend: LLM 백엔드 (ollama, mock/replay - 추론 없이 하네스 처리량 측정, record - 실제 호출 녹화)
+            bootstrap_resamples: 요약 신뢰 구간의 부트스트랩 재표본 수 (0이면 생략)
+            bootstrap_seed: 부트스트랩 시드
+            flush_every: 결과 스트림(.jsonl)을 몇 건마다 flush할지
+            legacy_json: 기존 단일 JSON 결과 파일(.json)도 함께 생성할지
+            trace: 단계별 구간을 Chrome 트레이스 파일(<결과>.trace.json)로 기록할지
+            profile: 하네스 프로파일 모드 ("cpu", "alloc", None이면 끔) - 결과 파일 옆에 단계별 보고서 저장
+            concurrency: 동시 LLM 호출 수 (1이면 순차 실행, 정수면 고정, "auto"면 지연/처리량/오류로 조절)
+            max_concurrency: concurrency="auto"의 최대 한도
+            call_policy: LLM 호출 타임아웃/재시도/헤지 정책 (None이면 기존처럼 바로 호출)
+            schedule: 케이스 실행 순서 - "lpt"(지난 결과로 예측한 소요 시간이 긴 케이스부터),
+                "plan"(계획 순서, 예측 vs 실제 makespan만 보고), None이면 기존처럼 계획 순서
+            history: 소요 시간 예측에 사용할 지난 결과 파일 (기본: results/의 같은 도메인 결과 전체)
+            response_cache: 같은 (모델, 온도, 프롬프트)의 성공 응답을 재사용할 캐시 (None이면 매번 호출)
+        """
+        self.adapter = adapter
+        self.backend = backend
+        self.model_name = model
+        self.model = model if backend in LIVE_BACKENDS else f"{backend}:{model}"  # 모의/재생 결과가 실제 결과와 섞이지 않도록
+        self.llm = self.create_llm(adapter.temperature)
+        self.enc = _encoding()
+        self.results = []
+        self.selection = None
+        self.bootstrap_resamples = bootstrap_resamples
+        self.bootstrap_seed = bootstrap_seed
+        self.flush_every = flush_every
+        self.legacy_json = legacy_json
+        self.trace = trace
+        self.profile = profile
+        self.limiter = create_limiter(concurrency, max_concurrency)
+        self.policy = call_policy or CallPolicy()
+        self.schedule = schedule
+        self.history = list(history) if history else None
+        self.response_cache = response_cache
+        self._stream = None  # 실행 중인 결과 스트림 (결과가 나올 때마다 기록)
+        self._trace_owner = False  # 이 실행이 트레이스 세션을 열었는지 (바깥 세션이 있으면 거기에 포함)
+        self._profile_owner = False  # 이 실행이 프로파일을 시작했는지
+        self._run_stem = None  # 이번 실행 결과 파일의 stem (트레이스/프로파일 보고서 경로)
+        adapter.setup(self)
+
+    def create_llm(self, temperature: float):
+        """같은 백엔드/모델로 채팅 모델 생성 (어댑터의 평가용 모델 등)"""
+        return create_chat_model(self.backend, model=self.model_name, temperature=temperature)
+
+    def count_tokens(self, text: str) -> int:
+        """토큰 수 계산"""
+        return len(self.enc.encode(text))
+
+    def generate_prompt(self, case, **options) -> str:
+        """테스트 케이스의 프롬프트 (어댑터 build_prompt)"""
+        return self.adapter.build_prompt(case, **options)
+
+    def invoke(self, prompt: str, llm=None, span: str = "llm_call") -> str:
+        """
+        동시 호출 한도와 호출 정책을 거친 모델 호출 (응답 텍스트만 필요한 Judge 평가 등)
+
+        Args:
+            prompt: 프롬프트
+            llm: 호출할 모델 (기본: 생성 모델)
+            span: 시도마다 기록할 트레이스 구간 이름
+
+        Returns:
+            str: 응답 텍스트
+
+        Raises:
+            LLMCallError: 재시도/헤지 후에도 실패 (메시지는 원래 오류 그대로)
+        """
+        llm = llm or self.llm
+        cache = self.response_cache
+        if cache is not None:
+            cached = cache.get(llm, prompt)
+            if cached is not None:
+                return cached.text
+        with profiling.paused():
+            outcome = self.policy.invoke(llm, prompt, self.limiter, span=span)
+        if cache is not None:
+            cache.put(llm, prompt, outcome.text)
+        return outcome.text
+
+    def call_llm(self, prompt: str, llm=None) -> LLMCall:
+        """
+        모델 호출 1회 (시간 측정, 실패는 예외 대신 success=False로 기록)
+
+        Args:
+            prompt: 프롬프트
+            llm: 호출할 모델 (기본: 생성 모델)
+
+        Returns:
+            LLMCall: 응답, 성공 여부, 경과 시간(한도/재시도 대기 제외), 입출력 토큰, 재시도/헤지/캐시 기록
+        """
+        llm = llm or self.llm
+        cache = self.response_cache
+        cached = cache.get(llm, prompt) if cache is not None else None
+        if cached is not None:
+            response = cached.text
+            success = True
+            error_msg = None
+            elapsed, retries, hedged = 0.0, 0, False
+        else:
+            try:
+                with profiling.paused():
+                    outcome = self.policy.invoke(llm, prompt, self.limiter, span="llm_call")
+                response = outcome.text
+                success = True
+                error_msg = None
+            except LLMCallError as e:
+                outcome = e.result
+                response = ""
+                success = False
+                error_msg = str(e)
+            elapsed, retries, hedged = outcome.elapsed, outcome.retries, outcome.hedged
+            if success and cache is not None:
+                cache.put(llm, prompt, response)
+
+        with tracing.span("token_count"):
+            input_tokens = self.count_tokens(prompt)
+            output_tokens = self.count_tokens(response) if response else 0
+        return LLMCall(
+            prompt=prompt,
+            response=response,
+            success=success,
+            error=error_msg,
+            elapsed=elapsed,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            retries=retries,
+            hedged=hedged,
+            cached=cached is not None
+        )
+
+    def run_single_experiment(self, case, prompt: str = None) -> Dict[str, Any]:
+        """
+        단일 실험 실행
+
+        Args:
+            case: 테스트 케이스
+            prompt: 미리 렌더링된 프롬프트 (매니페스트 실행 시). 없으면 새로 생성
+
+        Returns:
+            Dict: 케이스 결과
+        """
+        if prompt is None:
+            with tracing.span("prompt_build"):
+                prompt = self.adapter.build_prompt(case)
+        call = self.call_llm(prompt)
+        with tracing.span("score"):
+            result = self.adapter.make_result(case, call, self)
+        if self.policy.active:  # 정책을 켠 실행만 (기본 실행의 결과 모양은 그대로)
+            result["retries"] = call.retries
+            result["hedged"] = call.hedged
+        if self.response_cache is not None:
+            result["cached"] = call.cached
+            if call.cached:  # 캐시 적중은 새 지연 측정이 아니므로 시간 값을 비움 (통계/예측에서 빠짐)
+                for key in _TIMING_KEYS:
+                    if key in result:
+                        result[key] = None
+        return result
+
+    def build_plan(self, manifest_dir: str = None, synthetic: int = None, seed: int = DEFAULT_SEED) -> List[Tuple]:
+        """(테스트 케이스, 렌더링된 프롬프트 또는 None) 목록"""
+        domain = self.adapter.domain
+        if manifest_dir:
+            print(f"매니페스트: {manifest_dir}")
+            return list(iter_manifest_prompts(manifest_dir, domain, self.adapter.version, self.adapter.load_cases()))
+        if synthetic:
+            print(f"합성 코퍼스: {synthetic:,}개 (seed={seed})")
+            return [(case, None) for case in SyntheticCorpus(domain, synthetic, seed)]
+        return [(case, None) for case in self.adapter.load_cases()]
+
+    def print_header(self, count: int):
+        """실행 헤더 출력"""
+        print("=" * 70)
+        print(self.adapter.title)
+        print("=" * 70)
+        notes = self.adapter.notes()
+        if notes is not None:
+            for line in notes:
+                print(line)
+            print("=" * 70)
+        print(f"시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"모델: {self.model}")
+        for line in self.adapter.info_lines():
+            print(line)
+        print(f"실험 횟수: {count}회")
+        print()
+
+    def run_all_experiments(
+        self,
+        limit: int = None,
+        manifest_dir: str = None,
+        shard: Tuple[int, int] = None,
+        sample: int = None,
+        stratify: Sequence[str] = (),
+        seed: int = DEFAULT_SEED,
+        synthetic: int = None
+    ) -> Dict[str, Any]:
+        """
+        전체 실험 실행
+
+        Args:
+            limit: 앞에서부터 실행할 실험 수 (기본: 어댑터 default_limit, sample 지정 시 무시)
+            manifest_dir: 사전 렌더링된 프롬프트 매니페스트 (scripts/render_prompts.py 출력)
+            shard: (i, N) - test_case_id 해시로 나눈 N개 샤드 중 i번째만 실행
+            sample: 층화 추출 개수
+            stratify: 층화 속성 (예: ("category", "difficulty"))
+            seed: 표본 추출 시드 (합성 코퍼스 생성 시드로도 사용)
+            synthetic: 기존 케이스 대신 합성 코퍼스 N개로 실행 (evaluation.synthetic, 부하 측정용)
+
+        Returns:
+            Dict: 전체 실험 결과 요약
+        """
+        if limit is None:
+            limit = self.adapter.default_limit
+        with self._run_trace(), self._run_profile():
+            self.print_header(sample if sample is not None else limit)
+
+            with tracing.span("plan"), profiling.phase("plan"):
+                plan = self.build_plan(manifest_dir, synthetic, seed)
+                plan, self.selection = select_plan(
+                    plan, self.adapter.domain, limit=limit, shard=shard,
+                    sample=sample, stratify=stratify, seed=seed
+                )
+            total = len(plan)
+            if sample is not None or shard:
+                print(f"선택: {describe_selection(self.selection)} → 이번 실행 {total}회")
+
+            workers = self.limiter.max_limit
+            schedule = None
+            if self.schedule:
+                with tracing.span("schedule"), profiling.phase("plan"):
+                    schedule = self.schedule_plan(plan)
+                    plan = schedule.apply(plan)
+                print(f"스케줄: {describe_schedule_plan(schedule)}")
+
+            self._stream = self._open_result_stream()
+            self._run_stem = self._stream.stem
+            first_record = len(self.results)
+            loop_start = time.perf_counter()
+            if workers > 1:  # 케이스를 동시에 실행하고 기록/출력은 계획 순서대로
+                print(f"동시 실행: 최대 {workers}개 (LLM 호출 한도 {'자동' if self.limiter.adaptive else '고정'})")
+            if schedule is not None:  # 스케줄 순서대로 배정하고 끝난 순서대로 기록 (긴 케이스 뒤에서 워커가 놀지 않도록)
+                cases = completion_map(self._run_case, plan, workers)
+            else:
+                cases = ordered_map(self._run_case, plan, workers)
+            try:
+                with profiling.phase("cases"):
+                    for i in range(1, total + 1):
+                        position, result = next(cases) if schedule is not None else (i - 1, None)
+                        case = plan[position][0]
+                        print(f"[{i:3d}/{total}] {case.id} - {case.category}/{case.subcategory}", end=" ")
+
+                        if result is None:
+                            result = next(cases)
+                        else:
+                            schedule.record(position, result)
+                        with tracing.span("serialize", cat="io", id=case.id):
+                            self._stream.write(result)
+                        # 요약 계산에 필요한 값만 압축 레코드로 보관 (응답 미리보기는 스트림에만 기록)
+                        self.results.append(ResultRecord.from_dict(result, omit=STREAM_ONLY_KEYS))
+
+                        if result["success"]:
+                            print(self.adapter.progress(result))
+                        else:
+                            print(f"실패: {result['error']}")
+            finally:
+                cases.close()  # 중단 시 아직 시작하지 않은 케이스 취소
+                self._stream.close()  # 중단되어도 그때까지의 결과는 스트림에 남음
+
+            makespan = time.perf_counter() - loop_start
+            print(f"하네스 처리량: {describe_throughput(total, makespan)}")
+            if workers > 1:
+                print(f"동시 호출: {describe_limiter(self.limiter.snapshot())}")
+            if self.policy.active:
+                print(f"호출 정책: {describe_call_policy(self.policy.snapshot())}")
+            if self.response_cache is not None:
+                print(f"응답 캐시: {describe_response_cache(self.response_cache.snapshot())}")
+            schedule_report = None
+            if schedule is not None:
+                # 요약(부트스트랩 재표본 포함)이 실행 순서에 영향받지 않도록 계획 순서로 되돌림
+                self.results[first_record:] = schedule.restore(self.results[first_record:])
+                schedule_report = schedule.report(makespan)
+                print(f"스케줄({schedule.policy}): {describe_schedule(schedule_report)}")
+
+            summary = self._generate_summary()
+            summary["selection"] = self.selection
+            if workers > 1:
+                summary["concurrency"] = self.limiter.snapshot()
+            if self.policy.active:
+                summary["call_policy"] = self.policy.snapshot()
+            if self.response_cache is not None:
+                summary["response_cache"] = self.response_cache.snapshot()
+            if schedule_report is not None:
+                summary["schedule"] = schedule_report
+            self._save_results(summary)
+        return summary
+
+    def duration_model(self) -> DurationModel:
+        """지난 결과(history, 기본: results/의 같은 도메인)로 이 모델의 케이스 소요 시간 예측 모델 생성"""
+        paths = self.history or history_paths(os.path.join(PROJECT_ROOT, "results"), self.adapter.domain)
+        # 모델이 기록되지 않은 초기 결과는 실제 모델 실행이므로 모의/재생 실행에는 사용하지 않음
+        return load_duration_model(paths, self.model, include_unlabeled=self.model == self.model_name)
+
+    def schedule_plan(self, plan: List[Tuple], duration_model: Optional[DurationModel] = None) -> SchedulePlan:
+        """
+        계획 항목별 소요 시간을 예측하고 실행 순서 결정
+
+        Args:
+            plan: (테스트 케이스, 렌더링된 프롬프트 또는 None) 목록
+            duration_model: 예측 모델 (기본: duration_model())
+
+        Returns:
+            SchedulePlan: 실행 순서, 예측, 예측 makespan (워커 수 = 동시 호출 최대 한도)
+        """
+        if duration_model is None:
+            duration_model = self.duration_model()
+        version = self.adapter.version
+        predicted, sources = [], []
+        for case, prompt in plan:
+            if prompt is None:  # 입력 토큰 수만 필요 (프롬프트는 보관하지 않고 실행 시 다시 생성)
+                prompt = self.adapter.build_prompt(case)
+            seconds, source = duration_model.predict(version, case.category, self.count_tokens(prompt))
+            predicted.append(seconds)
+            sources.append(source)
+        return SchedulePlan.build(self.schedule or "lpt", predicted, sources, self.limiter.max_limit, duration_model)
+
+    def _run_case(self, planned: Tuple) -> Dict[str, Any]:
+        """계획 항목 1개 실행 (동시 실행 시 워커 스레드에서 호출)"""
+        case, prompt = planned
+        with tracing.span("case", id=case.id):
+            return self.run_single_experiment(case, prompt=prompt)
+
+    def merge_shards(self, result_paths: List[str]) -> Dict[str, Any]:
+        """
+        샤드 결과 파일을 합쳐 단일 실행과 같은 요약 생성
+
+        Args:
+            result_paths: --shard i/N 실행 결과 파일 (N개 모두)
+
+        Returns:
+            Dict: 병합된 결과 요약
+        """
+        with self._run_trace(), self._run_profile():
+            with profiling.phase("merge"):
+                self.selection, self.results = merge_shard_results(result_paths, self.adapter.domain)
+            summary = self._generate_summary()
+            summary["selection"] = self.selection
+            self._save_results(summary)
+        return summary
+
+    # ---- 작업 큐 (evaluation.work_queue) ----
+
+    def enqueue(
+        self,
+        queue_path: str,
+        limit: int = None,
+        manifest_dir: str = None,
+        sample: int = None,
+        stratify: Sequence[str] = (),
+        seed: int = DEFAULT_SEED,
+        synthetic: int = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    ) -> WorkQueue:
+        """
+        실행 계획을 작업 큐로 생성 (실험은 각 노드의 run_queue_worker가 실행)
+
+        Args:
+            queue_path: 새 큐 파일 (공유 저장소)
+            limit, manifest_dir, sample, stratify, seed, synthetic: run_all_experiments와 같음
+            max_attempts: 케이스당 최대 임대 시도 수
+
+        Returns:
+            WorkQueue: 생성한 큐
+        """
+        if limit is None:
+            limit = self.adapter.default_limit
+        with tracing.span("plan"), profiling.phase("plan"):
+            plan = self.build_plan(manifest_dir, synthetic, seed)
+            plan, selection = select_plan(
+                plan, self.adapter.domain, limit=limit, sample=sample, stratify=stratify, seed=seed
+            )
+        config = queue_config(self, selection, manifest_dir, synthetic, seed, max_attempts)
+        queue = WorkQueue.create(queue_path, config, [case.id for case, _ in plan])
+        print(f"작업 큐 생성: {queue_path} ({len(plan)}개, {describe_selection(selection)})")
+        return queue
+
+    def run_queue_worker(
+        self,
+        queue: WorkQueue,
+        worker_id: Optional[str] = None,
+        lease: float = DEFAULT_LEASE,
+        wait: bool = True
+    ) -> int:
+        """
+        작업 큐의 케이스를 임대로 가져와 실행하고 결과를 큐에 기록
+
+        동시성(concurrency)만큼 한 번에 임대해 ordered_map으로 실행하고, 실행 중에는 별도 스레드가
+        임대를 연장합니다. 중단되면 끝내지 못한 임대는 바로 대기로 되돌립니다.
+
+        Args:
+            queue: 작업 큐
+            worker_id: 워커 ID (기본: <호스트>:<pid>)
+            lease: 임대 시간 (초)
+            wait: 대기 케이스가 없어도 다른 워커의 임대가 남아 있으면 기다릴지 (만료되면 가져감)
+
+        Returns:
+            int: 이 워커가 기록한 결과 수
+
+        Raises:
+            ValueError: 큐와 도메인/버전/모델/어댑터 옵션이 다르거나, 큐의 케이스가 이 노드의 계획에 없음
+        """
+        check_engine(queue.config, self)
+        config = queue.config
+        worker_id = worker_id or default_worker_id()
+        plan = {case.id: (case, prompt) for case, prompt in
+                self.build_plan(config["manifest_dir"], config["synthetic"], config["seed"])}
+        missing = [case_id for case_id in config["selection"]["plan"] if case_id not in plan]
+        if missing:
+            raise ValueError(f"큐의 케이스 {len(missing)}개가 이 노드의 계획에 없습니다: {', '.join(missing[:5])}")
+
+        workers = self.limiter.max_limit
+        poll = min(5.0, lease / 4)
+        written = 0
+        queue.register_worker(worker_id)
+        print(f"워커 {worker_id}: {queue.path} ({describe_counts(queue.counts())})")
+        with queue.heartbeating(worker_id, lease):
+            while True:
+                ids = queue.claim(worker_id, workers, lease)
+                if not ids:
+                    if not wait or queue.is_finished():
+                        break
+                    time.sleep(poll)  # 다른 워커의 임대가 끝나거나 만료될 때까지
+                    continue
+                cases = ordered_map(self._run_case, [plan[case_id] for case_id in ids], workers)
+                done = 0
+                try:
+                    for case_id in ids:
+                        case, _ = plan[case_id]
+                        result = next(cases)
+                        written += queue.complete(worker_id, case_id, result)
+                        done += 1
+                        status = self.adapter.progress(result) if result["success"] else f"실패: {result['error']}"
+                        print(f"{case.id} - {case.category}/{case.subcategory} {status}")
+                finally:
+                    cases.close()
+                    if done < len(ids):  # 중단: 끝내지 못한 케이스는 만료를 기다리지 않고 다른 워커에게
+                        queue.release(worker_id, ids[done:])
+        print(f"워커 종료: {written}건 기록 ({describe_counts(queue.counts())})")
+        return written
+
+    def finalize_queue(self, queue: WorkQueue) -> Dict[str, Any]:
+        """
+        작업 큐의 결과를 계획 순서로 모아 단일 실행과 같은 요약 생성 (merge_shards와 같은 방식)
+
+        Args:
+            queue: 모든 케이스가 끝난 작업 큐
+
+        Returns:
+            Dict: 요약
+
+        Raises:
+            ValueError: 큐와 설정이 다르거나 아직 끝나지 않은 케이스가 있음
+        """
+        check_engine(queue.config, self)
+        queue.requeue_expired()
+        with self._run_trace(), self._run_profile():
+            with profiling.phase("merge"):
+                self.selection = queue.config["selection"]
+                self.results = queue.results()
+            summary = self._generate_summary()
+            summary["selection"] = self.selection
+            self._save_results(summary)
+        return summary
+
+    @contextmanager
+    def _run_trace(self):
+        """
+        trace=True면 실행 동안 트레이스 기록, 끝나면(중단되어도) <결과>.trace.json 저장
+
+        이미 바깥에서 기록 중이면(tracing.tracing_session 등) 새 세션을 열지 않고 그 트레이스에 포함
+        """
+        if not self.trace or tracing.is_enabled():
+            yield
+            return
+        tracing.start_tracing(f"{self.adapter.domain} {self.adapter.version}")
+        self._trace_owner = True
+        self._run_stem = None
+        try:
+            yield
+        finally:
+            self._trace_owner = False
+            tracing.stop_tracing(self._run_stem and self._run_stem + TRACE_SUFFIX)
+
+    @contextmanager
+    def _run_profile(self):
+        """
+        profile이 지정되면 실행 동안 하네스 프로파일, 끝나면(중단되어도) 결과 파일 옆에 보고서 저장
+
+        모델 호출(call_llm, 평가용 모델 호출)은 profiling.paused()로 cpu 프로파일에서 제외
+        """
+        if not self.profile or profiling.is_enabled():
+            yield
+            return
+        profiling.start_profiling(self.profile)
+        self._profile_owner = True
+        self._run_stem = None
+        try:
+            yield
+        finally:
+            self._profile_owner = False
+            profiling.stop_profiling(self._run_stem)
+
+    def _generate_summary(self) -> Dict[str, Any]:
+        """실험 결과 요약 (어댑터 summarize)"""
+        with tracing.span("summary"), profiling.phase("summary"):
+            return self.adapter.summarize(self.results, self)
+
+    def _open_result_stream(self) -> ResultStreamWriter:
+        """결과 스트림 열기 (results/<접두어>_<시작 시각>.jsonl)"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if self.selection and self.selection["shard"]:
+            timestamp += "_shard{}of{}".format(*self.selection["shard"])  # 같은 머신에서 동시에 실행해도 파일이 겹치지 않도록
+        return ResultStreamWriter(
+            os.path.join(PROJECT_ROOT, "results", f"{self.adapter.results_prefix}_{timestamp}"),
+            self.adapter.results_key, self.flush_every
+        )
+
+    def _save_results(self, summary: Dict[str, Any]):
+        """결과 저장 및 출력 (결과 스트림을 닫고 요약 파일 기록)"""
+        stream = self._stream
+        with tracing.span("save", cat="io"), profiling.phase("save"):
+            if stream is None:  # merge_shards: 병합한 결과를 새 스트림으로 기록
+                stream = self._open_result_stream()
+                for result in self.results:
+                    stream.write(result)
+            self._stream = None
+            summary_path = stream.write_summary(summary)
+            legacy_path = export_legacy_json(summary_path) if self.legacy_json else None
+        self._run_stem = stream.stem
+
+        print()
+        self.adapter.print_summary(summary)
+        print()
+        print(f"결과 저장: {stream.path} ({stream.count}건)")
+        print(f"요약 저장: {summary_path}")
+        if legacy_path:
+            print(f"기존 형식 저장: {legacy_path}")
+        if self._trace_owner:
+            print(f"트레이스 저장: {stream.stem + TRACE_SUFFIX}")
+        if self._profile_owner:
+            print(f"프로파일 저장: {profiling.report_path_of(self.profile, stream.stem)}")
+        print("=" * 70)
+
+
+def create_engine(
+    domain: str,
+    version: Optional[str] = None,
+    model: str = DEFAULT_MODEL,
+    backend: str = "ollama",
+    adapter_options: Optional[Dict[str, Any]] = None,
+    **engine_options
+) -> ExperimentEngine:
+    """
+    도메인 이름으로 엔진 생성
+
+    Args:
+        domain: business, career, development, data_analysis
+        version: 프롬프트 버전 (기본: 도메인 기본 버전)
+        model: 사용할 Ollama 모델
+        backend: LLM 백엔드
+        adapter_options: 어댑터 전용 설정 (예: {"minify": True}, {"data_modes": {...}})
+        **engine_options: ExperimentEngine 키워드 인자 (bootstrap_resamples, flush_every, trace, profile, concurrency, call_policy,
+            response_cache 등)
+
+    Returns:
+        ExperimentEngine
+    """
+    adapter = adapter_class(domain)(version, **(adapter_options or {}))
+    return ExperimentEngine(adapter, model=model, backend=backend, **engine_options)
+
+
+def main():
+    """통합 실행 진입점 (python -m evaluation.engine <도메인> ...)"""
+    import argparse
+
+    from evaluation.bootstrap import add_bootstrap_arguments, parse_bootstrap_arguments
+    from evaluation.call_policy import add_call_policy_arguments, parse_call_policy_arguments
+    from evaluation.concurrency import add_concurrency_arguments, parse_concurrency_arguments
+    from evaluation.llm_backends import add_backend_arguments, parse_backend_arguments
+    from evaluation.partition import add_selection_arguments, parse_selection_arguments
+    from evaluation.response_cache import add_cache_arguments, parse_cache_arguments
+    from evaluation.result_io import add_output_arguments, load_run_summary, parse_output_arguments
+    from evaluation.scheduling import add_schedule_arguments, parse_schedule_arguments
+    from evaluation.work_queue import add_queue_arguments, parse_queue_arguments, run_queue_command
+
+    # 도메인 전용 인자를 붙이려면 도메인을 먼저 알아야 함
+    pre = argparse.ArgumentParser(add_help=False)
+    pre.add_argument("domain", nargs="?", choices=list(ADAPTERS))
+    domain = pre.parse_known_args()[0].domain
+
+    parser = argparse.ArgumentParser(description="도메인 프롬프트 실험 (통합 엔진)")
+    parser.add_argument("domain", choices=list(ADAPTERS), help="실험 도메인")
+    parser.add_argument("--version", "-v", type=str, default=None,
+                        help="프롬프트 버전 (기본: 도메인 기본 버전)")
+    parser.add_argument("--limit", "-l", type=int, default=None,
+                        help="실험 횟수 (기본: 도메인 전체 실행 수, --synthetic이면 합성 케이스 전체)")
+    parser.add_argument("--model", "-m", type=str, default=DEFAULT_MODEL, help="사용할 Ollama 모델")
+    parser.add_argument("--manifest", type=str, default=None,
+                        help="사전 렌더링된 프롬프트 매니페스트 디렉토리")
+    parser.add_argument("--synthetic", type=int, default=None,
+                        help="기존 케이스 대신 합성 케이스 N개로 실행 (--seed로 재현)")
+    parser.add_argument("--baseline", type=str, default=None,
+                        help="비교 기준 결과 파일 (개발자: 언어별, 데이터 분석: 카테고리별 변화)")
+    add_selection_arguments(parser)
+    add_bootstrap_arguments(parser)
+    add_output_arguments(parser)
+    add_backend_arguments(parser)
+    add_concurrency_arguments(parser)
+    add_call_policy_arguments(parser)
+    add_cache_arguments(parser)
+    add_schedule_arguments(parser)
+    add_queue_arguments(parser)
+    if domain:
+        adapter_class(domain).add_arguments(parser)
+
+    args = parser.parse_args()
+    cls = adapter_class(args.domain)
+    selection = parse_selection_arguments(parser, args)
+    bootstrap = parse_bootstrap_arguments(parser, args)
+    output = parse_output_arguments(parser, args)
+    backend = parse_backend_arguments(parser, args)
+    concurrency = parse_concurrency_arguments(parser, args)
+    call_policy = parse_call_policy_arguments(parser, args)
+    response_cache = parse_cache_arguments(parser, args)
+    schedule = parse_schedule_arguments(parser, args)
+    queue = parse_queue_arguments(parser, args)
+    adapter_options = cls.options_from_args(parser, args)
+    if args.synthetic is not None and args.synthetic < 1:
+        parser.error("--synthetic은 1 이상이어야 합니다")
+    if args.synthetic and args.manifest:
+        parser.error("--synthetic은 --manifest와 함께 사용할 수 없습니다")
+    if args.baseline and cls.baseline_key is None:
+        parser.error(f"{args.domain} 도메인은 --baseline을 지원하지 않습니다")
+
+    try:
+        engine = create_engine(
+            args.domain, args.version, model=args.model, backend=backend,
+            adapter_options=adapter_options, **bootstrap, **output, **concurrency, **call_policy, **response_cache,
+            **schedule
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    if args.baseline:
+        engine.adapter.set_baseline(load_run_summary(args.baseline))
+
+    if args.merge:
+        try:
+            engine.merge_shards(args.merge)
+        except ValueError as e:
+            parser.error(str(e))
+        print()
+        print(f"샤드 결과 {len(args.merge)}개 병합 완료!")
+        return
+
+    limit = args.limit if args.limit is not None else (args.synthetic or cls.default_limit)
+    if queue:
+        try:
+            run_queue_command(engine, queue, lease=args.lease, max_attempts=args.max_attempts, limit=limit,
+                              manifest_dir=args.manifest, synthetic=args.synthetic, **selection)
+        except (ValueError, FileExistsError) as e:
+            parser.error(str(e))
+        return
+    engine.run_all_experiments(limit=limit, manifest_dir=args.manifest, synthetic=args.synthetic, **selection)
+
+    print()
+    print(f"{limit}회 {args.domain} {engine.adapter.version.upper()} 실험 완료!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+Few-shot 예시 검색 인덱스 (Few-shot Example Index)
+================================================================================
+
+## 이 모듈의 목적
+분류 실험의 Few-shot 예시를 고정된 수작업 예시 대신,
+**질의 텍스트와 가장 가까운 라벨 예시 k개**를 검색하여 사용합니다.
+
+## 왜 BM25인가?
+- 임베딩 모델 없이 로컬에서 바로 동작 (추가 LLM 호출 없음)
+- 수천 개 후보에서도 역색인(inverted index) 덕분에 밀리초 단위 검색
+- 한국어는 띄어쓰기 단위가 길어서 단어 + 음절 bigram을 함께 색인
+
+## 캐시와 증분 업데이트
+- 토큰화 결과(역색인, 문서 길이)를 gzip JSON으로 저장 → 재실행 시 재토큰화 없음
+- add()는 새 예시만 색인에 추가 (같은 텍스트/라벨은 중복 추가하지 않음)
+
+## 사용 예시
+
+```python
+from evaluation.example_index import ExampleIndex
+
+index = ExampleIndex.load_or_create("results/indexes/sentiment.json.gz")
+index.add_many([("정말 좋아요", "긍정"), ("별로예요", "부정")])
+index.save("results/indexes/sentiment.json.gz")
+
+examples = index.search("서비스가 훌륭해요", k=1, per_label=True)
+# → [{"text": "정말 좋아요", "label": "긍정", "score": ...}, ...]
+```
+================================================================================
+"""
+
+import gzip
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+_TOKEN_PATTERN = re.compile(r"[0-9A-Za-z가-힣]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """단어 + 음절 bigram 토큰화 (한국어 어미 변화에 강건하도록)"""
+    tokens = []
+    for word in _TOKEN_PATTERN.findall(text.lower()):
+        tokens.append(word)
+        if len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def _example_id(text: str, label: str) -> str:
+    return hashlib.sha1(f"{label}\t{text}".encode("utf-8")).hexdigest()[:16]
+
+
+class ExampleIndex:
+    """
+    라벨이 있는 예시의 BM25 역색인
+
+    Attributes:
+        docs: 색인된 예시 목록 [{"id", "text", "label"}]
+        postings: 토큰 → {문서 번호: 출현 횟수}
+        doc_lengths: 문서별 토큰 수
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.docs: List[Dict[str, str]] = []
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.doc_lengths: List[int] = []
+        self._ids = set()
+        self._total_length = 0
+
+    def __len__(self):
+        return len(self.docs)
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+
+    def add(self, text: str, label: str) -> bool:
+        """
+        예시 1개 추가 (증분 업데이트)
+
+        Returns:
+            bool: 새로 추가되었으면 True, 이미 있으면 False
+        """
+        example_id = _example_id(text, label)
+        if example_id in self._ids:
+            return False
+
+        doc_no = len(self.docs)
+        tokens = tokenize(text)
+        for token, tf in Counter(tokens).items():
+            self.postings.setdefault(token, {})[doc_no] = tf
+
+        self.docs.append({"id": example_id, "text": text, "label": label})
+        self.doc_lengths.append(len(tokens))
+        self._ids.add(example_id)
+        self._total_length += len(tokens)
+        return True
+
+    def add_many(self, examples: Iterable[Tuple[str, str]]) -> int:
+        """(text, label) 목록 추가, 새로 추가된 개수 반환"""
+        return sum(1 for text, label in examples if self.add(text, label))
+
+    def labels(self) -> List[str]:
+        """색인에 포함된 라벨 (처음 등장한 순서)"""
+        return list(dict.fromkeys(doc["label"] for doc in self.docs))
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def _scores(self, query: str) -> Dict[int, float]:
+        """질의 토큰이 등장하는 문서만 BM25 점수 계산"""
+        n_docs = len(self.docs)
+        if n_docs == 0:
+            return {}
+
+        avg_length = self._total_length / n_docs or 1.0
+        scores: Dict[int, float] = {}
+
+        for token in set(tokenize(query)):
+            posting = self.postings.get(token)
+            if not posting:
+                continue
+            idf = math.log(1 + (n_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc_no, tf in posting.items():
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_no] / avg_length)
+                scores[doc_no] = scores.get(doc_no, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return scores
+
+    def search(
+        self,
+        query: str,
+        k: int = 3,
+        per_label: bool = False,
+        exclude_text: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        질의와 가장 가까운 라벨 예시 검색
+
+        Args:
+            query: 분류할 텍스트
+            k: 반환할 예시 수 (per_label=True면 라벨당 개수)
+            per_label: 라벨마다 k개씩 반환 (라벨 균형을 맞춘 Few-shot용)
+            exclude_text: 결과에서 제외할 텍스트 (평가 대상 자신이 예시로 새는 것 방지)
+
+        Returns:
+            List[Dict]: [{"text", "label", "score"}] - 점수 내림차순
+        """
+        scores = self._scores(query)
+        candidates = (
+            (score, doc_no) for doc_no, score in scores.items()
+            if exclude_text is None or self.docs[doc_no]["text"] != exclude_text
+        )
+
+        if not per_label:
+            top = heapq.nlargest(k, candidates)
+        else:
+            by_label: Dict[str, List[Tuple[float, int]]] = {}
+            for score, doc_no in candidates:
+                by_label.setdefault(self.docs[doc_no]["label"], []).append((score, doc_no))
+            top = []
+            for label in self.labels():
+                top.extend(heapq.nlargest(k, by_label.get(label, [])))
+            top.sort(reverse=True)
+
+        return [
+            {"text": self.docs[doc_no]["text"], "label": self.docs[doc_no]["label"], "score": round(score, 4)}
+            for score, doc_no in top
+        ]
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드
+    # ------------------------------------------------------------------
+
+    def save(self, path: str):
+        """토큰화 결과까지 포함하여 gzip JSON으로 저장"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        data = {
+            "k1": self.k1,
+            "b": self.b,
+            "docs": self.docs,
+            "doc_lengths": self.doc_lengths,
+            "postings": {token: list(posting.items()) for token, posting in self.postings.items()},
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> "ExampleIndex":
+        """저장된 인덱스 로드 (재토큰화 없음)"""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+
+        index = cls(k1=data["k1"], b=data["b"])
+        index.docs = data["docs"]
+        index.doc_lengths = data["doc_lengths"]
+        index.postings = {token: dict(pairs) for token, pairs in data["postings"].items()}
+        index._ids = {doc["id"] for doc in index.docs}
+        index._total_length = sum(index.doc_lengths)
+        return index
+
+    @classmethod
+    def load_or_create(cls, path: str) -> "ExampleIndex":
+        """인덱스 파일이 있으면 로드, 없으면 빈 인덱스 생성"""
+        if path and os.path.exists(path):
+            return cls.load(path)
+        return cls()
@@ -0,0 +1,515 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+LLM 백엔드 (LLM Backends)
+================================================================================
+
+## 이 모듈의 목적
+도메인 실행기가 사용할 채팅 모델을 **백엔드 이름으로 생성**합니다.
+- ollama: 실제 Ollama 서버 (langchain_ollama.ChatOllama)
+- mock: Ollama 없이 결정적인 응답을 즉시 돌려주는 모의 모델
+- record: 실제 Ollama 호출을 그대로 쓰면서 프롬프트/응답/시간/토큰 수를 녹화 파일(JSONL)에 추가
+- replay: 녹화 파일의 응답을 모델 없이 다시 재생 (녹화된 지연 또는 지정한 지연, 토큰 단위 스트리밍)
+
+## 왜 필요한가?
+- 하네스(프롬프트 생성 → 호출 → 토큰 계산 → 품질 평가 → 집계)의 처리량과 메모리를
+  측정하려 해도, 실행 시간 대부분이 Ollama 추론에 묶여 있음
+- 합성 코퍼스(evaluation.synthetic)로 수만~수십만 건을 돌리려면 추론 없는 백엔드가 필요
+
+## 모의 응답 (MockChatModel)
+- 같은 (seed, 프롬프트)에는 항상 같은 응답 (프롬프트 sha256으로 난수 시드 결정)
+- 프롬프트의 목록 항목(- ..., 1. ...) 일부를 되받아 써서 요소 포함율이 케이스마다 달라짐
+- 마크다운 제목/표/목록과 존댓말 표현을 섞어 구조/전문성 점수도 분포를 가짐
+- 평가(Judge) 프롬프트의 JSON 형식("accuracy": <1-10> 등)을 감지하면 점수 JSON으로 응답
+- latency를 주면 응답마다 해당 시간(±50%)만큼 대기하여 서버 지연을 흉내
+
+## 녹화/재생 (RecordingChatModel / ReplayChatModel)
+모의 응답은 실제 모델 응답의 길이/내용 분포와 다르므로, 하네스 벤치마크를 실제 실행과 같은 입력으로
+돌리려면 한 번 녹화한 실행을 재생합니다.
+
+    results/recordings/<모델>.jsonl   한 줄에 호출 1건
+    {"prompt_sha256", "prompt", "response", "elapsed", "prompt_tokens", "output_tokens", "model", "temperature", "recorded_at"}
+
+- 같은 프롬프트가 여러 번 녹화되어 있으면 (일관성 측정 등) 녹화 순서대로 돌아가며 재생
+- latency: "recorded"(녹화된 시간) / "none"(즉시) / 초 단위 숫자, speed로 배속 (10이면 10배 빠르게)
+- 녹화에 없는 프롬프트: miss="error"면 예외(실행기에는 실패로 기록), "mock"이면 모의 응답
+- stream()은 응답을 토큰 조각으로 나눠 지연을 고르게 나누어 돌려줌
+- HTTP로 Ollama API를 흉내 내는 서버는 evaluation.ollama_emulator 참고
+
+## 사용 예시
+
+```python
+from evaluation.llm_backends import create_chat_model
+
+llm = create_chat_model("mock", model="qwen2.5:7b", temperature=0.3)
+print(llm.invoke("다음 요소를 포함하세요:\\n- 일정\\n- 예산").content)
+```
+
+```bash
+python scripts/run_business_experiments.py v2 --backend mock --synthetic 10000
+python scripts/run_business_experiments.py v4 20 --backend record       # 실제 실행 녹화
+python scripts/run_business_experiments.py v4 20 --backend replay --replay-latency none
+```
+================================================================================
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+
+BACKENDS = ("ollama", "mock", "record", "replay")
+LIVE_BACKENDS = ("ollama", "record")  # 실제 모델 응답 (결과의 모델 이름에 백엔드 접두어를 붙이지 않음)
+REPLAY_MISS_POLICIES = ("error", "mock")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RECORDINGS_DIR = os.path.join(PROJECT_ROOT, "results", "recordings")
+
+# 응답에 되받아 쓸 프롬프트 목록 항목 ("- 항목", "* 항목", "1. 항목")
+_LIST_ITEM = re.compile(r"^\s*(?:[-*]|\d+\.)\s+(.{2,80}?)\s*$", re.MULTILINE)
+
+# 평가 프롬프트의 점수 필드 ("accuracy": <1-10>)
+_SCORE_FIELD = re.compile(r'"(\w+)"\s*:\s*<1-10>')
+
+# 스트리밍 조각 (단어 + 뒤따르는 공백, 대략 토큰 1~2개)
+_CHUNK = re.compile(r"\S+\s*|\s+")
+
+_HEADINGS = ["개요", "핵심 내용", "세부 사항", "검토 결과", "권장 사항", "다음 단계"]
+_PHRASES = [
+    "검토 부탁드립니다.", "확인 후 회신 부탁드립니다.", "안내드립니다.", "감사합니다.",
+    "개선을 권장합니다.", "추가 검토가 필요합니다.", "요청하신 내용을 정리했습니다.",
+]
+
+
+class MockMessage:
+    """invoke() 응답 (AIMessage처럼 content 속성만 제공)"""
+
+    __slots__ = ("content",)
+
+    def __init__(self, content: str):
+        self.content = content
+
+
+@dataclass
+class Completion:
+    """모의/재생 모델의 응답 1건 (대기 전, HTTP 에뮬레이터와 공유)"""
+    text: str
+    latency: float  # 응답 전체에 걸릴 시간 (초)
+    prompt_tokens: Optional[int] = None  # 녹화된 토큰 수 (없으면 HTTP 에뮬레이터가 조각 수로 추정)
+    output_tokens: Optional[int] = None
+
+
+def prompt_text(prompt: Any) -> str:
+    """문자열 또는 LangChain 메시지 목록 → 프롬프트 문자열 (메시지 내용을 줄바꿈으로 연결)"""
+    if isinstance(prompt, str):
+        return prompt
+    return "\n".join(str(getattr(m, "content", m)) for m in prompt)
+
+
+def split_chunks(text: str) -> List[str]:
+    """스트리밍용 토큰 조각 (이어 붙이면 원래 텍스트)"""
+    return _CHUNK.findall(text)
+
+
+def prompt_key(prompt: str) -> str:
+    """녹화 파일의 프롬프트 키 (sha256)"""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def stream_completion(completion: Completion) -> Iterator[MockMessage]:
+    """응답을 토큰 조각으로 나눠 지연을 고르게 나누어 반환"""
+    chunks = split_chunks(completion.text) or [""]
+    delay = completion.latency / len(chunks)
+    for chunk in chunks:
+        if delay > 0:
+            time.sleep(delay)
+        yield MockMessage(chunk)
+
+
+class MockChatModel:
+    """
+    Ollama 없이 결정적인 응답을 돌려주는 모의 채팅 모델
+
+    Attributes:
+        model: 흉내 낼 모델 이름 (응답에는 영향 없음)
+        temperature: 호환용 (응답에는 영향 없음)
+        latency: 응답당 평균 지연(초), 0이면 대기하지 않음
+        seed: 응답 난수 시드 (같은 seed + 프롬프트 → 같은 응답)
+    """
+
+    def __init__(self, model: str = "mock", temperature: float = 0.0, latency: float = 0.0, seed: int = 0):
+        self.model = model
+        self.temperature = temperature
+        self.latency = latency
+        self.seed = seed
+        self.calls = 0
+
+    def invoke(self, prompt: Any) -> MockMessage:
+        """
+        프롬프트에 대한 모의 응답 생성
+
+        Args:
+            prompt: 문자열 (LangChain 메시지 목록이면 내용을 이어 붙여 사용)
+
+        Returns:
+            MockMessage: content에 응답 텍스트
+        """
+        completion = self.complete(prompt)
+        if completion.latency > 0:
+            time.sleep(completion.latency)
+        return MockMessage(completion.text)
+
+    def stream(self, prompt: Any) -> Iterator[MockMessage]:
+        """invoke와 같은 응답을 토큰 조각으로 나눠 반환 (지연도 조각마다 나눔)"""
+        return stream_completion(self.complete(prompt))
+
+    def complete(self, prompt: Any) -> Completion:
+        """대기 없이 응답과 흉내 낼 지연 계산 (invoke/stream/HTTP 에뮬레이터 공용)"""
+        prompt = prompt_text(prompt)
+        digest = hashlib.sha256(f"{self.seed}:{prompt}".encode("utf-8")).digest()
+        rng = random.Random(int.from_bytes(digest[:8], "big"))
+        self.calls += 1
+
+        latency = self.latency * rng.uniform(0.5, 1.5) if self.latency > 0 else 0.0
+
+        score_fields = _SCORE_FIELD.findall(prompt)
+        if score_fields:
+            text = self._judge_response(rng, score_fields)
+        else:
+            text = self._document_response(rng, prompt)
+        return Completion(text, latency)
+
+    @staticmethod
+    def _judge_response(rng: random.Random, fields: List[str]) -> str:
+        scores = ", ".join(f'"{field}": {rng.randint(4, 10)}' for field in dict.fromkeys(fields))
+        return f'```json\n{{{scores}, "feedback": "모의 평가 응답"}}\n```'
+
+    @staticmethod
+    def _document_response(rng: random.Random, prompt: str) -> str:
+        items = list(dict.fromkeys(_LIST_ITEM.findall(prompt)))
+        echoed = [item for item in items if rng.random() < 0.7]
+
+        lines = []
+        for heading in rng.sample(_HEADINGS, rng.randint(2, 4)):
+            lines.append(f"## {heading}")
+            for _ in range(rng.randint(1, 3)):
+                item = echoed.pop() if echoed else rng.choice(_PHRASES)
+                lines.append(f"- {item}")
+            lines.append(rng.choice(_PHRASES))
+            lines.append("")
+        while echoed:
+            lines.append(f"- {echoed.pop()}")
+        if rng.random() < 0.5:
+            lines.extend(["| 항목 | 내용 |", "|---|---|", f"| 요약 | {rng.choice(_PHRASES)} |"])
+        if rng.random() < 0.3:
+            lines.extend(["```python", "result = process(data)", "```"])
+        return "\n".join(lines)
+
+
+def default_recording_path(model: str) -> str:
+    """모델별 기본 녹화 파일 (results/recordings/<모델>.jsonl, ':' 등은 '_'로)"""
+    return os.path.join(RECORDINGS_DIR, re.sub(r"[^\w.-]", "_", model) + ".jsonl")
+
+
+class RecordingChatModel:
+    """
+    실제 채팅 모델 호출을 녹화 파일에 추가하는 래퍼
+
+    응답은 감싼 모델의 응답을 그대로 반환하고, 실패한 호출은 녹화하지 않습니다.
+    (평가용 모델 등 여러 인스턴스가 같은 파일에 써도 되도록 파일 추가는 잠금 안에서 한 줄씩)
+
+    Attributes:
+        inner: 실제 채팅 모델 (ChatOllama)
+        path: 녹화 파일 경로
+        recorded: 이 인스턴스가 녹화한 호출 수
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, inner, path: str, model: str, temperature: float):
+        """
+        Args:
+            inner: invoke(prompt).content 를 제공하는 실제 채팅 모델
+            path: 녹화 파일 경로 (없으면 생성, 있으면 이어서 추가)
+            model: 녹화에 기록할 모델 이름
+            temperature: 녹화에 기록할 샘플링 온도
+        """
+        self.inner = inner
+        self.path = path
+        self.model = model
+        self.temperature = temperature
+        self.recorded = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def invoke(self, prompt: Any):
+        """감싼 모델 호출 + 녹화"""
+        start = time.perf_counter()
+        message = self.inner.invoke(prompt)
+        elapsed = time.perf_counter() - start
+
+        text = prompt_text(prompt)
+        metadata = getattr(message, "response_metadata", None) or {}
+        record = {
+            "prompt_sha256": prompt_key(text),
+            "prompt": text,
+            "response": message.content,
+            "elapsed": round(elapsed, 4),
+            "prompt_tokens": metadata.get("prompt_eval_count"),
+            "output_tokens": metadata.get("eval_count"),
+            "model": self.model,
+            "temperature": self.temperature,
+            "recorded_at": datetime.now().isoformat()
+        }
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+            self.recorded += 1
+        return message
+
+
+def load_recording(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    녹화 파일 → 프롬프트 키별 녹화 목록 (녹화 순서 유지, 잘린 마지막 줄은 무시)
+
+    Args:
+        path: 녹화 파일 경로
+
+    Returns:
+        Dict[str, List[Dict]]: prompt_sha256 → [녹화, ...]
+
+    Raises:
+        FileNotFoundError: 녹화 파일이 없음
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"녹화 파일이 없습니다: {path} (먼저 --backend record로 실행)")
+    index: Dict[str, List[Dict[str, Any]]] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # 녹화 중 중단된 마지막 줄
+            index.setdefault(record["prompt_sha256"], []).append(record)
+    return index
+
+
+class ReplayChatModel:
+    """
+    녹화 파일의 응답을 재생하는 채팅 모델 (모델 없이 실제 응답으로 하네스 벤치마크)
+
+    Attributes:
+        path: 녹화 파일 경로
+        latency: "recorded"(녹화된 시간), "none"(즉시), 또는 응답당 초
+        speed: 지연 배속 (2.0이면 절반 시간)
+        miss: 녹화에 없는 프롬프트 처리 ("error" 또는 "mock")
+        hits / misses: 재생한 호출 수 / 녹화에 없던 호출 수
+    """
+
+    def __init__(
+        self,
+        path: str,
+        model: str = "replay",
+        temperature: float = 0.0,
+        latency: Union[str, float] = "recorded",
+        speed: float = 1.0,
+        miss: str = "error",
+        seed: int = 0
+    ):
+        """
+        Args:
+            path: 녹화 파일 경로
+            model: 모델 이름 (모의 응답 대체 시 사용)
+            temperature: 호환용 (응답에는 영향 없음)
+            latency: "recorded", "none", 또는 응답당 초
+            speed: 지연 배속 (0보다 커야 함)
+            miss: 녹화에 없는 프롬프트 처리 ("error": LookupError, "mock": 모의 응답)
+            seed: miss="mock"일 때 모의 응답 시드
+        """
+        if speed <= 0:
+            raise ValueError(f"speed는 0보다 커야 합니다: {speed}")
+        if miss not in REPLAY_MISS_POLICIES:
+            raise ValueError(f"지원하지 않는 miss 정책: {miss} (가능: {', '.join(REPLAY_MISS_POLICIES)})")
+        self.path = path
+        self.model = model
+        self.temperature = temperature
+        self.latency = latency if latency in ("recorded", "none") else float(latency)
+        self.speed = speed
+        self.miss = miss
+        self.hits = 0
+        self.misses = 0
+        self._index = load_recording(path)
+        self._turns: Dict[str, int] = {}  # 프롬프트 키 → 다음에 재생할 녹화 순번
+        self._lock = threading.Lock()  # 동시 호출(--concurrency) 시 순번/통계 보호
+        self._fallback = MockChatModel(model=model, temperature=temperature, seed=seed) if miss == "mock" else None
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._index.values())
+
+    def complete(self, prompt: Any) -> Completion:
+        """대기 없이 녹화된 응답과 재생할 지연 계산 (invoke/stream/HTTP 에뮬레이터 공용)"""
+        text = prompt_text(prompt)
+        key = prompt_key(text)
+        records = self._index.get(key)
+        if not records:
+            with self._lock:
+                self.misses += 1
+            if self._fallback is None:
+                raise LookupError(f"녹화에 없는 프롬프트입니다 (sha256 {key[:12]}..., {self.path})")
+            completion = self._fallback.complete(text)
+            completion.latency = self._latency(completion.latency)
+            return completion
+
+        with self._lock:
+            turn = self._turns.get(key, 0)
+            self._turns[key] = turn + 1
+            self.hits += 1
+        record = records[turn % len(records)]
+        response = record["response"]
+        return Completion(
+            response, self._latency(record.get("elapsed") or 0.0),
+            record.get("prompt_tokens"), record.get("output_tokens")
+        )
+
+    def _latency(self, recorded: float) -> float:
+        if self.latency == "none":
+            return 0.0
+        base = recorded if self.latency == "recorded" else self.latency
+        return base / self.speed
+
+    def invoke(self, prompt: Any) -> MockMessage:
+        """
+        녹화된 응답 재생
+
+        Args:
+            prompt: 문자열 (LangChain 메시지 목록이면 내용을 이어 붙여 사용)
+
+        Returns:
+            MockMessage: content에 녹화된 응답 텍스트
+
+        Raises:
+            LookupError: 녹화에 없는 프롬프트 (miss="error")
+        """
+        completion = self.complete(prompt)
+        if completion.latency > 0:
+            time.sleep(completion.latency)
+        return MockMessage(completion.text)
+
+    def stream(self, prompt: Any) -> Iterator[MockMessage]:
+        """녹화된 응답을 토큰 조각으로 나눠 반환 (지연도 조각마다 나눔)"""
+        return stream_completion(self.complete(prompt))
+
+
+# CLI에서 지정한 백엔드별 기본 인자 (set_backend_options, create_chat_model이 병합)
+_BACKEND_OPTIONS: Dict[str, Dict[str, Any]] = {}
+
+
+def set_backend_options(backend: str, **options):
+    """
+    이후 create_chat_model(backend, ...)에 기본으로 넘길 인자 설정 (실행기 CLI → 엔진 → 평가용 모델까지 공통)
+
+    Args:
+        backend: 백엔드 이름
+        **options: 백엔드별 인자 (None인 값은 무시)
+    """
+    _BACKEND_OPTIONS[backend] = {key: value for key, value in options.items() if value is not None}
+
+
+def create_chat_model(backend: str = "ollama", model: str = "qwen2.5:7b", temperature: float = 0.3, **kwargs):
+    """
+    백엔드 이름으로 채팅 모델 생성
+
+    Args:
+        backend: "ollama", "mock", "record", "replay"
+        model: 모델 이름
+        temperature: 샘플링 온도
+        **kwargs: 백엔드별 추가 인자 (set_backend_options 값보다 우선)
+            - ollama: base_url 등 ChatOllama 인자
+            - mock: latency, seed
+            - record: recording(녹화 파일, 기본 results/recordings/<모델>.jsonl), base_url
+            - replay: recording, latency, speed, miss, seed
+
+    Returns:
+        invoke(prompt).content 를 제공하는 채팅 모델
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드
+        FileNotFoundError: replay인데 녹화 파일이 없음
+    """
+    options = {**_BACKEND_OPTIONS.get(backend, {}), **kwargs}
+    if backend == "ollama":
+        from langchain_ollama import ChatOllama
+        return ChatOllama(model=model, temperature=temperature, **options)
+    if backend == "mock":
+        return MockChatModel(model=model, temperature=temperature, **options)
+    if backend == "record":
+        path = options.pop("recording", None) or default_recording_path(model)
+        inner = create_chat_model("ollama", model=model, temperature=temperature, **options)
+        return RecordingChatModel(inner, path, model, temperature)
+    if backend == "replay":
+        path = options.pop("recording", None) or default_recording_path(model)
+        return ReplayChatModel(path, model=model, temperature=temperature, **options)
+    raise ValueError(f"지원하지 않는 LLM 백엔드: {backend} (가능: {', '.join(BACKENDS)})")
+
+
+def add_backend_arguments(parser, default: str = "ollama"):
+    """실행기 CLI에 --backend와 녹화/재생/서버 주소 인자 추가"""
+    parser.add_argument("--backend", choices=BACKENDS, default=default,
+                        help="LLM 백엔드 (mock: 결정적 모의 응답, record: 실제 호출 녹화, replay: 녹화 재생 - 하네스 처리량 측정용)")
+    parser.add_argument("--recording", type=str, default=None,
+                        help="record/replay 녹화 파일 (기본: results/recordings/<모델>.jsonl)")
+    parser.add_argument("--replay-latency", type=str, default="recorded",
+                        help="replay 지연: recorded(녹화된 시간), none(즉시), 또는 응답당 초 (기본: recorded)")
+    parser.add_argument("--replay-speed", type=float, default=1.0,
+                        help="replay 지연 배속 (예: 10이면 10배 빠르게, 기본: 1)")
+    parser.add_argument("--replay-miss", choices=REPLAY_MISS_POLICIES, default="error",
+                        help="녹화에 없는 프롬프트: error(실패로 기록) 또는 mock(모의 응답, 기본: error)")
+    parser.add_argument("--ollama-url", type=str, default=None,
+                        help="ollama/record 서버 주소 (예: evaluation.ollama_emulator의 http://127.0.0.1:11435)")
+
+
+def parse_backend_arguments(parser, args) -> str:
+    """
+    add_backend_arguments로 추가한 인자를 검증하고 백엔드 기본 인자로 설정
+
+    Returns:
+        str: 백엔드 이름 (실행기 backend 인자)
+    """
+    if args.replay_latency not in ("recorded", "none"):
+        try:
+            if float(args.replay_latency) < 0:
+                raise ValueError
+        except ValueError:
+            parser.error("--replay-latency는 recorded, none, 또는 0 이상의 초여야 합니다")
+    if args.replay_speed <= 0:
+        parser.error("--replay-speed는 0보다 커야 합니다")
+    if args.backend == "replay" and args.recording and not os.path.exists(args.recording):
+        parser.error(f"녹화 파일이 없습니다: {args.recording}")
+    if args.ollama_url and args.backend not in LIVE_BACKENDS:
+        parser.error("--ollama-url은 --backend ollama/record에서만 사용할 수 있습니다")
+
+    set_backend_options("ollama", base_url=args.ollama_url)
+    set_backend_options("record", recording=args.recording, base_url=args.ollama_url)
+    set_backend_options(
+        "replay", recording=args.recording, latency=args.replay_latency,
+        speed=args.replay_speed, miss=args.replay_miss
+    )
+    return args.backend
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="모의 LLM 응답 확인")
+    parser.add_argument("prompt", nargs="?", default="다음 요소를 포함하세요:\n- 일정 공유\n- 예산 확인\n- 담당자 지정")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(MockChatModel(seed=args.seed).invoke(args.prompt).content)
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+프롬프트 매니페스트 (Prompt Manifest)
+================================================================================
+
+## 이 모듈의 목적
+실행 계획에 포함된 모든 (테스트 케이스, 버전) 프롬프트를 **실행 전에 미리 렌더링**하여
+매니페스트로 저장합니다.
+
+## 왜 필요한가?
+- 실행기는 LLM 호출 직전에 프롬프트를 만들기 때문에 전체 입력 크기를 미리 알 수 없음
+- 다른 머신에서 동일한 프롬프트로 실행하려면 프롬프트 자체를 전달해야 함
+- CPU 작업(렌더링, 토큰 계산)과 LLM 실행을 분리하면 렌더링을 병렬화할 수 있음
+
+## 저장 구조
+```
+results/manifests/<name>/
+├── manifest.json            # 메타 정보 + 항목 목록
+└── blobs/ab/abcd....txt.gz  # 프롬프트 본문 (SHA-256 기반, gzip 압축)
+```
+
+각 항목은 domain, version, test_case_id, prompt_sha256, input_tokens, blob 경로를 가집니다.
+동일한 프롬프트는 하나의 blob을 공유합니다.
+================================================================================
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+MANIFEST_FILENAME = "manifest.json"
+BLOB_DIRNAME = "blobs"
+
+# render_fn(domain, version, test_case_id) -> (prompt, input_tokens)
+RenderFn = Callable[[str, str, str], Tuple[str, int]]
+
+
+def prompt_hash(prompt: str) -> str:
+    """프롬프트 본문의 SHA-256 해시"""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def shard_of(key: str, shard_count: int) -> int:
+    """키(test_case_id)의 해시로 샤드 번호 계산 (실행 환경과 무관하게 안정적)"""
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+def write_blob(manifest_dir: str, prompt: str) -> Tuple[str, str]:
+    """
+    프롬프트를 압축 blob으로 저장
+
+    Returns:
+        (prompt_sha256, manifest_dir 기준 상대 경로)
+    """
+    sha = prompt_hash(prompt)
+    rel_path = f"{BLOB_DIRNAME}/{sha[:2]}/{sha}.txt.gz"
+    abs_path = os.path.join(manifest_dir, rel_path)
+
+    if not os.path.exists(abs_path):
+        os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+        # 병렬 워커가 같은 blob을 동시에 쓸 수 있으므로 임시 파일 후 rename
+        tmp_path = f"{abs_path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, "wb") as f:
+            f.write(prompt.encode("utf-8"))
+        os.replace(tmp_path, abs_path)
+
+    return sha, rel_path
+
+
+def _render_job(args: Tuple[RenderFn, str, str, str, str]) -> Dict:
+    """워커 프로세스에서 실행되는 단일 렌더링 작업"""
+    render_fn, manifest_dir, domain, version, test_case_id = args
+    prompt, input_tokens = render_fn(domain, version, test_case_id)
+    sha, rel_path = write_blob(manifest_dir, prompt)
+    return {
+        "domain": domain,
+        "version": version,
+        "test_case_id": test_case_id,
+        "prompt_sha256": sha,
+        "input_tokens": input_tokens,
+        "blob": rel_path,
+    }
+
+
+def render_manifest(
+    manifest_dir: str,
+    jobs: List[Tuple[str, str, str]],
+    render_fn: RenderFn,
+    workers: int = 1,
+    meta: Optional[Dict] = None
+) -> Dict:
+    """
+    실행 계획의 모든 프롬프트를 렌더링하여 매니페스트 생성
+
+    Args:
+        manifest_dir: 매니페스트를 저장할 디렉토리
+        jobs: (domain, version, test_case_id) 목록
+        render_fn: 프롬프트 렌더링 함수 (워커에서 호출되므로 모듈 최상위 함수여야 함)
+        workers: 병렬 워커 프로세스 수 (1이면 현재 프로세스에서 순차 실행)
+        meta: 매니페스트에 함께 기록할 추가 정보 (모델명 등)
+
+    Returns:
+        Dict: 저장된 매니페스트 내용
+    """
+    os.makedirs(manifest_dir, exist_ok=True)
+    tasks = [(render_fn, manifest_dir, domain, version, tc_id) for domain, version, tc_id in jobs]
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            entries = list(executor.map(_render_job, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    else:
+        entries = [_render_job(task) for task in tasks]
+
+    # 도메인/버전별 입력 토큰 집계
+    totals = {}
+    for entry in entries:
+        key = f"{entry['domain']}/{entry['version']}"
+        stats = totals.setdefault(key, {"count": 0, "input_tokens": 0})
+        stats["count"] += 1
+        stats["input_tokens"] += entry["input_tokens"]
+
+    manifest = {
+        "created_at": datetime.now().isoformat(),
+        "meta": meta or {},
+        "total_prompts": len(entries),
+        "unique_blobs": len({e["prompt_sha256"] for e in entries}),
+        "total_input_tokens": sum(e["input_tokens"] for e in entries),
+        "totals": totals,
+        "entries": entries,
+    }
+
+    with open(os.path.join(manifest_dir, MANIFEST_FILENAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    return manifest
+
+
+def load_manifest(
+    manifest_dir: str,
+    shard: Optional[Tuple[int, int]] = None
+) -> Dict:
+    """
+    매니페스트 로드
+
+    Args:
+        manifest_dir: 매니페스트 디렉토리
+        shard: (shard_index, shard_count) - 지정 시 해당 샤드의 항목만 남김.
+               같은 test_case_id는 항상 같은 샤드에 배정됨
+
+    Returns:
+        Dict: 매니페스트 (entries는 샤드 필터링 적용)
+    """
+    with open(os.path.join(manifest_dir, MANIFEST_FILENAME), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    if shard is not None:
+        index, count = shard
+        manifest["entries"] = [
+            e for e in manifest["entries"]
+            if shard_of(e["test_case_id"], count) == index
+        ]
+    return manifest
+
+
+def read_prompt(manifest_dir: str, entry: Dict) -> str:
+    """매니페스트 항목의 프롬프트 본문 읽기 (해시 검증 포함)"""
+    with gzip.open(os.path.join(manifest_dir, entry["blob"]), "rb") as f:
+        prompt = f.read().decode("utf-8")
+
+    if prompt_hash(prompt) != entry["prompt_sha256"]:
+        raise ValueError(f"프롬프트 해시 불일치: {entry['test_case_id']} ({entry['blob']})")
+    return prompt
+
+
+def iter_manifest_prompts(
+    manifest_dir: str,
+    domain: str,
+    version: str,
+    test_cases: List,
+    shard: Optional[Tuple[int, int]] = None
+) -> Iterator[Tuple[object, str]]:
+    """
+    매니페스트에서 실행할 (테스트 케이스, 프롬프트) 쌍을 순서대로 반환
+
+    실행기가 generate_prompt() 대신 이 함수를 사용하면
+    매니페스트에 저장된 프롬프트를 그대로 실행합니다.
+
+    Args:
+        manifest_dir: 매니페스트 디렉토리
+        domain: 실행기 도메인 (business, career, development, data_analysis)
+        version: 실행기 프롬프트 버전
+        test_cases: 해당 도메인의 전체 테스트 케이스 (채점에 필요한 정보 조회용)
+        shard: (shard_index, shard_count) - 여러 호스트에 나눠 실행할 때 사용
+    """
+    manifest = load_manifest(manifest_dir, shard=shard)
+    cases_by_id = {tc.id: tc for tc in test_cases}
+
+    for entry in manifest["entries"]:
+        if entry["domain"] != domain or entry["version"] != version:
+            continue
+        test_case = cases_by_id.get(entry["test_case_id"])
+        if test_case is None:
+            raise KeyError(f"매니페스트의 테스트 케이스를 찾을 수 없습니다: {entry['test_case_id']}")
+        yield test_case, read_prompt(manifest_dir, entry)
@@ -62,13 +62,16 @@ Created: 2025-01-19
 """
 
 import re
-import time
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Union
 from dataclasses import dataclass
 from collections import Counter
 
 import tiktoken
 
+from evaluation import profiling, tracing
+from evaluation.call_policy import CallPolicy
+from evaluation.concurrency import DEFAULT_MAX_CONCURRENCY, create_limiter, ordered_map
+
 
 # ============================================================================
 # 데이터 클래스: 평가 결과 저장
@@ -141,7 +144,14 @@ class PromptEvaluator:
     ```
     """
 
-    def __init__(self, llm, tokenizer_model: str = "gpt-3.5-turbo"):
+    def __init__(
+        self,
+        llm,
+        tokenizer_model: str = "gpt-3.5-turbo",
+        concurrency: Union[int, str] = 1,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        call_policy: CallPolicy = None
+    ):
         """
         평가기 초기화
 
@@ -151,8 +161,17 @@ class PromptEvaluator:
                            - "gpt-3.5-turbo": OpenAI 토크나이저 (업계 표준)
                            - 실제 사용하는 모델과 다를 수 있지만,
                              일관된 비교를 위해 동일한 토크나이저 사용
+            concurrency: 동시 LLM 호출 수 (1이면 순차, 정수면 고정, "auto"면 지연/처리량/오류로 조절)
+                         - evaluate_batch가 케이스를 동시에 평가 (결과 순서는 입력 순서 유지)
+            max_concurrency: concurrency="auto"의 최대 한도
+            call_policy: LLM 호출 타임아웃/재시도/헤지 정책 (None이면 바로 호출)
+                         - 재시도/헤지 후에도 실패하면 LLMCallError
         """
         self.llm = llm
+        # 모든 LLM 호출 앞의 동시 호출 한도 (evaluation.concurrency)
+        self.limiter = create_limiter(concurrency, max_concurrency)
+        # 모든 LLM 호출의 타임아웃/재시도/헤지 정책 (evaluation.call_policy)
+        self.policy = call_policy or CallPolicy()
         # tiktoken: OpenAI의 토큰화 라이브러리
         # 업계에서 토큰 수 측정의 표준으로 사용됨
         self.encoder = tiktoken.encoding_for_model(tokenizer_model)
@@ -391,6 +410,7 @@ class PromptEvaluator:
     # 평가 지표 4: Latency (응답 시간)
     # ========================================================================
 
+    @tracing.traced("measure_latency", cat="llm")
     def measure_latency(self, prompt: str) -> EvaluationResult:
         """
         응답 시간을 측정합니다.
@@ -415,21 +435,16 @@ class PromptEvaluator:
         Returns:
             EvaluationResult: 응답 시간 정보
         """
-        # 시작 시간 기록
-        start = time.time()
-
-        # LLM 호출
-        response = self.llm.invoke(prompt)
-
-        # 종료 시간 기록
-        latency = time.time() - start
+        # LLM 호출 (응답 시간에는 한도 대기/재시도 대기 시간이 들어가지 않음)
+        with profiling.paused():
+            call = self.policy.invoke(self.llm, prompt, self.limiter)
 
         return EvaluationResult(
             metric_name="Latency",
             score=1.0,  # 비교용이므로 고정 점수
             details={
-                "latency_seconds": round(latency, 3),
-                "response_preview": response.content[:50]  # 응답 미리보기
+                "latency_seconds": round(call.elapsed, 3),
+                "response_preview": call.text[:50]  # 응답 미리보기
             }
         )
 
@@ -437,6 +452,7 @@ class PromptEvaluator:
     # 평가 지표 5: Consistency (일관성)
     # ========================================================================
 
+    @tracing.traced("consistency", cat="llm")
     def consistency(self, prompt: str, n_trials: int = 5) -> EvaluationResult:
         """
         일관성을 측정합니다. (같은 질문에 같은 답을 하는가?)
@@ -475,9 +491,10 @@ class PromptEvaluator:
 
         # n번 실행
         for _ in range(n_trials):
-            response = self.llm.invoke(prompt)
+            with profiling.paused():
+                response_text = self.policy.invoke(self.llm, prompt, self.limiter).text
             # 정규화: 공백 통일, 소문자 변환
-            normalized = re.sub(r'\s+', ' ', response.content.strip().lower())
+            normalized = re.sub(r'\s+', ' ', response_text.strip().lower())
             responses.append(normalized)
 
         # 가장 많이 나온 응답의 비율 계산
@@ -526,14 +543,15 @@ class PromptEvaluator:
         """
         results = {}
 
-        # 응답 시간 측정과 동시에 응답 받기
-        start = time.time()
-        response = self.llm.invoke(prompt)
-        latency = time.time() - start
-        response_text = response.content
+        # 응답 시간 측정과 동시에 응답 받기 (한도 대기/재시도 대기 시간 제외)
+        with profiling.paused():
+            call = self.policy.invoke(self.llm, prompt, self.limiter, span="llm_call")
+        response_text = call.text
+        latency = call.elapsed
 
         # 1. 토큰 효율성
-        results["token_efficiency"] = self.token_efficiency(prompt, response_text)
+        with tracing.span("token_count"):
+            results["token_efficiency"] = self.token_efficiency(prompt, response_text)
 
         # 2. 응답 시간
         results["latency"] = EvaluationResult(
@@ -544,8 +562,9 @@ class PromptEvaluator:
 
         # 3. 정확도 (정답이 있을 때만)
         if expected:
-            results["exact_match"] = self.exact_match(response_text, expected)
-            results["f1_score"] = self.f1_score(response_text, expected)
+            with tracing.span("score"):
+                results["exact_match"] = self.exact_match(response_text, expected)
+                results["f1_score"] = self.f1_score(response_text, expected)
 
         # 4. 일관성 (옵션)
         if measure_consistency:
@@ -583,6 +602,8 @@ class PromptEvaluator:
 
         Returns:
             Dict: 요약 통계와 상세 결과
+                  (동시 평가 시 summary["concurrency"]에 동시 호출 한도 지표,
+                   호출 정책을 켜면 summary["call_policy"]에 재시도/헤지 지표)
         """
         all_results = []
         total_em = 0
@@ -590,13 +611,20 @@ class PromptEvaluator:
         total_tokens = 0
         total_latency = 0
 
-        for i, case in enumerate(test_cases):
-            # 템플릿에 입력값 적용
-            prompt = prompt_template.format(**case["input"])
-            expected = case.get("expected")
+        def evaluate_case(indexed: tuple) -> Dict[str, EvaluationResult]:
+            i, case = indexed
+            with tracing.span("case", index=i):
+                # 템플릿에 입력값 적용
+                with tracing.span("prompt_build"):
+                    prompt = prompt_template.format(**case["input"])
+                expected = case.get("expected")
+
+                # 개별 평가
+                return self.evaluate_single(prompt, expected)
 
-            # 개별 평가
-            result = self.evaluate_single(prompt, expected)
+        # 동시 평가(concurrency > 1)여도 결과/출력은 입력 순서대로
+        workers = self.limiter.max_limit
+        for i, result in enumerate(ordered_map(evaluate_case, enumerate(test_cases), workers)):
             all_results.append(result)
 
             # 집계
@@ -614,14 +642,19 @@ class PromptEvaluator:
 
         n = len(test_cases)
 
+        summary = {
+            "total_cases": n,
+            "accuracy_em": total_em / n if n > 0 else 0,
+            "accuracy_f1": total_f1 / n if n > 0 else 0,
+            "avg_tokens": total_tokens / n if n > 0 else 0,
+            "avg_latency": total_latency / n if n > 0 else 0,
+        }
+        if workers > 1:
+            summary["concurrency"] = self.limiter.snapshot()
+        if self.policy.active:
+            summary["call_policy"] = self.policy.snapshot()
         return {
-            "summary": {
-                "total_cases": n,
-                "accuracy_em": total_em / n if n > 0 else 0,
-                "accuracy_f1": total_f1 / n if n > 0 else 0,
-                "avg_tokens": total_tokens / n if n > 0 else 0,
-                "avg_latency": total_latency / n if n > 0 else 0,
-            },
+            "summary": summary,
             "details": all_results
         }
 
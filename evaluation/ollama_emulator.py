@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+Ollama HTTP 에뮬레이터 (Ollama API Emulator)
+================================================================================
+
+## 이 모듈의 목적
+Ollama 서버의 /api/generate, /api/chat 을 흉내 내는 로컬 HTTP 서버입니다.
+응답은 녹화 파일 재생(ReplayChatModel) 또는 모의 응답(MockChatModel)으로 만듭니다.
+
+## 왜 필요한가?
+- --backend mock/replay는 모델 객체를 바꿔 끼우므로 HTTP 클라이언트(ChatOllama, httpx), 연결 재사용,
+  NDJSON 스트리밍 파싱 같은 실제 호출 경로는 측정되지 않음
+- 에뮬레이터에 --backend ollama --ollama-url 로 붙이면 모든 실행기를 모델 없이 끝에서 끝까지 측정 가능
+
+## 지원 엔드포인트
+| 메서드 | 경로 | 응답 |
+|--------|------|------|
+| GET | / | "Ollama is running" |
+| GET | /api/version | {"version"} |
+| GET | /api/tags | 에뮬레이터 모델 1개 |
+| POST | /api/show | 최소 모델 정보 |
+| POST | /api/generate | stream(기본 true)이면 NDJSON 조각, 아니면 JSON 1개 |
+| POST | /api/chat | 〃 (messages 내용을 줄바꿈으로 이어 프롬프트로 사용) |
+
+스트리밍은 응답을 토큰 조각으로 나눠 지연(녹화된 시간 또는 지정한 시간)을 조각마다 고르게 나눕니다.
+마지막 조각(done=true)에 prompt_eval_count / eval_count / *_duration(ns)을 넣습니다.
+
+## 사용 예시
+
+```bash
+# 터미널 1: 녹화 재생 서버 (10배 빠르게)
+python -m evaluation.ollama_emulator --source replay --recording results/recordings/qwen2.5_7b.jsonl --speed 10
+
+# 터미널 2: 실제 Ollama 경로로 실행
+python scripts/run_business_experiments.py v4 --backend ollama --ollama-url http://127.0.0.1:11435
+```
+
+```python
+from evaluation.llm_backends import MockChatModel
+from evaluation.ollama_emulator import start_emulator
+
+server = start_emulator(MockChatModel(latency=0.2), port=0)   # 빈 포트, 백그라운드 스레드
+... ChatOllama(model="qwen2.5:7b", base_url=server.url) ...
+server.shutdown()
+```
+================================================================================
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator
+
+from evaluation.llm_backends import Completion, split_chunks
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 11435  # 실제 Ollama(11434)와 겹치지 않도록
+EMULATOR_VERSION = "0.0.0-emulator"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class OllamaEmulator(ThreadingHTTPServer):
+    """
+    Ollama API 에뮬레이터 서버
+
+    Attributes:
+        source: complete(prompt) → Completion 을 제공하는 응답 원천 (ReplayChatModel, MockChatModel)
+        model_name: /api/tags 에 보일 모델 이름
+        requests: 처리한 생성 요청 수
+    """
+
+    daemon_threads = True
+
+    def __init__(self, source, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 model_name: str = "qwen2.5:7b", verbose: bool = False):
+        """
+        Args:
+            source: 응답 원천 (complete 메서드 필요)
+            host: 바인딩 주소
+            port: 포트 (0이면 빈 포트)
+            model_name: /api/tags 에 보일 모델 이름
+            verbose: 요청마다 접근 로그 출력
+        """
+        super().__init__((host, port), _Handler)
+        self.source = source
+        self.model_name = model_name
+        self.verbose = verbose
+        self.requests = 0
+        self._lock = threading.Lock()  # 재생 순번/모의 호출 수는 스레드 안전하지 않음
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def complete(self, prompt: str) -> Completion:
+        with self._lock:
+            self.requests += 1
+            return self.source.complete(prompt)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """요청 1건 처리 (HTTP/1.1 keep-alive, 스트리밍은 chunked 전송)"""
+
+    protocol_version = "HTTP/1.1"
+    server: OllamaEmulator
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # ---- 응답 헬퍼 ----
+
+    def _send_json(self, payload: Any, status: int = 200):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_text(self, text: str):
+        body = text.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_stream(self, lines: Iterator[Dict[str, Any]]):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for payload in lines:
+            data = (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+            self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _read_body(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    # ---- 라우팅 ----
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path == "/":
+            self._send_text("Ollama is running")
+        elif self.path == "/api/version":
+            self._send_json({"version": EMULATOR_VERSION})
+        elif self.path == "/api/tags":
+            name = self.server.model_name
+            self._send_json({"models": [{
+                "name": name, "model": name, "modified_at": _now(), "size": 0, "digest": "",
+                "details": {"format": "emulator", "family": "emulator", "parameter_size": "", "quantization_level": ""}
+            }]})
+        else:
+            self._send_json({"error": f"not found: {self.path}"}, 404)
+
+    def do_POST(self):
+        try:
+            request = self._read_body()
+        except json.JSONDecodeError as e:
+            self._send_json({"error": f"invalid JSON: {e}"}, 400)
+            return
+        if self.path == "/api/generate":
+            self._generate(request, chat=False)
+        elif self.path == "/api/chat":
+            self._generate(request, chat=True)
+        elif self.path == "/api/show":
+            self._send_json({
+                "modelfile": "", "parameters": "", "template": "{{ .Prompt }}",
+                "details": {"format": "emulator", "family": "emulator"},
+                "model_info": {}, "capabilities": ["completion"]
+            })
+        else:
+            self._send_json({"error": f"not found: {self.path}"}, 404)
+
+    def _generate(self, request: Dict[str, Any], chat: bool):
+        """/api/generate, /api/chat 공통 (stream 기본값 true - Ollama와 동일)"""
+        if chat:
+            prompt = "\n".join(str(m.get("content", "")) for m in request.get("messages", []))
+        else:
+            prompt = request.get("prompt", "")
+        model = request.get("model") or self.server.model_name
+        try:
+            completion = self.server.complete(prompt)
+        except LookupError as e:  # 녹화에 없는 프롬프트
+            self._send_json({"error": str(e)}, 404)
+            return
+
+        chunks = split_chunks(completion.text) or [""]
+        final = {
+            "model": model,
+            "created_at": _now(),
+            "done": True,
+            "done_reason": "stop",
+            "total_duration": int(completion.latency * 1e9),
+            "load_duration": 0,
+            "prompt_eval_count": completion.prompt_tokens or len(split_chunks(prompt)),
+            "prompt_eval_duration": 0,
+            "eval_count": completion.output_tokens or len(chunks),
+            "eval_duration": int(completion.latency * 1e9),
+        }
+
+        def piece(text: str) -> Dict[str, Any]:
+            if chat:
+                return {"model": model, "created_at": _now(), "message": {"role": "assistant", "content": text}, "done": False}
+            return {"model": model, "created_at": _now(), "response": text, "done": False}
+
+        if not request.get("stream", True):
+            if completion.latency > 0:
+                time.sleep(completion.latency)
+            message = piece(completion.text)
+            message.update(final)
+            if not chat:
+                message["context"] = []
+            self._send_json(message)
+            return
+
+        def lines() -> Iterator[Dict[str, Any]]:
+            delay = completion.latency / len(chunks)
+            for chunk in chunks:
+                if delay > 0:
+                    time.sleep(delay)
+                yield piece(chunk)
+            last = piece("")
+            last.update(final)
+            if not chat:
+                last["context"] = []
+            yield last
+
+        self._send_stream(lines())
+
+
+def start_emulator(source, host: str = DEFAULT_HOST, port: int = 0, **kwargs) -> OllamaEmulator:
+    """
+    에뮬레이터를 백그라운드 스레드에서 시작 (벤치마크/스크립트 내부용)
+
+    Args:
+        source: 응답 원천 (ReplayChatModel, MockChatModel)
+        host: 바인딩 주소
+        port: 포트 (기본 0: 빈 포트)
+        **kwargs: OllamaEmulator 인자 (model_name, verbose)
+
+    Returns:
+        OllamaEmulator: 실행 중인 서버 (.url, 끝나면 .shutdown())
+    """
+    server = OllamaEmulator(source, host=host, port=port, **kwargs)
+    threading.Thread(target=server.serve_forever, name="ollama-emulator", daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from evaluation.llm_backends import (
+        REPLAY_MISS_POLICIES,
+        MockChatModel,
+        ReplayChatModel,
+        default_recording_path
+    )
+
+    parser = argparse.ArgumentParser(description="Ollama API 에뮬레이터 (/api/generate, /api/chat)")
+    parser.add_argument("--source", choices=("replay", "mock"), default="replay",
+                        help="응답 원천 (replay: 녹화 재생, mock: 결정적 모의 응답)")
+    parser.add_argument("--model", "-m", type=str, default="qwen2.5:7b", help="흉내 낼 모델 이름")
+    parser.add_argument("--recording", type=str, default=None,
+                        help="replay 녹화 파일 (기본: results/recordings/<모델>.jsonl)")
+    parser.add_argument("--latency", type=str, default=None,
+                        help="응답당 지연: replay는 recorded(기본)/none/초, mock은 평균 초 (기본: 0)")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay 지연 배속 (기본: 1)")
+    parser.add_argument("--miss", choices=REPLAY_MISS_POLICIES, default="error",
+                        help="녹화에 없는 프롬프트: error(404) 또는 mock(모의 응답)")
+    parser.add_argument("--host", type=str, default=DEFAULT_HOST, help=f"바인딩 주소 (기본: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"포트 (기본: {DEFAULT_PORT})")
+    parser.add_argument("--verbose", action="store_true", help="요청마다 접근 로그 출력")
+    args = parser.parse_args()
+
+    if args.source == "replay":
+        recording = args.recording or default_recording_path(args.model)
+        try:
+            source = ReplayChatModel(
+                recording, model=args.model, latency=args.latency or "recorded",
+                speed=args.speed, miss=args.miss
+            )
+        except (FileNotFoundError, ValueError) as e:
+            parser.error(str(e))
+        description = f"녹화 재생 {len(source):,}건 ({recording})"
+    else:
+        try:
+            source = MockChatModel(model=args.model, latency=float(args.latency or 0))
+        except ValueError:
+            parser.error("mock 지연은 초 단위 숫자여야 합니다")
+        description = "모의 응답"
+
+    server = OllamaEmulator(source, host=args.host, port=args.port, model_name=args.model, verbose=args.verbose)
+    print("=" * 70)
+    print(f"Ollama 에뮬레이터: {server.url} ({description})")
+    print(f"실행기 연결: --backend ollama --ollama-url {server.url}")
+    print("=" * 70)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n처리한 생성 요청: {server.requests:,}건")
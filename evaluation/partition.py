@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+실험 계획 분할 (Sharding & Stratified Sampling)
+================================================================================
+
+## 이 모듈의 목적
+도메인 실행기(run_*_experiments.py)의 실행 계획에서 **어떤 케이스를 실행할지**
+결정합니다.
+
+## 왜 필요한가?
+- limit은 리스트 앞에서부터 N개만 잘라서, 짧은 스모크 실행이 앞쪽 카테고리로 치우침
+- 한 번의 실행을 여러 머신에 나눠 돌리고 결과를 다시 합칠 방법이 없음
+
+## 선택 순서
+1. --sample K 가 있으면 층화 추출 (없으면 기존처럼 limit개를 앞에서부터)
+   - --stratify 속성 조합(예: category,difficulty)별 크기에 비례하여 K개 배분
+   - K가 층 수 이상이면 모든 층에서 최소 1개
+   - 층 안에서는 (seed, test_case_id) 해시 순으로 선택 → 머신/실행 순서와 무관
+2. --shard i/N 이 있으면 test_case_id 해시로 i번째 샤드만 남김 (0 ≤ i < N)
+   - 매니페스트 샤딩(evaluation.manifest.shard_of)과 같은 배정
+3. 선택된 케이스는 원래 계획 순서를 유지
+
+## 결과 병합
+각 샤드 결과 파일의 summary에는 selection(선택 조건 + 샤드 전 계획 ID 목록)이 기록됩니다.
+--merge로 샤드 결과를 모으면 계획 순서대로 결과를 정렬한 뒤 같은 요약 함수로
+다시 집계하므로, 단일 프로세스 실행과 같은 요약이 나옵니다.
+
+```bash
+python scripts/run_business_experiments.py v2 --sample 24 --stratify category,difficulty --shard 0/3
+python scripts/run_business_experiments.py v2 --sample 24 --stratify category,difficulty --shard 1/3
+python scripts/run_business_experiments.py v2 --sample 24 --stratify category,difficulty --shard 2/3
+python scripts/run_business_experiments.py v2 --merge results/business_experiments_*.summary.json
+```
+================================================================================
+"""
+
+import hashlib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from evaluation.manifest import shard_of
+from evaluation.result_io import iter_raw_results, load_run_summary
+
+
+DEFAULT_SEED = 42
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    --shard 인자 해석 ("i/N" → (i, N), 0 ≤ i < N)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 범위를 벗어난 경우
+    """
+    index, sep, count = value.partition("/")
+    if not sep or not index.strip().isdigit() or not count.strip().isdigit():
+        raise ValueError(f"--shard 형식은 i/N 입니다 (예: 0/4): {value}")
+    index, count = int(index), int(count)
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"샤드 번호는 0 이상 {count} 미만이어야 합니다: {value}")
+    return index, count
+
+
+def parse_stratify(value: str) -> Tuple[str, ...]:
+    """--stratify 인자 해석 ("category,difficulty" → ("category", "difficulty"))"""
+    return tuple(field.strip() for field in value.split(",") if field.strip())
+
+
+def _rank(seed: int, case_id: str) -> bytes:
+    """층 안에서의 선택 순서 (실행 환경과 무관한 해시)"""
+    return hashlib.sha256(f"{seed}:{case_id}".encode("utf-8")).digest()
+
+
+def _allocate(sizes: Dict[Tuple, int], k: int) -> Dict[Tuple, int]:
+    """층별 크기에 비례하여 k개 배분 (최대 나머지 방식, k ≥ 층 수면 층마다 최소 1개)"""
+    total = sum(sizes.values())
+    quotas = {key: k * n / total for key, n in sizes.items()}
+    alloc = {key: int(q) for key, q in quotas.items()}
+
+    if k >= len(sizes):
+        for key in alloc:
+            alloc[key] = max(alloc[key], 1)
+
+    remaining = k - sum(alloc.values())
+    # 최소 1개 보장으로 초과한 만큼은 몫보다 많이 받은 큰 층에서 회수
+    while remaining < 0:
+        key = max((key for key in alloc if alloc[key] > 1), key=lambda key: alloc[key] - quotas[key])
+        alloc[key] -= 1
+        remaining += 1
+    # 남은 몫은 소수점 이하가 큰 층부터 (동률이면 먼저 등장한 층)
+    order = sorted(sizes, key=lambda key: quotas[key] - int(quotas[key]), reverse=True)
+    while remaining > 0:
+        for key in order:
+            if remaining and alloc[key] < sizes[key]:
+                alloc[key] += 1
+                remaining -= 1
+    return alloc
+
+
+def stratified_sample(
+    cases: Sequence[Any],
+    k: int,
+    fields: Sequence[str] = (),
+    seed: int = DEFAULT_SEED,
+    case_of: Callable[[Any], Any] = lambda item: item
+) -> List[Any]:
+    """
+    층화 추출 (원래 순서 유지)
+
+    Args:
+        cases: 실행 계획 항목 목록
+        k: 뽑을 개수 (전체보다 크면 전체)
+        fields: 층을 나눌 테스트 케이스 속성 (비어 있으면 단순 무작위 추출)
+        seed: 선택 순서 해시의 시드
+        case_of: 항목 → 테스트 케이스 (항목이 (케이스, 프롬프트) 쌍일 때 사용)
+
+    Returns:
+        List: 선택된 항목 (cases의 순서대로)
+    """
+    if k >= len(cases):
+        return list(cases)
+
+    strata: Dict[Tuple, List[int]] = {}
+    for pos, item in enumerate(cases):
+        case = case_of(item)
+        try:
+            key = tuple(getattr(case, field) for field in fields)
+        except AttributeError as e:
+            raise ValueError(f"층화 속성이 테스트 케이스에 없습니다: {e}") from None
+        strata.setdefault(key, []).append(pos)
+
+    alloc = _allocate({key: len(positions) for key, positions in strata.items()}, k)
+    chosen = []
+    for key, positions in strata.items():
+        ranked = sorted(positions, key=lambda pos: _rank(seed, case_of(cases[pos]).id))
+        chosen.extend(ranked[:alloc[key]])
+    return [cases[pos] for pos in sorted(chosen)]
+
+
+def select_plan(
+    plan: Sequence[Any],
+    domain: str,
+    limit: Optional[int] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    sample: Optional[int] = None,
+    stratify: Sequence[str] = (),
+    seed: int = DEFAULT_SEED,
+    case_of: Callable[[Any], Any] = lambda item: item[0]
+) -> Tuple[List[Any], Dict]:
+    """
+    실행 계획에 표본 추출/샤딩 적용
+
+    Args:
+        plan: 전체 실행 계획 [(테스트 케이스, 프롬프트 또는 None)]
+        domain: 실행기 도메인 (병합 시 검증용)
+        limit: 표본 추출이 없을 때 앞에서부터 실행할 개수
+        shard: (shard_index, shard_count)
+        sample: 층화 추출 개수 (지정 시 limit 대신 사용)
+        stratify: 층화 속성
+        seed: 표본 추출 시드
+
+    Returns:
+        (이 프로세스가 실행할 계획, summary에 기록할 selection 정보)
+    """
+    if sample is not None:
+        selected = stratified_sample(plan, sample, stratify, seed=seed, case_of=case_of)
+    else:
+        selected = list(plan[:limit] if limit is not None else plan)
+
+    selection = {
+        "domain": domain,
+        "limit": None if sample is not None else limit,
+        "sample": sample,
+        "stratify": list(stratify) if sample is not None else [],
+        "seed": seed if sample is not None else None,
+        "shard": list(shard) if shard else None,
+        "plan": [case_of(item).id for item in selected],
+    }
+
+    if shard:
+        index, count = shard
+        selected = [item for item in selected if shard_of(case_of(item).id, count) == index]
+    return selected, selection
+
+
+def merge_shard_results(paths: Sequence[str], domain: str) -> Tuple[Dict, List[Dict]]:
+    """
+    샤드 결과 파일 병합
+
+    Args:
+        paths: 각 샤드의 결과 파일 (.summary.json / .jsonl / 기존 .json, summary.selection 포함)
+        domain: 실행기 도메인
+
+    Returns:
+        (샤드 정보를 뺀 selection, 계획 순서로 정렬한 결과 목록)
+
+    Raises:
+        ValueError: 선택 조건이 다르거나, 샤드가 빠졌거나 중복된 경우
+    """
+    base = None
+    seen_shards = set()
+    results_by_id: Dict[str, Dict] = {}
+
+    for path in paths:
+        selection = load_run_summary(path).get("selection")
+        if not selection:
+            raise ValueError(f"selection 정보가 없는 결과 파일입니다 (샤드 실행 결과가 아님): {path}")
+        if selection["domain"] != domain:
+            raise ValueError(f"다른 도메인의 결과 파일입니다 ({selection['domain']}): {path}")
+
+        shard = tuple(selection["shard"] or (0, 1))
+        common = {key: value for key, value in selection.items() if key != "shard"}
+        if base is None:
+            base, shard_count = common, shard[1]
+        elif common != base or shard[1] != shard_count:
+            raise ValueError(f"선택 조건(limit/sample/stratify/seed/샤드 수)이 다른 결과 파일입니다: {path}")
+        if shard in seen_shards:
+            raise ValueError(f"같은 샤드가 두 번 포함되었습니다 ({shard[0]}/{shard[1]}): {path}")
+        seen_shards.add(shard)
+
+        for result in iter_raw_results(path):
+            results_by_id[result["test_case_id"]] = result
+
+    if base is None:
+        raise ValueError("병합할 결과 파일이 없습니다")
+    missing_shards = sorted(set(range(shard_count)) - {index for index, _ in seen_shards})
+    if missing_shards:
+        raise ValueError(f"누락된 샤드: {', '.join(f'{i}/{shard_count}' for i in missing_shards)}")
+    missing = [case_id for case_id in base["plan"] if case_id not in results_by_id]
+    if missing:
+        raise ValueError(f"결과가 없는 테스트 케이스 {len(missing)}개: {', '.join(missing[:5])}")
+
+    return dict(base, shard=None), [results_by_id[case_id] for case_id in base["plan"]]
+
+
+def describe_selection(selection: Dict) -> str:
+    """selection 정보를 출력용 문자열로 변환"""
+    parts = []
+    if selection.get("sample") is not None:
+        stratify = ",".join(selection["stratify"]) or "없음"
+        parts.append(f"층화 추출 {selection['sample']}개 (층: {stratify}, seed={selection['seed']})")
+    elif selection.get("limit") is not None:
+        parts.append(f"앞에서부터 {selection['limit']}개")
+    if selection.get("shard"):
+        index, count = selection["shard"]
+        parts.append(f"샤드 {index}/{count}")
+    return ", ".join(parts) or "전체"
+
+
+def add_selection_arguments(parser):
+    """실행기 CLI에 --shard/--sample/--stratify/--seed/--merge 인자 추가"""
+    parser.add_argument("--shard", type=str, default=None,
+                        help="i/N: test_case_id 해시로 나눈 N개 샤드 중 i번째만 실행 (0부터)")
+    parser.add_argument("--sample", type=int, default=None,
+                        help="층화 추출로 K개 실행 (지정 시 실험 횟수(limit) 대신 사용)")
+    parser.add_argument("--stratify", type=str, default="category,difficulty",
+                        help="층화 속성 (기본: category,difficulty)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
+                        help=f"표본 추출 시드 (기본: {DEFAULT_SEED})")
+    parser.add_argument("--merge", type=str, nargs="+", default=None,
+                        help="샤드 결과 파일들을 합쳐 하나의 요약 생성 (실험은 실행하지 않음)")
+
+
+def parse_selection_arguments(parser, args) -> Dict:
+    """add_selection_arguments로 추가한 인자를 run_all_experiments 키워드 인자로 변환"""
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except ValueError as e:
+        parser.error(str(e))
+    if args.sample is not None and args.sample < 1:
+        parser.error("--sample은 1 이상이어야 합니다")
+    return {
+        "shard": shard,
+        "sample": args.sample,
+        "stratify": parse_stratify(args.stratify),
+        "seed": args.seed,
+    }
@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+하네스 프로파일링 (Harness Profiling)
+================================================================================
+
+## 이 모듈의 목적
+실행기 자체(채점, 합성 코퍼스 렌더링, 요약, 결과 기록)가 느릴 때 프로파일러를 손으로 붙이지 않도록
+**--profile cpu|alloc** 한 번으로 단계별 프로파일을 결과 파일 옆에 저장합니다.
+
+## 모드
+| 모드 | 도구 | 출력 |
+|------|------|------|
+| cpu | cProfile | <결과>.<단계>.pstats (단계별) + <결과>.profile.txt (단계별 누적 시간 상위 함수) |
+| alloc | tracemalloc | <결과>.alloc.txt (단계별 최대 메모리 + 단계 동안 늘어난 할당 상위 위치) |
+
+## 단계 (phase)
+실행기는 phase("plan"), phase("cases"), phase("summary"), phase("save")처럼 구간을 나눕니다.
+단계마다 별도 cProfile 프로파일 / tracemalloc 스냅샷을 쓰므로 "요약 계산이 느린지, 케이스 루프가 느린지"가
+바로 보입니다. 단계가 중첩되면 안쪽 단계에 기록하고 끝나면 바깥 단계로 돌아갑니다.
+
+## 모델 호출 제외
+- cpu: 모델 호출은 paused() 안에서 실행되어 프로파일에서 빠집니다 (응답 대기 시간이 하네스 핫스팟을 가리지 않도록)
+- alloc: LLM 클라이언트 라이브러리(langchain, ollama, httpx 등)에서 생긴 할당은 필터로 제외
+
+## 동시 실행 (--concurrency)
+cProfile은 프로파일을 시작한 스레드만 측정하므로, 케이스를 워커 스레드에서 동시에 실행하면 cpu 프로파일에는
+메인 스레드의 기록/출력/요약만 남습니다 (하네스 핫스팟을 보려면 동시성 1로 실행).
+
+## 비활성 시 비용
+phase()/paused()는 전역 변수 1번 확인 후 공유 no-op 객체를 반환합니다.
+
+## 사용 예시
+
+```bash
+python scripts/run_business_experiments.py --backend mock --synthetic 100000 --profile cpu
+python -m evaluation.engine development --backend mock --sample 40 --profile alloc
+python -m pstats results/business_experiments_<ts>.cases.pstats   # 대화형 분석
+```
+
+```python
+from evaluation import profiling
+
+with profiling.profiling_session("cpu", "results/my_run"):
+    with profiling.phase("score"):
+        ...
+```
+================================================================================
+"""
+
+import cProfile
+import fnmatch
+import io
+import linecache
+import pstats
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+PROFILE_MODES = ("cpu", "alloc")
+DEFAULT_TOP = 30
+
+# alloc 모드에서 제외할 LLM 클라이언트 모듈 (모델 호출 I/O 버퍼)
+LLM_CLIENT_PATTERNS = ("*/langchain*", "*/ollama/*", "*/httpx/*", "*/httpcore/*", "*/http/client.py", "*/ssl.py")
+
+_profiler = None  # 활성 프로파일러 (None이면 비활성)
+
+
+class _NullContext:
+    """프로파일 비활성 시 phase()/paused()가 반환하는 공유 no-op 컨텍스트"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullContext()
+
+
+class CpuProfiler:
+    """
+    단계별 cProfile 프로파일러
+
+    Attributes:
+        profiles: 단계 이름 → cProfile.Profile (처음 들어간 순서)
+    """
+
+    mode = "cpu"
+
+    def __init__(self):
+        self.profiles: Dict[str, cProfile.Profile] = {}
+        self._active: Optional[cProfile.Profile] = None
+        self._thread = threading.get_ident()  # 프로파일하는 스레드
+
+    def _switch(self, profile: Optional[cProfile.Profile]):
+        if self._active is not None:
+            self._active.disable()
+        self._active = profile
+        if profile is not None:
+            profile.enable()
+
+    @contextmanager
+    def phase(self, name: str):
+        """name 단계의 프로파일로 전환 (끝나면 이전 단계로 복귀)"""
+        previous = self._active
+        profile = self.profiles.get(name)
+        if profile is None:
+            profile = self.profiles[name] = cProfile.Profile()
+        self._switch(profile)
+        try:
+            yield
+        finally:
+            self._switch(previous)
+
+    @contextmanager
+    def paused(self):
+        """블록 동안 측정 중단 (모델 호출 등 하네스 밖의 대기 시간, 워커 스레드에서는 no-op)"""
+        active = self._active
+        if active is None or threading.get_ident() != self._thread:
+            yield
+            return
+        active.disable()
+        try:
+            yield
+        finally:
+            active.enable()
+
+    def close(self):
+        self._switch(None)
+
+    def write(self, stem: str, top: int = DEFAULT_TOP) -> List[str]:
+        """
+        단계별 .pstats 파일과 요약 보고서 저장
+
+        Args:
+            stem: 확장자를 뺀 출력 경로 (결과 파일과 같은 stem)
+            top: 보고서에 넣을 단계별 상위 함수 수
+
+        Returns:
+            List[str]: 저장한 파일 경로 (보고서가 첫 번째)
+        """
+        self.close()
+        report_path = report_path_of(self.mode, stem)
+        paths = [report_path]
+        out = io.StringIO()
+        for name, profile in self.profiles.items():
+            path = f"{stem}.{name}.pstats"
+            profile.dump_stats(path)
+            paths.append(path)
+            stats = pstats.Stats(profile, stream=out)
+            out.write(f"{'=' * 70}\n[{name}] 총 {stats.total_tt:.3f}s (모델 호출 제외), {stats.total_calls:,}회 호출\n{'=' * 70}\n")
+            stats.sort_stats("cumulative").print_stats(top)
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(out.getvalue())
+        return paths
+
+
+class AllocProfiler:
+    """
+    단계별 tracemalloc 할당 프로파일러
+
+    단계가 끝날 때 시작 시점 스냅샷과 비교하여 늘어난 할당 위치와 단계 중 최대 메모리를 기록합니다.
+
+    Attributes:
+        reports: 단계 이름 → {"peak", "growth", "top"} (같은 단계에 여러 번 들어가면 누적)
+    """
+
+    mode = "alloc"
+
+    def __init__(self, frames: int = 1):
+        """
+        Args:
+            frames: 할당 위치마다 저장할 호출 스택 깊이
+        """
+        self.reports: Dict[str, Dict] = {}
+        self._filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, linecache.__file__),
+            tracemalloc.Filter(False, fnmatch.__file__),  # 스냅샷 필터 자체의 패턴 캐시
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            *(tracemalloc.Filter(False, pattern) for pattern in LLM_CLIENT_PATTERNS)
+        ]
+        self._peaks: List[int] = []  # 진행 중인 단계별 최대 메모리 (안쪽 단계 진입 전까지)
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start(frames)
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    @contextmanager
+    def phase(self, name: str):
+        """name 단계 동안의 할당 증가/최대 메모리 기록"""
+        before = self._snapshot()
+        self._carry_peak()
+        self._peaks.append(0)
+        try:
+            yield
+        finally:
+            self._carry_peak()
+            peak = self._peaks.pop()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)  # 바깥 단계의 최대값에도 반영
+            diff = self._snapshot().compare_to(before, "lineno")
+            report = self.reports.setdefault(name, {"peak": 0, "growth": 0, "top": {}})
+            report["peak"] = max(report["peak"], peak)
+            report["growth"] += sum(stat.size_diff for stat in diff)
+            for stat in diff:
+                if stat.size_diff > 0:
+                    frame = stat.traceback[0]
+                    key = f"{frame.filename}:{frame.lineno}"
+                    size, count = report["top"].get(key, (0, 0))
+                    report["top"][key] = (size + stat.size_diff, count + stat.count_diff)
+
+    def _carry_peak(self):
+        """지금까지의 최대 메모리를 진행 중인 단계에 반영하고 측정 초기화"""
+        _, peak = tracemalloc.get_traced_memory()
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], peak)
+        tracemalloc.reset_peak()
+
+    def paused(self):
+        """alloc 모드는 LLM 클라이언트 할당을 필터로 제외하므로 중단하지 않음"""
+        return _NULL
+
+    def close(self):
+        if self._started and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def write(self, stem: str, top: int = DEFAULT_TOP) -> List[str]:
+        """
+        단계별 할당 보고서 저장
+
+        Args:
+            stem: 확장자를 뺀 출력 경로 (결과 파일과 같은 stem)
+            top: 단계별 상위 할당 위치 수
+
+        Returns:
+            List[str]: 저장한 파일 경로
+        """
+        self.close()
+        path = report_path_of(self.mode, stem)
+        with open(path, "w", encoding="utf-8") as f:
+            for name, report in self.reports.items():
+                f.write(f"{'=' * 70}\n[{name}] 최대 {_format_size(report['peak'])}, 단계 동안 증가 {_format_size(report['growth'])}\n{'=' * 70}\n")
+                ranked = sorted(report["top"].items(), key=lambda item: item[1][0], reverse=True)[:top]
+                for location, (size, count) in ranked:
+                    f.write(f"{_format_size(size):>12}  {count:>+9,}개  {location}\n")
+                f.write("\n")
+        return [path]
+
+
+def _format_size(size: int) -> str:
+    if abs(size) >= 1 << 20:
+        return f"{size / (1 << 20):,.2f}MiB"
+    return f"{size / 1024:,.1f}KiB"
+
+
+def report_path_of(mode: str, stem: str) -> str:
+    """모드별 보고서 경로 (<stem>.profile.txt / <stem>.alloc.txt)"""
+    return stem + (".profile.txt" if mode == "cpu" else ".alloc.txt")
+
+
+def phase(name: str):
+    """
+    프로파일 단계 컨텍스트 매니저
+
+    Args:
+        name: 단계 이름 (cpu 모드에서는 <stem>.<name>.pstats 파일 이름에 사용)
+
+    Returns:
+        with 블록에 쓰는 컨텍스트 (비활성 시 공유 no-op 객체)
+    """
+    profiler = _profiler
+    if profiler is None:
+        return _NULL
+    return profiler.phase(name)
+
+
+def paused():
+    """모델 호출 등 하네스 밖의 대기 구간 (cpu 프로파일에서 제외)"""
+    profiler = _profiler
+    if profiler is None:
+        return _NULL
+    return profiler.paused()
+
+
+def is_enabled() -> bool:
+    """프로파일 중인지"""
+    return _profiler is not None
+
+
+def start_profiling(mode: str):
+    """
+    프로파일 시작 (이미 프로파일 중이면 기존 프로파일러 반환)
+
+    Args:
+        mode: "cpu" 또는 "alloc"
+
+    Returns:
+        CpuProfiler | AllocProfiler: 활성 프로파일러
+    """
+    global _profiler
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"지원하지 않는 프로파일 모드: {mode} (가능: {', '.join(PROFILE_MODES)})")
+    if _profiler is None:
+        _profiler = CpuProfiler() if mode == "cpu" else AllocProfiler()
+    return _profiler
+
+
+def stop_profiling(stem: Optional[str] = None) -> List[str]:
+    """
+    프로파일 종료
+
+    Args:
+        stem: 지정하면 이 경로 기준으로 보고서 저장
+
+    Returns:
+        List[str]: 저장한 파일 경로 (저장하지 않았으면 빈 목록)
+    """
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler is None:
+        return []
+    if stem:
+        return profiler.write(stem)
+    profiler.close()
+    return []
+
+
+@contextmanager
+def profiling_session(mode: str, stem: Optional[str] = None) -> Iterator:
+    """with 블록 동안 프로파일하고 끝나면 보고서 저장"""
+    profiler = start_profiling(mode)
+    try:
+        yield profiler
+    finally:
+        stop_profiling(stem)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="저장된 단계별 pstats 파일 요약 출력")
+    parser.add_argument("paths", nargs="+", help="<결과>.<단계>.pstats 파일")
+    parser.add_argument("--sort", type=str, default="cumulative", help="정렬 기준 (cumulative, tottime, calls 등)")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help=f"출력할 상위 함수 수 (기본: {DEFAULT_TOP})")
+    args = parser.parse_args()
+
+    for path in args.paths:
+        print("=" * 70)
+        print(path)
+        print("=" * 70)
+        pstats.Stats(path).sort_stats(args.sort).print_stats(args.top)
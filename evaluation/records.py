@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+압축 레코드 (Compact Records)
+================================================================================
+
+## 이 모듈의 목적
+테스트 케이스와 실험 결과를 메모리에 **작게** 보관하기 위한 공용 도구입니다.
+
+## 왜 필요한가?
+- 합성 코퍼스(10만 개 이상)를 로드하면 케이스마다 __dict__가 생겨 메모리가 빠르게 증가
+- category, industry, difficulty 같은 값은 몇 종류뿐인데 케이스마다 별도 문자열로 존재
+- 실험 결과는 같은 키 10여 개를 가진 dict로 쌓여, 결과마다 해시 테이블이 하나씩 생김
+
+## 구성
+- intern_fields(): 테스트 케이스 __post_init__에서 범주형 문자열 필드를 intern
+  (테스트 케이스 dataclass는 frozen + slots로 선언)
+- ResultRecord: 키 배치(layout)를 같은 모양의 결과끼리 공유하고 값만 튜플로 저장하는
+  읽기 전용 Mapping. r["success"], r.get("error") 등 기존 dict 접근 코드가 그대로 동작하며,
+  dict(r)로 원래 dict(키 순서 포함)를 복원
+
+## 벤치마크
+```bash
+python -m evaluation.records --bench 100000
+```
+================================================================================
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+
+# 결과 레코드에서 intern할 범주형 값의 키
+INTERNED_RESULT_KEYS = frozenset({
+    "category", "subcategory", "difficulty", "industry", "language", "data_mode", "version",
+})
+
+
+def intern_fields(obj: Any, names: Iterable[str]):
+    """
+    객체의 문자열 필드를 sys.intern으로 교체 (frozen dataclass에서도 동작)
+
+    Args:
+        obj: 테스트 케이스 인스턴스
+        names: intern할 필드 이름
+    """
+    for name in names:
+        value = getattr(obj, name)
+        if type(value) is str:
+            object.__setattr__(obj, name, sys.intern(value))
+
+
+# 키 튜플 → (공유 layout(키 → 위치), intern할 값의 위치)
+_LAYOUTS: Dict[Tuple[str, ...], Tuple[Dict[str, int], Tuple[int, ...]]] = {}
+
+
+def _layout_for(keys: Tuple[str, ...]) -> Tuple[Dict[str, int], Tuple[int, ...]]:
+    entry = _LAYOUTS.get(keys)
+    if entry is None:
+        layout = {key: i for i, key in enumerate(keys)}
+        positions = tuple(i for i, key in enumerate(keys) if key in INTERNED_RESULT_KEYS)
+        entry = _LAYOUTS.setdefault(keys, (layout, positions))
+    return entry
+
+
+class ResultRecord(Mapping):
+    """
+    실험 결과 1건의 압축 표현 (읽기 전용 Mapping)
+
+    같은 키 구성을 가진 결과는 하나의 layout을 공유하고, 레코드는 값 튜플만 가집니다.
+    """
+
+    __slots__ = ("_layout", "_values")
+
+    def __init__(self, layout: Dict[str, int], values: Tuple):
+        self._layout = layout
+        self._values = values
+
+    @classmethod
+    def from_dict(cls, result: Dict[str, Any], omit: Iterable[str] = ()) -> "ResultRecord":
+        """결과 dict를 압축 레코드로 변환 (범주형 값은 intern, omit의 키는 빼고 보관)"""
+        if omit:
+            result = {key: value for key, value in result.items() if key not in omit}
+        layout, intern_positions = _layout_for(tuple(result))
+        values = list(result.values())
+        for i in intern_positions:
+            if type(values[i]) is str:
+                values[i] = sys.intern(values[i])
+        return cls(layout, tuple(values))
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._layout[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._layout
+
+    def __repr__(self) -> str:
+        return f"ResultRecord({dict(self)!r})"
+
+    def __reduce__(self):
+        # 프로세스 간 전달/pickle 시 dict로 보내고 받는 쪽에서 layout을 다시 공유
+        return (ResultRecord.from_dict, (dict(self),))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """원래 키 순서의 dict로 변환 (JSON 저장용)"""
+        return dict(zip(self._layout, self._values))
+
+
+def to_plain_results(results: Iterable[Mapping]) -> list:
+    """결과 목록(ResultRecord 또는 dict)을 JSON 저장용 dict 목록으로 변환"""
+    return [result.to_dict() if isinstance(result, ResultRecord) else dict(result) for result in results]
+
+
+# ============================================================================
+# 벤치마크
+# ============================================================================
+
+def _measure(factory, n: int) -> Tuple[float, float]:
+    """n개 생성 시간(ms, tracemalloc 없이 측정)과 레코드당 메모리(bytes)"""
+    import gc
+    import time
+    import tracemalloc
+
+    gc.collect()
+    start = time.perf_counter()
+    records = [factory(i) for i in range(n)]
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    del records
+
+    gc.collect()
+    tracemalloc.start()
+    records = [factory(i) for i in range(n)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    gc.collect()
+    return elapsed_ms, current / n
+
+
+def run_benchmark(n_records: int = 100_000):
+    """테스트 케이스/결과 레코드의 생성 시간과 레코드당 메모리를 기존 표현과 비교"""
+    import dataclasses
+    import random
+
+    from evaluation.business_test_cases import BusinessTestCase
+
+    # 비교 기준: 같은 필드의 일반 dataclass (slots/frozen/intern 없음)
+    PlainCase = dataclasses.make_dataclass(
+        "PlainBusinessTestCase", [(f.name, f.type) for f in dataclasses.fields(BusinessTestCase)]
+    )
+
+    rng = random.Random(42)
+    categories = ["email", "report"]
+    subcategories = ["formal", "apology", "proposal", "follow_up", "weekly", "analysis", "meeting", "project"]
+    industries = ["IT", "금융", "제조", "유통", "의료", "교육", "공공", "컨설팅"]
+    difficulties = ["easy", "medium", "hard"]
+    rows = [
+        (
+            f"SYN-{i:07d}", rng.choice(categories), rng.choice(subcategories), f"시나리오 {i}",
+            rng.choice(industries), f"입력 맥락 {i}", [f"요소{i % 7}", f"요소{i % 5}"], rng.choice(difficulties),
+        )
+        for i in range(n_records)
+    ]
+
+    def fields_of(i: int) -> Tuple:
+        # JSON 로드처럼 같은 범주 값이라도 레코드마다 새 문자열 객체가 만들어지는 상황을 재현
+        case_id, category, subcategory, scenario, industry, context, elements, difficulty = rows[i]
+        return (
+            case_id, (category + " ")[:-1], (subcategory + " ")[:-1], scenario,
+            (industry + " ")[:-1], context, elements, (difficulty + " ")[:-1],
+        )
+
+    def result_dict(i: int) -> Dict[str, Any]:
+        case_id, category, subcategory, scenario, industry, _, _, difficulty = fields_of(i)
+        return {
+            "test_case_id": case_id, "category": category, "subcategory": subcategory,
+            "scenario": scenario, "industry": industry, "difficulty": difficulty,
+            "success": True, "error": None,
+            "input_tokens": 800 + i % 300, "output_tokens": 400 + i % 200,
+            "total_tokens": 1200 + i % 500, "response_time": 3.2,
+            "quality_evaluation": None, "response_preview": "",
+        }
+
+    benchmarks = [
+        ("테스트 케이스 (dataclass)", lambda i: PlainCase(*fields_of(i))),
+        ("테스트 케이스 (slots+frozen+intern)", lambda i: BusinessTestCase(*fields_of(i))),
+        ("실험 결과 (dict)", result_dict),
+        ("실험 결과 (ResultRecord)", lambda i: ResultRecord.from_dict(result_dict(i))),
+    ]
+
+    print("=" * 70)
+    print(f"레코드 벤치마크 ({n_records:,}개, 레코드당 메모리 = 생성 중 새로 할당된 메모리 / 개수)")
+    print("=" * 70)
+    print(f"{'표현':<36} {'생성 시간':>12} {'레코드당 메모리':>16}")
+    for name, factory in benchmarks:
+        elapsed_ms, per_record = _measure(factory, n_records)
+        print(f"{name:<36} {elapsed_ms:>10,.1f}ms {per_record:>14,.0f}B")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="압축 레코드 벤치마크")
+    parser.add_argument("--bench", type=int, default=100_000, help="생성할 레코드 수")
+    args = parser.parse_args()
+
+    run_benchmark(args.bench)
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+응답 캐시 (Response Cache)
+================================================================================
+
+## 이 모듈의 목적
+엔진의 모든 LLM 호출(생성, Judge 평가) 앞에서 **같은 (모델, 온도, 프롬프트)의 성공 응답을
+재사용**합니다. 캐시 적중은 동시 호출 한도, 호출 정책(타임아웃/재시도/헤지)을 거치지 않고
+바로 반환됩니다.
+
+## 왜 필요한가?
+- 결정적 모델(온도 0)에 같은 프롬프트를 반복하면 같은 응답을 얻으려고 매번 다시 추론함
+- 녹화/재생 백엔드(--backend record/replay)는 실행 사이의 재사용이고,
+  이 캐시는 실행 중(프로세스 안)의 재사용
+
+## 샘플링 온도
+온도가 0보다 큰 모델의 반복 호출은 서로 다른 표본입니다. 이를 캐시로 합치면 반복 수만큼의
+독립 표본이 있는 것처럼 보이지만 실제로는 서로 다른 프롬프트 수만큼만 샘플링하므로,
+신뢰구간과 순차 비교가 과신하게 됩니다. 그래서
+- 기본: 온도가 0인 모델만 캐시 (온도 > 0 또는 온도를 알 수 없는 모델은 매번 호출, "bypassed"로 셈)
+- --response-cache-sampled: 온도 > 0도 캐시 (명시적 허용, 실행 시작에 경고 출력, 요약에 기록)
+  반복이 독립 표본이 아니어도 되는 실험(프롬프트 디버깅, 파이프라인 점검)에만 씁니다.
+
+## 동작
+- 키: (모델 클래스, 모델 이름, 샘플링 온도, 프롬프트 sha256) - 생성 모델과 Judge 모델은 따로
+- 값: 응답 텍스트 (응답 시간은 저장하지 않음)
+- 적중은 새 지연 측정이 아니므로 엔진은 적중 결과의 시간 값(response_time 등)을 비워 둠
+  (지연 통계, 신뢰구간, 소요 시간 예측(evaluation.scheduling)에서 빠짐)
+- 실패한 호출은 저장하지 않음
+- 최근 사용 순으로 max_entries개까지 보관 (넘으면 가장 오래 쓰이지 않은 항목부터 제거)
+- 같은 프롬프트가 동시에 진행 중이면 둘 다 모델을 호출 (먼저 끝난 응답이 저장됨)
+
+기본은 끔이며 켜지 않으면 결과, 응답 시간, 트레이스가 캐시 도입 전과 같습니다.
+
+## 결과에 남는 값
+- 케이스 결과: "cached"(캐시 적중 여부) - 캐시를 켠 실행만
+- 실행 요약의 "response_cache": 최대 항목 수, 온도 > 0 허용 여부, 항목/적중/조회/우회/제거 수
+- 트레이스: 적중할 때마다 "response_cache" 카운터 (누적 적중 수)
+
+## 사용 예시
+
+```python
+from evaluation.response_cache import ResponseCache
+
+cache = ResponseCache(max_entries=10_000)
+cached = cache.get(llm, prompt)  # 온도 > 0이면 항상 None (sampled=True가 아니면)
+if cached is None:
+    text = llm.invoke(prompt).content
+    cache.put(llm, prompt, text)
+```
+
+```bash
+python -m evaluation.engine development --version v1 --backend mock --response-cache 500
+python -m evaluation.response_cache --calls 1000 --distinct 100
+python -m evaluation.response_cache --temperature 0.3                     # 모두 우회
+python -m evaluation.response_cache --temperature 0.3 --response-cache-sampled
+```
+================================================================================
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from evaluation import tracing
+from evaluation.llm_backends import prompt_key, prompt_text
+
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+@dataclass
+class CachedResponse:
+    """캐시에 저장된 성공 응답"""
+    text: str
+
+
+class ResponseCache:
+    """
+    (모델, 온도, 프롬프트) → 성공 응답 LRU 캐시 (여러 스레드에서 함께 사용)
+
+    Attributes:
+        max_entries: 최대 항목 수
+        sampled: 온도 > 0인 모델도 캐시하는지
+        hits: 적중 수
+        misses: 적중하지 않은 조회 수
+        bypassed: 캐시하지 않는 모델(온도 > 0)이라 건너뛴 조회 수
+        evictions: 한도를 넘어 제거한 항목 수
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, sampled: bool = False):
+        """
+        Args:
+            max_entries: 최대 항목 수 (1 이상)
+            sampled: 온도 > 0(또는 온도를 알 수 없는) 모델도 캐시 (반복이 독립 표본이 아니게 됨)
+
+        Raises:
+            ValueError: max_entries가 1보다 작음
+        """
+        if max_entries < 1:
+            raise ValueError(f"응답 캐시 크기는 1 이상이어야 합니다: {max_entries}")
+        self.max_entries = max_entries
+        self.sampled = sampled
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(llm, prompt: Any) -> Tuple:
+        """캐시 키 (모델 클래스, 모델 이름, 샘플링 온도, 프롬프트 sha256)"""
+        return (
+            type(llm).__name__, getattr(llm, "model", None), getattr(llm, "temperature", None),
+            prompt_key(prompt_text(prompt))
+        )
+
+    def cacheable(self, llm) -> bool:
+        """이 모델의 응답을 캐시하는지 (온도 0, 또는 sampled)"""
+        return self.sampled or getattr(llm, "temperature", None) == 0
+
+    def get(self, llm, prompt: Any) -> Optional[CachedResponse]:
+        """
+        저장된 응답 조회 (적중하면 최근 사용으로 갱신)
+
+        Args:
+            llm: 호출할 모델
+            prompt: 프롬프트 (문자열 또는 메시지 목록)
+
+        Returns:
+            CachedResponse 또는 None (저장된 응답 없음, 또는 캐시하지 않는 모델)
+        """
+        if not self.cacheable(llm):
+            with self._lock:
+                self.bypassed += 1
+            return None
+        key = self.key(llm, prompt)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            hits = self.hits
+        tracing.counter("response_cache", hits=hits)
+        return cached
+
+    def put(self, llm, prompt: Any, text: str):
+        """
+        성공 응답 저장 (넘치면 가장 오래 쓰이지 않은 항목 제거, 캐시하지 않는 모델은 무시)
+
+        Args:
+            llm: 호출한 모델
+            prompt: 프롬프트
+            text: 응답 텍스트
+        """
+        if not self.cacheable(llm):
+            return
+        key = self.key(llm, prompt)
+        with self._lock:
+            self._entries[key] = CachedResponse(text)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """실행 요약에 기록할 캐시 지표"""
+        with self._lock:
+            return {
+                "max_entries": self.max_entries,
+                "sampled": self.sampled,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "lookups": self.hits + self.misses,
+                "bypassed": self.bypassed,
+                "evictions": self.evictions,
+            }
+
+
+def describe_response_cache(snapshot: Dict[str, Any]) -> str:
+    """응답 캐시 지표 한 줄 (실행 로그용)"""
+    lookups = snapshot["lookups"]
+    rate = f" ({snapshot['hits'] / lookups:.1%})" if lookups else ""
+    line = (f"적중 {snapshot['hits']:,}/{lookups:,}회{rate}, "
+            f"항목 {snapshot['entries']:,}/{snapshot['max_entries']:,}개, 제거 {snapshot['evictions']:,}회")
+    if snapshot["bypassed"]:
+        line += f", 온도 > 0이라 우회 {snapshot['bypassed']:,}회"
+    if snapshot["sampled"]:
+        line += " [온도 > 0 캐시 허용]"
+    return line
+
+
+def add_cache_arguments(parser):
+    """실행기 CLI에 응답 캐시 옵션 추가 (--response-cache [N])"""
+    parser.add_argument("--response-cache", type=int, nargs="?", const=DEFAULT_MAX_ENTRIES, default=None,
+                        metavar="N",
+                        help=f"같은 (모델, 온도, 프롬프트)의 성공 응답을 실행 중 재사용, 최대 N개 보관 "
+                             f"(N 생략 시 {DEFAULT_MAX_ENTRIES:,}, 기본: 끔). 온도 0인 모델만 캐시")
+    parser.add_argument("--response-cache-sampled", action="store_true",
+                        help="온도 > 0인 모델도 캐시 (반복 호출이 독립 표본이 아니게 됨, 경고 출력)")
+
+
+def parse_cache_arguments(parser, args) -> Dict[str, Any]:
+    """
+    응답 캐시 옵션 검증
+
+    Returns:
+        Dict: 실행기 생성자 키워드 인자 {"response_cache": ResponseCache 또는 None(끔)}
+    """
+    if args.response_cache is None:
+        if args.response_cache_sampled:
+            parser.error("--response-cache-sampled는 --response-cache와 함께 써야 합니다")
+        return {"response_cache": None}
+    if args.response_cache < 1:
+        parser.error("--response-cache는 1 이상이어야 합니다")
+    if args.response_cache_sampled:
+        print("!" * 70, file=sys.stderr)
+        print("경고: --response-cache-sampled - 온도 > 0인 모델의 응답도 캐시합니다.", file=sys.stderr)
+        print("  같은 프롬프트의 반복이 한 표본을 재사용하므로 반복 수가 독립 표본 수가 아니고,", file=sys.stderr)
+        print("  신뢰구간/순차 비교가 과신합니다. 응답 분산을 보는 실험에 쓰지 마세요.", file=sys.stderr)
+        print("!" * 70, file=sys.stderr)
+    return {"response_cache": ResponseCache(args.response_cache, sampled=args.response_cache_sampled)}
+
+
+if __name__ == "__main__":
+    import argparse
+    import random
+    import time
+
+    from evaluation.llm_backends import MockChatModel
+
+    parser = argparse.ArgumentParser(description="반복 프롬프트로 응답 캐시 적중/제거 확인 (모의 모델)")
+    parser.add_argument("--calls", type=int, default=1000, help="호출 수 (기본: 1000)")
+    parser.add_argument("--distinct", type=int, default=100, help="서로 다른 프롬프트 수 (기본: 100)")
+    parser.add_argument("--temperature", type=float, default=0.0, help="모의 모델 샘플링 온도 (기본: 0)")
+    add_cache_arguments(parser)
+    parser.set_defaults(response_cache=DEFAULT_MAX_ENTRIES)
+    args = parser.parse_args()
+    cache = parse_cache_arguments(parser, args)["response_cache"]
+
+    rng = random.Random(0)
+    llm = MockChatModel(temperature=args.temperature)
+    start = time.perf_counter()
+    for _ in range(args.calls):
+        prompt = f"다음 요소를 포함하세요:\n- 항목 {rng.randrange(args.distinct)}"
+        if cache.get(llm, prompt) is None:
+            cache.put(llm, prompt, llm.invoke(prompt).content)
+    print(f"{args.calls}회 호출, {time.perf_counter() - start:.2f}초")
+    print(describe_response_cache(cache.snapshot()))
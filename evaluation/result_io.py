@@ -0,0 +1,511 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+실험 결과 파일 읽기 (Result File I/O)
+================================================================================
+
+## 이 모듈의 목적
+results/ 의 실험 결과 JSON을 **하나의 정규화된 형태**로 읽습니다.
+
+## 왜 필요한가?
+실행기와 시기에 따라 파일 모양이 다름
+- 결과 목록 키: "detailed_results" (business/career/development) vs "results" (data_analysis, 초기 파일)
+- 케이스 ID: "test_case_id" vs "id" (초기 파일)
+- 품질: quality_evaluation.quality_score vs "score"/"quality" (초기 파일)
+- 포함율: element_coverage / issue_detection_rate / detection_rate
+- 지연: response_time vs generation_time(+evaluation_time, LLM-as-a-Judge) vs "time"
+- 토큰: total_tokens vs "tokens"
+
+## 정규화된 케이스 행 (normalize_result)
+test_case_id, category, subcategory, difficulty, success, quality_score,
+coverage(%), latency(초), input_tokens, output_tokens, total_tokens, error,
+metrics(quality_evaluation의 수치/불리언 필드 → float, 예: accuracy, has_structure)
+
+## 실행 정보 (run_info)
+domain(파일 이름 또는 selection), version, model, started_at(timestamp 또는 파일 이름),
+n_results. 케이스별 결과 목록이 없는 파일(all_experiments.json 등)은 domain=None.
+
+## 스트리밍 읽기 (iter_run_results)
+수십만 건짜리 결과 파일도 결과 배열만 원소 단위로 파싱하여 한 건씩 반환
+(summary 등 나머지 값은 읽고 버림, 파일 전체를 json.load 하지 않음)
+
+## 스트리밍 기록 (ResultStreamWriter)
+실행기는 결과가 나올 때마다 한 줄짜리 JSON(JSONL)으로 바로 기록하고, 끝나면 요약만
+작은 파일로 따로 씁니다.
+
+    results/business_experiments_<ts>.jsonl          케이스 결과 (한 줄에 1건, flush_every건마다 flush)
+    results/business_experiments_<ts>.summary.json   {"summary", "results_key", "results_file", "n_results"}
+    results/business_experiments_<ts>.trace.json     --trace일 때 단계별 구간 (evaluation.tracing, 결과 파일 아님)
+    results/business_experiments_<ts>.profile.txt    --profile cpu 보고서 (+ <ts>.<단계>.pstats, evaluation.profiling)
+    results/business_experiments_<ts>.alloc.txt      --profile alloc 보고서
+
+- 실행이 중간에 끊겨도 그때까지의 결과가 남음 (마지막의 잘린 줄은 읽을 때 무시)
+- load_run_file()에 .jsonl / .summary.json 을 주면 기존 {"summary", "detailed_results"} 모양으로 복원
+- export_legacy_json()으로 기존 단일 JSON 파일(indent=2)을 스트리밍으로 생성 (--legacy-json)
+================================================================================
+"""
+
+import json
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from evaluation.profiling import PROFILE_MODES
+
+
+RESULT_LIST_KEYS = ("detailed_results", "results")
+
+# 파일 이름 접두어 → 도메인 (긴 접두어 먼저)
+FILE_PREFIX_DOMAINS = (
+    ("data_analysis_llm_judge", "data_analysis"),
+    ("data_analysis_experiments", "data_analysis"),
+    ("business_experiments", "business"),
+    ("career_experiments", "career"),
+    ("development_experiments", "development"),
+)
+
+_FILE_TIMESTAMP = re.compile(r"_(\d{8}_\d{6})")
+
+# 정규화 필드 → 원본 키 후보 (앞에서부터 처음 있는 값 사용)
+_CASE_ID_KEYS = ("test_case_id", "id")
+_LATENCY_KEYS = ("response_time", "generation_time", "time")
+_TOKEN_KEYS = ("total_tokens", "tokens")
+_COVERAGE_KEYS = ("element_coverage", "issue_detection_rate", "detection_rate")
+_QUALITY_KEYS = ("quality_score",)
+_LEGACY_QUALITY_KEYS = ("score", "quality")  # quality_evaluation이 없던 초기 파일
+
+
+STREAM_SUFFIX = ".jsonl"
+SUMMARY_SUFFIX = ".summary.json"
+TRACE_SUFFIX = ".trace.json"  # --trace: Chrome 트레이스 (evaluation.tracing, 결과 파일 아님)
+DEFAULT_FLUSH_EVERY = 1
+
+# 스트림 파일에만 기록하고 실행기 메모리(요약 계산용)에는 보관하지 않는 키
+STREAM_ONLY_KEYS = ("response_preview",)
+
+
+def load_run_file(path: str) -> Any:
+    """
+    결과 파일 로드 (스트리밍 형식은 기존 단일 JSON 모양으로 복원)
+
+    Args:
+        path: 결과 JSON, 결과 스트림(.jsonl) 또는 요약 파일(.summary.json)
+
+    Returns:
+        기존 형식이면 파일 내용 그대로, 스트리밍 형식이면 {"summary", 결과 목록 키: [...]}
+    """
+    if path.endswith(STREAM_SUFFIX):
+        sidecar = path[:-len(STREAM_SUFFIX)] + SUMMARY_SUFFIX
+        meta = _read_json(sidecar) if os.path.exists(sidecar) else {}  # 요약이 없으면 중단된 실행
+        return _legacy_shape(meta, path)
+    data = _read_json(path)
+    if is_summary_file(data):
+        return _legacy_shape(data, stream_path_of(path, data))
+    return data
+
+
+def load_run_summary(path: str) -> Dict[str, Any]:
+    """결과 파일의 summary만 로드 (스트리밍 형식은 결과 스트림을 읽지 않음)"""
+    if path.endswith(STREAM_SUFFIX):
+        path = path[:-len(STREAM_SUFFIX)] + SUMMARY_SUFFIX
+    data = _read_json(path)
+    return (data.get("summary") or {}) if isinstance(data, dict) else {}
+
+
+def is_summary_file(data: Any) -> bool:
+    """스트리밍 형식의 요약 파일(.summary.json) 내용인지"""
+    return isinstance(data, dict) and isinstance(data.get("results_file"), str) and "summary" in data
+
+
+def stream_path_of(summary_path: str, meta: Dict) -> str:
+    """요약 파일이 가리키는 결과 스트림 경로 (같은 디렉토리)"""
+    return os.path.join(os.path.dirname(summary_path), meta["results_file"])
+
+
+def _read_json(path: str) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _legacy_shape(meta: Dict, stream_path: str) -> Dict[str, Any]:
+    return {
+        "summary": meta.get("summary") or {},
+        meta.get("results_key", RESULT_LIST_KEYS[0]): list(iter_stream_records(stream_path)),
+    }
+
+
+def result_list(data: Any) -> Optional[List[Dict]]:
+    """케이스별 결과 목록 (없으면 None)"""
+    if not isinstance(data, dict):
+        return None
+    for key in RESULT_LIST_KEYS:
+        results = data.get(key)
+        if isinstance(results, list) and all(isinstance(r, dict) for r in results[:1]):
+            if not results or any(id_key in results[0] for id_key in _CASE_ID_KEYS):
+                return results
+    return None
+
+
+def domain_of_path(path: str) -> Optional[str]:
+    """파일 이름 접두어로 도메인 추정"""
+    name = os.path.basename(path)
+    for prefix, domain in FILE_PREFIX_DOMAINS:
+        if name.startswith(prefix):
+            return domain
+    return None
+
+
+def run_info(path: str, data: Any) -> Dict[str, Any]:
+    """
+    결과 파일의 실행 정보
+
+    Args:
+        path: 결과 파일 경로
+        data: load_run_file() 결과
+
+    Returns:
+        Dict: name, domain, version, model, started_at, n_results
+    """
+    summary = data.get("summary") if isinstance(data, dict) else None
+    summary = summary if isinstance(summary, dict) else {}
+    info = summary.get("experiment_info") if isinstance(summary.get("experiment_info"), dict) else {}
+    selection = summary.get("selection") or {}
+    results = result_list(data)
+
+    started_at = info.get("timestamp") or (data.get("timestamp") if isinstance(data, dict) else None)
+    if not started_at:
+        match = _FILE_TIMESTAMP.search(os.path.basename(path))
+        if match:
+            started_at = datetime.strptime(match.group(1), "%Y%m%d_%H%M%S").isoformat()
+
+    return {
+        "name": os.path.basename(path),
+        "domain": (selection.get("domain") or domain_of_path(path)) if results is not None else None,
+        "version": info.get("version") or summary.get("version"),
+        "model": info.get("model") or (data.get("model") if isinstance(data, dict) else None),
+        "started_at": started_at,
+        "n_results": len(results) if results is not None else 0,
+    }
+
+
+def _first(record: Dict, keys: Tuple[str, ...]) -> Any:
+    for key in keys:
+        value = record.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+def normalize_result(raw: Dict) -> Dict[str, Any]:
+    """
+    케이스 결과 1건을 정규화
+
+    Args:
+        raw: 결과 파일의 케이스 결과 dict (형식 무관)
+
+    Returns:
+        Dict: 정규화된 케이스 행 (모듈 설명 참고)
+    """
+    evaluation = raw.get("quality_evaluation")
+    evaluation = evaluation if isinstance(evaluation, dict) else {}
+
+    metrics = {}
+    for key, value in evaluation.items():
+        number = _number(value)
+        if number is not None:
+            metrics[key] = number
+
+    success = raw.get("success")
+    return {
+        "test_case_id": _first(raw, _CASE_ID_KEYS),
+        "category": raw.get("category"),
+        "subcategory": raw.get("subcategory"),
+        "difficulty": raw.get("difficulty"),
+        "success": None if success is None else bool(success),
+        "quality_score": _number(_first(evaluation, _QUALITY_KEYS) if evaluation else _first(raw, _LEGACY_QUALITY_KEYS)),
+        "coverage": _number(_first(evaluation, _COVERAGE_KEYS) if evaluation else _first(raw, _COVERAGE_KEYS)),
+        "latency": _number(_first(raw, _LATENCY_KEYS)),
+        "input_tokens": raw.get("input_tokens"),
+        "output_tokens": raw.get("output_tokens"),
+        "total_tokens": _first(raw, _TOKEN_KEYS),
+        "error": raw.get("error"),
+        "metrics": metrics,
+    }
+
+
+def iter_normalized_results(data: Any) -> Iterator[Dict[str, Any]]:
+    """결과 파일의 케이스 결과를 정규화하여 순서대로 반환"""
+    for raw in result_list(data) or ():
+        yield normalize_result(raw)
+
+
+# ============================================================================
+# 스트리밍 읽기 (결과 목록을 한 건씩 파싱)
+# ============================================================================
+
+_STREAM_CHUNK = 1 << 16
+
+
+class _JsonStream:
+    """파일을 조금씩 읽으며 JSON 값을 하나씩 디코딩하는 버퍼"""
+
+    def __init__(self, f):
+        self._f = f
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int = _STREAM_CHUNK) -> bool:
+        if self._eof:
+            return False
+        chunk = self._f.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (끝이면 "")"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf) or not self._fill():
+                return self._buf[self._pos:self._pos + 1]
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"JSON 형식 오류: '{char}' 필요, '{self.peek()}' 발견")
+        self._pos += 1
+
+    def decode(self) -> Any:
+        """다음 JSON 값 1개 (값이 버퍼 경계에 걸치면 더 읽고 다시 시도)"""
+        self.peek()
+        size = _STREAM_CHUNK
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                if end < len(self._buf) or self._eof:  # 끝에 걸친 숫자가 잘렸을 수 있음
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            if not self._fill(size):
+                continue
+            size = max(size, len(self._buf))  # 큰 값은 읽는 양을 늘려 재시도 횟수를 줄임
+
+
+def iter_stream_records(path: str) -> Iterator[Dict]:
+    """결과 스트림(.jsonl)의 레코드를 하나씩 반환 (줄바꿈으로 끝나지 않은 마지막 줄은 기록 중 중단된 것으로 보고 무시)"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                return
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_raw_results(path: str) -> Iterator[Dict]:
+    """
+    결과 파일의 케이스 결과 dict를 하나씩 반환 (파일 전체를 메모리에 올리지 않음)
+
+    최상위 객체에서 결과 목록 키(RESULT_LIST_KEYS)의 배열만 원소 단위로 파싱하고,
+    나머지 값(summary 등)은 읽고 버립니다. 스트리밍 형식(.jsonl, .summary.json)은
+    결과 스트림을 한 줄씩 읽습니다.
+    """
+    if path.endswith(SUMMARY_SUFFIX):
+        path = stream_path_of(path, _read_json(path))
+    if path.endswith(STREAM_SUFFIX):
+        yield from iter_stream_records(path)
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        stream = _JsonStream(f)
+        if stream.peek() != "{":
+            return
+        stream.expect("{")
+        while stream.peek() not in ("}", ""):
+            key = stream.decode()
+            stream.expect(":")
+            if key in RESULT_LIST_KEYS and stream.peek() == "[":
+                stream.expect("[")
+                first = True
+                while stream.peek() != "]":
+                    item = stream.decode()
+                    if first and not (isinstance(item, dict) and any(k in item for k in _CASE_ID_KEYS)):
+                        return  # 케이스별 결과 목록이 아님 (cot_hard_experiment.json 등)
+                    first = False
+                    yield item
+                    if stream.peek() == ",":
+                        stream.expect(",")
+                return
+            stream.decode()
+            if stream.peek() == ",":
+                stream.expect(",")
+
+
+def iter_run_results(path: str) -> Iterator[Dict[str, Any]]:
+    """결과 파일의 케이스 결과를 정규화하여 하나씩 반환 (스트리밍)"""
+    for raw in iter_raw_results(path):
+        yield normalize_result(raw)
+
+
+def read_run(path: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """결과 파일 → (실행 정보, 정규화된 케이스 행 목록)"""
+    data = load_run_file(path)
+    return run_info(path, data), list(iter_normalized_results(data))
+
+
+# ============================================================================
+# 스트리밍 기록 (결과가 나올 때마다 JSONL 추가)
+# ============================================================================
+
+def _compact_json(record: Mapping) -> str:
+    return json.dumps(dict(record), ensure_ascii=False, separators=(",", ":"))
+
+
+class ResultStreamWriter:
+    """
+    실행 결과 스트림 기록기
+
+    <stem>.jsonl 에 결과를 한 줄씩 추가하고, 끝나면 <stem>.summary.json 에 요약을 씁니다.
+
+    Attributes:
+        stem: 확장자를 뺀 출력 경로 (트레이스/프로파일 보고서도 같은 stem 사용)
+        path: 결과 스트림 경로 (<stem>.jsonl)
+        summary_path: 요약 파일 경로 (<stem>.summary.json)
+        count: 기록한 결과 수
+    """
+
+    def __init__(self, stem: str, results_key: str = RESULT_LIST_KEYS[0], flush_every: int = DEFAULT_FLUSH_EVERY):
+        """
+        Args:
+            stem: 확장자를 뺀 출력 경로 (예: results/business_experiments_20260121_203535)
+            results_key: 기존 형식으로 복원할 때의 결과 목록 키 ("detailed_results" / "results")
+            flush_every: 몇 건마다 디스크로 flush할지 (1이면 매 건)
+        """
+        if flush_every < 1:
+            raise ValueError(f"flush_every는 1 이상이어야 합니다: {flush_every}")
+        os.makedirs(os.path.dirname(os.path.abspath(stem)), exist_ok=True)
+        self.stem = stem
+        self.path = stem + STREAM_SUFFIX
+        self.summary_path = stem + SUMMARY_SUFFIX
+        self.results_key = results_key
+        self.flush_every = flush_every
+        self.count = 0
+        self._f = open(self.path, "w", encoding="utf-8")
+
+    def write(self, record: Mapping):
+        """결과 1건 추가 (dict 또는 ResultRecord)"""
+        self._f.write(_compact_json(record) + "\n")
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self._f.flush()
+
+    def close(self):
+        """결과 스트림 닫기 (남은 버퍼 flush)"""
+        if not self._f.closed:
+            self._f.close()
+
+    def write_summary(self, summary: Dict) -> str:
+        """
+        결과 스트림을 닫고 요약 파일 기록
+
+        Args:
+            summary: 실행기 요약
+
+        Returns:
+            str: 요약 파일 경로
+        """
+        self.close()
+        with open(self.summary_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "summary": summary,
+                "results_key": self.results_key,
+                "results_file": os.path.basename(self.path),
+                "n_results": self.count,
+            }, f, ensure_ascii=False, indent=2)
+        return self.summary_path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _indented(value: Any, prefix: str) -> str:
+    return json.dumps(value, ensure_ascii=False, indent=2).replace("\n", "\n" + prefix)
+
+
+def export_legacy_json(path: str, out_path: Optional[str] = None) -> str:
+    """
+    스트리밍 형식 결과를 기존 단일 JSON 파일로 내보내기 (결과를 한 건씩 옮겨 씀)
+
+    출력은 json.dump({"summary", 결과 목록 키}, indent=2)와 같은 모양입니다.
+
+    Args:
+        path: 요약 파일(.summary.json) 또는 결과 스트림(.jsonl)
+        out_path: 출력 경로 (기본: 같은 이름의 .json)
+
+    Returns:
+        str: 출력 경로
+    """
+    stem = path[:-len(SUMMARY_SUFFIX)] if path.endswith(SUMMARY_SUFFIX) else path[:-len(STREAM_SUFFIX)]
+    summary_path = stem + SUMMARY_SUFFIX
+    meta = _read_json(summary_path) if os.path.exists(summary_path) else {}
+    stream_path = stream_path_of(summary_path, meta) if meta else stem + STREAM_SUFFIX
+    out_path = out_path or stem + ".json"
+
+    with open(out_path, "w", encoding="utf-8") as out:
+        out.write('{\n  "summary": ' + _indented(meta.get("summary") or {}, "  "))
+        out.write(',\n  ' + json.dumps(meta.get("results_key", RESULT_LIST_KEYS[0])) + ': [')
+        first = True
+        for record in iter_stream_records(stream_path):
+            out.write(("\n    " if first else ",\n    ") + _indented(record, "    "))
+            first = False
+        out.write("]\n}" if first else "\n  ]\n}")
+    return out_path
+
+
+def add_output_arguments(parser):
+    """실행기 CLI에 --flush-every/--legacy-json/--trace/--profile 인자 추가"""
+    parser.add_argument("--flush-every", type=int, default=DEFAULT_FLUSH_EVERY,
+                        help=f"결과 스트림(.jsonl)을 몇 건마다 flush할지 (기본: {DEFAULT_FLUSH_EVERY})")
+    parser.add_argument("--legacy-json", action="store_true",
+                        help="기존 단일 JSON 결과 파일(.json)도 함께 생성")
+    parser.add_argument("--trace", action="store_true",
+                        help="단계별 구간을 Chrome 트레이스(<결과>.trace.json)로 기록 (chrome://tracing, ui.perfetto.dev)")
+    parser.add_argument("--profile", choices=PROFILE_MODES, default=None,
+                        help="하네스 프로파일 (cpu: 단계별 cProfile .pstats, alloc: tracemalloc 할당 보고서, 모델 호출 시간 제외)")
+
+
+def parse_output_arguments(parser, args) -> Dict:
+    """add_output_arguments로 추가한 인자를 실행기 키워드 인자로 변환"""
+    if args.flush_every < 1:
+        parser.error("--flush-every는 1 이상이어야 합니다")
+    return {"flush_every": args.flush_every, "legacy_json": args.legacy_json, "trace": args.trace, "profile": args.profile}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="스트리밍 형식 결과를 기존 단일 JSON 파일로 변환")
+    parser.add_argument("paths", nargs="+", help="요약 파일(.summary.json) 또는 결과 스트림(.jsonl)")
+    args = parser.parse_args()
+
+    for path in args.paths:
+        if not path.endswith((SUMMARY_SUFFIX, STREAM_SUFFIX)):
+            parser.error(f"스트리밍 형식 결과 파일이 아닙니다: {path}")
+        print(f"{path} → {export_legacy_json(path)}")
@@ -0,0 +1,405 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+실험 결과 카탈로그 DB (Results Catalog, SQLite)
+================================================================================
+
+## 이 모듈의 목적
+results/ 의 실험 결과 파일을 **정규화된 SQLite DB**로 점진 색인하고,
+여러 실행에 걸친 집계를 바로 조회합니다.
+
+## 왜 필요한가?
+- results/ 에는 모양이 제각각인 타임스탬프 JSON 파일이 수십 개
+  (detailed_results vs results, quality_evaluation vs judge 필드 등)
+- "모든 실행에서 V4 resume 케이스의 평균 지연" 같은 질문에 파일을 직접 열어 합산해야 함
+
+## 구조
+- 파일 읽기/정규화: evaluation.result_io (형식 차이는 모두 여기서 흡수)
+- files: 색인한 파일의 sha256 (같은 내용이면 다시 읽지 않음, 이름을 바꿔도 재색인 안 함)
+- runs: 실행 1건 (domain, version, model, started_at, summary JSON)
+- results: 케이스 결과 1건 (정규화 필드)
+- metrics: quality_evaluation의 수치 필드 (accuracy, has_structure 등, 이름-값 행)
+- 인덱스: runs(domain, version), results(run_id, category, subcategory),
+  results(test_case_id), results(category, subcategory)
+  (색인 후 ANALYZE → 실행 조건이 있으면 runs에서 먼저 좁힌 뒤 실행별 결과만 탐색)
+
+## 점진 색인
+1. (경로, 크기, 수정 시각)이 이전과 같으면 해시도 계산하지 않고 건너뜀
+2. 내용 해시가 이미 있으면 건너뜀 (복사/이름 변경)
+3. 같은 경로의 내용이 바뀌었으면 이전 실행을 지우고 다시 색인
+
+## 사용 예시
+
+```bash
+# 색인 (새 파일만)
+python -m evaluation.results_db ingest
+
+# 집계: 도메인/버전/카테고리로 거르고 원하는 열로 묶기
+python -m evaluation.results_db query --domain career --version v4 --category resume
+python -m evaluation.results_db query --domain business --group-by run,category
+
+# 실행 목록 / 버전이 기록되지 않은 예전 파일에 버전 지정 / 임의 SQL
+python -m evaluation.results_db runs
+python -m evaluation.results_db tag career_experiments_20260122_110432.json --version v4
+python -m evaluation.results_db sql "SELECT domain, COUNT(*) FROM runs GROUP BY domain"
+```
+================================================================================
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from evaluation.result_io import SUMMARY_SUFFIX, TRACE_SUFFIX, iter_normalized_results, load_run_file, run_info
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "results")
+DEFAULT_DB_PATH = os.path.join(RESULTS_DIR, "results.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    sha256      TEXT PRIMARY KEY,
+    path        TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    mtime       REAL NOT NULL,
+    run_id      INTEGER,
+    ingested_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id     INTEGER PRIMARY KEY,
+    name       TEXT NOT NULL,
+    domain     TEXT,
+    version    TEXT,
+    model      TEXT,
+    started_at TEXT,
+    n_results  INTEGER NOT NULL,
+    summary    TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    result_id     INTEGER PRIMARY KEY,
+    run_id        INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    test_case_id  TEXT,
+    category      TEXT,
+    subcategory   TEXT,
+    difficulty    TEXT,
+    success       INTEGER,
+    quality_score REAL,
+    coverage      REAL,
+    latency       REAL,
+    input_tokens  INTEGER,
+    output_tokens INTEGER,
+    total_tokens  INTEGER,
+    error         TEXT
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    result_id INTEGER NOT NULL REFERENCES results(result_id) ON DELETE CASCADE,
+    name      TEXT NOT NULL,
+    value     REAL
+);
+CREATE INDEX IF NOT EXISTS idx_files_path ON files(path);
+CREATE INDEX IF NOT EXISTS idx_runs_domain_version ON runs(domain, version);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id, category, subcategory);
+CREATE INDEX IF NOT EXISTS idx_results_case ON results(test_case_id);
+CREATE INDEX IF NOT EXISTS idx_results_category ON results(category, subcategory);
+CREATE INDEX IF NOT EXISTS idx_metrics_result ON metrics(result_id, name);
+"""
+
+_RESULT_COLUMNS = (
+    "test_case_id", "category", "subcategory", "difficulty", "success", "quality_score",
+    "coverage", "latency", "input_tokens", "output_tokens", "total_tokens", "error",
+)
+
+# query --group-by 에 쓸 수 있는 열 (이름 → SQL 식)
+GROUP_COLUMNS = {
+    "run": "runs.name",
+    "domain": "runs.domain",
+    "version": "runs.version",
+    "model": "runs.model",
+    "category": "results.category",
+    "subcategory": "results.subcategory",
+    "difficulty": "results.difficulty",
+    "test_case_id": "results.test_case_id",
+}
+
+# query 필터 (이름 → SQL 열)
+FILTER_COLUMNS = {
+    "domain": "runs.domain",
+    "version": "runs.version",
+    "model": "runs.model",
+    "run": "runs.name",
+    "category": "results.category",
+    "subcategory": "results.subcategory",
+    "difficulty": "results.difficulty",
+    "test_case_id": "results.test_case_id",
+}
+
+AGGREGATES = (
+    ("n", "COUNT(*)"),
+    ("success_rate", "ROUND(AVG(results.success) * 100, 1)"),
+    ("avg_quality", "ROUND(AVG(results.quality_score), 2)"),
+    ("avg_coverage", "ROUND(AVG(results.coverage), 1)"),
+    ("avg_latency", "ROUND(AVG(results.latency), 2)"),
+    ("avg_tokens", "ROUND(AVG(results.total_tokens), 0)"),
+)
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultsDB:
+    """
+    실험 결과 카탈로그 (SQLite)
+
+    Attributes:
+        path: DB 파일 경로 (":memory:" 가능)
+        conn: sqlite3 연결
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+
+    def _is_unchanged(self, path: str, size: int, mtime: float) -> bool:
+        row = self.conn.execute(
+            "SELECT 1 FROM files WHERE path = ? AND size = ? AND mtime = ?", (path, size, mtime)
+        ).fetchone()
+        return row is not None
+
+    def ingest_file(self, path: str, version: Optional[str] = None) -> Optional[int]:
+        """
+        결과 파일 1개 색인
+
+        Args:
+            path: 결과 JSON 파일
+            version: 파일에 버전이 기록되어 있지 않을 때 사용할 프롬프트 버전
+
+        Returns:
+            Optional[int]: 새로 만든 run_id (이미 색인했거나 케이스 결과가 없으면 None)
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        if self._is_unchanged(path, stat.st_size, stat.st_mtime):
+            return None
+        sha256 = _file_sha256(path)
+        if self.conn.execute("SELECT 1 FROM files WHERE sha256 = ?", (sha256,)).fetchone():
+            return None
+
+        data = load_run_file(path)
+        info = run_info(path, data)
+        now = datetime.now().isoformat()
+
+        with self.conn:
+            # 같은 경로의 이전 내용은 교체
+            for (old_run_id,) in self.conn.execute(
+                "SELECT run_id FROM files WHERE path = ? AND run_id IS NOT NULL", (path,)
+            ).fetchall():
+                self.conn.execute("DELETE FROM runs WHERE run_id = ?", (old_run_id,))
+            self.conn.execute("DELETE FROM files WHERE path = ?", (path,))
+
+            run_id = None
+            if info["n_results"]:  # 케이스별 결과가 없는 파일(all_experiments.json 등)은 해시만 기록
+                summary = data.get("summary")
+                cursor = self.conn.execute(
+                    "INSERT INTO runs (name, domain, version, model, started_at, n_results, summary) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (info["name"], info["domain"], info["version"] or version, info["model"],
+                     info["started_at"], info["n_results"],
+                     json.dumps(summary, ensure_ascii=False) if summary is not None else None),
+                )
+                run_id = cursor.lastrowid
+                self._insert_results(run_id, iter_normalized_results(data))
+
+            self.conn.execute(
+                "INSERT INTO files (sha256, path, size, mtime, run_id, ingested_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (sha256, path, stat.st_size, stat.st_mtime, run_id, now),
+            )
+        return run_id
+
+    def _insert_results(self, run_id: int, rows: Iterable[Dict[str, Any]]):
+        placeholders = ", ".join("?" * (len(_RESULT_COLUMNS) + 1))
+        insert_result = (
+            f"INSERT INTO results (run_id, {', '.join(_RESULT_COLUMNS)}) VALUES ({placeholders})"
+        )
+        metric_rows = []
+        for row in rows:
+            values = [row[column] for column in _RESULT_COLUMNS]
+            if values[4] is not None:  # success → 0/1
+                values[4] = int(values[4])
+            result_id = self.conn.execute(insert_result, (run_id, *values)).lastrowid
+            metric_rows.extend((result_id, name, value) for name, value in row["metrics"].items())
+        self.conn.executemany("INSERT INTO metrics (result_id, name, value) VALUES (?, ?, ?)", metric_rows)
+
+    def ingest(self, paths: Sequence[str], version: Optional[str] = None) -> Tuple[int, int]:
+        """
+        여러 결과 파일 색인
+
+        Returns:
+            (새로 색인한 실행 수, 건너뛴 파일 수)
+        """
+        added = skipped = 0
+        for path in paths:
+            if self.ingest_file(path, version=version) is None:
+                skipped += 1
+            else:
+                added += 1
+        if added:
+            self.conn.execute("ANALYZE")  # 쿼리 계획기가 runs → results 순서를 고르도록 통계 갱신
+        return added, skipped
+
+    def tag_version(self, name: str, version: str) -> int:
+        """실행 이름(파일 이름)으로 버전 지정, 바뀐 실행 수 반환"""
+        with self.conn:
+            return self.conn.execute("UPDATE runs SET version = ? WHERE name = ?", (version, name)).rowcount
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def query(self, group_by: Sequence[str] = (), **filters) -> Tuple[List[str], List[Tuple]]:
+        """
+        케이스 결과 집계
+
+        Args:
+            group_by: 묶을 열 (GROUP_COLUMNS의 키)
+            **filters: 필터 (FILTER_COLUMNS의 키 = 값, None은 무시)
+
+        Returns:
+            (열 이름 목록, 행 목록)
+
+        Raises:
+            KeyError: 지원하지 않는 필터/묶음 열
+        """
+        where, params = [], []
+        for name, value in filters.items():
+            if value is None:
+                continue
+            if name not in FILTER_COLUMNS:
+                raise KeyError(f"지원하지 않는 필터: {name} (가능: {', '.join(FILTER_COLUMNS)})")
+            where.append(f"{FILTER_COLUMNS[name]} = ?")
+            params.append(value)
+        for name in group_by:
+            if name not in GROUP_COLUMNS:
+                raise KeyError(f"지원하지 않는 묶음 열: {name} (가능: {', '.join(GROUP_COLUMNS)})")
+
+        group_exprs = [GROUP_COLUMNS[name] for name in group_by]
+        select = group_exprs + [expr for _, expr in AGGREGATES]
+        sql = f"SELECT {', '.join(select)} FROM results JOIN runs ON runs.run_id = results.run_id"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if group_exprs:
+            sql += f" GROUP BY {', '.join(group_exprs)} ORDER BY {', '.join(group_exprs)}"
+        rows = self.conn.execute(sql, params).fetchall()
+        return list(group_by) + [name for name, _ in AGGREGATES], rows
+
+    def runs(self) -> Tuple[List[str], List[Tuple]]:
+        """색인된 실행 목록"""
+        columns = ["run_id", "name", "domain", "version", "model", "started_at", "n_results"]
+        rows = self.conn.execute(f"SELECT {', '.join(columns)} FROM runs ORDER BY started_at, name").fetchall()
+        return columns, rows
+
+    def sql(self, statement: str, params: Sequence = ()) -> Tuple[List[str], List[Tuple]]:
+        """임의 SQL 실행 (열 이름, 행)"""
+        cursor = self.conn.execute(statement, params)
+        columns = [d[0] for d in cursor.description] if cursor.description else []
+        return columns, cursor.fetchall()
+
+
+def default_result_files(results_dir: str = RESULTS_DIR) -> List[str]:
+    """results/ 의 결과 JSON 파일 목록 (스트리밍 형식은 요약 파일, 같은 실행의 --legacy-json 파일이 있으면 그쪽만, 트레이스 제외)"""
+    paths = {path for path in glob.glob(os.path.join(results_dir, "*.json")) if not path.endswith(TRACE_SUFFIX)}
+    return sorted(
+        path for path in paths
+        if not (path.endswith(SUMMARY_SUFFIX) and path[:-len(SUMMARY_SUFFIX)] + ".json" in paths)
+    )
+
+
+def print_table(columns: List[str], rows: List[Tuple]):
+    """열 이름/행을 고정폭 표로 출력"""
+    cells = [[("" if v is None else str(v)) for v in row] for row in rows]
+    widths = [max([len(c)] + [len(row[i]) for row in cells]) for i, c in enumerate(columns)]
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in cells:
+        print("  ".join(v.ljust(w) for v, w in zip(row, widths)))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="실험 결과 카탈로그 DB (SQLite)")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help="DB 파일 (기본: results/results.sqlite)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_ingest = sub.add_parser("ingest", help="결과 파일 색인 (이미 색인한 파일은 건너뜀)")
+    p_ingest.add_argument("paths", nargs="*", help="결과 JSON 파일 (기본: results/*.json)")
+    p_ingest.add_argument("--version", type=str, default=None, help="버전이 기록되지 않은 파일에 지정할 버전")
+
+    p_query = sub.add_parser("query", help="케이스 결과 집계")
+    for name in FILTER_COLUMNS:
+        p_query.add_argument(f"--{name.replace('_', '-')}", dest=name, type=str, default=None)
+    p_query.add_argument("--group-by", type=str, default="",
+                         help=f"묶을 열, 쉼표 구분 ({', '.join(GROUP_COLUMNS)})")
+
+    sub.add_parser("runs", help="색인된 실행 목록")
+
+    p_tag = sub.add_parser("tag", help="실행에 프롬프트 버전 지정")
+    p_tag.add_argument("name", help="실행 이름 (결과 파일 이름)")
+    p_tag.add_argument("--version", type=str, required=True)
+
+    p_sql = sub.add_parser("sql", help="임의 SQL 실행")
+    p_sql.add_argument("statement")
+
+    args = parser.parse_args()
+
+    with ResultsDB(args.db) as db:
+        start = time.perf_counter()
+        if args.command == "ingest":
+            added, skipped = db.ingest(args.paths or default_result_files(), version=args.version)
+            print(f"색인: 새 실행 {added}개, 건너뜀 {skipped}개 ({(time.perf_counter() - start) * 1000:,.1f}ms)")
+        elif args.command == "query":
+            group_by = [name.strip() for name in args.group_by.split(",") if name.strip()]
+            filters = {name: getattr(args, name) for name in FILTER_COLUMNS}
+            try:
+                columns, rows = db.query(group_by, **filters)
+            except KeyError as e:
+                parser.error(str(e.args[0]))
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print_table(columns, rows)
+            print(f"\n{len(rows)}행, {elapsed_ms:.2f}ms")
+        elif args.command == "runs":
+            print_table(*db.runs())
+        elif args.command == "tag":
+            print(f"버전 지정: {db.tag_version(args.name, args.version)}개 실행")
+        elif args.command == "sql":
+            columns, rows = db.sql(args.statement)
+            print_table(columns, rows)
+            print(f"\n{len(rows)}행, {(time.perf_counter() - start) * 1000:.2f}ms")
@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+실행 간 케이스별 비교 (Run Diff)
+================================================================================
+
+## 이 모듈의 목적
+두 개 이상의 실험 결과 파일을 test_case_id로 조인하여 **케이스별 품질/토큰/지연 변화**,
+가장 크게 나빠진 케이스, 대응 표본 유의성 검정을 보고합니다.
+
+## 왜 필요한가?
+- 지금은 두 실행의 summary(평균)만 눈으로 비교
+- 평균이 같아도 일부 케이스가 크게 나빠졌을 수 있고, 차이가 우연인지 알 수 없음
+
+## 처리 방식
+1. 기준 실행(첫 번째 파일)을 스트리밍으로 읽어 test_case_id → 지표 튜플 해시 테이블 구성
+   (케이스 결과 dict 전체가 아니라 비교할 숫자만 보관)
+2. 비교 실행을 스트리밍으로 읽으며 해시 조인 (result_io.iter_run_results, 파일 전체를 로드하지 않음)
+3. 지표별로 한 번의 순회에서
+   - RunningStats로 평균/분산 (paired t-검정)
+   - 차이 배열(array('d'), 케이스당 8바이트)로 Wilcoxon 부호 순위 검정
+   - 개선/악화 건수로 부호 검정
+   - 크기 top-N 힙으로 가장 크게 나빠진 케이스
+4. --out 을 주면 케이스별 차이를 JSONL로 바로 기록 (메모리에 모으지 않음)
+
+어느 한쪽이라도 실패(success=False)한 케이스는 지표 비교에서 제외하고 따로 셉니다.
+
+## 사용 예시
+
+```bash
+python -m evaluation.run_diff results/business_experiments_20260121_203535.json \\
+    results/business_experiments_20260121_205822.json --top 5
+
+# 기준 1개 + 비교 여러 개, 케이스별 차이 저장
+python -m evaluation.run_diff base.json v2.json v3.json --out /tmp/deltas.jsonl
+```
+================================================================================
+"""
+
+import heapq
+import json
+import os
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from evaluation.result_io import iter_run_results
+from evaluation.stats import RunningStats, paired_t_test, sign_test, wilcoxon_signed_rank
+
+
+# 비교 지표 → 좋아지는 방향 (+1: 클수록 좋음, -1: 작을수록 좋음)
+DIFF_METRICS = {
+    "quality_score": 1,
+    "coverage": 1,
+    "total_tokens": -1,
+    "latency": -1,
+}
+
+DEFAULT_TOP = 10
+
+
+class MetricDiff:
+    """
+    지표 1개의 케이스별 차이 누적기 (other - base)
+
+    Attributes:
+        name: 지표 이름
+        direction: 좋아지는 방향 (+1 / -1)
+    """
+
+    def __init__(self, name: str, direction: int, top: int = DEFAULT_TOP):
+        self.name = name
+        self.direction = direction
+        self.top = top
+        self.base = RunningStats()
+        self.other = RunningStats()
+        self.delta = RunningStats()
+        self.diffs = array("d")
+        self.improved = 0
+        self.worsened = 0
+        self.unchanged = 0
+        self._worst: List[Tuple[float, str, float, float]] = []  # (악화 크기, id, base, other) 최소 힙
+
+    def add(self, case_id: str, base: float, other: float):
+        """케이스 1건의 지표 쌍 추가"""
+        delta = other - base
+        self.base.add(base)
+        self.other.add(other)
+        self.delta.add(delta)
+        self.diffs.append(delta)
+
+        worse = -self.direction * delta
+        if worse > 0:
+            self.worsened += 1
+            item = (worse, case_id, base, other)
+            if len(self._worst) < self.top:
+                heapq.heappush(self._worst, item)
+            elif item > self._worst[0]:
+                heapq.heapreplace(self._worst, item)
+        elif worse < 0:
+            self.improved += 1
+        else:
+            self.unchanged += 1
+
+    def report(self) -> Dict[str, Any]:
+        """지표 요약 + 검정 결과"""
+        t, p_t = paired_t_test(self.delta)
+        z, p_w = wilcoxon_signed_rank(self.diffs)
+        return {
+            "n": self.delta.n,
+            "base_mean": self.base.mean if self.delta.n else None,
+            "other_mean": self.other.mean if self.delta.n else None,
+            "mean_delta": self.delta.mean if self.delta.n else None,
+            "delta_std": self.delta.std if self.delta.n > 1 else None,
+            "t": t,
+            "p_t": p_t,
+            "wilcoxon_z": z,
+            "p_wilcoxon": p_w,
+            "improved": self.improved,
+            "worsened": self.worsened,
+            "unchanged": self.unchanged,
+            "p_sign": sign_test(self.improved, self.worsened),
+            "worst": [
+                {"test_case_id": case_id, "base": base, "other": other, "delta": other - base}
+                for _, case_id, base, other in sorted(self._worst, reverse=True)
+            ],
+        }
+
+
+def index_run(path: str, metrics: Sequence[str]) -> Tuple[Dict[str, Tuple], int]:
+    """
+    기준 실행의 해시 테이블 구성 (스트리밍)
+
+    Args:
+        path: 기준 결과 파일
+        metrics: 보관할 지표
+
+    Returns:
+        (test_case_id → (성공 여부, 지표값...), 중복 ID 수 - 마지막 값 사용)
+    """
+    index: Dict[str, Tuple] = {}
+    duplicates = 0
+    for row in iter_run_results(path):
+        case_id = row["test_case_id"]
+        if case_id is None:
+            continue
+        if case_id in index:
+            duplicates += 1
+        index[case_id] = (row["success"] is not False,) + tuple(row[m] for m in metrics)
+    return index, duplicates
+
+
+def diff_runs(
+    base_index: Dict[str, Tuple],
+    other_path: str,
+    metrics: Sequence[str] = tuple(DIFF_METRICS),
+    top: int = DEFAULT_TOP,
+    on_case: Optional[Callable[[Dict], None]] = None
+) -> Dict[str, Any]:
+    """
+    기준 해시 테이블과 비교 실행을 조인하여 차이 보고서 생성
+
+    Args:
+        base_index: index_run() 결과의 해시 테이블
+        other_path: 비교 결과 파일 (스트리밍으로 읽음)
+        metrics: 비교할 지표 (DIFF_METRICS의 키, index_run과 같은 순서)
+        top: 지표별로 보고할 최대 악화 케이스 수
+        on_case: 케이스별 차이 dict를 받을 콜백 (JSONL 기록 등)
+
+    Returns:
+        Dict: matched, only_base, only_other, failed_pairs, metrics(지표별 report)
+    """
+    diffs = [MetricDiff(name, DIFF_METRICS[name], top) for name in metrics]
+    matched_ids = set()
+    only_other = 0
+    failed_pairs = 0
+
+    for row in iter_run_results(other_path):
+        case_id = row["test_case_id"]
+        base = base_index.get(case_id)
+        if base is None:
+            only_other += 1
+            continue
+        matched_ids.add(case_id)
+        if not base[0] or row["success"] is False:
+            failed_pairs += 1
+            continue
+
+        case_delta = {"test_case_id": case_id} if on_case else None
+        for diff, base_value in zip(diffs, base[1:]):
+            other_value = row[diff.name]
+            if base_value is None or other_value is None:
+                continue
+            diff.add(case_id, base_value, other_value)
+            if case_delta is not None:
+                case_delta[diff.name] = {"base": base_value, "other": other_value, "delta": other_value - base_value}
+        if on_case:
+            on_case(case_delta)
+
+    return {
+        "other": os.path.basename(other_path),
+        "matched": len(matched_ids),
+        "only_base": len(base_index) - len(matched_ids),
+        "only_other": only_other,
+        "failed_pairs": failed_pairs,
+        "metrics": {diff.name: diff.report() for diff in diffs},
+    }
+
+
+def compare_runs(
+    paths: Sequence[str],
+    metrics: Sequence[str] = tuple(DIFF_METRICS),
+    top: int = DEFAULT_TOP,
+    out_path: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    첫 번째 파일을 기준으로 나머지 실행을 각각 비교
+
+    Args:
+        paths: 결과 파일 (2개 이상, 첫 번째가 기준)
+        metrics: 비교할 지표
+        top: 지표별 최대 악화 케이스 수
+        out_path: 케이스별 차이를 기록할 JSONL 경로
+
+    Returns:
+        List[Dict]: 비교 실행별 보고서 (base, base_duplicates 포함)
+    """
+    if len(paths) < 2:
+        raise ValueError("비교하려면 결과 파일이 2개 이상 필요합니다")
+    unknown = [name for name in metrics if name not in DIFF_METRICS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 지표: {', '.join(unknown)} (가능: {', '.join(DIFF_METRICS)})")
+
+    base_index, duplicates = index_run(paths[0], metrics)
+    out = open(out_path, "w", encoding="utf-8") if out_path else None
+    try:
+        reports = []
+        for other_path in paths[1:]:
+            other_name = os.path.basename(other_path)
+            on_case = None
+            if out:
+                def on_case(case_delta, other_name=other_name):
+                    out.write(json.dumps(dict(case_delta, other=other_name), ensure_ascii=False) + "\n")
+            report = diff_runs(base_index, other_path, metrics, top, on_case)
+            report["base"] = os.path.basename(paths[0])
+            report["base_duplicates"] = duplicates
+            reports.append(report)
+        return reports
+    finally:
+        if out:
+            out.close()
+
+
+def _fmt(value: Optional[float], spec: str = ".2f") -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def print_diff_report(report: Dict[str, Any]):
+    """비교 보고서 출력"""
+    print("=" * 78)
+    print(f"{report['base']} → {report['other']}")
+    print("=" * 78)
+    print(f"조인: {report['matched']}건 (기준에만 {report['only_base']}건, 비교에만 {report['only_other']}건, "
+          f"한쪽 실패 {report['failed_pairs']}건)")
+    if report["base_duplicates"]:
+        print(f"  기준 실행에 중복 ID {report['base_duplicates']}건 (마지막 결과 사용)")
+    print()
+    print(f"{'지표':<14} {'n':>7} {'기준':>9} {'비교':>9} {'Δ평균':>9} {'개선/악화':>15} "
+          f"{'p(t)':>8} {'p(W)':>8} {'p(부호)':>8}")
+    for name, m in report["metrics"].items():
+        wins = f"{m['improved']}/{m['worsened']}"
+        print(f"{name:<14} {m['n']:>7} {_fmt(m['base_mean']):>9} {_fmt(m['other_mean']):>9} "
+              f"{_fmt(m['mean_delta'], '+.2f'):>9} {wins:>15} "
+              f"{_fmt(m['p_t'], '.4f'):>8} {_fmt(m['p_wilcoxon'], '.4f'):>8} {_fmt(m['p_sign'], '.4f'):>8}")
+
+    for name, m in report["metrics"].items():
+        if not m["worst"]:
+            continue
+        print()
+        print(f"가장 크게 나빠진 케이스 ({name}):")
+        for w in m["worst"]:
+            print(f"  {w['test_case_id']:<16} {_fmt(w['base']):>9} → {_fmt(w['other']):>9} ({w['delta']:+.2f})")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="실행 간 케이스별 비교 (첫 번째 파일이 기준)")
+    parser.add_argument("paths", nargs="+", help="결과 JSON 파일 (2개 이상)")
+    parser.add_argument("--metrics", type=str, default=",".join(DIFF_METRICS),
+                        help=f"비교 지표, 쉼표 구분 (기본: {','.join(DIFF_METRICS)})")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="지표별 최대 악화 케이스 수")
+    parser.add_argument("--out", type=str, default=None, help="케이스별 차이를 기록할 JSONL 경로")
+    parser.add_argument("--json", action="store_true", help="보고서를 JSON으로 출력")
+    args = parser.parse_args()
+
+    try:
+        reports = compare_runs(
+            args.paths, [m.strip() for m in args.metrics.split(",") if m.strip()], args.top, args.out
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.json:
+        print(json.dumps(reports, ensure_ascii=False, indent=2))
+    else:
+        for report in reports:
+            print_diff_report(report)
+            print()
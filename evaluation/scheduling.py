@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+최장 예상 우선 스케줄링 (Makespan-aware Scheduling)
+================================================================================
+
+## 이 모듈의 목적
+지난 실행 결과로 케이스별 소요 시간을 예측하고, 동시 실행(--concurrency) 시
+**오래 걸릴 케이스부터** 워커에 배정(LPT, Longest Processing Time first)하여
+실행 전체 시간(makespan)을 줄입니다. 실행이 끝나면 예측 makespan과 실제 makespan을 보고합니다.
+
+## 왜 필요한가?
+- 케이스 지연은 약 5초 ~ 60초 이상으로 편차가 크고, 대부분 출력 길이로 결정됨
+  (예: V4 이력서 피드백은 출력 약 2,700토큰)
+- 목록 순서대로 동시 실행하면 긴 케이스가 끝부분에 몰릴 때 다른 워커가 놀고
+  마지막 몇 개(straggler)만 남아 실행이 길어짐
+- 긴 케이스를 먼저 시작하면 짧은 케이스가 끝부분의 빈 시간을 채움
+
+## 소요 시간 예측 (DurationModel)
+같은 도메인의 지난 결과 파일에서 성공한 케이스의 (버전, 카테고리, 입력 토큰, 소요 시간)을 모아
+다음 순서로 처음 표본이 충분한(min_samples 이상) 그룹을 사용합니다.
+
+| 단계 | 그룹 | 비고 |
+|------|------|------|
+| 1 | (버전, 카테고리) | 버전이 기록되지 않은 초기 결과 파일은 제외 |
+| 2 | 카테고리 | 모든 버전 |
+| 3 | 전체 | 표본 1개 이상 |
+| 4 | 없음 | 입력 토큰 수에 비례 (이력이 없으면 입력이 긴 케이스부터) |
+
+그룹 안에서는 입력 토큰에 대한 1차 회귀(기울기가 양수일 때)로, 아니면 중앙값으로 예측하며
+그룹에서 관측한 범위를 크게 벗어나지 않도록 [최솟값/2, 최댓값×2]로 제한합니다.
+소요 시간은 케이스 1건의 전체 시간(total_time, 없으면 response_time/generation_time/time)입니다.
+
+모의/재생 실행의 시간이 실제 모델 예측에 섞이지 않도록 모델 이름이 같은 실행만 사용합니다
+(모델이 기록되지 않은 초기 파일은 실제 백엔드 실행에서만 사용).
+
+## 스케줄 (--schedule)
+| 값 | 동작 |
+|----|------|
+| (없음) | 기존처럼 계획 순서대로 실행, 예측/보고 없음 |
+| plan | 계획 순서대로 실행하고 예측 vs 실제 makespan만 보고 (비교 기준) |
+| lpt | 예측 소요 시간이 긴 케이스부터 실행하고 보고 |
+
+예측 makespan은 워커 수(동시 호출 최대 한도)만큼의 워커에 케이스를 순서대로, 먼저 비는 워커에
+배정하는 목록 스케줄링 시뮬레이션입니다. 스케줄한 실행은 결과를 끝난 순서대로 받으므로
+(evaluation.concurrency.completion_map) 맨 앞의 긴 케이스를 기다리느라 워커가 놀지 않습니다.
+결과 스트림 .jsonl과 진행 출력은 끝난 순서이고, 결과는 요약 전에 계획 순서로 되돌리므로
+요약(부트스트랩 신뢰 구간 포함)은 계획 순서 실행과 같습니다.
+
+## 노출하는 지표
+- 실행 로그: "스케줄(lpt): 예측 makespan ... / 실제 ..."
+- 실행 요약의 "schedule" 항목 (--schedule을 지정한 실행만): 예측/실제 makespan,
+  계획 순서였을 때의 예측 makespan, 실제 소요 시간으로 시뮬레이션한 makespan(두 순서),
+  케이스별 예측 오차, 예측 근거(그룹 단계)별 케이스 수
+
+## 사용 예시
+
+```bash
+python scripts/run_career_experiments.py --version v4 --concurrency 4 --schedule lpt
+python -m evaluation.engine business --version v4 --concurrency auto --schedule lpt --history results/business_*.summary.json
+python -m evaluation.scheduling career --version v4 --workers 4   # 예측만 (모델 호출 없음)
+```
+
+```python
+from evaluation.scheduling import load_duration_model, history_paths
+
+model = load_duration_model(history_paths("results", "career"), "qwen2.5:7b")
+seconds, source = model.predict("v4", "resume", 2038)
+```
+================================================================================
+"""
+
+import glob
+import heapq
+import os
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from statistics import median
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from evaluation.result_io import (
+    STREAM_SUFFIX,
+    SUMMARY_SUFFIX,
+    TRACE_SUFFIX,
+    domain_of_path,
+    iter_raw_results,
+    load_run_summary
+)
+
+
+SCHEDULES = ("plan", "lpt")
+MIN_GROUP_SAMPLES = 3
+SECONDS_PER_INPUT_TOKEN = 0.01  # 이력이 전혀 없을 때의 예측 (순서만 의미 있음)
+
+# 케이스 1건의 소요 시간 키 (앞에서부터 처음 있는 값, Judge 평가가 있으면 total_time)
+_DURATION_KEYS = ("total_time", "response_time", "generation_time", "time")
+
+# 예측 근거 (DurationModel.predict의 두 번째 반환값)
+SOURCE_LABELS = {
+    "version": "버전+카테고리",
+    "category": "카테고리",
+    "all": "전체",
+    "tokens": "입력 토큰",
+}
+
+
+def case_duration(result: Dict[str, Any]) -> Optional[float]:
+    """케이스 결과의 소요 시간(초) (기록이 없으면 None)"""
+    for key in _DURATION_KEYS:
+        value = result.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+    return None
+
+
+# ============================================================================
+# 소요 시간 예측
+# ============================================================================
+
+@dataclass
+class _GroupFit:
+    """그룹 1개의 예측식 (seconds = intercept + slope × input_tokens, [low, high]로 제한)"""
+    n: int
+    intercept: float
+    slope: float
+    low: float
+    high: float
+
+    @classmethod
+    def fit(cls, samples: List[Tuple[Optional[int], float]]) -> "_GroupFit":
+        seconds = [s for _, s in samples]
+        low, high = min(seconds) / 2, max(seconds) * 2
+        with_tokens = [(t, s) for t, s in samples if t]
+        if len(with_tokens) >= MIN_GROUP_SAMPLES:
+            mean_t = sum(t for t, _ in with_tokens) / len(with_tokens)
+            mean_s = sum(s for _, s in with_tokens) / len(with_tokens)
+            var = sum((t - mean_t) ** 2 for t, _ in with_tokens)
+            if var > 0:
+                slope = sum((t - mean_t) * (s - mean_s) for t, s in with_tokens) / var
+                if slope > 0:
+                    return cls(len(samples), mean_s - slope * mean_t, slope, low, high)
+        return cls(len(samples), median(seconds), 0.0, low, high)
+
+    def predict(self, input_tokens: Optional[int]) -> float:
+        seconds = self.intercept + self.slope * (input_tokens or 0) if self.slope else self.intercept
+        return min(max(seconds, self.low), self.high)
+
+
+class DurationModel:
+    """
+    지난 결과로 케이스 소요 시간 예측 ((버전, 카테고리) → 카테고리 → 전체 → 입력 토큰)
+
+    Attributes:
+        n_samples: 학습에 사용한 케이스 수
+        runs: 학습에 사용한 결과 파일 이름
+    """
+
+    def __init__(self, min_samples: int = MIN_GROUP_SAMPLES):
+        """
+        Args:
+            min_samples: (버전, 카테고리)/카테고리 그룹을 사용할 최소 표본 수
+        """
+        self.min_samples = min_samples
+        self.n_samples = 0
+        self.runs: List[str] = []
+        self._samples: Dict[Tuple, List[Tuple[Optional[int], float]]] = defaultdict(list)
+        self._fits: Dict[Tuple, _GroupFit] = {}
+
+    def add(self, version: Optional[str], category: Optional[str], input_tokens: Optional[int], seconds: float):
+        """관측 1건 추가"""
+        sample = (input_tokens if isinstance(input_tokens, int) else None, seconds)
+        if version and category:
+            self._samples[("version", version, category)].append(sample)
+        if category:
+            self._samples[("category", category)].append(sample)
+        self._samples[("all",)].append(sample)
+        self.n_samples += 1
+        self._fits.clear()
+
+    def add_run(self, path: str, version: Optional[str]) -> int:
+        """
+        결과 파일 1개의 성공한 케이스를 모두 추가
+
+        Returns:
+            int: 추가한 케이스 수
+        """
+        added = 0
+        for result in iter_raw_results(path):
+            seconds = case_duration(result)
+            if result.get("success") is False or not seconds or seconds <= 0:
+                continue
+            self.add(version, result.get("category"), result.get("input_tokens"), seconds)
+            added += 1
+        if added:
+            self.runs.append(os.path.basename(path))
+        return added
+
+    def _group(self, key: Tuple) -> Optional[_GroupFit]:
+        samples = self._samples.get(key)
+        needed = 1 if key == ("all",) else self.min_samples
+        if not samples or len(samples) < needed:
+            return None
+        if key not in self._fits:
+            self._fits[key] = _GroupFit.fit(samples)
+        return self._fits[key]
+
+    def predict(self, version: Optional[str], category: Optional[str], input_tokens: int) -> Tuple[float, str]:
+        """
+        케이스 1개의 예상 소요 시간
+
+        Args:
+            version: 프롬프트 버전
+            category: 케이스 카테고리
+            input_tokens: 프롬프트 입력 토큰 수
+
+        Returns:
+            Tuple[float, str]: (예상 초, 예측 근거 - "version", "category", "all", "tokens")
+        """
+        for source, key in (
+            ("version", ("version", version, category)),
+            ("category", ("category", category)),
+            ("all", ("all",))
+        ):
+            group = self._group(key)
+            if group is not None:
+                return round(group.predict(input_tokens), 3), source
+        return round(input_tokens * SECONDS_PER_INPUT_TOKEN, 3), "tokens"
+
+
+def history_paths(results_dir: str, domain: str) -> List[str]:
+    """
+    결과 디렉토리에서 도메인의 지난 결과 파일 (스트리밍 형식은 .summary.json, 내보낸 .json 중복 제외)
+
+    Args:
+        results_dir: 결과 디렉토리
+        domain: 도메인 이름
+
+    Returns:
+        List[str]: 결과 파일 경로 (이름 순)
+    """
+    paths = []
+    for path in sorted(glob.glob(os.path.join(results_dir, "*.json"))):
+        if path.endswith(TRACE_SUFFIX) or domain_of_path(path) != domain:
+            continue
+        if not path.endswith(SUMMARY_SUFFIX) and os.path.exists(path[:-len(".json")] + SUMMARY_SUFFIX):
+            continue  # --legacy-json으로 내보낸 파일 (같은 결과가 스트림에 있음)
+        paths.append(path)
+    for path in sorted(glob.glob(os.path.join(results_dir, "*" + STREAM_SUFFIX))):
+        stem = path[:-len(STREAM_SUFFIX)]
+        if domain_of_path(path) == domain and not os.path.exists(stem + SUMMARY_SUFFIX):
+            paths.append(path)  # 중단되어 요약이 없는 실행
+    return paths
+
+
+def load_duration_model(
+    paths: Iterable[str],
+    model: str,
+    include_unlabeled: bool = True,
+    min_samples: int = MIN_GROUP_SAMPLES
+) -> DurationModel:
+    """
+    지난 결과 파일로 소요 시간 모델 생성
+
+    Args:
+        paths: 결과 파일 (JSON, .jsonl, .summary.json)
+        model: 현재 실행의 모델 이름 (이름이 같은 실행만 사용, 예: "qwen2.5:7b", "mock:qwen2.5:7b")
+        include_unlabeled: 모델이 기록되지 않은 초기 결과 파일도 사용할지 (실제 백엔드 실행만)
+        min_samples: 그룹 최소 표본 수
+
+    Returns:
+        DurationModel: 학습한 모델 (결과가 없으면 입력 토큰 비례 예측)
+    """
+    duration_model = DurationModel(min_samples)
+    for path in paths:
+        interrupted = path.endswith(STREAM_SUFFIX) and not os.path.exists(path[:-len(STREAM_SUFFIX)] + SUMMARY_SUFFIX)
+        try:
+            summary = {} if interrupted else load_run_summary(path)
+        except (OSError, ValueError):
+            continue
+        info = summary.get("experiment_info") if isinstance(summary.get("experiment_info"), dict) else {}
+        run_model = info.get("model")
+        if run_model != model and not (run_model is None and include_unlabeled):
+            continue
+        try:
+            duration_model.add_run(path, info.get("version") or summary.get("version"))
+        except (OSError, ValueError):
+            continue  # 깨진 결과 파일은 건너뜀
+    return duration_model
+
+
+# ============================================================================
+# 스케줄
+# ============================================================================
+
+def simulate_makespan(durations: Iterable[float], workers: int) -> float:
+    """
+    목록 스케줄링 makespan (순서대로 먼저 비는 워커에 배정)
+
+    Args:
+        durations: 실행 순서대로의 케이스 소요 시간
+        workers: 워커 수
+
+    Returns:
+        float: 마지막 케이스가 끝나는 시각
+    """
+    finish = [0.0] * max(1, workers)
+    for seconds in durations:
+        heapq.heapreplace(finish, finish[0] + seconds)
+    return max(finish)
+
+
+@dataclass
+class SchedulePlan:
+    """
+    실행 순서와 예측
+
+    Attributes:
+        policy: "plan" 또는 "lpt"
+        workers: 시뮬레이션 워커 수
+        order: 실행 순서 (계획 인덱스 목록)
+        predicted: 계획 순서대로의 예상 소요 시간
+        sources: 계획 순서대로의 예측 근거
+        history_runs: 학습에 사용한 결과 파일 수
+        history_samples: 학습에 사용한 케이스 수
+    """
+    policy: str
+    workers: int
+    order: List[int]
+    predicted: List[float]
+    sources: List[str]
+    history_runs: int = 0
+    history_samples: int = 0
+    actual: List[Optional[float]] = field(default_factory=list)
+    finished: List[int] = field(default_factory=list)  # 끝난 순서대로의 실행 위치
+
+    @classmethod
+    def build(
+        cls,
+        policy: str,
+        predicted: Sequence[float],
+        sources: Sequence[str],
+        workers: int,
+        model: Optional[DurationModel] = None
+    ) -> "SchedulePlan":
+        """예측으로 실행 순서 결정 (lpt: 예상 시간 내림차순, 같으면 계획 순서)"""
+        if policy not in SCHEDULES:
+            raise ValueError(f"지원하지 않는 스케줄: {policy} (가능: {', '.join(SCHEDULES)})")
+        order = list(range(len(predicted)))
+        if policy == "lpt":
+            order.sort(key=lambda i: -predicted[i])
+        return cls(
+            policy=policy, workers=workers, order=order, predicted=list(predicted), sources=list(sources),
+            history_runs=len(model.runs) if model else 0, history_samples=model.n_samples if model else 0,
+            actual=[None] * len(predicted)
+        )
+
+    def apply(self, plan: Sequence) -> List:
+        """계획을 실행 순서로 재배열"""
+        return [plan[i] for i in self.order]
+
+    def record(self, position: int, result: Dict[str, Any]):
+        """실행 순서 position번째 케이스가 끝남 (끝난 순서대로 호출, 실제 소요 시간 기록)"""
+        self.finished.append(position)
+        self.actual[self.order[position]] = case_duration(result)
+
+    def restore(self, items: Sequence) -> List:
+        """끝난 순서대로 모은 항목(record 호출 순서)을 계획 순서로 되돌림"""
+        restored = [None] * len(items)
+        for item, position in zip(items, self.finished):
+            restored[self.order[position]] = item
+        return restored
+
+    @property
+    def predicted_makespan(self) -> float:
+        return simulate_makespan((self.predicted[i] for i in self.order), self.workers)
+
+    @property
+    def predicted_plan_makespan(self) -> float:
+        return simulate_makespan(self.predicted, self.workers)
+
+    def report(self, actual_makespan: float) -> Dict[str, Any]:
+        """
+        예측 vs 실제 보고 (실행 요약의 "schedule" 항목)
+
+        Args:
+            actual_makespan: 케이스 실행 구간의 실제 경과 시간(초)
+
+        Returns:
+            Dict: policy, workers, history, predicted/actual makespan, 시뮬레이션 makespan, 케이스 예측 오차, 근거별 수
+        """
+        measured = [(p, a) for p, a in zip(self.predicted, self.actual) if a]
+        report = {
+            "policy": self.policy,
+            "workers": self.workers,
+            "history_runs": self.history_runs,
+            "history_samples": self.history_samples,
+            "predicted_makespan": round(self.predicted_makespan, 2),
+            "predicted_plan_order_makespan": round(self.predicted_plan_makespan, 2),
+            "actual_makespan": round(actual_makespan, 2),
+            "prediction_ratio": round(actual_makespan / self.predicted_makespan, 3) if self.predicted_makespan else None,
+            "prediction_sources": dict(Counter(self.sources)),
+        }
+        if measured:
+            actual_order = [self.actual[i] or 0.0 for i in self.order]
+            report["simulated_makespan"] = round(simulate_makespan(actual_order, self.workers), 2)
+            report["simulated_plan_order_makespan"] = round(
+                simulate_makespan((a or 0.0 for a in self.actual), self.workers), 2
+            )
+            report["case_mae_seconds"] = round(sum(abs(p - a) for p, a in measured) / len(measured), 2)
+            report["case_mape"] = round(100 * sum(abs(p - a) / a for p, a in measured) / len(measured), 1)
+        return report
+
+
+def describe_schedule_plan(schedule: SchedulePlan) -> str:
+    """실행 전 스케줄 요약 한 줄"""
+    history = (f"지난 결과 {schedule.history_runs}개({schedule.history_samples:,}건)" if schedule.history_runs
+               else "지난 결과 없음 - 입력 토큰 비례")
+    sources = ", ".join(f"{SOURCE_LABELS[s]} {n}" for s, n in Counter(schedule.sources).most_common())
+    return (f"{schedule.policy}, 워커 {schedule.workers}개, {history}, "
+            f"예측 makespan {schedule.predicted_makespan:,.1f}초 "
+            f"(계획 순서 {schedule.predicted_plan_makespan:,.1f}초) [{sources}]")
+
+
+def describe_schedule(report: Dict[str, Any]) -> str:
+    """실행 후 예측 vs 실제 한 줄 (report() 결과)"""
+    line = (f"예측 makespan {report['predicted_makespan']:,.1f}초 / 실제 {report['actual_makespan']:,.1f}초 "
+            f"(계획 순서 예측 {report['predicted_plan_order_makespan']:,.1f}초)")
+    if "case_mape" in report:
+        line += (f", 실제 소요 시간 기준 {report['simulated_makespan']:,.1f}초 "
+                 f"(계획 순서 {report['simulated_plan_order_makespan']:,.1f}초), 케이스 예측 오차 {report['case_mape']}%")
+    return line
+
+
+def add_schedule_arguments(parser):
+    """실행기 CLI에 스케줄 옵션 추가 (--schedule, --history)"""
+    parser.add_argument("--schedule", choices=SCHEDULES, default=None,
+                        help="케이스 실행 순서: lpt(지난 결과로 예측한 소요 시간이 긴 케이스부터), "
+                             "plan(계획 순서, 예측 vs 실제 makespan만 보고) (기본: 없음)")
+    parser.add_argument("--history", type=str, nargs="+", default=None,
+                        help="소요 시간 예측에 사용할 지난 결과 파일 (기본: results/의 같은 도메인 결과 전체)")
+
+
+def parse_schedule_arguments(parser, args) -> Dict[str, Any]:
+    """
+    스케줄 옵션 검증
+
+    Returns:
+        Dict: 실행기 생성자 키워드 인자 {"schedule", "history"}
+    """
+    if args.history and not args.schedule:
+        parser.error("--history는 --schedule과 함께 사용해야 합니다")
+    for path in args.history or ():
+        if not os.path.exists(path):
+            parser.error(f"결과 파일이 없습니다: {path}")
+    return {"schedule": args.schedule, "history": args.history}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from evaluation.engine import ADAPTERS, DEFAULT_MODEL, PROJECT_ROOT, create_engine
+
+    parser = argparse.ArgumentParser(description="지난 결과로 케이스 소요 시간과 makespan 예측 (모델 호출 없음)")
+    parser.add_argument("domain", choices=list(ADAPTERS))
+    parser.add_argument("--version", type=str, default=None, help="프롬프트 버전 (기본: 어댑터 기본 버전)")
+    parser.add_argument("--model", type=str, default=DEFAULT_MODEL, help=f"예측할 모델 (기본: {DEFAULT_MODEL})")
+    parser.add_argument("--workers", type=int, default=4, help="워커 수 (기본: 4)")
+    parser.add_argument("--limit", type=int, default=None, help="케이스 수 (기본: 어댑터 default_limit)")
+    parser.add_argument("--top", type=int, default=10, help="예상 소요 시간 상위 몇 개를 출력할지 (기본: 10)")
+    add_schedule_arguments(parser)
+    parser.set_defaults(schedule="lpt")
+    args = parser.parse_args()
+    options = parse_schedule_arguments(parser, args)
+
+    # 프롬프트/토큰 계산만 필요하므로 모의 백엔드 엔진 사용 (예측은 --model 실행 이력으로)
+    engine = create_engine(args.domain, args.version, backend="mock", concurrency=args.workers, **options)
+    duration_model = load_duration_model(
+        options["history"] or history_paths(os.path.join(PROJECT_ROOT, "results"), args.domain), args.model
+    )
+    plan = engine.build_plan()[:args.limit or engine.adapter.default_limit]
+    schedule = engine.schedule_plan(plan, duration_model)
+    print(f"{args.domain} {engine.adapter.version} ({args.model}), 케이스 {len(plan)}개")
+    print(f"스케줄: {describe_schedule_plan(schedule)}")
+    print()
+    print(f"예상 소요 시간 상위 {args.top}개:")
+    for index in sorted(range(len(plan)), key=lambda i: -schedule.predicted[i])[:args.top]:
+        case = plan[index][0]
+        print(f"  {case.id:<12} {case.category + '/' + case.subcategory:<32} "
+              f"{schedule.predicted[index]:7.1f}초 ({SOURCE_LABELS[schedule.sources[index]]})")
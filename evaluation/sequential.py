@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+순차 검정 (Sequential Testing)
+================================================================================
+
+## 이 모듈의 목적
+프롬프트 버전 비교를 **결론이 날 때까지만** 실행합니다. 같은 케이스에 여러 버전을
+번갈아 실행하며 케이스마다 검정을 갱신하고, 차이가 통계적으로 확정되면 멈춥니다.
+
+## 왜 필요한가?
+- 108배 원칙은 버전 비교마다 항상 108 × 버전 수만큼 생성
+- V4가 V3를 크게 이기는 경우 30건 정도면 이미 결론이 났는데도 끝까지 실행
+- 고정 표본 검정(t-검정)을 매 케이스마다 보고 멈추면 1종 오류가 부풀려짐 (peeking)
+
+## 방법: 혼합 SPRT (mSPRT, always-valid p-value)
+케이스별 품질 차이 d = score(B) - score(A) 에 대해 정규 혼합 우도비
+
+    Λ_n = sqrt(σ² / (σ² + nτ²)) · exp(n²τ² d̄² / (2σ²(σ² + nτ²)))
+
+를 계산합니다 (σ²: 차이의 분산 추정치, τ: 예상 효과 크기). p_n = min(p_{n-1}, 1/Λ_n)은
+아무 시점에서 멈춰도 유효한 p-value이고, 같은 경계로 신뢰 수열(confidence sequence)
+
+    d̄ ± sqrt(σ²(σ² + nτ²) / (n²τ²) · log((σ² + nτ²) / (σ² α²)))
+
+을 얻습니다.
+
+## 멈춤 조건 (버전 쌍마다)
+- 신뢰 수열이 0을 벗어남 → 더 좋은 버전 확정 (p ≤ α)
+- 신뢰 수열이 ±margin 안에 들어옴 → 실질적 차이 없음 확정
+- 최소 min_cases건 전에는 멈추지 않음 (분산 추정 안정화)
+- σ²는 min_std² (기본: (τ/2)²) 아래로 내려가지 않음. Judge 점수처럼 이산적인 점수는 초반 차이가
+  모두 같아 분산 추정이 0이 되기 쉬운데, 그대로 쓰면 신뢰 수열 폭이 0이 되어 결론이 척도와 무관해짐.
+  하한이 있으면 차이가 모두 같아도(분산 0) 신뢰 수열은 실제 척도의 폭을 유지하고,
+  결론은 보고하는 구간/p-value와 항상 일치함
+- 버전이 3개 이상이면 모든 쌍을 비교하고 α를 쌍 수로 나눔 (Bonferroni)
+
+모든 쌍이 확정된 버전은 더 이상 실행하지 않으므로, 확정되지 않은 쌍에 남은 버전만 호출합니다.
+
+## 사용 예시
+
+```python
+from evaluation.sequential import SequentialComparison
+
+comparison = SequentialComparison(["v3", "v4"], alpha=0.05)
+for case in cases:
+    scores = {v: run(v, case) for v in comparison.active_versions()}
+    comparison.update(scores)
+    if comparison.settled:
+        break
+print(comparison.report())
+```
+================================================================================
+"""
+
+import math
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from evaluation.stats import RunningStats
+
+
+DEFAULT_ALPHA = 0.05
+DEFAULT_TAU = 1.0        # 예상 효과 크기 (품질 점수 단위)
+DEFAULT_MARGIN = 0.5     # 이보다 작은 차이는 실질적으로 같다고 봄 (품질 점수 단위)
+DEFAULT_MIN_CASES = 10
+DEFAULT_MIN_STD_RATIO = 0.5  # 분산 하한: min_std 미지정 시 τ × 이 값 (차이가 모두 같아도 실제 척도의 폭 유지)
+
+
+class MixtureSPRT:
+    """
+    대응 차이의 평균에 대한 혼합 SPRT (양측)
+
+    Attributes:
+        alpha: 유의수준
+        tau: 혼합 분포의 표준편차 (예상 효과 크기)
+        min_std: 차이 표준편차 추정의 하한 (품질 점수 단위)
+        diffs: 차이의 RunningStats
+        p_value: always-valid p-value (min_n건 이후 최솟값)
+    """
+
+    def __init__(
+        self,
+        alpha: float = DEFAULT_ALPHA,
+        tau: float = DEFAULT_TAU,
+        min_n: int = 2,
+        min_std: Optional[float] = None
+    ):
+        if not 0 < alpha < 1:
+            raise ValueError(f"alpha는 0과 1 사이여야 합니다: {alpha}")
+        if tau <= 0:
+            raise ValueError(f"tau는 0보다 커야 합니다: {tau}")
+        if min_std is not None and min_std <= 0:
+            raise ValueError(f"min_std는 0보다 커야 합니다: {min_std}")
+        self.alpha = alpha
+        self.tau = tau
+        self.min_std = min_std if min_std is not None else tau * DEFAULT_MIN_STD_RATIO
+        self.min_n = max(2, min_n)  # 분산 추정이 불안정한 초반(예: 같은 차이 2건 → 분산 0)은 p-value에 반영하지 않음
+        self.diffs = RunningStats()
+        self.p_value = 1.0
+
+    def update(self, diff: float):
+        """차이 1건 추가 후 p-value 갱신"""
+        self.diffs.add(diff)
+        if self.diffs.n >= self.min_n:
+            self.p_value = min(self.p_value, math.exp(-self.log_likelihood_ratio()))
+
+    def _scale(self) -> Tuple[float, float, float]:
+        n = self.diffs.n
+        var = max(self.diffs.variance, self.min_std ** 2)
+        return n, var, var + n * self.tau ** 2
+
+    def log_likelihood_ratio(self) -> float:
+        """log Λ_n"""
+        n, var, mixed = self._scale()
+        mean = self.diffs.mean
+        return 0.5 * math.log(var / mixed) + (n * self.tau * mean) ** 2 / (2 * var * mixed)
+
+    def confidence_interval(self) -> Tuple[float, float]:
+        """신뢰 수열의 현재 구간 (1-alpha, 언제 봐도 유효)"""
+        n, var, mixed = self._scale()
+        if n < 2:
+            return -math.inf, math.inf
+        radius = math.sqrt(var * mixed / (n * self.tau) ** 2 * math.log(mixed / (var * self.alpha ** 2)))
+        return self.diffs.mean - radius, self.diffs.mean + radius
+
+
+class SequentialComparison:
+    """
+    여러 버전의 케이스별 점수를 받아 모든 버전 쌍을 순차 검정
+
+    Attributes:
+        versions: 비교 버전 (앞 버전이 쌍의 A)
+        tests: (A, B) → MixtureSPRT (차이 = B - A)
+        decisions: (A, B) → {"decision", "stopped_at"} (확정된 쌍만)
+    """
+
+    def __init__(
+        self,
+        versions: Sequence[str],
+        alpha: float = DEFAULT_ALPHA,
+        tau: float = DEFAULT_TAU,
+        margin: float = DEFAULT_MARGIN,
+        min_cases: int = DEFAULT_MIN_CASES,
+        min_std: Optional[float] = None
+    ):
+        if len(versions) < 2 or len(set(versions)) != len(versions):
+            raise ValueError(f"서로 다른 버전이 2개 이상 필요합니다: {list(versions)}")
+        self.versions = list(versions)
+        self.alpha = alpha
+        self.margin = margin
+        self.min_cases = max(2, min_cases)
+        self.min_std = min_std if min_std is not None else tau * DEFAULT_MIN_STD_RATIO
+        pairs = list(combinations(self.versions, 2))
+        self.tests = {pair: MixtureSPRT(alpha / len(pairs), tau, self.min_cases, self.min_std) for pair in pairs}
+        self.decisions: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.cases = 0
+
+    @property
+    def settled(self) -> bool:
+        """모든 버전 쌍의 결론이 났는지"""
+        return len(self.decisions) == len(self.tests)
+
+    def active_versions(self) -> List[str]:
+        """아직 확정되지 않은 쌍에 남아 있는 버전 (다음 케이스에서 실행할 버전)"""
+        active = {v for pair in self.tests if pair not in self.decisions for v in pair}
+        return [v for v in self.versions if v in active]
+
+    def update(self, scores: Dict[str, float]):
+        """
+        케이스 1건의 버전별 점수 반영
+
+        Args:
+            scores: 버전 → 점수 (실패 등으로 빠진 버전이 있으면 그 버전이 포함된 쌍은 건너뜀)
+        """
+        self.cases += 1
+        for pair, test in self.tests.items():
+            a, b = pair
+            if pair in self.decisions or a not in scores or b not in scores:
+                continue
+            test.update(scores[b] - scores[a])
+            if test.diffs.n < test.min_n:
+                continue
+            low, high = test.confidence_interval()
+            if low > 0 or high < 0:
+                decision = b if low > 0 else a
+            elif -self.margin < low and high < self.margin:
+                decision = "equivalent"
+            else:
+                continue
+            self.decisions[pair] = {"decision": decision, "stopped_at": test.diffs.n}
+
+    def report(self) -> List[Dict[str, Any]]:
+        """쌍별 결과 (평균 차이, 신뢰 구간, p-value, 결론)"""
+        rows = []
+        for (a, b), test in self.tests.items():
+            low, high = test.confidence_interval()
+            decided = self.decisions.get((a, b), {})
+            rows.append({
+                "a": a,
+                "b": b,
+                "n": test.diffs.n,
+                "mean_diff": round(test.diffs.mean, 4) if test.diffs.n else None,
+                "ci": [round(low, 4), round(high, 4)] if test.diffs.n > 1 else None,
+                "p_value": round(test.p_value, 6),
+                "alpha": test.alpha,
+                "decision": decided.get("decision"),
+                "stopped_at": decided.get("stopped_at"),
+            })
+        return rows
+
+
+def describe_decision(row: Dict[str, Any]) -> str:
+    """쌍별 결과 한 줄 설명"""
+    if row["decision"] is None:
+        return "미확정 (예산 소진)"
+    if row["decision"] == "equivalent":
+        return f"차이 없음 ({row['stopped_at']}건에서 확정)"
+    return f"{row['decision']} 우세 ({row['stopped_at']}건에서 확정)"
+
+
+if __name__ == "__main__":
+    import argparse
+    import random
+
+    parser = argparse.ArgumentParser(description="순차 검정 시뮬레이션 (정규 분포 점수)")
+    parser.add_argument("--effect", type=float, default=1.0, help="B - A 실제 평균 차이")
+    parser.add_argument("--std", type=float, default=1.5, help="차이의 표준편차")
+    parser.add_argument("--budget", type=int, default=108, help="최대 케이스 수")
+    parser.add_argument("--trials", type=int, default=1000, help="반복 횟수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--check", action="store_true",
+                        help="퇴화 케이스 확인: 차이가 모두 같을 때(분산 0) 결론이 보고한 신뢰 구간과 일치하는지")
+    args = parser.parse_args()
+
+    if args.check:
+        failures = []
+        # 차이가 모두 같아도 구간 폭은 min_std 척도로 유지되고, 결론은 그 구간이 가리키는 쪽이어야 함
+        for diff, expected in ((0.0, "equivalent"), (0.5, "B"), (-0.5, "A"), (2.0, "B")):
+            comparison = SequentialComparison(["A", "B"])
+            for _ in range(args.budget):
+                comparison.update({"A": 0.0, "B": diff})
+                if comparison.settled:
+                    break
+            row = comparison.report()[0]
+            low, high = row["ci"]
+            ok = row["decision"] == expected and high - low > 0
+            status = "통과" if ok else "실패"
+            print(f"차이 {diff:+.1f}: 결론={row['decision']} ({row['stopped_at']}건), "
+                  f"구간={row['ci']}, p={row['p_value']} → {status}")
+            if not ok:
+                failures.append(diff)
+        raise SystemExit(1 if failures else 0)
+
+    rng = random.Random(args.seed)
+    # 효과가 0이면 어느 쪽이든 우세 결론은 1종 오류
+    wrong_decisions = ("A",) if args.effect > 0 else ("B",) if args.effect < 0 else ("A", "B")
+    wrong, used, outcomes = 0, 0, {}
+    for _ in range(args.trials):
+        comparison = SequentialComparison(["A", "B"])
+        for _ in range(args.budget):
+            comparison.update({"A": 0.0, "B": rng.gauss(args.effect, args.std)})
+            if comparison.settled:
+                break
+        row = comparison.report()[0]
+        outcomes[row["decision"]] = outcomes.get(row["decision"], 0) + 1
+        used += comparison.cases
+        wrong += row["decision"] in wrong_decisions
+
+    print(f"효과 {args.effect:+.2f} (표준편차 {args.std}), 예산 {args.budget}건, {args.trials}회 반복")
+    print(f"결론 분포: {outcomes}")
+    print(f"평균 사용 케이스: {used / args.trials:.1f}건 ({1 - used / (args.trials * args.budget):.0%} 절약)")
+    print(f"잘못된 방향 결론: {wrong / args.trials:.2%}")
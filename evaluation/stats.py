@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+통계 검정 도구 (Statistics Helpers)
+================================================================================
+
+## 이 모듈의 목적
+두 실행의 케이스별 차이(paired difference)를 **한 번의 순회로** 요약하고
+유의성을 검정합니다. scipy 없이 표준 라이브러리만 사용합니다.
+
+## 구성
+- RunningStats: Welford 방식 평균/분산 (값을 저장하지 않음)
+- paired_t_test(): 차이의 평균이 0인지 (대응 표본 t-검정, 양측)
+- wilcoxon_signed_rank(): 차이의 분포가 0 대칭인지 (부호 순위 검정, 정규 근사 + 동순위 보정)
+- sign_test(): 개선/악화 건수만으로 검정 (이항 검정, n이 크면 정규 근사)
+- student_t_sf(), normal_sf(): 꼬리 확률
+
+## 언제 무엇을 보나?
+- t-검정: 차이가 대략 정규분포일 때 가장 검정력이 높음
+- Wilcoxon: 품질 점수처럼 이산적이고 치우친 분포에서도 안전
+- 부호 검정: 크기는 무시하고 "몇 건이 좋아졌나"만 볼 때
+================================================================================
+"""
+
+import math
+from typing import Iterable, Optional, Tuple
+
+
+class RunningStats:
+    """
+    스트리밍 평균/분산 (Welford)
+
+    Attributes:
+        n: 값 개수
+        mean: 평균
+    """
+
+    __slots__ = ("n", "mean", "_m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, x: float):
+        """값 1개 추가"""
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (x - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """표본 분산 (n-1)"""
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        """표본 표준편차"""
+        return math.sqrt(self.variance)
+
+
+# ============================================================================
+# 분포 꼬리 확률
+# ============================================================================
+
+def normal_sf(z: float) -> float:
+    """표준정규분포 P(Z > z)"""
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """정규화 불완전 베타 함수의 연분수 (Lentz 방법)"""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c, d = 1.0, 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 300):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-12:
+            break
+    return h
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    """정규화 불완전 베타 함수 I_x(a, b)"""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    if x < (a + 1.0) / (a + b + 2.0):
+        return math.exp(log_front) * _betacf(a, b, x) / a
+    return 1.0 - math.exp(log_front) * _betacf(b, a, 1.0 - x) / b
+
+
+def student_t_sf(t: float, df: float) -> float:
+    """자유도 df인 t분포 P(T > t)"""
+    if df <= 0:
+        return float("nan")
+    tail = 0.5 * _betainc(df / 2.0, 0.5, df / (df + t * t))
+    return tail if t >= 0 else 1.0 - tail
+
+
+# ============================================================================
+# 대응 표본 검정
+# ============================================================================
+
+def paired_t_test(diffs: RunningStats) -> Tuple[Optional[float], Optional[float]]:
+    """
+    대응 표본 t-검정 (양측)
+
+    Args:
+        diffs: 케이스별 차이(other - base)의 RunningStats
+
+    Returns:
+        (t 통계량, p-value), 표본이 2개 미만이면 (None, None)
+    """
+    if diffs.n < 2:
+        return None, None
+    if diffs.std == 0.0:
+        return (0.0, 1.0) if diffs.mean == 0.0 else (math.copysign(math.inf, diffs.mean), 0.0)
+    t = diffs.mean / (diffs.std / math.sqrt(diffs.n))
+    return t, min(1.0, 2.0 * student_t_sf(abs(t), diffs.n - 1))
+
+
+def wilcoxon_signed_rank(diffs: Iterable[float]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Wilcoxon 부호 순위 검정 (양측, 정규 근사, 0 차이 제외, 동순위 보정)
+
+    Args:
+        diffs: 케이스별 차이 (한 번 정렬하므로 메모리에 있는 시퀀스)
+
+    Returns:
+        (z 통계량, p-value), 0이 아닌 차이가 없으면 (None, None)
+    """
+    nonzero = sorted((abs(d), d > 0) for d in diffs if d != 0)
+    n = len(nonzero)
+    if n == 0:
+        return None, None
+
+    w_plus = 0.0
+    tie_term = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and nonzero[j + 1][0] == nonzero[i][0]:
+            j += 1
+        rank = (i + j + 2) / 2.0  # 동순위는 평균 순위
+        count = j - i + 1
+        w_plus += rank * sum(1 for k in range(i, j + 1) if nonzero[k][1])
+        tie_term += count ** 3 - count
+        i = j + 1
+
+    mean = n * (n + 1) / 4.0
+    var = n * (n + 1) * (2 * n + 1) / 24.0 - tie_term / 48.0
+    if var <= 0:
+        return 0.0, 1.0
+    z = (w_plus - mean) / math.sqrt(var)
+    return z, min(1.0, 2.0 * normal_sf(abs(z)))
+
+
+def sign_test(wins: int, losses: int) -> Optional[float]:
+    """
+    부호 검정 (양측, 동점 제외)
+
+    Args:
+        wins: 좋아진 케이스 수
+        losses: 나빠진 케이스 수
+
+    Returns:
+        p-value (비교 가능한 케이스가 없으면 None)
+    """
+    n = wins + losses
+    if n == 0:
+        return None
+    k = min(wins, losses)
+    if n <= 1000:
+        tail = sum(math.comb(n, i) for i in range(k + 1)) / 2.0 ** n
+        return min(1.0, 2.0 * tail)
+    z = (abs(wins - losses) - 1) / math.sqrt(n)  # 연속성 보정
+    return min(1.0, 2.0 * normal_sf(z))
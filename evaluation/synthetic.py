@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+합성 코퍼스 생성기 (Synthetic Corpus Generator)
+================================================================================
+
+## 이 모듈의 목적
+기존 도메인 테스트 케이스(*_TEST_CASES)를 재조합하여 **1만~100만 개의 변형 케이스**를
+시드 기반으로 재현 가능하게 만들고, 모의 LLM 백엔드(evaluation.llm_backends)와 함께
+Ollama와 무관하게 하네스의 처리량과 메모리를 측정합니다.
+
+## 왜 필요한가?
+- 도메인별 케이스는 80~108개뿐이라 카탈로그/코퍼스/샤딩/결과 저장이 대규모에서
+  어떻게 동작하는지 확인할 방법이 없음
+- 실제 추론을 섞으면 하네스 자체의 비용이 추론 시간에 묻혀 보이지 않음
+
+## 변형 규칙 (variant i)
+- 난수: random.Random("{seed}:{domain}:{i}") → 어느 위치든 독립적으로 같은 케이스 생성
+- 기준 케이스 1개를 골라 category/subcategory/difficulty와 본문(입력 맥락, 코드, 데이터) 유지
+- 같은 category의 다른 케이스에서 시나리오/산업군/직무 등 맥락 필드를 가져옴
+- expected_* 목록은 같은 subcategory 케이스들의 항목 풀에서 기준 케이스와 같은 개수만큼 추출
+- ID: SYN-<도메인 약어>-0000001
+
+## 사용 예시
+
+```python
+from evaluation.synthetic import SyntheticCorpus
+
+corpus = SyntheticCorpus("business", 100_000, seed=42)
+case = corpus[12345]          # 전체를 만들지 않고 i번째만 생성
+for case in corpus: ...       # 순서대로 생성 (메모리에 쌓지 않음)
+```
+
+```bash
+# 생성 속도/메모리 측정
+python -m evaluation.synthetic --domain business -n 100000 --bench
+
+# 코퍼스 파일로 저장 (evaluation.corpus.CorpusFile로 다시 로드 가능)
+python -m evaluation.synthetic --domain development -n 1000000 --out /tmp/dev_1m.jsonl.gz
+
+# 모의 백엔드로 하네스 처리량 측정
+python scripts/run_business_experiments.py v2 --backend mock --synthetic 10000
+```
+================================================================================
+"""
+
+import dataclasses
+import random
+from collections.abc import Sequence
+from typing import Any, Dict, List, Tuple
+
+
+DEFAULT_SEED = 42
+
+# 도메인 → (케이스 로더, ID 약어, 같은 category에서 빌려올 맥락 필드, 재조합할 목록 필드)
+DOMAIN_SPECS: Dict[str, Tuple[str, str, Tuple[str, ...], str]] = {
+    "business": (
+        "evaluation.business_test_cases:get_all_business_test_cases", "BUS",
+        ("scenario", "industry"), "expected_elements",
+    ),
+    "career": (
+        "evaluation.career_test_cases:get_all_career_test_cases", "CAR",
+        ("job_position", "experience_level", "company_type"), "expected_issues",
+    ),
+    "development": (
+        "evaluation.development_test_cases:get_all_development_test_cases", "DEV",
+        (), "expected_issues",
+    ),
+    "data_analysis": (
+        "evaluation.data_analysis_test_cases:get_all_data_analysis_test_cases", "DAT",
+        ("scenario", "industry"), "expected_elements",
+    ),
+}
+
+
+def _load_base_cases(domain: str) -> List[Any]:
+    import importlib
+
+    module_name, func_name = DOMAIN_SPECS[domain][0].split(":")
+    return getattr(importlib.import_module(module_name), func_name)()
+
+
+class SyntheticCorpus(Sequence):
+    """
+    기존 케이스를 재조합한 합성 테스트 케이스 시퀀스 (요청한 위치만 생성)
+
+    Attributes:
+        domain: 도메인 이름 (DOMAIN_SPECS의 키)
+        size: 케이스 수
+        seed: 생성 시드 (같은 seed → 같은 코퍼스)
+    """
+
+    def __init__(self, domain: str, size: int, seed: int = DEFAULT_SEED):
+        if domain not in DOMAIN_SPECS:
+            raise ValueError(f"지원하지 않는 도메인: {domain} (가능: {', '.join(DOMAIN_SPECS)})")
+        if size < 0:
+            raise ValueError(f"합성 케이스 수는 0 이상이어야 합니다: {size}")
+        self.domain = domain
+        self.size = size
+        self.seed = seed
+        self._bases: List[Any] = []
+        self._donors: Dict[str, List[Any]] = {}      # category → 같은 category 케이스
+        self._pools: Dict[str, List[str]] = {}       # subcategory → 목록 항목 풀 (중복 제거)
+
+    def _prepare(self):
+        """기준 케이스와 재조합 풀 구성 (최초 1회)"""
+        if self._bases:
+            return
+        _, _, _, list_field = DOMAIN_SPECS[self.domain]
+        bases = _load_base_cases(self.domain)
+        for case in bases:
+            self._donors.setdefault(case.category, []).append(case)
+            pool = self._pools.setdefault(case.subcategory, [])
+            pool.extend(getattr(case, list_field))
+        self._pools = {key: list(dict.fromkeys(items)) for key, items in self._pools.items()}
+        self._bases = bases
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._make(i) for i in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"합성 코퍼스 범위를 벗어남: {index} (크기 {self.size})")
+        return self._make(index)
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield self._make(i)
+
+    def _make(self, i: int) -> Any:
+        """i번째 변형 케이스 생성"""
+        self._prepare()
+        _, prefix, context_fields, list_field = DOMAIN_SPECS[self.domain]
+        rng = random.Random(f"{self.seed}:{self.domain}:{i}")
+
+        base = rng.choice(self._bases)
+        changes = {"id": f"SYN-{prefix}-{i + 1:07d}"}
+
+        donor = rng.choice(self._donors[base.category])
+        for field in context_fields:
+            changes[field] = getattr(donor, field)
+
+        pool = self._pools[base.subcategory]
+        count = min(len(getattr(base, list_field)), len(pool))
+        changes[list_field] = rng.sample(pool, count)
+
+        return dataclasses.replace(base, **changes)
+
+
+def write_synthetic_corpus(path: str, domain: str, size: int, seed: int = DEFAULT_SEED) -> int:
+    """
+    합성 코퍼스를 코퍼스 파일(evaluation.corpus 형식)로 저장 (한 줄씩 기록, 전체를 메모리에 올리지 않음)
+
+    Args:
+        path: 저장 경로 (.gz로 끝나면 압축)
+        domain: 도메인 이름
+        size: 케이스 수
+        seed: 생성 시드
+
+    Returns:
+        int: 저장한 레코드 수
+    """
+    from evaluation.corpus import write_corpus
+
+    return write_corpus(path, {"SYNTHETIC_TEST_CASES": SyntheticCorpus(domain, size, seed)})
+
+
+def describe_throughput(count: int, elapsed: float) -> str:
+    """처리량과 프로세스 최대 메모리(RSS)를 출력용 문자열로 변환"""
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    text = f"{count:,}건 / {elapsed:,.2f}s = {rate:,.1f}건/s"
+    try:
+        import resource
+    except ImportError:  # Windows
+        return text
+    import sys
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mib = peak / (1 << 20) if sys.platform == "darwin" else peak / 1024  # macOS는 bytes, Linux는 KiB
+    return f"{text}, 최대 RSS {peak_mib:,.1f}MiB"
+
+
+# ============================================================================
+# 벤치마크
+# ============================================================================
+
+def run_benchmark(domain: str, size: int, seed: int = DEFAULT_SEED):
+    """생성 속도, 전체 보관 시 케이스당 메모리, 재현성 확인"""
+    import gc
+    import time
+    import tracemalloc
+
+    corpus = SyntheticCorpus(domain, size, seed)
+    corpus._prepare()  # 기준 케이스 로드는 측정에서 제외
+
+    start = time.perf_counter()
+    for _ in corpus:
+        pass
+    stream_s = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    cases = list(corpus)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    probe = size // 2
+    assert SyntheticCorpus(domain, size, seed)[probe] == cases[probe], "같은 seed에서 다른 케이스가 생성됨"
+
+    print("=" * 60)
+    print(f"합성 코퍼스 벤치마크 ({domain}, {size:,}개, seed={seed})")
+    print("=" * 60)
+    print(f"기준 케이스: {len(corpus._bases)}개 → 변형 {size:,}개")
+    print(f"순차 생성: {describe_throughput(size, stream_s)}")
+    print(f"전체 보관 메모리: {current / (1 << 20):,.1f}MiB (케이스당 {current / max(size, 1):,.0f}B)")
+    print(f"고유 ID: {len({case.id for case in cases}):,}개")
+    print(f"예시: {cases[0]}")
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="합성 테스트 케이스 코퍼스 생성")
+    parser.add_argument("--domain", choices=list(DOMAIN_SPECS), default="business")
+    parser.add_argument("-n", "--size", type=int, default=10_000, help="케이스 수 (기본: 10000)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"생성 시드 (기본: {DEFAULT_SEED})")
+    parser.add_argument("--out", type=str, default=None, help="코퍼스 파일 저장 경로 (.jsonl 또는 .jsonl.gz)")
+    parser.add_argument("--bench", action="store_true", help="생성 속도/메모리 측정")
+    args = parser.parse_args()
+
+    if args.out:
+        start = time.perf_counter()
+        written = write_synthetic_corpus(args.out, args.domain, args.size, args.seed)
+        print(f"저장: {args.out} ({describe_throughput(written, time.perf_counter() - start)})")
+    if args.bench or not args.out:
+        run_benchmark(args.domain, args.size, args.seed)
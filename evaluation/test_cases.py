@@ -67,6 +67,7 @@ Created: 2025-01-19
 """
 
 from dataclasses import dataclass
+import sys
 from typing import List, Dict, Any
 
 
@@ -74,7 +75,7 @@ from typing import List, Dict, Any
 # 데이터 클래스: 단일 테스트 케이스
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TestCase:
     """
     단일 테스트 케이스를 표현하는 데이터 클래스
@@ -100,6 +101,11 @@ class TestCase:
     category: str = ""     # 카테고리 (수학, 논리, 요약 등)
     difficulty: str = ""   # 난이도 (easy, medium, hard)
 
+    def __post_init__(self):
+        # 카테고리/난이도 문자열은 케이스 간 공유 (frozen이므로 object.__setattr__ 사용)
+        object.__setattr__(self, "category", sys.intern(self.category))
+        object.__setattr__(self, "difficulty", sys.intern(self.difficulty))
+
 
 # ============================================================================
 # 테스트 스위트 클래스: 테스트 케이스 모음
@@ -140,6 +146,8 @@ class TestSuite:
         """
         self.name = name
         self.cases = cases or []
+        self._catalog = None
+        self._catalog_key = None
 
     def add(
         self,
@@ -158,6 +166,7 @@ class TestSuite:
             difficulty: 난이도 (easy/medium/hard)
         """
         self.cases.append(TestCase(input_data, expected, category, difficulty))
+        self._catalog = None
 
     def to_list(self) -> List[Dict]:
         """
@@ -191,7 +200,7 @@ class TestSuite:
             TestSuite: 필터링된 새 테스트 스위트
         """
         filtered = TestSuite(f"{self.name} ({difficulty})")
-        filtered.cases = [c for c in self.cases if c.difficulty == difficulty]
+        filtered.cases = self._case_catalog().query(difficulty=difficulty)
         return filtered
 
     def filter_by_category(self, category: str) -> 'TestSuite':
@@ -205,9 +214,25 @@ class TestSuite:
             TestSuite: 필터링된 새 테스트 스위트
         """
         filtered = TestSuite(f"{self.name} ({category})")
-        filtered.cases = [c for c in self.cases if c.category == category]
+        filtered.cases = self._case_catalog().query(category=category)
         return filtered
 
+    def _case_catalog(self):
+        """
+        category/difficulty 인덱스 (필요할 때 1회 구성)
+
+        cases 리스트를 교체하거나 직접 append한 경우에도
+        (리스트 id, 길이)가 바뀌면 다시 구성합니다.
+        """
+        from evaluation.catalog import CaseCatalog
+
+        key = (id(self.cases), len(self.cases))
+        if self._catalog is None or self._catalog_key != key:
+            self._catalog = CaseCatalog(index_fields=("category", "difficulty"))
+            self._catalog.add_many(self.cases)
+            self._catalog_key = key
+        return self._catalog
+
     def __len__(self):
         """테스트 케이스 개수 반환"""
         return len(self.cases)
@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+실행 구간 트레이스 (Chrome Trace Spans)
+================================================================================
+
+## 이 모듈의 목적
+실행 1회의 벽시계 시간이 **어느 단계에서 쓰이는지** 구간(span)으로 기록하고,
+Chrome/Perfetto 트레이스 이벤트 JSON으로 저장합니다.
+
+## 왜 필요한가?
+- 결과 파일에는 케이스별 response_time(모델 호출)만 있음
+- 프롬프트 생성, 토큰 계산, 품질 평가, Judge 호출, 결과 기록에 드는 시간은 보이지 않음
+- 하네스 처리량(--backend mock)이 떨어져도 어느 단계 때문인지 알 수 없음
+
+## 기록하는 구간 (cat)
+| 이름 | cat | 위치 |
+|------|-----|------|
+| plan | run | 실행 계획 생성 + 표본 추출/샤드 선택 |
+| case | run | 케이스 1건 전체 (args.id) |
+| prompt_build | run | 어댑터 build_prompt |
+| queue_wait | llm | 동시 호출 한도 대기 (evaluation.concurrency) |
+| llm_call | llm | 생성 모델 호출 |
+| token_count | run | 입출력 토큰 계산 |
+| score | run | 품질 평가 + 결과 dict 생성 |
+| judge | llm | LLM-as-a-Judge 평가 호출 (데이터 분석) |
+| serialize | io | 결과 스트림 1건 기록 |
+| summary / save | run | 요약 계산 / 요약 파일 기록 |
+
+카운터 "concurrency"(ph "C")는 동시 호출 한도가 바뀔 때마다 한도/진행 중 호출 수를 기록합니다.
+
+## 트랙
+스레드마다 별도 트랙(tid)에 기록하므로 동시 요청은 서로 다른 줄에 보입니다.
+track="..."으로 스레드와 무관한 이름 있는 트랙에 기록할 수도 있습니다.
+
+## 비활성 시 비용
+트레이스가 꺼져 있으면 span()은 전역 변수 1번 확인 후 공유 no-op 객체를 반환하고,
+@traced 함수는 같은 확인 1번 후 원래 함수를 그대로 호출합니다.
+(python -m evaluation.tracing 으로 구간당 비용 측정)
+
+## 사용 예시
+
+```python
+from evaluation import tracing
+
+with tracing.tracing_session("results/run.trace.json"):
+    with tracing.span("prompt_build", id=case.id):
+        prompt = build_prompt(case)
+
+@tracing.traced("consistency", cat="llm")
+def consistency(...): ...
+```
+
+```bash
+python scripts/run_business_experiments.py v4 20 --trace
+# → results/business_experiments_<ts>.trace.json 을 chrome://tracing 또는 ui.perfetto.dev 에서 열기
+```
+================================================================================
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+_tracer = None  # 활성 Tracer (None이면 트레이스 비활성)
+
+
+class Tracer:
+    """
+    트레이스 이벤트 수집기
+
+    Attributes:
+        events: Chrome 트레이스 이벤트 목록 (완료 구간 "X" + 트랙 이름 "M")
+        pid: 기록할 프로세스 ID
+    """
+
+    def __init__(self, process_name: str = "prompt-experiment"):
+        """
+        Args:
+            process_name: 트레이스 뷰어에 표시할 프로세스 이름
+        """
+        self.pid = os.getpid()
+        self.events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": self.pid, "tid": 0, "args": {"name": process_name}}
+        ]
+        self._origin = time.perf_counter_ns()
+        self._tids: Dict[Any, int] = {}
+        self._lock = threading.Lock()
+
+    def now_us(self) -> float:
+        """트레이스 시작 기준 경과 시간 (마이크로초)"""
+        return (time.perf_counter_ns() - self._origin) / 1000
+
+    def _tid(self, track: Optional[str]) -> int:
+        """스레드(또는 이름 있는 트랙) → 트랙 번호 (처음 보면 트랙 이름 이벤트 추가)"""
+        key = track if track is not None else threading.get_ident()
+        tid = self._tids.get(key)
+        if tid is None:
+            with self._lock:
+                tid = self._tids.get(key)
+                if tid is None:
+                    tid = self._tids[key] = len(self._tids) + 1
+                    name = track if track is not None else threading.current_thread().name
+                    self.events.append({"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}})
+        return tid
+
+    def complete(self, name: str, cat: str, start_us: float, end_us: float,
+                 track: Optional[str] = None, args: Optional[Dict[str, Any]] = None):
+        """
+        완료된 구간 1개 기록
+
+        Args:
+            name: 구간 이름
+            cat: 분류 (run, llm, io 등 - 뷰어에서 필터링)
+            start_us: 시작 시각 (now_us)
+            end_us: 종료 시각 (now_us)
+            track: 이름 있는 트랙 (기본: 현재 스레드)
+            args: 구간 속성 (케이스 ID 등)
+        """
+        event = {
+            "name": name, "cat": cat, "ph": "X", "pid": self.pid, "tid": self._tid(track),
+            "ts": round(start_us, 3), "dur": round(end_us - start_us, 3)
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)  # list.append는 GIL 아래에서 원자적
+
+    def counter(self, name: str, values: Dict[str, float]):
+        """
+        카운터 값 기록 (뷰어에서 시간에 따른 그래프로 표시)
+
+        Args:
+            name: 카운터 이름
+            values: 계열 이름 → 값
+        """
+        self.events.append({"name": name, "ph": "C", "pid": self.pid, "ts": round(self.now_us(), 3), "args": values})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Chrome 트레이스 JSON 객체 형식"""
+        return {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> str:
+        """
+        트레이스 파일 저장
+
+        Args:
+            path: 저장 경로 (.trace.json)
+
+        Returns:
+            str: 저장 경로
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+        return path
+
+
+class _NullSpan:
+    """트레이스 비활성 시 span()이 반환하는 공유 no-op 구간"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        """구간 속성 추가 (비활성 시 무시)"""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """활성 트레이스의 구간 1개 (with 블록이 끝나면 기록)"""
+
+    __slots__ = ("tracer", "name", "cat", "track", "args", "start")
+
+    def __init__(self, tracer: Tracer, name: str, cat: str, track: Optional[str], args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.track = track
+        self.args = args
+
+    def __enter__(self):
+        self.start = self.tracer.now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = self.tracer.now_us()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.complete(self.name, self.cat, self.start, end, self.track, self.args)
+        return False
+
+    def set(self, **args):
+        """구간 속성 추가 (예: 호출 후 알게 된 토큰 수)"""
+        self.args.update(args)
+
+
+def span(name: str, cat: str = "run", track: Optional[str] = None, **args):
+    """
+    구간 기록 컨텍스트 매니저
+
+    Args:
+        name: 구간 이름
+        cat: 분류 (run, llm, io)
+        track: 이름 있는 트랙 (기본: 현재 스레드)
+        **args: 구간 속성 (트레이스 뷰어의 Args에 표시)
+
+    Returns:
+        with 블록에 쓰는 구간 (트레이스 비활성 시 공유 no-op 객체)
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, cat, track, args)
+
+
+def counter(name: str, **values: float):
+    """
+    카운터 값 기록 (트레이스 비활성 시 무시)
+
+    Args:
+        name: 카운터 이름
+        **values: 계열 이름 → 값 (예: limit=4, in_flight=3)
+    """
+    tracer = _tracer
+    if tracer is not None:
+        tracer.counter(name, values)
+
+
+def traced(name: Optional[str] = None, cat: str = "run") -> Callable:
+    """
+    함수 호출 전체를 구간으로 기록하는 데코레이터
+
+    Args:
+        name: 구간 이름 (기본: 함수 __qualname__)
+        cat: 분류
+
+    Returns:
+        Callable: 데코레이터
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with _Span(tracer, span_name, cat, None, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def is_enabled() -> bool:
+    """트레이스 기록 중인지"""
+    return _tracer is not None
+
+
+def start_tracing(process_name: str = "prompt-experiment") -> Tracer:
+    """
+    트레이스 기록 시작 (이미 기록 중이면 기존 Tracer 반환)
+
+    Args:
+        process_name: 트레이스 뷰어에 표시할 프로세스 이름
+
+    Returns:
+        Tracer: 활성 수집기
+    """
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(process_name)
+    return _tracer
+
+
+def stop_tracing(path: Optional[str] = None) -> Optional[Tracer]:
+    """
+    트레이스 기록 종료
+
+    Args:
+        path: 지정하면 수집한 트레이스를 이 경로에 저장
+
+    Returns:
+        Optional[Tracer]: 종료한 수집기 (기록 중이 아니었으면 None)
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None and path:
+        tracer.write(path)
+    return tracer
+
+
+@contextmanager
+def tracing_session(path: Optional[str] = None, process_name: str = "prompt-experiment") -> Iterator[Tracer]:
+    """
+    with 블록 동안 트레이스를 기록하고 끝나면 저장
+
+    Args:
+        path: 저장 경로 (None이면 저장하지 않음 - 반환된 Tracer.to_dict()로 사용)
+        process_name: 트레이스 뷰어에 표시할 프로세스 이름
+    """
+    tracer = start_tracing(process_name)
+    try:
+        yield tracer
+    finally:
+        stop_tracing(path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="구간 기록 비용 측정 (비활성/활성)")
+    parser.add_argument("-n", type=int, default=200_000, help="반복 횟수 (기본: 200000)")
+    args = parser.parse_args()
+
+    @traced("noop")
+    def noop():
+        pass
+
+    def bench(label: str):
+        start = time.perf_counter()
+        for _ in range(args.n):
+            with span("noop", id=1):
+                pass
+        per_span = (time.perf_counter() - start) / args.n * 1e9
+        start = time.perf_counter()
+        for _ in range(args.n):
+            noop()
+        per_call = (time.perf_counter() - start) / args.n * 1e9
+        print(f"{label}: span {per_span:,.0f}ns/회, @traced {per_call:,.0f}ns/회")
+
+    bench("비활성")
+    with tracing_session() as tracer:
+        bench("활성")
+    print(f"활성 구간 기록: {len(tracer.events) - 2:,}개")
@@ -0,0 +1,611 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+다중 노드 작업 큐 (Work Queue, SQLite + 임대)
+================================================================================
+
+## 이 모듈의 목적
+도메인 전체 실행을 여러 머신에 **수동 분할 없이** 나눠 돌립니다.
+공유 저장소의 SQLite 파일 하나가 큐이고, 각 노드의 워커가 케이스를 임대(lease)로
+가져가 실행하고 결과를 큐에 다시 씁니다.
+
+## 왜 필요한가?
+- --shard i/N은 노드 수를 미리 정해야 하고, 느린 노드/죽은 노드의 샤드는 다시 손으로 돌려야 함
+- 노드마다 처리 속도가 달라도 빨리 끝난 워커가 남은 케이스를 계속 가져가야 함
+
+## 동작
+| 단계 | 누가 | 동작 |
+|------|------|------|
+| enqueue | 아무 노드 1회 | 실행 계획(limit/sample/stratify/합성/매니페스트)과 케이스 ID를 큐에 기록 |
+| worker | 각 노드 (여러 개 가능) | 대기 케이스를 임대로 가져가 실행 → 결과 기록, 실행 중에는 heartbeat로 임대 연장 |
+| coordinate / finalize | 아무 노드 | 만료된 임대를 다시 대기로 돌리고, 모두 끝나면 단일 실행과 같은 요약 생성 |
+
+- 케이스는 계획 순서대로 배정하고, 임대는 claim할 때마다 시도 수가 늘어납니다.
+  시도 수가 max_attempts에 이른 케이스가 또 만료되면 failed (워커를 계속 죽이는 케이스)
+- 결과는 먼저 기록한 쪽이 이깁니다 (만료 후 다른 워커가 다시 실행해도 중복 기록 없음)
+- 워커는 남은 대기 케이스가 없어도 다른 워커의 임대가 남아 있으면 기다렸다가,
+  만료되면 그 케이스를 가져갑니다 (코디네이터 없이도 죽은 워커의 케이스가 처리됨)
+- 요약은 merge_shards와 같이 결과를 계획 순서로 모아 같은 요약 함수로 다시 집계
+
+## 공유 저장소 주의
+- SQLite 잠금(BEGIN IMMEDIATE)으로 임대를 배정하므로 POSIX 잠금이 동작하는 파일 시스템이 필요합니다
+  (WAL은 공유 메모리가 필요해 쓰지 않음)
+- 임대 만료는 노드 시계로 판단하므로 노드 시계는 NTP로 맞춰 두고, 임대는 가장 느린 케이스보다 넉넉하게
+
+## 사용 예시
+
+```bash
+# 큐 생성 (실행기 옵션 그대로: 버전, --sample, --synthetic 등)
+python scripts/run_business_experiments.py v4 108 --enqueue /shared/business_v4.sqlite
+
+# 각 노드에서 워커 실행 (백엔드/동시성/호출 정책은 노드마다 다르게)
+python scripts/run_business_experiments.py v4 --worker /shared/business_v4.sqlite --concurrency auto
+python -m evaluation.work_queue worker /shared/business_v4.sqlite --ollama-url http://127.0.0.1:11434
+
+# 진행 상황 / 만료 임대 회수 / 최종 요약
+python -m evaluation.work_queue status /shared/business_v4.sqlite
+python -m evaluation.work_queue coordinate /shared/business_v4.sqlite   # 끝날 때까지 회수 후 요약
+python scripts/run_business_experiments.py v4 --finalize /shared/business_v4.sqlite
+
+# 로컬 검증: 워커 프로세스 4개 + 코디네이터
+python -m evaluation.work_queue local results/queue.sqlite --workers 4 --backend mock
+```
+================================================================================
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+DEFAULT_LEASE = 300.0  # 임대 시간 (초) - heartbeat가 lease / HEARTBEAT_DIVISOR마다 연장
+DEFAULT_MAX_ATTEMPTS = 3
+HEARTBEAT_DIVISOR = 3
+QUEUE_COMMANDS = ("enqueue", "worker", "finalize")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    case_id     TEXT PRIMARY KEY,
+    position    INTEGER NOT NULL,
+    state       TEXT NOT NULL DEFAULT 'pending',
+    worker      TEXT,
+    lease_until REAL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    result      TEXT,
+    finished_at REAL
+);
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id  TEXT PRIMARY KEY,
+    host       TEXT,
+    pid        INTEGER,
+    started_at REAL,
+    last_seen  REAL,
+    completed  INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_state ON tasks(state, position);
+"""
+
+TASK_STATES = ("pending", "leased", "done", "failed")
+
+
+def default_worker_id() -> str:
+    """<호스트>:<pid> (노드/프로세스마다 다름)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """
+    SQLite 작업 큐 (연결 1개 = 스레드 1개, heartbeat 스레드는 자기 연결을 엽니다)
+
+    Attributes:
+        path: 큐 파일 경로
+        config: enqueue 때 기록한 실행 설정 (도메인, 버전, 모델, 어댑터 옵션, 계획 옵션, selection)
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 기존 큐 파일 (WorkQueue.create로 생성)
+
+        Raises:
+            FileNotFoundError: 큐 파일이 없음
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"작업 큐가 없습니다: {path} (먼저 --enqueue로 생성)")
+        self.path = path
+        self.conn = self._connect(path)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'config'").fetchone()
+        if row is None:
+            raise ValueError(f"작업 큐 설정이 없습니다: {path}")
+        self.config: Dict[str, Any] = json.loads(row[0])
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        # 트랜잭션은 직접 관리 (claim은 BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡음)
+        conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        conn.execute("PRAGMA busy_timeout = 60000")
+        return conn
+
+    @classmethod
+    def create(cls, path: str, config: Dict[str, Any], case_ids: Sequence[str]) -> "WorkQueue":
+        """
+        큐 파일 생성
+
+        Args:
+            path: 새 큐 파일 경로
+            config: 실행 설정 (JSON 직렬화 가능)
+            case_ids: 계획 순서의 test_case_id
+
+        Returns:
+            WorkQueue
+
+        Raises:
+            FileExistsError: 같은 경로에 큐가 이미 있음 (진행 중인 큐를 덮어쓰지 않도록)
+        """
+        if os.path.exists(path):
+            raise FileExistsError(f"작업 큐가 이미 있습니다: {path}")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = cls._connect(path)
+        try:
+            conn.executescript(SCHEMA)
+            conn.execute("BEGIN")
+            conn.execute("INSERT INTO meta VALUES ('config', ?)", (json.dumps(config, ensure_ascii=False),))
+            conn.execute("INSERT INTO meta VALUES ('created_at', ?)", (str(time.time()),))
+            conn.executemany(
+                "INSERT INTO tasks (case_id, position) VALUES (?, ?)",
+                ((case_id, i) for i, case_id in enumerate(case_ids))
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return cls(path)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 트랜잭션 (시작할 때 쓰기 잠금 - 두 워커가 같은 케이스를 가져가지 않도록)"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    @property
+    def max_attempts(self) -> int:
+        return self.config.get("max_attempts", DEFAULT_MAX_ATTEMPTS)
+
+    # ---- 워커 ----
+
+    def register_worker(self, worker_id: str):
+        """워커 등록 (같은 ID로 다시 시작하면 시작 시각만 갱신)"""
+        now = time.time()
+        host, _, pid = worker_id.rpartition(":")
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO workers (worker_id, host, pid, started_at, last_seen) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(worker_id) DO UPDATE SET started_at = excluded.started_at, last_seen = excluded.last_seen",
+                (worker_id, host or worker_id, int(pid) if pid.isdigit() else None, now, now)
+            )
+
+    def claim(self, worker_id: str, count: int = 1, lease: float = DEFAULT_LEASE) -> List[str]:
+        """
+        대기 케이스를 계획 순서대로 최대 count개 임대 (만료된 임대는 먼저 회수)
+
+        Args:
+            worker_id: 워커 ID
+            count: 가져갈 최대 케이스 수
+            lease: 임대 시간 (초)
+
+        Returns:
+            List[str]: 임대한 test_case_id (없으면 빈 목록)
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            self._requeue_expired(conn, now)
+            ids = [row[0] for row in conn.execute(
+                "SELECT case_id FROM tasks WHERE state = 'pending' ORDER BY position LIMIT ?", (count,)
+            )]
+            conn.executemany(
+                "UPDATE tasks SET state = 'leased', worker = ?, lease_until = ?, attempts = attempts + 1 "
+                "WHERE case_id = ?",
+                ((worker_id, now + lease, case_id) for case_id in ids)
+            )
+        return ids
+
+    def heartbeat(self, worker_id: str, lease: float = DEFAULT_LEASE) -> int:
+        """
+        이 워커가 임대 중인 케이스의 임대 연장
+
+        Returns:
+            int: 연장한 케이스 수
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            extended = conn.execute(
+                "UPDATE tasks SET lease_until = ? WHERE worker = ? AND state = 'leased'",
+                (now + lease, worker_id)
+            ).rowcount
+            conn.execute("UPDATE workers SET last_seen = ? WHERE worker_id = ?", (now, worker_id))
+        return extended
+
+    def complete(self, worker_id: str, case_id: str, result: Dict[str, Any]) -> bool:
+        """
+        케이스 결과 기록 (이미 다른 워커가 기록했으면 무시)
+
+        임대가 만료되어 대기/다른 워커로 넘어갔어도 아직 결과가 없으면 이 결과를 씁니다.
+
+        Returns:
+            bool: 이 결과가 기록되었는지
+        """
+        payload = json.dumps(result, ensure_ascii=False)
+        with self._transaction() as conn:
+            written = conn.execute(
+                "UPDATE tasks SET state = 'done', worker = ?, result = ?, lease_until = NULL, finished_at = ? "
+                "WHERE case_id = ? AND state != 'done'",
+                (worker_id, payload, time.time(), case_id)
+            ).rowcount
+            if written:
+                conn.execute("UPDATE workers SET completed = completed + 1 WHERE worker_id = ?", (worker_id,))
+        return bool(written)
+
+    def release(self, worker_id: str, case_ids: Sequence[str]):
+        """중단된 워커가 아직 끝내지 못한 임대를 바로 대기로 되돌림 (만료를 기다리지 않도록)"""
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE tasks SET state = 'pending', worker = NULL, lease_until = NULL "
+                "WHERE case_id = ? AND worker = ? AND state = 'leased'",
+                ((case_id, worker_id) for case_id in case_ids)
+            )
+
+    @contextmanager
+    def heartbeating(self, worker_id: str, lease: float = DEFAULT_LEASE) -> Iterator[None]:
+        """with 블록 동안 별도 스레드(별도 연결)에서 lease / HEARTBEAT_DIVISOR마다 임대 연장"""
+        stop = threading.Event()
+
+        def beat():
+            queue = WorkQueue(self.path)
+            try:
+                while not stop.wait(lease / HEARTBEAT_DIVISOR):
+                    queue.heartbeat(worker_id, lease)
+            finally:
+                queue.close()
+
+        thread = threading.Thread(target=beat, name="queue-heartbeat", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    # ---- 코디네이터 ----
+
+    def _requeue_expired(self, conn: sqlite3.Connection, now: float) -> Tuple[int, int]:
+        failed = conn.execute(
+            "UPDATE tasks SET state = 'failed', worker = NULL, lease_until = NULL "
+            "WHERE state = 'leased' AND lease_until < ? AND attempts >= ?",
+            (now, self.max_attempts)
+        ).rowcount
+        requeued = conn.execute(
+            "UPDATE tasks SET state = 'pending', worker = NULL, lease_until = NULL "
+            "WHERE state = 'leased' AND lease_until < ?",
+            (now,)
+        ).rowcount
+        return requeued, failed
+
+    def requeue_expired(self) -> Tuple[int, int]:
+        """
+        만료된 임대 회수
+
+        Returns:
+            (대기로 되돌린 수, 시도 수 초과로 failed 처리한 수)
+        """
+        with self._transaction() as conn:
+            return self._requeue_expired(conn, time.time())
+
+    def requeue_failed(self) -> int:
+        """failed 케이스를 시도 수 0으로 다시 대기 (원인을 고친 뒤)"""
+        with self._transaction() as conn:
+            return conn.execute(
+                "UPDATE tasks SET state = 'pending', attempts = 0 WHERE state = 'failed'"
+            ).rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 케이스 수 {"pending", "leased", "done", "failed"}"""
+        counts = dict.fromkeys(TASK_STATES, 0)
+        counts.update(self.conn.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state"))
+        return counts
+
+    def is_finished(self) -> bool:
+        """대기/임대 중인 케이스가 없는지 (failed는 끝난 것으로 봄)"""
+        counts = self.counts()
+        return counts["pending"] == 0 and counts["leased"] == 0
+
+    def workers(self) -> List[Dict[str, Any]]:
+        """워커 목록 (완료 수, 마지막 heartbeat, 현재 임대 수)"""
+        rows = self.conn.execute(
+            "SELECT w.worker_id, w.completed, w.last_seen, "
+            "(SELECT COUNT(*) FROM tasks t WHERE t.worker = w.worker_id AND t.state = 'leased') "
+            "FROM workers w ORDER BY w.started_at"
+        ).fetchall()
+        return [
+            {"worker_id": worker_id, "completed": completed, "last_seen": last_seen, "leased": leased}
+            for worker_id, completed, last_seen, leased in rows
+        ]
+
+    def results(self) -> List[Dict[str, Any]]:
+        """
+        계획 순서의 케이스 결과
+
+        Raises:
+            ValueError: 결과가 없는 케이스가 있음 (대기/임대/failed)
+        """
+        counts = self.counts()
+        if counts["done"] != sum(counts.values()):
+            raise ValueError(f"아직 끝나지 않은 작업 큐입니다: {describe_counts(counts)}"
+                             + (" (failed는 requeue --failed로 다시 대기)" if counts["failed"] else ""))
+        return [json.loads(row[0]) for row in self.conn.execute(
+            "SELECT result FROM tasks ORDER BY position"
+        )]
+
+
+def describe_counts(counts: Dict[str, int]) -> str:
+    """상태별 케이스 수 한 줄"""
+    total = sum(counts.values())
+    return (f"완료 {counts['done']}/{total}, 대기 {counts['pending']}, "
+            f"임대 {counts['leased']}, 실패 {counts['failed']}")
+
+
+def queue_config(engine, selection: Dict[str, Any], manifest_dir: Optional[str], synthetic: Optional[int],
+                 seed: int, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> Dict[str, Any]:
+    """
+    큐에 기록할 실행 설정 (워커가 같은 계획/어댑터를 다시 만들 수 있도록)
+
+    Args:
+        engine: 큐를 만드는 엔진
+        selection: select_plan의 selection
+        manifest_dir: 매니페스트 디렉토리 (워커도 같은 경로로 읽음)
+        synthetic: 합성 코퍼스 크기
+        seed: 표본 추출/합성 코퍼스 시드
+        max_attempts: 케이스당 최대 임대 시도 수
+    """
+    return {
+        "domain": engine.adapter.domain,
+        "version": engine.adapter.version,
+        "model": engine.model_name,
+        "model_label": engine.model,
+        "backend": engine.backend,
+        "adapter_options": engine.adapter.options(),
+        "manifest_dir": os.path.abspath(manifest_dir) if manifest_dir else None,
+        "synthetic": synthetic,
+        "seed": seed,
+        "max_attempts": max_attempts,
+        "selection": selection,
+    }
+
+
+def check_engine(config: Dict[str, Any], engine):
+    """
+    엔진이 큐를 만든 설정과 같은 도메인/버전/모델/어댑터 옵션인지 확인
+
+    모델은 결과에 기록하는 이름(mock/replay는 "mock:<모델>")으로 비교하므로, 실제 호출(ollama/record)
+    큐에 모의/재생 워커의 결과가 섞이지 않습니다.
+
+    Raises:
+        ValueError: 설정이 다름 (다른 버전 결과가 섞이지 않도록)
+    """
+    actual = {
+        "domain": engine.adapter.domain,
+        "version": engine.adapter.version,
+        "model_label": engine.model,
+        "adapter_options": json.loads(json.dumps(engine.adapter.options())),
+    }
+    for key, value in actual.items():
+        if config[key] != value:
+            raise ValueError(f"작업 큐와 실행기 설정이 다릅니다 ({key}: 큐 {config[key]!r}, 실행기 {value!r})")
+
+
+def add_queue_arguments(parser):
+    """실행기 CLI에 작업 큐 옵션 추가 (--enqueue, --worker, --finalize, --lease, --max-attempts)"""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--enqueue", type=str, default=None, metavar="QUEUE",
+                       help="실행 계획을 작업 큐(SQLite, 공유 저장소)로 만들고 종료 (실험은 워커가 실행)")
+    group.add_argument("--worker", type=str, default=None, metavar="QUEUE",
+                       help="작업 큐에서 케이스를 임대로 가져와 실행하는 워커 (노드마다 실행)")
+    group.add_argument("--finalize", type=str, default=None, metavar="QUEUE",
+                       help="작업 큐의 결과로 단일 실행과 같은 요약 생성")
+    parser.add_argument("--lease", type=float, default=DEFAULT_LEASE,
+                        help=f"워커 임대 시간 (초, 실행 중에는 자동 연장, 기본: {DEFAULT_LEASE:g})")
+    parser.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS,
+                        help=f"케이스당 최대 임대 시도 수 (--enqueue, 기본: {DEFAULT_MAX_ATTEMPTS})")
+
+
+def parse_queue_arguments(parser, args) -> Optional[Tuple[str, str]]:
+    """
+    작업 큐 옵션 검증
+
+    Returns:
+        Optional[Tuple[str, str]]: (명령 - enqueue/worker/finalize, 큐 경로), 큐를 쓰지 않으면 None
+    """
+    if args.lease <= 0:
+        parser.error("--lease는 0보다 커야 합니다")
+    if args.max_attempts < 1:
+        parser.error("--max-attempts는 1 이상이어야 합니다")
+    for command in QUEUE_COMMANDS:
+        path = getattr(args, command)
+        if path is None:
+            continue
+        if getattr(args, "merge", None):
+            parser.error(f"--{command}는 --merge와 함께 사용할 수 없습니다")
+        if getattr(args, "shard", None):
+            parser.error(f"--{command}는 --shard와 함께 사용할 수 없습니다 (작업 큐가 케이스를 나눔)")
+        if command != "enqueue" and not os.path.exists(path):
+            parser.error(f"작업 큐가 없습니다: {path}")
+        return command, path
+    return None
+
+
+def run_queue_command(engine, queue_command: Tuple[str, str], lease: float = DEFAULT_LEASE,
+                      max_attempts: int = DEFAULT_MAX_ATTEMPTS, **plan_options) -> Any:
+    """
+    실행기 CLI의 --enqueue/--worker/--finalize 실행
+
+    Args:
+        engine: 실행기 (ExperimentEngine)
+        queue_command: parse_queue_arguments 결과
+        lease: 워커 임대 시간
+        max_attempts: 케이스당 최대 임대 시도 수 (enqueue)
+        **plan_options: run_all_experiments 키워드 인자 (limit, manifest_dir, sample, stratify, seed, synthetic)
+
+    Returns:
+        enqueue: WorkQueue, worker: 기록한 결과 수, finalize: 요약
+    """
+    command, path = queue_command
+    if command == "enqueue":
+        plan_options.pop("shard", None)
+        return engine.enqueue(path, max_attempts=max_attempts, **plan_options)
+    with WorkQueue(path) as queue:
+        if command == "worker":
+            return engine.run_queue_worker(queue, lease=lease)
+        return engine.finalize_queue(queue)
+
+
+if __name__ == "__main__":
+    import argparse
+    import subprocess
+    import sys
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from evaluation.call_policy import add_call_policy_arguments, parse_call_policy_arguments
+    from evaluation.concurrency import add_concurrency_arguments, parse_concurrency_arguments
+    from evaluation.engine import ADAPTERS, create_engine
+    from evaluation.llm_backends import add_backend_arguments, parse_backend_arguments
+
+    parser = argparse.ArgumentParser(description="다중 노드 작업 큐 (워커/코디네이터/상태)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_status = sub.add_parser("status", help="상태별 케이스 수와 워커 목록")
+    p_status.add_argument("queue")
+
+    p_requeue = sub.add_parser("requeue", help="만료된 임대 회수 (--failed: failed 케이스도 다시 대기)")
+    p_requeue.add_argument("queue")
+    p_requeue.add_argument("--failed", action="store_true")
+
+    # local 모드가 워커 자식 프로세스에 그대로 넘기는 엔진 인자 (add_engine_arguments가 추가하는 인자 전부)
+    engine_options = (
+        "backend", "recording", "replay_latency", "replay_speed", "replay_miss", "ollama_url",
+        "concurrency", "max_concurrency", "timeout", "retries", "retry_budget",
+        "hedge", "hedge_backend", "hedge_url", "lease",
+    )
+
+    def add_engine_arguments(p):
+        p.add_argument("queue")
+        add_backend_arguments(p, default=None)  # 기본: 큐를 만든 실행기의 백엔드
+        add_concurrency_arguments(p)
+        add_call_policy_arguments(p)
+        p.add_argument("--lease", type=float, default=DEFAULT_LEASE, help=f"임대 시간 (초, 기본: {DEFAULT_LEASE:g})")
+
+    p_worker = sub.add_parser("worker", help="큐 설정으로 엔진을 만들어 워커 실행")
+    add_engine_arguments(p_worker)
+
+    p_coord = sub.add_parser("coordinate", help="만료 임대를 회수하며 기다렸다가 모두 끝나면 요약 생성")
+    add_engine_arguments(p_coord)
+    p_coord.add_argument("--interval", type=float, default=10.0, help="회수/상태 출력 주기 (초, 기본: 10)")
+
+    p_local = sub.add_parser("local", help="로컬 검증: 큐 생성 + 워커 프로세스 N개 + 코디네이터")
+    add_engine_arguments(p_local)
+    p_local.add_argument("--domain", choices=list(ADAPTERS), default="business")
+    p_local.add_argument("--version", type=str, default=None)
+    p_local.add_argument("--limit", type=int, default=None)
+    p_local.add_argument("--synthetic", type=int, default=None)
+    p_local.add_argument("--workers", type=int, default=4, help="워커 프로세스 수 (기본: 4)")
+    p_local.add_argument("--interval", type=float, default=1.0, help="회수/상태 출력 주기 (초, 기본: 1)")
+
+    args = parser.parse_args()
+
+    if args.command in ("status", "requeue"):
+        with WorkQueue(args.queue) as queue:
+            if args.command == "requeue":
+                requeued, failed = queue.requeue_expired()
+                print(f"만료 임대 회수: {requeued}개 대기, {failed}개 failed")
+                if args.failed:
+                    print(f"failed 다시 대기: {queue.requeue_failed()}개")
+            config = queue.config
+            print(f"{config['domain']} {config['version']} ({config['model']}): {describe_counts(queue.counts())}")
+            now = time.time()
+            for worker in queue.workers():
+                print(f"  {worker['worker_id']:<32} 완료 {worker['completed']:>5}  임대 {worker['leased']:>3}  "
+                      f"마지막 heartbeat {now - worker['last_seen']:.0f}초 전")
+        sys.exit(0)
+
+    parse_backend_arguments(parser, args)
+    concurrency = parse_concurrency_arguments(parser, args)
+    call_policy = parse_call_policy_arguments(parser, args)
+
+    procs = []
+    if args.command == "local":
+        if os.path.exists(args.queue):
+            parser.error(f"작업 큐가 이미 있습니다: {args.queue}")
+        engine = create_engine(args.domain, args.version, backend=args.backend or "mock")
+        engine.enqueue(args.queue, limit=args.limit, synthetic=args.synthetic)
+        # 워커는 자식 프로세스 (로컬 파일이어도 프로세스 간 임대/잠금은 여러 노드와 같음)
+        # 백엔드/동시성/호출 정책 설정은 프로세스마다 따로라 받은 엔진 인자를 모두 넘김
+        worker_argv = [sys.executable, "-m", "evaluation.work_queue", "worker", args.queue]
+        for name in engine_options:
+            value = getattr(args, name)
+            if value is not None:
+                worker_argv += ["--" + name.replace("_", "-"), str(value)]
+        procs = [
+            subprocess.Popen(
+                worker_argv,
+                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), stdout=subprocess.DEVNULL
+            )
+            for _ in range(args.workers)
+        ]
+        print(f"워커 프로세스 {len(procs)}개 시작")
+
+    with WorkQueue(args.queue) as queue:
+        config = queue.config
+        if args.command == "worker":
+            engine = create_engine(
+                config["domain"], config["version"], model=config["model"],
+                backend=args.backend or config["backend"],
+                adapter_options=config["adapter_options"], **concurrency, **call_policy
+            )
+            engine.run_queue_worker(queue, lease=args.lease)
+            sys.exit(0)
+
+        # 코디네이터: 요약의 모델 이름이 큐를 만든 실행과 같도록 큐의 백엔드로 엔진 생성
+        engine = create_engine(
+            config["domain"], config["version"], model=config["model"], backend=config["backend"],
+            adapter_options=config["adapter_options"]
+        )
+        while not queue.is_finished():
+            time.sleep(args.interval)
+            requeued, failed = queue.requeue_expired()
+            line = describe_counts(queue.counts())
+            if requeued or failed:
+                line += f" (만료 임대 회수: {requeued}개 대기, {failed}개 failed)"
+            print(line)
+        for proc in procs:
+            proc.wait()
+        engine.finalize_queue(queue)
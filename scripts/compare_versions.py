@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+프롬프트 버전 순차 비교 (Sequential Version Comparison)
+================================================================================
+
+## 이 스크립트의 목적
+두 개 이상의 프롬프트 버전을 **같은 케이스에 번갈아 실행**하고, 케이스마다 순차 검정
+(evaluation.sequential, mSPRT)을 갱신하여 결론이 나면 바로 멈춥니다.
+
+## 108배 원칙과의 관계
+- 예산(--max-cases, 기본: 도메인 전체 케이스)은 그대로 108회
+- 차이가 크면 수십 건에서 멈추고, 차이가 애매하면 예산을 다 쓰고 "미확정"으로 보고
+- 언제 멈춰도 유효한 p-value를 쓰므로 매 케이스 결과를 보고 멈춰도 1종 오류가 부풀지 않음
+- 케이스 순서는 --seed로 섞음 (앞쪽 카테고리만 보고 결론 내지 않도록)
+
+## 밴딧 배분 (--bandit thompson|ucb)
+모든 버전을 같은 케이스에 실행하는 대신, 호출마다 밴딧(evaluation.bandit)이 다음 버전을 고릅니다.
+유망한 버전에 호출을 더 쓰고, 최고 버전일 확률이 --stop-prob 이상이면 멈춥니다.
+버전마다 같은 (섞인) 케이스 순서로 진행하며, 배분 기록(trace)은 --seed로 재현됩니다.
+
+## 사용 방법
+```bash
+# 비즈니스 V3 vs V4
+python scripts/compare_versions.py --domain business --versions v3 v4
+
+# 취업 준비 3개 버전 전체 비교 (모든 쌍, Bonferroni 보정)
+python scripts/compare_versions.py --domain career
+
+# Ollama 없이 동작 확인
+python scripts/compare_versions.py --domain development --backend mock
+
+# 비즈니스 v1~v4 Thompson sampling (1000토큰당 0.2점 감점)
+python scripts/compare_versions.py --domain business --bandit thompson --token-penalty 0.2
+```
+
+## 출력
+- 버전 쌍별 평균 차이, 신뢰 구간, always-valid p-value, 결론과 멈춘 시점
+- LLM 호출 수와 전체 실행 대비 절약한 호출 수
+- 밴딧: 버전별 실행 수, 평균 보상, 최고 버전일 확률
+- results/version_comparison_<domain>_<timestamp>.json (케이스별 점수 / 배분 기록 포함)
+================================================================================
+"""
+
+import sys
+import os
+import json
+import random
+import argparse
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Windows 한글 출력 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+# 상위 디렉토리 모듈 임포트를 위한 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from evaluation.bandit import (
+    DEFAULT_STOP_PROB,
+    STRATEGIES,
+    VersionBandit,
+    reward_of
+)
+from evaluation.llm_backends import add_backend_arguments, parse_backend_arguments
+from evaluation.partition import DEFAULT_SEED
+from evaluation.result_io import normalize_result
+from evaluation.sequential import (
+    DEFAULT_ALPHA,
+    DEFAULT_MARGIN,
+    DEFAULT_MIN_CASES,
+    DEFAULT_TAU,
+    SequentialComparison,
+    describe_decision
+)
+from render_prompts import DOMAIN_VERSIONS, create_runner, load_domain_test_cases
+
+
+# 버전이 2개 이상인 도메인만 비교 가능 (데이터 분석은 단일 버전)
+COMPARABLE_DOMAINS = [domain for domain, versions in DOMAIN_VERSIONS.items() if len(versions) > 1]
+
+
+def shuffled_cases(domain: str, seed: int) -> List:
+    """도메인 테스트 케이스를 seed로 섞은 순서"""
+    cases = list(load_domain_test_cases(domain))
+    random.Random(seed).shuffle(cases)
+    return cases
+
+
+def run_sequential_comparison(
+    domain: str,
+    versions: List[str],
+    max_cases: int = None,
+    alpha: float = DEFAULT_ALPHA,
+    tau: float = DEFAULT_TAU,
+    margin: float = DEFAULT_MARGIN,
+    min_cases: int = DEFAULT_MIN_CASES,
+    min_std: Optional[float] = None,
+    seed: int = DEFAULT_SEED,
+    model: str = "qwen2.5:7b",
+    backend: str = "ollama"
+) -> Dict:
+    """
+    버전들을 케이스마다 번갈아 실행하며 순차 검정
+
+    Parameters
+    ----------
+    domain : str
+        실험 도메인 (business, career, development)
+    versions : List[str]
+        비교할 프롬프트 버전 (2개 이상)
+    max_cases : int, optional
+        최대 케이스 수 (기본: 도메인 전체)
+    alpha, tau, margin, min_cases
+        순차 검정 설정 (evaluation.sequential 참고)
+    min_std : float, optional
+        차이 표준편차 추정의 하한 (기본: tau / 2)
+    seed : int
+        케이스 순서 시드
+    model : str
+        사용할 모델
+    backend : str
+        LLM 백엔드 (ollama, mock, record, replay)
+
+    Returns
+    -------
+    Dict
+        summary(설정, 쌍별 결과, 호출 수)와 trace(케이스별 버전 점수)
+    """
+    runners = {version: create_runner(domain, version, model=model, backend=backend) for version in versions}
+    cases = shuffled_cases(domain, seed)[:max_cases]
+    comparison = SequentialComparison(versions, alpha=alpha, tau=tau, margin=margin, min_cases=min_cases,
+                                      min_std=min_std)
+
+    print("=" * 70)
+    print(f"프롬프트 버전 순차 비교 ({domain}: {' vs '.join(v.upper() for v in versions)})")
+    print("=" * 70)
+    print(f"시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"예산: {len(cases)}건 × {len(versions)}개 버전 = {len(cases) * len(versions)}회")
+    print(f"alpha={alpha}, tau={tau}, margin=±{margin}, 최소 {min_cases}건, "
+          f"표준편차 하한 {comparison.min_std}, seed={seed}")
+    print()
+
+    calls = 0
+    trace = []
+    for i, test_case in enumerate(cases, 1):
+        scores = {}
+        for version in comparison.active_versions():
+            result = normalize_result(runners[version].run_single_experiment(test_case))
+            calls += 1
+            if result["success"] is not False and result["quality_score"] is not None:
+                scores[version] = result["quality_score"]
+        decided_before = len(comparison.decisions)
+        comparison.update(scores)
+        trace.append({"test_case_id": test_case.id, "scores": scores})
+
+        score_text = "  ".join(f"{v}: {s:.1f}" for v, s in scores.items()) or "실패"
+        print(f"[{i:3d}/{len(cases)}] {test_case.id} {score_text}")
+        for row in comparison.report():
+            if (row["a"], row["b"]) in list(comparison.decisions)[decided_before:]:
+                print(f"      → {row['b']} vs {row['a']}: {describe_decision(row)}")
+        if comparison.settled:
+            break
+
+    budget_calls = len(cases) * len(versions)
+    return {
+        "summary": {
+            "experiment_info": {
+                "domain": domain,
+                "versions": versions,
+                "model": model if backend == "ollama" else f"{backend}:{model}",
+                "seed": seed,
+                "alpha": alpha,
+                "tau": tau,
+                "margin": margin,
+                "min_cases": min_cases,
+                "min_std": comparison.min_std,
+                "timestamp": datetime.now().isoformat()
+            },
+            "cases_run": comparison.cases,
+            "settled": comparison.settled,
+            "llm_calls": calls,
+            "budget_calls": budget_calls,
+            "calls_saved": budget_calls - calls,
+            "pairs": comparison.report()
+        },
+        "trace": trace
+    }
+
+
+def run_bandit_allocation(
+    domain: str,
+    versions: List[str],
+    strategy: str = "thompson",
+    max_cases: int = None,
+    budget: int = None,
+    stop_prob: float = DEFAULT_STOP_PROB,
+    token_penalty: float = 0.0,
+    latency_penalty: float = 0.0,
+    seed: int = DEFAULT_SEED,
+    model: str = "qwen2.5:7b",
+    backend: str = "ollama"
+) -> Dict:
+    """
+    밴딧으로 버전별 호출을 배분하며 최고 버전 탐색
+
+    Parameters
+    ----------
+    domain : str
+        실험 도메인 (business, career, development)
+    versions : List[str]
+        후보 프롬프트 버전 (2개 이상)
+    strategy : str
+        밴딧 전략 (thompson, ucb)
+    max_cases : int, optional
+        버전별 최대 케이스 수 (기본: 도메인 전체)
+    budget : int, optional
+        최대 LLM 호출 수 (기본: 케이스 수 × 버전 수)
+    stop_prob : float
+        최고 버전일 확률이 이 값 이상이면 종료
+    token_penalty, latency_penalty : float
+        1000토큰당 / 1초당 보상 감점
+    seed : int
+        케이스 순서와 밴딧 난수 시드
+    model : str
+        사용할 모델
+    backend : str
+        LLM 백엔드 (ollama, mock, record, replay)
+
+    Returns
+    -------
+    Dict
+        summary(설정, 버전별 결과, 호출 수)와 trace(호출별 배분 기록)
+    """
+    runners = {version: create_runner(domain, version, model=model, backend=backend) for version in versions}
+    cases = shuffled_cases(domain, seed)[:max_cases]
+    budget_calls = len(cases) * len(versions)
+    budget = min(budget or budget_calls, budget_calls)
+    bandit = VersionBandit(versions, strategy, seed=seed)
+    cursors = dict.fromkeys(versions, 0)  # 버전별 다음 케이스 위치
+
+    print("=" * 70)
+    print(f"프롬프트 버전 밴딧 배분 ({domain}: {', '.join(v.upper() for v in versions)}, {strategy})")
+    print("=" * 70)
+    print(f"시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"예산: {budget}회 (전체 실행 {budget_calls}회), 종료 조건 P(best) ≥ {stop_prob}")
+    print(f"보상: 품질 - {token_penalty} × 토큰/1000 - {latency_penalty} × 초, seed={seed}")
+    print()
+
+    trace = []
+    prob_best = {}
+    while bandit.pulls < budget:
+        version = bandit.choose(exclude=[v for v in versions if cursors[v] >= len(cases)])
+        if version is None:
+            break
+        test_case = cases[cursors[version]]
+        cursors[version] += 1
+
+        row = normalize_result(runners[version].run_single_experiment(test_case))
+        reward = reward_of(row, token_penalty, latency_penalty)
+        bandit.update(version, reward)
+        prob_best = bandit.prob_best()
+        trace.append({
+            "step": bandit.pulls,
+            "version": version,
+            "test_case_id": test_case.id,
+            "success": row["success"],
+            "quality_score": row["quality_score"],
+            "total_tokens": row["total_tokens"],
+            "latency": row["latency"],
+            "reward": round(reward, 4),
+            "prob_best": {v: round(p, 4) for v, p in prob_best.items()}
+        })
+
+        leader = max(prob_best, key=prob_best.get)
+        print(f"[{bandit.pulls:3d}/{budget}] {version:>4} {test_case.id} 보상: {reward:.2f}  "
+              f"(선두 {leader} P={prob_best[leader]:.2f})")
+        if bandit.pulls >= bandit.warmup * len(versions) and prob_best[leader] >= stop_prob:
+            break
+
+    return {
+        "summary": {
+            "experiment_info": {
+                "domain": domain,
+                "versions": versions,
+                "strategy": strategy,
+                "model": model if backend == "ollama" else f"{backend}:{model}",
+                "seed": seed,
+                "stop_prob": stop_prob,
+                "token_penalty": token_penalty,
+                "latency_penalty": latency_penalty,
+                "timestamp": datetime.now().isoformat()
+            },
+            "best_version": max(prob_best, key=prob_best.get) if prob_best else None,
+            "prob_best": prob_best,
+            "arms": bandit.summary(),
+            "llm_calls": bandit.pulls,
+            "budget_calls": budget_calls,
+            "calls_saved": budget_calls - bandit.pulls
+        },
+        "trace": trace
+    }
+
+
+def print_bandit_summary(summary: Dict):
+    """버전별 배분 결과와 절약한 호출 수 출력"""
+    print()
+    print("=" * 70)
+    print("밴딧 배분 결과")
+    print("=" * 70)
+    for arm in summary["arms"]:
+        mean = f"{arm['mean_reward']:.2f}" if arm["mean_reward"] is not None else "-"
+        print(f"  {arm['version']:>4}: {arm['pulls']:3d}회, 평균 보상 {mean}, "
+              f"P(best)={summary['prob_best'].get(arm['version'], 0):.2f}")
+    saved = summary["calls_saved"]
+    print()
+    print(f"최고 버전: {summary['best_version']}")
+    print(f"LLM 호출: {summary['llm_calls']}회 / 전체 실행 {summary['budget_calls']}회 "
+          f"(절약 {saved}회, {saved / max(summary['budget_calls'], 1):.0%})")
+
+
+def print_comparison_summary(summary: Dict):
+    """쌍별 결과와 절약한 호출 수 출력"""
+    print()
+    print("=" * 70)
+    print("순차 비교 결과")
+    print("=" * 70)
+    for row in summary["pairs"]:
+        ci = "[{:+.2f}, {:+.2f}]".format(*row["ci"]) if row["ci"] else "-"
+        mean = f"{row['mean_diff']:+.2f}" if row["mean_diff"] is not None else "-"
+        print(f"  {row['b']} - {row['a']}: 평균 차이 {mean}, 신뢰 구간 {ci}, p={row['p_value']:.4f} "
+              f"(n={row['n']}) → {describe_decision(row)}")
+    saved = summary["calls_saved"]
+    print()
+    print(f"LLM 호출: {summary['llm_calls']}회 / 전체 실행 {summary['budget_calls']}회 "
+          f"(절약 {saved}회, {saved / max(summary['budget_calls'], 1):.0%})")
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="프롬프트 버전 순차 비교 (결론이 나면 조기 종료)")
+    parser.add_argument("--domain", "-d", type=str, required=True, choices=COMPARABLE_DOMAINS,
+                        help="실험 도메인")
+    parser.add_argument("--versions", "-v", type=str, nargs="+", default=None,
+                        help="비교할 버전 (기본: 도메인의 모든 버전)")
+    parser.add_argument("--max-cases", type=int, default=None,
+                        help="최대 케이스 수 (기본: 도메인 전체)")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="유의수준 (모든 쌍 합계)")
+    parser.add_argument("--tau", type=float, default=DEFAULT_TAU, help="예상 효과 크기 (품질 점수 단위)")
+    parser.add_argument("--margin", type=float, default=DEFAULT_MARGIN,
+                        help="이보다 작은 차이는 '차이 없음'으로 확정")
+    parser.add_argument("--min-cases", type=int, default=DEFAULT_MIN_CASES, help="멈추기 전 최소 케이스 수")
+    parser.add_argument("--min-std", type=float, default=None,
+                        help="차이 표준편차 추정의 하한 (기본: tau / 2, 점수가 모두 같아 분산이 0일 때 바로 멈추지 않도록)")
+    parser.add_argument("--bandit", choices=STRATEGIES, default=None,
+                        help="순차 검정 대신 밴딧으로 버전별 호출 배분")
+    parser.add_argument("--budget", type=int, default=None,
+                        help="밴딧 최대 호출 수 (기본: 케이스 수 × 버전 수)")
+    parser.add_argument("--stop-prob", type=float, default=DEFAULT_STOP_PROB,
+                        help="밴딧 종료 조건: 최고 버전일 확률")
+    parser.add_argument("--token-penalty", type=float, default=0.0, help="밴딧 보상 감점 (1000토큰당)")
+    parser.add_argument("--latency-penalty", type=float, default=0.0, help="밴딧 보상 감점 (1초당)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="케이스 순서 (밴딧 난수) 시드")
+    parser.add_argument("--model", "-m", type=str, default="qwen2.5:7b", help="사용할 모델")
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+    backend = parse_backend_arguments(parser, args)
+
+    versions = args.versions or DOMAIN_VERSIONS[args.domain]
+    for version in versions:
+        if version not in DOMAIN_VERSIONS[args.domain]:
+            parser.error(f"{args.domain} 도메인은 {version} 버전을 지원하지 않습니다")
+    if len(set(versions)) < 2:
+        parser.error("서로 다른 버전이 2개 이상 필요합니다")
+    if args.max_cases is not None and args.max_cases < 1:
+        parser.error("--max-cases는 1 이상이어야 합니다")
+    if not 0 < args.alpha < 1:
+        parser.error("--alpha는 0과 1 사이여야 합니다")
+    if args.min_std is not None and args.min_std <= 0:
+        parser.error("--min-std는 0보다 커야 합니다")
+
+    if args.budget is not None and args.budget < 1:
+        parser.error("--budget은 1 이상이어야 합니다")
+    if not 0 < args.stop_prob <= 1:
+        parser.error("--stop-prob은 0보다 크고 1 이하여야 합니다")
+
+    if args.bandit:
+        output = run_bandit_allocation(
+            args.domain, versions, strategy=args.bandit, max_cases=args.max_cases, budget=args.budget,
+            stop_prob=args.stop_prob, token_penalty=args.token_penalty,
+            latency_penalty=args.latency_penalty, seed=args.seed, model=args.model, backend=backend
+        )
+        print_bandit_summary(output["summary"])
+    else:
+        output = run_sequential_comparison(
+            args.domain, versions, max_cases=args.max_cases, alpha=args.alpha, tau=args.tau,
+            margin=args.margin, min_cases=args.min_cases, min_std=args.min_std, seed=args.seed,
+            model=args.model, backend=backend
+        )
+        print_comparison_summary(output["summary"])
+
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_path = os.path.join(project_root, f"results/version_comparison_{args.domain}_{timestamp}.json")
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {output_path}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+프롬프트 사전 렌더링 (Render Stage)
+================================================================================
+
+## 이 스크립트의 목적
+실행 계획의 모든 (테스트 케이스, 버전) 프롬프트를 미리 렌더링하여 매니페스트로 저장
+
+## 사용 방법
+```bash
+# 비즈니스 V2/V4 프롬프트를 4개 프로세스로 렌더링
+python scripts/render_prompts.py --domain business --versions v2 v4 --workers 4
+
+# 저장된 매니페스트로 실행 (렌더링 단계 생략)
+python scripts/run_business_experiments.py v4 108 --manifest results/manifests/<name>
+```
+
+## 출력
+- 도메인/버전별 프롬프트 수와 총 입력 토큰
+- results/manifests/<name>/manifest.json + 압축 blob
+================================================================================
+"""
+
+import sys
+import os
+import argparse
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+# Windows 한글 출력 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+# 상위 디렉토리 모듈 임포트를 위한 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from evaluation.engine import adapter_class, create_engine, domain_versions
+from evaluation.manifest import render_manifest
+
+
+# 도메인별 지원 버전 (데이터 분석은 단일 버전)
+DOMAIN_VERSIONS = domain_versions()
+
+# 워커 프로세스별 실행기/테스트 케이스 캐시
+_RUNNERS: Dict[Tuple[str, str], object] = {}
+_CASES: Dict[str, Dict[str, object]] = {}
+
+
+def create_runner(domain: str, version: str, model: str = "qwen2.5:7b", backend: str = "ollama"):
+    """도메인 실험 엔진 생성 (렌더링 단계에서는 프롬프트 생성과 토큰 계산에만 사용)"""
+    return create_engine(domain, version, model=model, backend=backend)
+
+
+def load_domain_test_cases(domain: str) -> List:
+    """도메인의 전체 테스트 케이스 로드"""
+    return adapter_class(domain)().load_cases()
+
+
+def render_prompt(domain: str, version: str, test_case_id: str) -> Tuple[str, int]:
+    """단일 프롬프트 렌더링 + 토큰 계산 (워커 프로세스에서 호출)"""
+    key = (domain, version)
+    if key not in _RUNNERS:
+        _RUNNERS[key] = create_runner(domain, version)
+    if domain not in _CASES:
+        _CASES[domain] = {tc.id: tc for tc in load_domain_test_cases(domain)}
+
+    runner = _RUNNERS[key]
+    prompt = runner.generate_prompt(_CASES[domain][test_case_id])
+    return prompt, runner.count_tokens(prompt)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="프롬프트 사전 렌더링 (매니페스트 생성)")
+    parser.add_argument("--domain", "-d", type=str, required=True, choices=list(DOMAIN_VERSIONS),
+                        help="실험 도메인")
+    parser.add_argument("--versions", "-v", type=str, nargs="+", default=None,
+                        help="렌더링할 프롬프트 버전 (기본: 도메인의 모든 버전)")
+    parser.add_argument("--limit", "-l", type=int, default=None,
+                        help="버전당 테스트 케이스 수 (기본: 전체)")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count() or 1,
+                        help="렌더링 워커 프로세스 수")
+    parser.add_argument("--out", "-o", type=str, default=None,
+                        help="매니페스트 디렉토리 (기본: results/manifests/<domain>_<timestamp>)")
+    args = parser.parse_args()
+
+    versions = args.versions or DOMAIN_VERSIONS[args.domain]
+    for version in versions:
+        if version not in DOMAIN_VERSIONS[args.domain]:
+            parser.error(f"{args.domain} 도메인은 {version} 버전을 지원하지 않습니다")
+
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    manifest_dir = args.out or os.path.join(project_root, "results", "manifests", f"{args.domain}_{timestamp}")
+
+    test_cases = load_domain_test_cases(args.domain)[:args.limit]
+    jobs = [(args.domain, version, tc.id) for version in versions for tc in test_cases]
+
+    print("=" * 70)
+    print("프롬프트 사전 렌더링")
+    print("=" * 70)
+    print(f"도메인: {args.domain}")
+    print(f"버전: {', '.join(versions)}")
+    print(f"프롬프트 수: {len(jobs)}개 (워커 {args.workers}개)")
+
+    manifest = render_manifest(
+        manifest_dir,
+        jobs,
+        render_prompt,
+        workers=args.workers,
+        meta={"domain": args.domain, "versions": versions}
+    )
+
+    print()
+    for key, stats in manifest["totals"].items():
+        print(f"  {key}: {stats['count']}개, 입력 토큰 {stats['input_tokens']:,}")
+    print(f"총 입력 토큰: {manifest['total_input_tokens']:,} (고유 프롬프트 {manifest['unique_blobs']}개)")
+    print(f"매니페스트 저장: {manifest_dir}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -57,6 +57,15 @@ ollama serve
 # 실험 실행
 python run_all_experiments.py
 
+# 단계별 구간 기록 (results/all_experiments.trace.json → chrome://tracing)
+python run_all_experiments.py --trace
+
+# 하네스 프로파일 (실험별 results/all_experiments.exp<N>.pstats + all_experiments.profile.txt)
+python run_all_experiments.py --profile cpu
+
+# 호출 기한 60초, 일시적 오류는 최대 3회 재시도 (실행 전체 재시도 20회까지)
+python run_all_experiments.py --timeout 60 --retries 3 --retry-budget 20
+
 # 결과 확인
 cat results/all_experiments.json
 ```
@@ -76,7 +85,6 @@ cat results/all_experiments.json
 import sys
 import json
 import re
-import time
 from datetime import datetime
 from typing import Dict, List, Any
 
@@ -108,6 +116,23 @@ from evaluation.test_cases import (
     get_hard_problems_suite        # 어려운 문제 (수학+논리) 26개
 )
 
+# Few-shot 예시 검색 (실험 4, 5의 검색 기반 예시 선택)
+from evaluation.example_index import ExampleIndex
+from evaluation import profiling, tracing
+from evaluation.call_policy import (
+    CallPolicy,
+    LLMCallError,
+    add_call_policy_arguments,
+    describe_call_policy,
+    parse_call_policy_arguments
+)
+
+# 예시 인덱스 캐시 경로 (토큰화 결과 저장 → 재실행 시 재색인 없음)
+EXAMPLE_INDEX_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "results", "indexes", "classification_examples.json.gz"
+)
+
 
 # ============================================================================
 # ExperimentRunner 클래스
@@ -133,6 +158,8 @@ class ExperimentRunner:
     ----------
     llm : ChatOllama
         Ollama LLM 인스턴스 (qwen2.5:7b 모델)
+    policy : CallPolicy
+        LLM 호출 타임아웃/재시도/헤지 정책 (기본: 바로 호출)
     enc : tiktoken.Encoding
         토큰 수 측정을 위한 토크나이저
     all_results : dict
@@ -145,7 +172,7 @@ class ExperimentRunner:
     >>> print(result["correct"])  # True
     """
 
-    def __init__(self, model: str = "qwen2.5:7b"):
+    def __init__(self, model: str = "qwen2.5:7b", call_policy: CallPolicy = None):
         """
         실험 실행기 초기화
 
@@ -153,6 +180,8 @@ class ExperimentRunner:
         ----------
         model : str, optional
             사용할 Ollama 모델명 (기본값: "qwen2.5:7b")
+        call_policy : CallPolicy, optional
+            LLM 호출 타임아웃/재시도/헤지 정책 (None이면 바로 호출)
 
         왜 temperature=0인가?
         --------------------
@@ -160,6 +189,7 @@ class ExperimentRunner:
         - temperature > 0이면 매번 다른 출력이 나와 비교 어려움
         """
         self.llm = ChatOllama(model=model, temperature=0)
+        self.policy = call_policy or CallPolicy()
 
         # tiktoken 토크나이저 초기화
         # 왜 gpt-3.5-turbo 인코딩을 사용하는가?
@@ -264,22 +294,43 @@ class ExperimentRunner:
             - response: LLM 응답 텍스트
             - correct: 정답 여부 (bool)
             - tokens: 총 토큰 수 (입력 + 출력)
-            - time: 응답 시간 (초)
+            - time: 응답 시간 (초, 재시도 대기 제외)
+            - error: 재시도 후에도 실패한 호출의 오류 (실패 시에만, 오답으로 처리)
+            - retries / hedged: 재시도 수 / 헤지 여부 (호출 정책을 켰을 때만)
+
+        왜 호출 실패를 오답으로 기록하는가?
+        -------------------------------
+        - 멈춘 요청 하나, 일시적 오류 하나 때문에 실험 전체가 "오류"로 끝나지 않도록
+        - 실패 수는 run_batch의 errors로 따로 집계 (정확도와 구분)
         """
-        start = time.time()
-        response = self.llm.invoke(prompt).content
-        elapsed = time.time() - start
+        error = None
+        try:
+            with profiling.paused():
+                call = self.policy.invoke(self.llm, prompt, span="llm_call")
+            response = call.text
+        except LLMCallError as e:
+            call = e.result
+            response = ""
+            error = str(e)
 
         # 토큰 수 = 입력 토큰 + 출력 토큰
-        tokens = self.count_tokens(prompt) + self.count_tokens(response)
-        correct = self.check_answer(response, expected)
+        with tracing.span("token_count"):
+            tokens = self.count_tokens(prompt) + self.count_tokens(response)
+        with tracing.span("score"):
+            correct = self.check_answer(response, expected) if error is None else False
 
-        return {
+        result = {
             "response": response,
             "correct": correct,
             "tokens": tokens,
-            "time": elapsed
+            "time": call.elapsed
         }
+        if error is not None:
+            result["error"] = error
+        if self.policy.active:
+            result["retries"] = call.retries
+            result["hedged"] = call.hedged
+        return result
 
     def run_batch(self, template: str, test_cases: List[Dict], input_key: str = "q") -> Dict:
         """
@@ -293,8 +344,9 @@ class ExperimentRunner:
 
         Parameters
         ----------
-        template : str
+        template : str or Callable[[Dict], str]
             프롬프트 템플릿 (예: "질문: {q}\\n답:")
+            또는 테스트 케이스별로 프롬프트를 만드는 함수 (검색 기반 Few-shot 등)
         test_cases : List[Dict]
             테스트 케이스 리스트
         input_key : str, optional
@@ -309,29 +361,54 @@ class ExperimentRunner:
             - total: 전체 개수
             - avg_tokens: 평균 토큰 수
             - avg_time: 평균 응답 시간
+            - errors: 재시도 후에도 실패한 호출 수 (오답으로 집계)
+            - retries / hedged: 재시도 / 헤지 합계 (호출 정책을 켰을 때만)
+
+        Raises
+        ------
+        RuntimeError
+            모든 케이스의 호출이 실패 (서버 중단 등 - 0% 정확도 대신 실험 오류로 기록)
         """
         correct_count = 0
         total_tokens = 0
         total_time = 0
+        errors = 0
+        retries = 0
+        hedged = 0
+        last_error = None
 
         for case in test_cases:
-            # 템플릿에 입력 값 삽입
-            prompt = template.format(**case["input"])
-            result = self.run_single(prompt, case["expected"])
+            with tracing.span("case"):
+                # 템플릿에 입력 값 삽입 (함수면 케이스별로 프롬프트 생성)
+                with tracing.span("prompt_build"):
+                    prompt = template(case) if callable(template) else template.format(**case["input"])
+                result = self.run_single(prompt, case["expected"])
 
             if result["correct"]:
                 correct_count += 1
             total_tokens += result["tokens"]
             total_time += result["time"]
+            if "error" in result:
+                errors += 1
+                last_error = result["error"]
+            retries += result.get("retries", 0)
+            hedged += result.get("hedged", False)
 
         n = len(test_cases)
-        return {
+        if n > 0 and errors == n:
+            raise RuntimeError(last_error)
+        batch = {
             "accuracy": correct_count / n if n > 0 else 0,
             "correct": correct_count,
             "total": n,
             "avg_tokens": total_tokens / n if n > 0 else 0,
-            "avg_time": total_time / n if n > 0 else 0
+            "avg_time": total_time / n if n > 0 else 0,
+            "errors": errors
         }
+        if self.policy.active:
+            batch["retries"] = retries
+            batch["hedged"] = hedged
+        return batch
 
     def print_result(self, name: str, result: Dict):
         """
@@ -343,7 +420,8 @@ class ExperimentRunner:
         print(f"  {name:<20} 정확도: {result['accuracy']*100:>5.1f}%  "
               f"({result['correct']}/{result['total']})  "
               f"토큰: {result['avg_tokens']:>5.0f}  "
-              f"시간: {result['avg_time']:.2f}s")
+              f"시간: {result['avg_time']:.2f}s"
+              + (f"  호출 실패: {result['errors']}" if result.get("errors") else ""))
 
 
 # ============================================================================
@@ -520,6 +598,67 @@ def run_experiment_3(runner: ExperimentRunner) -> Dict:
     return results
 
 
+# ============================================================================
+# Few-shot 예시 검색 인덱스
+# ============================================================================
+def get_example_index() -> ExampleIndex:
+    """
+    분류 예시 인덱스 로드 (없으면 생성)
+
+    저장된 인덱스에 새 예시만 증분 추가합니다.
+    인덱스 파일에 예시를 더 추가하면 (ExampleIndex.add_many + save)
+    실험 4, 5의 검색 기반 Few-shot이 자동으로 더 큰 후보 풀을 사용합니다.
+    """
+    index = ExampleIndex.load_or_create(EXAMPLE_INDEX_PATH)
+    added = index.add_many(
+        (case["input"]["text"], case["expected"])
+        for case in get_classification_test_suite().to_list()
+    )
+    if added:
+        index.save(EXAMPLE_INDEX_PATH)
+    return index
+
+
+def format_examples(examples: List[Dict[str, str]]) -> str:
+    """Few-shot 예시 목록 → 예시 블록 ('- "텍스트" → 라벨' 한 줄씩)"""
+    return "\n".join(f'- "{ex["text"]}" → {ex["label"]}' for ex in examples)
+
+
+def fixed_prompt(template: str, examples: List[Dict[str, str]]) -> str:
+    """
+    Few-shot 템플릿의 {examples}를 고정 예시로 채운 템플릿 반환 ({text}는 run_batch가 채움)
+
+    검색 기반 Few-shot(retrieval_prompt)과 같은 템플릿을 쓰므로 두 조건은 예시만 다릅니다.
+    """
+    return template.replace("{examples}", format_examples(examples))
+
+
+def retrieval_prompt(template: str, index: ExampleIndex, k: int, per_label: bool = True):
+    """
+    검색된 예시로 Few-shot 템플릿을 채우는 함수 반환 (run_batch의 template으로 사용)
+
+    Parameters
+    ----------
+    template : str
+        {examples}, {text}를 가진 Few-shot 템플릿 (고정 예시 조건과 같은 템플릿)
+    index : ExampleIndex
+        예시 인덱스 (후보 풀: 분류 스위트 전체 + 인덱스 파일에 추가한 예시)
+    k : int
+        검색할 예시 수 (per_label=True면 라벨당 개수)
+    per_label : bool, optional
+        라벨마다 k개씩 검색
+
+    후보 풀에 평가 대상 스위트가 들어 있으므로 평가 대상 텍스트 자신은 예시에서 제외합니다
+    (leave-one-out, 정답 유출 방지). 나머지 케이스는 예시로 쓰일 수 있어, 스위트와 무관한
+    고정 예시보다 평가 분포에 가까운 예시를 받는다는 점을 감안해 비교합니다.
+    """
+    def build(case: Dict) -> str:
+        text = case["input"]["text"]
+        examples = index.search(text, k=k, per_label=per_label, exclude_text=text)
+        return template.format(examples=format_examples(examples), text=text)
+    return build
+
+
 # ============================================================================
 # 실험 4: Zero-shot vs Few-shot
 # ============================================================================
@@ -568,19 +707,31 @@ def run_experiment_4(runner: ExperimentRunner) -> Dict:
 텍스트: {text}
 감성:"""
 
-    # Few-shot: 3개 예시 포함
-    few_shot = """다음 텍스트의 감성을 분류하세요.
+    # Few-shot 템플릿: 고정 예시와 검색 예시가 같은 형식 (예시 블록만 다름)
+    few_shot_template = """다음 텍스트의 감성을 분류하세요.
 카테고리: 긍정, 부정, 중립
 
 예시:
-- "정말 좋아요!" → 긍정
-- "별로예요" → 부정
-- "그냥 그래요" → 중립
+{examples}
 
 텍스트: {text}
 감성:"""
 
-    prompts = {"Zero-shot": zero_shot, "Few-shot (3예시)": few_shot}
+    # Few-shot: 3개 예시 포함
+    few_shot = fixed_prompt(few_shot_template, [
+        {"text": "정말 좋아요!", "label": "긍정"},
+        {"text": "별로예요", "label": "부정"},
+        {"text": "그냥 그래요", "label": "중립"},
+    ])
+
+    # 검색 기반 Few-shot: 라벨별로 가장 유사한 예시 1개씩 (총 3개, 나머지 케이스 중에서 검색)
+    index = get_example_index()
+
+    prompts = {
+        "Zero-shot": zero_shot,
+        "Few-shot (3예시)": few_shot,
+        "검색 Few-shot (3예시)": retrieval_prompt(few_shot_template, index, k=1, per_label=True),
+    }
 
     results = {}
     for name, template in prompts.items():
@@ -635,29 +786,39 @@ def run_experiment_5(runner: ExperimentRunner) -> Dict:
 텍스트: {text}
 감성:"""
 
-    # 3-shot: 예시 3개 (각 카테고리당 1개)
-    three_shot = """감성 분류 (긍정/부정/중립)
+    # 3-shot/5-shot 템플릿: 고정 예시와 검색 예시가 같은 형식 (예시 블록만 다름)
+    shot_template = """감성 분류 (긍정/부정/중립)
 예시:
-- "정말 좋아요" → 긍정
-- "별로예요" → 부정
-- "보통이에요" → 중립
+{examples}
 
 텍스트: {text}
 감성:"""
 
+    # 3-shot: 예시 3개 (각 카테고리당 1개)
+    three_shot = fixed_prompt(shot_template, [
+        {"text": "정말 좋아요", "label": "긍정"},
+        {"text": "별로예요", "label": "부정"},
+        {"text": "보통이에요", "label": "중립"},
+    ])
+
     # 5-shot: 예시 5개 (다양한 표현)
-    five_shot = """감성 분류 (긍정/부정/중립)
-예시:
-- "최고예요!" → 긍정
-- "만족합니다" → 긍정
-- "실망이에요" → 부정
-- "안 좋아요" → 부정
-- "그냥 그래요" → 중립
+    five_shot = fixed_prompt(shot_template, [
+        {"text": "최고예요!", "label": "긍정"},
+        {"text": "만족합니다", "label": "긍정"},
+        {"text": "실망이에요", "label": "부정"},
+        {"text": "안 좋아요", "label": "부정"},
+        {"text": "그냥 그래요", "label": "중립"},
+    ])
 
-텍스트: {text}
-감성:"""
+    # 검색 기반 5-shot: 라벨 구분 없이 가장 유사한 예시 5개 (나머지 케이스 중에서 검색)
+    index = get_example_index()
 
-    prompts = {"1-shot": one_shot, "3-shot": three_shot, "5-shot": five_shot}
+    prompts = {
+        "1-shot": one_shot,
+        "3-shot": three_shot,
+        "5-shot": five_shot,
+        "검색 5-shot": retrieval_prompt(shot_template, index, k=5, per_label=False),
+    }
 
     results = {}
     for name, template in prompts.items():
@@ -917,7 +1078,7 @@ def run_experiment_9(runner: ExperimentRunner) -> Dict:
     # - 0: 결정적 출력 (항상 같은 답)
     # - 0.7: 적당한 다양성 (서로 다른 추론 경로)
     # - 1.0+: 너무 무작위적
-    runner_temp = ExperimentRunner()
+    runner_temp = ExperimentRunner(call_policy=runner.policy)  # 재시도 예산은 실행 전체가 공유
     runner_temp.llm = ChatOllama(model="qwen2.5:7b", temperature=0.7)
 
     # 복잡한 수학 문제 8개 (Self-Consistency는 연산 비용이 3배)
@@ -941,7 +1102,12 @@ def run_experiment_9(runner: ExperimentRunner) -> Dict:
         # 3회 실행하여 각각의 답 수집
         answers = []
         for _ in range(3):
-            response = runner_temp.llm.invoke(prompt).content
+            try:
+                with profiling.paused():
+                    response = runner_temp.policy.invoke(runner_temp.llm, prompt, span="llm_call").text
+            except LLMCallError as e:
+                print(f"  호출 실패 (이 표본 제외): {e}")
+                continue
             # 숫자 추출 (마지막 숫자를 최종 답으로 간주)
             nums = re.findall(r'\d+', response)
             if nums:
@@ -1074,14 +1240,38 @@ def main():
     results/all_experiments.json
     - 모든 실험의 정확도, 정답 수, 전체 문제 수 포함
     - timestamp로 실험 시점 기록
+    results/all_experiments.trace.json (--trace)
+    - 실험/케이스/모델 호출/토큰 계산/채점 구간 (evaluation.tracing)
+    results/all_experiments.profile.txt / .alloc.txt (--profile)
+    - 실험별 하네스 프로파일, 모델 호출 시간 제외 (evaluation.profiling)
+
+    호출 정책 (--timeout, --retries, --retry-budget, --hedge)
+    ------------------------------------------------------
+    실패한 호출은 해당 케이스의 오답으로 기록하고 실험을 계속합니다 (모든 호출이 실패한 배치만 실험 오류).
+    정책을 켜면 결과 파일의 "call_policy"에 재시도/타임아웃/헤지 수를 기록합니다.
     """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="프롬프트 엔지니어링 종합 실험 (10개)")
+    parser.add_argument("--trace", action="store_true",
+                        help="단계별 구간을 Chrome 트레이스(results/all_experiments.trace.json)로 기록")
+    parser.add_argument("--profile", choices=profiling.PROFILE_MODES, default=None,
+                        help="실험별 하네스 프로파일 (cpu: cProfile, alloc: tracemalloc, 모델 호출 시간 제외)")
+    add_call_policy_arguments(parser)
+    args = parser.parse_args()
+    call_policy = parse_call_policy_arguments(parser, args)
+    if args.trace:
+        tracing.start_tracing("all_experiments")
+    if args.profile:
+        profiling.start_profiling(args.profile)
+
     print("=" * 70)
     print("프롬프트 엔지니어링 종합 실험 (10개)")
     print("=" * 70)
     print(f"시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
     # 실험 실행기 초기화
-    runner = ExperimentRunner()
+    runner = ExperimentRunner(**call_policy)
     all_results = {}
 
     # 10개 실험 정의
@@ -1100,9 +1290,10 @@ def main():
     ]
 
     # 실험 순차 실행
-    for name, func in experiments:
+    for number, (name, func) in enumerate(experiments, 1):
         try:
-            all_results[name] = func(runner)
+            with tracing.span("experiment", name=name), profiling.phase(f"exp{number}"):
+                all_results[name] = func(runner)
         except Exception as e:
             print(f"  오류 발생: {e}")
             all_results[name] = {"error": str(e)}
@@ -1143,6 +1334,14 @@ def main():
                     "correct": result["correct"],
                     "total": result["total"]
                 }
+                # 호출 실패/재시도/헤지 수 (있을 때만 - 기존 결과 파일 모양 유지)
+                for key in ("errors", "retries", "hedged"):
+                    if result.get(key):
+                        save_data["results"][exp_name][method][key] = result[key]
+
+    if runner.policy.active:
+        print(f"\n호출 정책: {describe_call_policy(runner.policy.snapshot())}")
+        save_data["call_policy"] = runner.policy.snapshot()
 
     # ========================================
     # 결과를 JSON 파일로 저장
@@ -1153,6 +1352,13 @@ def main():
         json.dump(save_data, f, ensure_ascii=False, indent=2)
 
     print(f"\n결과 저장: {results_path}")
+    if args.trace:
+        trace_path = os.path.join(project_root, "results/all_experiments.trace.json")
+        tracing.stop_tracing(trace_path)
+        print(f"트레이스 저장: {trace_path}")
+    if args.profile:
+        profile_paths = profiling.stop_profiling(os.path.join(project_root, "results/all_experiments"))
+        print(f"프로파일 저장: {profile_paths[0]}")
     print(f"완료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("\n" + "=" * 70)
     print("모든 실험 완료!")
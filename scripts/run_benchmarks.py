@@ -0,0 +1,553 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+하네스 마이크로벤치마크 (Harness Micro-benchmarks)
+================================================================================
+
+## 이 스크립트의 목적
+케이스마다 수천 번 실행되는 CPU 쪽 코드(프롬프트 빌더, 품질 평가, 채점 지표, 토큰 계산, 요약)의
+**입력 1건당 시간**을 실제 테스트 코퍼스로 측정하고, 저장된 기준선과 비교하여 느려진 핫패스를 찾습니다.
+
+## 측정 항목
+| 그룹 | 대상 | 입력 |
+|------|------|------|
+| prompt | 어댑터 build_prompt (templates/* 빌더), 분류 프롬프트 | 도메인/버전별 전체 테스트 케이스 |
+| quality | 어댑터 evaluate_response_quality | 모의 백엔드 응답 + 기대 요소/이슈 |
+| synonyms | DevelopmentAdapter._check_issue_with_synonyms | 개발 케이스 이슈 × 모의 응답 |
+| metrics | PromptEvaluator.exact_match / f1_score | 수학/논리/분류 스위트 정답 × 응답 3종 |
+| check_answer | ExperimentRunner.check_answer | metrics와 같은 입력 |
+| tokens | ExperimentEngine.count_tokens | 전체 도메인 프롬프트 + 응답 |
+| summary | ExperimentEngine._generate_summary | 도메인 전체 케이스 결과 (모의 백엔드, 부트스트랩 포함) |
+
+데이터 분석 품질 평가는 LLM-as-a-Judge 호출이라 하네스 CPU 비용이 아니므로 제외합니다.
+응답 3종: 정답 그대로 / 정답을 포함한 문장 / 모의 모델 응답 (일치, 포함, 불일치 경로를 모두 지나도록)
+
+## 측정 방식
+- 입력 전체를 1번 순회하는 것이 1 루프. 반복 1회가 --min-time초 이상이 되도록 루프 수를 맞춘 뒤 --repeat번 반복
+- 입력 1건당 시간(ns)의 min/median/max를 기록하고, 기준선 비교에는 median 사용
+- 첫 루프는 워밍업으로 버림 (지연 임포트, 정규식/토크나이저 캐시)
+
+## 결과 파일 (JSON)
+results/benchmarks/bench_<시각>.json
+- machine: 플랫폼, CPU, 코어 수, Python/패키지 버전, git 커밋 (다른 머신의 기준선과 비교하면 경고)
+- settings: repeat, min_time
+- benchmarks: 항목별 {group, items, loops, ns_per_item: {min, median, max}}
+
+## 기준선 비교
+- 기준선(기본: results/benchmarks/baseline.json)이 있으면 자동 비교
+- median이 기준선 대비 --threshold(기본 15%)보다 느려진 항목이 있으면 종료 코드 1
+- --save-baseline: 이번 결과를 기준선으로 저장 (비교 생략)
+
+## 사용 방법
+```bash
+# 전체 측정 + 기준선 저장 (변경 전)
+python scripts/run_benchmarks.py --save-baseline
+
+# 변경 후 비교 (느려지면 종료 코드 1)
+python scripts/run_benchmarks.py
+
+# 일부만 측정 (fnmatch 패턴)
+python scripts/run_benchmarks.py --filter "prompt.business.*" "quality.*"
+python scripts/run_benchmarks.py --list
+```
+================================================================================
+"""
+
+import sys
+import os
+import json
+import time
+import fnmatch
+import platform
+import argparse
+import statistics
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# Windows 한글 출력 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+# 상위 디렉토리 모듈 임포트를 위한 경로 설정
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from evaluation.engine import adapter_class, create_engine, domain_versions
+from evaluation.llm_backends import MockChatModel
+from evaluation.metrics import PromptEvaluator
+from evaluation.records import ResultRecord
+from evaluation.result_io import STREAM_ONLY_KEYS
+from evaluation.test_cases import get_all_test_suites
+from templates.classification import get_classification_prompt
+from templates.data_analysis.data_digest import DATA_MODES
+from run_all_experiments import SENTIMENT_LABELS, ExperimentRunner
+
+
+BENCHMARKS_DIR = os.path.join(PROJECT_ROOT, "results", "benchmarks")
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+DEFAULT_REPEAT = 7
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_THRESHOLD = 0.15
+SCHEMA_VERSION = 1
+
+# 기준선과 다르면 비교 결과를 믿기 어려운 머신 정보
+MACHINE_KEYS = ("platform", "processor", "cpu_count", "python", "implementation")
+PACKAGES = ("tiktoken", "numpy", "langchain-ollama")
+
+
+@dataclass
+class Benchmark:
+    """
+    마이크로벤치마크 1개
+
+    Attributes:
+        name: 항목 이름 (<그룹>.<대상>, --filter 대상)
+        group: 그룹 (prompt, quality, synonyms, metrics, check_answer, tokens, summary)
+        items: 1 루프에서 처리하는 입력 수 (입력 1건당 시간 계산)
+        run: 입력 전체를 1번 처리하는 함수
+    """
+    name: str
+    group: str
+    items: int
+    run: Callable[[], Any]
+
+
+# ============================================================================
+# 입력 준비 (실제 테스트 코퍼스 + 모의 응답)
+# ============================================================================
+
+_MOCK = MockChatModel(seed=0)
+
+
+def mock_response(prompt: str) -> str:
+    """프롬프트에 대한 결정적인 모의 응답 (대기 없음)"""
+    return _MOCK.complete(prompt).text
+
+
+def answer_pairs() -> List[tuple]:
+    """수학/논리/분류 스위트의 (응답, 정답) - 정답 그대로, 정답 포함 문장, 모의 응답"""
+    pairs = []
+    for suite in get_all_test_suites().values():
+        for case in suite.to_list():
+            expected = case["expected"]
+            question = next(iter(case["input"].values()))
+            pairs.append((expected, expected))
+            pairs.append((f"단계별로 풀면 답은 {expected}입니다.", expected))
+            pairs.append((mock_response(question), expected))
+    return pairs
+
+
+def domain_cases() -> Dict[str, List]:
+    """도메인별 전체 테스트 케이스"""
+    return {domain: adapter_class(domain)().load_cases() for domain in domain_versions()}
+
+
+# ============================================================================
+# 측정 항목
+# ============================================================================
+
+def _each(func: Callable, inputs: List) -> Callable[[], None]:
+    """inputs를 1번 순회하며 func(*입력)을 호출하는 루프 함수"""
+    def run():
+        for args in inputs:
+            func(*args)
+    return run
+
+
+def prompt_benchmarks(cases: Dict[str, List]) -> List[Benchmark]:
+    """도메인/버전(데이터 모드)별 프롬프트 생성, 분류 프롬프트"""
+    benchmarks = []
+    for domain, versions in domain_versions().items():
+        items = [(case,) for case in cases[domain]]
+        for version in versions:
+            adapter = adapter_class(domain)(version)
+            if domain == "data_analysis":
+                for mode in DATA_MODES:
+                    build = lambda case, mode=mode, adapter=adapter: adapter.build_prompt(case, data_mode=mode)
+                    benchmarks.append(Benchmark(f"prompt.{domain}.{mode}", "prompt", len(items), _each(build, items)))
+                continue
+            benchmarks.append(Benchmark(f"prompt.{domain}.{version}", "prompt", len(items), _each(adapter.build_prompt, items)))
+            if domain == "development":
+                build = lambda case, adapter=adapter: adapter.build_prompt(case, minify=True)
+                benchmarks.append(Benchmark(f"prompt.{domain}.{version}.minify", "prompt", len(items), _each(build, items)))
+
+    texts = [(case["input"]["text"], SENTIMENT_LABELS) for case in get_all_test_suites()["classification"].to_list()]
+    benchmarks.append(Benchmark("prompt.classification", "prompt", len(texts), _each(get_classification_prompt, texts)))
+    return benchmarks
+
+
+def quality_benchmarks(cases: Dict[str, List]) -> List[Benchmark]:
+    """키워드 기반 품질 평가 (비즈니스, 취업 준비, 개발) + 개발 이슈 동의어 매칭"""
+    benchmarks = []
+    for domain, expected_of in (
+        ("business", lambda case: (case.expected_elements,)),
+        ("career", lambda case: (case.expected_issues,)),
+        ("development", lambda case: (case.expected_issues, case.category)),
+    ):
+        adapter = adapter_class(domain)()
+        inputs = [(mock_response(adapter.build_prompt(case)), *expected_of(case)) for case in cases[domain]]
+        benchmarks.append(Benchmark(
+            f"quality.{domain}", "quality", len(inputs), _each(adapter.evaluate_response_quality, inputs)
+        ))
+        if domain == "development":
+            pairs = [(issue, response.lower()) for response, issues, _ in inputs for issue in issues]
+            benchmarks.append(Benchmark(
+                "synonyms.development", "synonyms", len(pairs), _each(adapter._check_issue_with_synonyms, pairs)
+            ))
+    return benchmarks
+
+
+def answer_benchmarks() -> List[Benchmark]:
+    """정답 채점 지표 (PromptEvaluator, ExperimentRunner.check_answer)"""
+    pairs = answer_pairs()
+    evaluator = PromptEvaluator(llm=None)
+    runner = ExperimentRunner.__new__(ExperimentRunner)  # 생성자(Ollama 연결) 없이 채점 메서드만 사용
+    return [
+        Benchmark("metrics.exact_match", "metrics", len(pairs), _each(evaluator.exact_match, pairs)),
+        Benchmark("metrics.f1_score", "metrics", len(pairs), _each(evaluator.f1_score, pairs)),
+        Benchmark("check_answer", "check_answer", len(pairs), _each(runner.check_answer, pairs)),
+    ]
+
+
+def token_benchmarks(cases: Dict[str, List]) -> List[Benchmark]:
+    """토큰 계산 (도메인 기본 버전 프롬프트 + 모의 응답)"""
+    engine = create_engine("business", backend="mock")
+    texts = []
+    for domain, domain_cases_ in cases.items():
+        adapter = adapter_class(domain)()
+        for case in domain_cases_:
+            prompt = adapter.build_prompt(case)
+            texts.append((prompt,))
+            texts.append((mock_response(prompt),))
+    return [Benchmark("tokens.count", "tokens", len(texts), _each(engine.count_tokens, texts))]
+
+
+def summary_benchmarks(cases: Dict[str, List]) -> List[Benchmark]:
+    """도메인별 요약 계산 (전체 케이스를 모의 백엔드로 실행한 결과)"""
+    benchmarks = []
+    for domain in domain_versions():
+        engine = create_engine(domain, backend="mock")
+        engine.results = [
+            ResultRecord.from_dict(engine.run_single_experiment(case), omit=STREAM_ONLY_KEYS)
+            for case in cases[domain]
+        ]
+        benchmarks.append(Benchmark(f"summary.{domain}", "summary", len(engine.results), engine._generate_summary))
+    return benchmarks
+
+
+def build_benchmarks() -> List[Benchmark]:
+    """전체 측정 항목 (입력 준비 포함)"""
+    cases = domain_cases()
+    return [
+        *prompt_benchmarks(cases),
+        *quality_benchmarks(cases),
+        *answer_benchmarks(),
+        *token_benchmarks(cases),
+        *summary_benchmarks(cases),
+    ]
+
+
+# ============================================================================
+# 측정
+# ============================================================================
+
+def _time_loops(run: Callable[[], Any], loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        run()
+    return time.perf_counter() - start
+
+
+def measure(benchmark: Benchmark, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME) -> Dict[str, Any]:
+    """
+    항목 1개 측정
+
+    Parameters
+    ----------
+    benchmark : Benchmark
+        측정할 항목
+    repeat : int
+        반복 횟수 (반복마다 입력 1건당 시간 1개)
+    min_time : float
+        반복 1회의 최소 시간(초) - 짧은 항목은 루프 수를 늘려 타이머 오차를 줄임
+
+    Returns
+    -------
+    Dict
+        {group, items, loops, repeat, ns_per_item: {min, median, max}}
+    """
+    elapsed = _time_loops(benchmark.run, 1)  # 워밍업 (결과는 루프 수 추정에만 사용)
+    loops = 1
+    while elapsed < min_time:
+        loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9) * 1.2))
+        elapsed = _time_loops(benchmark.run, loops)
+
+    per_item = [
+        _time_loops(benchmark.run, loops) / loops / benchmark.items * 1e9
+        for _ in range(repeat)
+    ]
+    return {
+        "group": benchmark.group,
+        "items": benchmark.items,
+        "loops": loops,
+        "repeat": repeat,
+        "ns_per_item": {
+            "min": round(min(per_item), 1),
+            "median": round(statistics.median(per_item), 1),
+            "max": round(max(per_item), 1)
+        }
+    }
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=10, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _cpu_model() -> str:
+    """CPU 모델명 (Linux는 /proc/cpuinfo, 그 외는 platform.processor)"""
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _package_version(name: str) -> Optional[str]:
+    from importlib import metadata
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def machine_info() -> Dict[str, Any]:
+    """결과 파일에 기록할 머신/환경 정보"""
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "platform": platform.platform(),
+        "processor": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "hostname": platform.node(),
+        "git_commit": _git("rev-parse", "HEAD"),
+        "git_dirty": bool(status) if status is not None else None,
+        "packages": {name: _package_version(name) for name in PACKAGES}
+    }
+
+
+def run_benchmarks(
+    benchmarks: List[Benchmark],
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME
+) -> Dict[str, Any]:
+    """
+    항목 전체 측정
+
+    Parameters
+    ----------
+    benchmarks : List[Benchmark]
+        측정할 항목
+    repeat : int
+        항목별 반복 횟수
+    min_time : float
+        반복 1회의 최소 시간(초)
+
+    Returns
+    -------
+    Dict
+        결과 파일 내용 (schema, created_at, machine, settings, benchmarks)
+    """
+    results = {}
+    for benchmark in benchmarks:
+        stats = measure(benchmark, repeat, min_time)
+        results[benchmark.name] = stats
+        ns = stats["ns_per_item"]
+        print(f"  {benchmark.name:<36} {_format_ns(ns['median']):>10}/건 "
+              f"(min {_format_ns(ns['min'])}, 입력 {benchmark.items:,}건 × {stats['loops']:,}루프)")
+    return {
+        "schema": SCHEMA_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "machine": machine_info(),
+        "settings": {"repeat": repeat, "min_time": min_time},
+        "benchmarks": results
+    }
+
+
+def _format_ns(ns: float) -> str:
+    if ns >= 1e6:
+        return f"{ns / 1e6:,.2f}ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:,.2f}µs"
+    return f"{ns:,.0f}ns"
+
+
+# ============================================================================
+# 기준선 비교
+# ============================================================================
+
+def machine_differences(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """기준선과 다른 머신 정보 (비교 결과 신뢰도 경고용)"""
+    return [
+        f"{key}: {baseline['machine'].get(key)} → {current['machine'].get(key)}"
+        for key in MACHINE_KEYS
+        if baseline["machine"].get(key) != current["machine"].get(key)
+    ]
+
+
+def compare_runs(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    항목별 median을 기준선과 비교
+
+    Parameters
+    ----------
+    current : Dict
+        이번 결과 (run_benchmarks 반환값)
+    baseline : Dict
+        기준선 결과
+    threshold : float
+        느려짐/빨라짐으로 판정할 상대 변화 (0.15 → ±15%)
+
+    Returns
+    -------
+    List[Dict]
+        항목별 {name, baseline, current, ratio, status}
+        status: regression(느려짐), improved(빨라짐), ok, new(기준선에 없음)
+    """
+    rows = []
+    for name, stats in current["benchmarks"].items():
+        now = stats["ns_per_item"]["median"]
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            rows.append({"name": name, "baseline": None, "current": now, "ratio": None, "status": "new"})
+            continue
+        before = base["ns_per_item"]["median"]
+        ratio = now / before if before else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append({"name": name, "baseline": before, "current": now, "ratio": round(ratio, 3), "status": status})
+    return rows
+
+
+STATUS_LABELS = {"regression": "느려짐", "improved": "빨라짐", "ok": "-", "new": "새 항목"}
+
+
+def print_comparison(rows: List[Dict[str, Any]], threshold: float):
+    """비교 표 출력"""
+    print()
+    print(f"{'항목':<38} {'기준선':>10} {'이번':>10} {'변화':>8}  판정 (기준 ±{threshold:.0%})")
+    for row in rows:
+        base = _format_ns(row["baseline"]) if row["baseline"] is not None else "-"
+        change = f"{row['ratio'] - 1:+.1%}" if row["ratio"] is not None else "-"
+        print(f"  {row['name']:<36} {base:>10} {_format_ns(row['current']):>10} {change:>8}  {STATUS_LABELS[row['status']]}")
+
+
+def save_run(run: Dict[str, Any], path: str) -> str:
+    """결과 파일 저장"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(run, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def load_run(path: str) -> Dict[str, Any]:
+    """결과 파일(기준선) 로드"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="하네스 마이크로벤치마크 (기준선 대비 느려지면 종료 코드 1)")
+    parser.add_argument("--filter", "-k", type=str, nargs="+", default=None,
+                        help="측정할 항목 이름 패턴 (fnmatch, 예: 'prompt.*' 'summary.business')")
+    parser.add_argument("--list", action="store_true",
+                        help="항목 이름만 출력")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"항목별 반복 횟수 (기본: {DEFAULT_REPEAT})")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                        help=f"반복 1회의 최소 시간(초) (기본: {DEFAULT_MIN_TIME})")
+    parser.add_argument("--out", "-o", type=str, default=None,
+                        help="결과 파일 (기본: results/benchmarks/bench_<timestamp>.json)")
+    parser.add_argument("--baseline", type=str, default=None,
+                        help="비교할 기준선 파일 (기본: results/benchmarks/baseline.json, 있으면 자동 비교)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="이번 결과를 기준선으로 저장 (비교 생략)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"느려짐 판정 기준 (기준선 median 대비 상대 변화, 기본: {DEFAULT_THRESHOLD})")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat은 1 이상이어야 합니다")
+    if args.min_time <= 0 or args.threshold <= 0:
+        parser.error("--min-time, --threshold는 0보다 커야 합니다")
+    if args.baseline and not os.path.exists(args.baseline):
+        parser.error(f"기준선 파일이 없습니다: {args.baseline}")
+    baseline_path = args.baseline or DEFAULT_BASELINE
+
+    print("=" * 70)
+    print("하네스 마이크로벤치마크")
+    print("=" * 70)
+    print("입력 준비 중 (테스트 코퍼스 + 모의 응답)...")
+    benchmarks = build_benchmarks()
+    if args.filter:
+        benchmarks = [b for b in benchmarks if any(fnmatch.fnmatch(b.name, pattern) for pattern in args.filter)]
+        if not benchmarks:
+            parser.error(f"패턴과 일치하는 항목이 없습니다: {' '.join(args.filter)}")
+    if args.list:
+        for benchmark in benchmarks:
+            print(f"  {benchmark.name:<36} {benchmark.group:<14} 입력 {benchmark.items:,}건")
+        return
+
+    print(f"항목 {len(benchmarks)}개, 반복 {args.repeat}회 (반복당 최소 {args.min_time}초)")
+    print()
+    run = run_benchmarks(benchmarks, args.repeat, args.min_time)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    out_path = save_run(run, args.out or os.path.join(BENCHMARKS_DIR, f"bench_{timestamp}.json"))
+    print()
+    print(f"결과 저장: {out_path}")
+
+    if args.save_baseline:
+        print(f"기준선 저장: {save_run(run, baseline_path)}")
+        return
+    if not os.path.exists(baseline_path):
+        print("기준선 없음 (--save-baseline으로 저장하면 이후 실행과 비교)")
+        return
+
+    baseline = load_run(baseline_path)
+    print(f"기준선: {baseline_path} ({baseline['created_at']}, 커밋 {(baseline['machine'].get('git_commit') or '?')[:10]})")
+    differences = machine_differences(run, baseline)
+    if differences:
+        print("경고: 기준선과 다른 머신/환경에서 측정 - 비교 결과를 신뢰하기 어렵습니다")
+        for line in differences:
+            print(f"  {line}")
+
+    rows = compare_runs(run, baseline, args.threshold)
+    print_comparison(rows, args.threshold)
+    regressions = [row for row in rows if row["status"] == "regression"]
+    print()
+    if regressions:
+        print(f"느려진 항목 {len(regressions)}개: {', '.join(row['name'] for row in regressions)}")
+        print("=" * 70)
+        sys.exit(1)
+    print("느려진 항목 없음")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
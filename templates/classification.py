@@ -1,12 +1,13 @@
 """분류 프롬프트 템플릿"""
 
-from typing import List
+from typing import Dict, List, Optional
 
 
 def get_classification_prompt(
     text: str,
     categories: List[str],
-    with_explanation: bool = False
+    with_explanation: bool = False,
+    examples: Optional[List[Dict[str, str]]] = None
 ) -> str:
     """
     분류 프롬프트 생성
@@ -15,6 +16,8 @@ def get_classification_prompt(
         text: 분류할 텍스트
         categories: 카테고리 목록
         with_explanation: 분류 이유 포함 여부
+        examples: Few-shot 예시 [{"text": ..., "label": ...}]
+                  (ExampleIndex.search() 결과를 그대로 전달 가능)
 
     Returns:
         구조화된 분류 프롬프트
@@ -40,6 +43,11 @@ def get_classification_prompt(
     else:
         output_format = f"### 출력\n카테고리명만 출력하세요: {categories_str}"
 
+    examples_section = ""
+    if examples:
+        example_lines = "\n".join(f'- "{ex["text"]}" → {ex["label"]}' for ex in examples)
+        examples_section = f"### 예시\n{example_lines}\n\n"
+
     return f"""### 지시사항
 아래 텍스트를 주어진 카테고리 중 하나로 분류하세요.
 
@@ -50,7 +58,7 @@ def get_classification_prompt(
 - 반드시 주어진 카테고리 중 하나만 선택
 - 가장 적합한 카테고리 선택
 
-{output_format}
+{examples_section}{output_format}
 
 ### 텍스트
 {text}
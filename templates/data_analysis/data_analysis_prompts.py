@@ -14,6 +14,8 @@
 
 from typing import List
 
+from .data_digest import build_data_section
+
 
 def _build_checklist(expected_elements: List[str]) -> str:
     """expected_elements를 분석 체크리스트로 변환"""
@@ -1149,9 +1151,15 @@ def get_prompt_by_category(
     industry: str,
     data_description: str,
     raw_data: str,
-    expected_elements: List[str]
+    expected_elements: List[str],
+    data_mode: str = "raw"
 ) -> str:
-    """카테고리에 맞는 프롬프트 생성"""
+    """
+    카테고리에 맞는 프롬프트 생성
+
+    data_mode가 "digest" 또는 "digest+sample"이면 raw_data의 표를
+    열별 통계 요약으로 대체합니다 (data_digest.build_data_section 참고).
+    """
     if category not in PROMPT_FUNCTIONS:
         raise ValueError(f"지원하지 않는 카테고리: {category}")
 
@@ -1159,6 +1167,6 @@ def get_prompt_by_category(
         scenario=scenario,
         industry=industry,
         data_description=data_description,
-        raw_data=raw_data,
+        raw_data=build_data_section(raw_data, mode=data_mode),
         expected_elements=expected_elements
     )
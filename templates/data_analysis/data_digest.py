@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+데이터 요약 전처리 (Data Digest)
+================================================================================
+
+## 이 모듈의 목적
+데이터 분석 프롬프트에 원본 표(raw_data)를 그대로 넣는 대신,
+pandas/NumPy로 **열별 통계 요약(digest)**을 계산하여 넣습니다.
+표가 커질수록 prefill 토큰과 지연 시간이 줄어듭니다.
+
+## 데이터 모드
+- raw: 원본 그대로 (기존 동작)
+- digest: 표를 열별 요약으로 대체
+- digest+sample: 요약 + 대표 행 샘플 (첫 행/마지막 행 포함)
+
+## 열별 요약 항목
+- 숫자 열: 합계(비율 단위 제외), 평균, 최소/최대(행 라벨), 상위 k개
+- 첫 행→마지막 행 변화량과 성장률: 행 라벨이 날짜/기간일 때만 (피처 중요도, 카테고리 목록처럼
+  순서가 시간이 아닌 표에서는 의미가 없으므로 생략)
+- 텍스트 열: 고유값 수, 최빈값
+
+## 표 인식 규칙
+- 쉼표로 구분된 줄이 3줄 이상(헤더 + 2행) 같은 열 수로 연속되면 표로 인식
+- "- "로 시작하는 목록, 표가 아닌 설명 문장은 그대로 유지
+- min_rows(기본 8)보다 작은 표는 요약이 원본보다 길어지므로 그대로 둠
+
+## 사용 예시
+
+```python
+from templates.data_analysis.data_digest import build_data_section
+
+data = build_data_section(test_case.raw_data, mode="digest+sample")
+```
+
+```bash
+python -m templates.data_analysis.data_digest --check   # 작은 수/음수 포맷, 변화량 생략 확인
+```
+================================================================================
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+DATA_MODES = ("raw", "digest", "digest+sample")
+
+# 이보다 작은 표는 원본이 요약보다 짧음 (열 4개 기준 약 8행부터 요약이 유리)
+DEFAULT_MIN_ROWS = 8
+
+# 숫자 + 짧은 단위 접미사 (12.5, 8,500, 32.5%, +3.3%p, 0.85$, 1.2초)
+_NUMBER_PATTERN = re.compile(r"^([+\-]?)\$?(\d[\d,]*(?:\.\d+)?)\s*([^\d\s]{0,3})$")
+
+# 합계가 의미 없는 단위 (비율, 평균값 등)
+_NON_ADDITIVE_UNITS = {"%", "%p", "배", "점"}
+
+# 시간 순서 행 라벨: 열 이름 (월, 가입월, 기간(월), 일자, 시간 등) 또는 모든 라벨의 형식
+_PERIOD_HEADER = re.compile(r"월|일자|일차|날짜|기간|시간|시점|연도|년도|분기|주차|요일|date|month|week|year|quarter|period|time|day",
+                            re.IGNORECASE)
+_PERIOD_LABEL = re.compile(
+    r"^(\d{4}[-/.]\d{1,2}([-/.]\d{1,2})?"   # 2024-01, 2024-01-15
+    r"|\d{1,2}[/.]\d{1,2}"                  # 01/15
+    r"|\d{1,2}:\d{2}"                       # 08:00
+    r"|\d{4}년(\s*\d{1,2}월)?"               # 2024년, 2024년 3월
+    r"|\d{4}\s*-?Q[1-4]|Q[1-4]"               # 2024Q1, Q1
+    r"|\d+\s*(월|주차|주|일차|일|개월|분기)"    # 3월, 2주차, 6개월
+    r"|[월화수목금토일](요일)?)$",             # 월, 화요일
+    re.IGNORECASE
+)
+
+
+def _parse_number(cell: str) -> Tuple[Optional[float], str]:
+    """셀 문자열을 (숫자, 단위)로 변환, 숫자가 아니면 (None, "")"""
+    match = _NUMBER_PATTERN.match(cell.strip())
+    if not match:
+        return None, ""
+    sign, digits, unit = match.groups()
+    value = float(digits.replace(",", ""))
+    return (-value if sign == "-" else value), unit
+
+
+def _fmt(value: float) -> str:
+    """요약 출력용 숫자 포맷 (큰 수는 천 단위 구분, 1 미만은 유효 숫자 3자리, -0은 0)"""
+    if abs(value) >= 100:
+        text = f"{value:,.0f}" if float(value).is_integer() else f"{value:,.1f}"
+    elif abs(value) >= 1:
+        text = f"{value:.2f}"
+    else:
+        # 0.003 → "0.003", 0.0456 → "0.0456" (소수 둘째 자리 반올림으로 0이 되지 않도록, 지수 표기 없이)
+        text = np.format_float_positional(value, precision=3, unique=False, fractional=False, trim="-")
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def _is_period_labels(header: str, labels: List[str]) -> bool:
+    """행 라벨이 시간 순서(날짜/기간)인지 - 첫 행→마지막 행 변화량이 의미 있는 표"""
+    return bool(_PERIOD_HEADER.search(header)) or all(_PERIOD_LABEL.match(label) for label in labels)
+
+
+def _split_row(line: str) -> List[str]:
+    return [cell.strip() for cell in line.split(",")]
+
+
+def _is_table_line(line: str) -> bool:
+    stripped = line.strip()
+    return "," in stripped and not stripped.startswith(("-", "•", "*"))
+
+
+def parse_blocks(raw_data: str) -> List[Tuple[str, object]]:
+    """
+    raw_data를 텍스트 블록과 표 블록으로 분리
+
+    Returns:
+        [("text", 줄 목록) 또는 ("table", DataFrame)] - 원본 순서 유지
+    """
+    lines = raw_data.strip("\n").splitlines()
+    blocks: List[Tuple[str, object]] = []
+    text: List[str] = []
+    i = 0
+
+    while i < len(lines):
+        if _is_table_line(lines[i]):
+            width = len(_split_row(lines[i]))
+            end = i + 1
+            while end < len(lines) and _is_table_line(lines[end]) and len(_split_row(lines[end])) == width:
+                end += 1
+
+            if end - i >= 3:
+                if text:
+                    blocks.append(("text", text))
+                    text = []
+                header = _split_row(lines[i])
+                rows = [_split_row(line) for line in lines[i + 1:end]]
+                blocks.append(("table", pd.DataFrame(rows, columns=header)))
+                i = end
+                continue
+
+        text.append(lines[i].strip())
+        i += 1
+
+    if text:
+        blocks.append(("text", text))
+    return blocks
+
+
+def digest_table(df: pd.DataFrame, top_k: int = 3) -> str:
+    """
+    표 하나를 열별 통계 요약으로 변환
+
+    Args:
+        df: 문자열 셀로 구성된 표
+        top_k: 숫자 열마다 표시할 상위 항목 수
+
+    Returns:
+        str: 열별 요약 (한 열당 한 줄)
+    """
+    # 첫 열 값이 모두 다르면 행 라벨(월, 지표명, 모델명 등)로 사용
+    first_col = df.columns[0]
+    label_col = first_col if df[first_col].is_unique else None
+    labels = df[label_col].tolist() if label_col else [f"{i + 1}행" for i in range(len(df))]
+    temporal = label_col is not None and _is_period_labels(label_col, labels)
+
+    parsed: Dict[str, Tuple[np.ndarray, Optional[str]]] = {}
+    for col in df.columns:
+        if col == label_col:
+            continue
+        values, units = zip(*(_parse_number(cell) for cell in df[col]))
+        numbers = np.array([np.nan if v is None else v for v in values], dtype=float)
+        # 80% 이상이 숫자로 해석되면 숫자 열로 취급 (단위가 섞이면 None)
+        if np.count_nonzero(~np.isnan(numbers)) >= 0.8 * len(numbers):
+            unit_set = {u for v, u in zip(values, units) if v is not None}
+            parsed[col] = (numbers, unit_set.pop() if len(unit_set) == 1 else None)
+
+    lines = [f"[표 요약] {len(df)}행 × {len(df.columns)}열" + (f" (기준 열: {label_col})" if label_col else "")]
+
+    for col in df.columns:
+        if col == label_col:
+            continue
+
+        if col not in parsed:
+            counts = df[col].value_counts()
+            lines.append(f"- {col}: 고유값 {len(counts)}개, 최빈 '{counts.index[0]}'({counts.iloc[0]}회)")
+            continue
+
+        numbers, unit = parsed[col]
+        valid = ~np.isnan(numbers)
+        vals = numbers[valid]
+        idx = np.flatnonzero(valid)
+        parts = []
+
+        if unit is None:
+            # 행마다 단위가 다른 열(지표가 행인 표): 합계/평균/변화는 의미가 없으므로 범위만 표시
+            cells = df[col].tolist()
+            parts.append(f"최소 {cells[idx[vals.argmin()]]}({labels[idx[vals.argmin()]]})")
+            parts.append(f"최대 {cells[idx[vals.argmax()]]}({labels[idx[vals.argmax()]]})")
+            lines.append(f"- {col}: " + ", ".join(parts))
+            continue
+
+        if unit not in _NON_ADDITIVE_UNITS:
+            parts.append(f"합계 {_fmt(vals.sum())}{unit}")
+        parts.append(f"평균 {_fmt(vals.mean())}{unit}")
+        parts.append(f"최소 {_fmt(vals.min())}{unit}({labels[idx[vals.argmin()]]})")
+        parts.append(f"최대 {_fmt(vals.max())}{unit}({labels[idx[vals.argmax()]]})")
+
+        if temporal:
+            first, last = vals[0], vals[-1]
+            change = _fmt(last - first)
+            delta = f"{labels[idx[0]]}→{labels[idx[-1]]} {'' if change.startswith('-') else '+'}{change}{unit}"
+            if first != 0:
+                delta += f" ({(last - first) / abs(first) * 100:+.1f}%)"
+            parts.append(delta)
+
+        order = np.argsort(-vals, kind="stable")[:top_k]
+        parts.append(f"상위{len(order)}: " + ", ".join(f"{labels[idx[j]]} {_fmt(vals[j])}{unit}" for j in order))
+
+        lines.append(f"- {col}: " + ", ".join(parts))
+
+    return "\n".join(lines)
+
+
+def sample_rows(df: pd.DataFrame, n: int = 3) -> str:
+    """첫 행과 마지막 행을 포함해 고르게 n개 행을 뽑아 원본 형식으로 반환"""
+    positions = sorted(set(np.linspace(0, len(df) - 1, num=min(n, len(df))).round().astype(int)))
+    rows = [", ".join(df.columns)] + [", ".join(df.iloc[p]) for p in positions]
+    return f"[샘플 행] {len(positions)}/{len(df)}행\n" + "\n".join(rows)
+
+
+def build_data_section(
+    raw_data: str,
+    mode: str = "raw",
+    top_k: int = 3,
+    sample_size: int = 3,
+    min_rows: int = DEFAULT_MIN_ROWS
+) -> str:
+    """
+    데이터 모드에 맞게 프롬프트의 데이터 영역 생성
+
+    Args:
+        raw_data: 테스트 케이스의 원본 데이터
+        mode: "raw", "digest", "digest+sample"
+        top_k: 숫자 열별 상위 항목 수
+        sample_size: digest+sample 모드의 샘플 행 수
+        min_rows: 요약할 최소 행 수 (이보다 작은 표는 요약이 더 길어지므로 원본 유지)
+
+    Returns:
+        str: 프롬프트에 넣을 데이터 (요약할 표가 없으면 원본 그대로)
+    """
+    if mode not in DATA_MODES:
+        raise ValueError(f"지원하지 않는 데이터 모드: {mode} (가능: {', '.join(DATA_MODES)})")
+    if mode == "raw":
+        return raw_data
+
+    blocks = parse_blocks(raw_data)
+    if not any(kind == "table" and len(block) >= min_rows for kind, block in blocks):
+        return raw_data
+
+    sections = []
+    for kind, block in blocks:
+        if kind == "text":
+            sections.append("\n".join(block))
+        elif len(block) < min_rows:
+            sections.append("\n".join([", ".join(block.columns)] + [", ".join(row) for row in block.values]))
+        else:
+            sections.append(digest_table(block, top_k=top_k))
+            if mode == "digest+sample":
+                sections.append(sample_rows(block, n=sample_size))
+
+    return "\n".join(sections)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="데이터 요약 확인")
+    parser.add_argument("--check", action="store_true",
+                        help="작은 수/음수 포맷과 시간 순서가 아닌 표의 변화량 생략 확인")
+    args = parser.parse_args()
+
+    if args.check:
+        failures = []
+        for value, expected in [(0.003, "0.003"), (0.045, "0.045"), (-0.004, "-0.004"), (0.0001234, "0.000123"),
+                                (-0.0, "0"), (-0.00000001, "-0.00000001"), (0.5, "0.5"), (12.5, "12.5"),
+                                (-3.25, "-3.25"), (1234.5, "1,234.5"), (-250.0, "-250")]:
+            status = "통과" if _fmt(value) == expected else "실패"
+            print(f"_fmt({value!r}) = {_fmt(value)!r} (기대 {expected!r}) → {status}")
+            if status == "실패":
+                failures.append(value)
+
+        months = "\n".join(f"2024-{m:02d}, 0.00{m}%, {-m}" for m in range(1, 10))
+        rate = digest_table(parse_blocks("월, 전환율, 손익\n" + months)[0][1])
+        features = digest_table(parse_blocks(
+            "피처, 중요도\n" + "\n".join(f"f{i}, 0.0{9 - i}" for i in range(9))
+        )[0][1])
+        for name, digest, expected, absent in [
+            ("작은 비율 열", rate, ["최소 0.001%(2024-01)", "2024-01→2024-09 +0.008% (+800.0%)"], []),
+            ("음수 열", rate, ["최대 -1(2024-01)", "2024-01→2024-09 -8 (-800.0%)"], []),
+            ("피처 중요도 표", features, ["최대 0.09(f0)"], ["→"]),
+        ]:
+            ok = all(text in digest for text in expected) and not any(text in digest for text in absent)
+            print(f"{name}: {'통과' if ok else '실패'}")
+            if not ok:
+                print(digest)
+                failures.append(name)
+        raise SystemExit(1 if failures else 0)
+
+    parser.print_help()
@@ -0,0 +1,541 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+코드 스니펫 축소기 (Code Snippet Minifier)
+================================================================================
+
+## 이 모듈의 목적
+개발 프롬프트에 들어가는 코드 스니펫에서 주석, docstring, 빈 줄, 불필요한 공백을 제거하여
+**CPU 추론의 prefill 토큰 수를 줄입니다.**
+
+## 언어별 처리 방식
+- Python: `tokenize`로 주석/문자열 위치를 찾고 `ast`로 docstring을 식별
+  (들여쓰기는 블록 깊이당 1칸으로 정규화, 문법은 그대로 유지)
+- JavaScript/TypeScript/Java/Go/Rust: 문자열·템플릿 리터럴·정규식 리터럴을 인식하는
+  보수적인 lexer로 `//`, `/* */` 주석 제거 + 공백 축소
+- 파싱 실패 또는 기타 언어: `#` 주석을 인식하는 같은 lexer로 처리
+
+## 라인 번호 매핑
+축소 후에도 원본 라인 번호를 복원할 수 있도록 `line_map`을 함께 반환합니다.
+`line_map[i]`는 축소된 코드의 (i+1)번째 줄이 원본의 몇 번째 줄인지를 나타냅니다.
+LLM 응답의 "L3", "라인 3" 같은 참조는 `remap_line_numbers()`로 원본 기준으로 바꿀 수 있습니다.
+
+## 사용 예시
+
+```python
+from templates.development.code_minifier import minify_code
+
+minified = minify_code(test_case.code_snippet, "python")
+prompt = get_code_review_prompt_v2(code=minified.code, ...)
+response = minified.remap_line_numbers(response)
+```
+
+## 언어별 토큰 절감 / 왕복 확인
+```bash
+python -m templates.development.code_minifier
+python -m templates.development.code_minifier --check   # 축소 후에도 같은 코드인지 (Python AST, JS/TS 리터럴)
+```
+================================================================================
+"""
+
+import ast
+import io
+import re
+import tokenize
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+
+# 보수적 lexer를 사용하는 C 계열 언어
+C_LIKE_LANGUAGES = {"javascript", "typescript", "java", "go", "rust"}
+
+# 정규식 리터럴이 올 수 있는 직전 문자 (JavaScript/TypeScript)
+_REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^")
+
+# 응답 내 라인 참조 패턴: L12, 라인 12, line 12, Line 12
+_LINE_REF_PATTERN = re.compile(r"(\bL|\b[Ll]ine\s*|라인\s*)(\d+)")
+
+
+@dataclass
+class MinifiedCode:
+    """
+    축소된 코드 스니펫
+
+    Attributes:
+        code: 축소된 코드
+        line_map: 축소 코드 라인(0-based 인덱스) → 원본 라인 번호(1-based)
+        language: 코드 언어
+        method: 사용된 처리 방식 ("python", "lexer")
+    """
+    code: str
+    line_map: List[int] = field(default_factory=list)
+    language: str = ""
+    method: str = ""
+
+    def original_line(self, line_no: int) -> Optional[int]:
+        """축소 코드의 라인 번호(1-based)를 원본 라인 번호로 변환"""
+        if 1 <= line_no <= len(self.line_map):
+            return self.line_map[line_no - 1]
+        return None
+
+    def remap_line_numbers(self, text: str) -> str:
+        """LLM 응답의 라인 참조(L12, 라인 12 등)를 원본 라인 번호로 치환"""
+        def _replace(match):
+            original = self.original_line(int(match.group(2)))
+            if original is None:
+                return match.group(0)
+            return f"{match.group(1)}{original}"
+
+        return _LINE_REF_PATTERN.sub(_replace, text)
+
+
+# ============================================================================
+# Python: tokenize + ast
+# ============================================================================
+
+def _python_docstring_rows(source: str, tokens: List[tokenize.TokenInfo]) -> Dict[int, bool]:
+    """
+    제거 가능한 docstring의 라인 범위
+
+    Returns:
+        {라인 번호: 대체 필요 여부} - 본문이 docstring 하나뿐이면 첫 줄을 `...`로 대체
+    """
+    tree = ast.parse(source)
+    rows: Dict[int, bool] = {}
+
+    # 라인별로 docstring 외의 토큰이 있는지 확인 (def f(): """doc""" 같은 한 줄 정의는 유지)
+    other_rows: Set[int] = set()
+    for tok in tokens:
+        if tok.type not in (tokenize.STRING, tokenize.NEWLINE, tokenize.NL, tokenize.COMMENT,
+                            tokenize.INDENT, tokenize.DEDENT, tokenize.ENDMARKER):
+            other_rows.add(tok.start[0])
+
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if not node.body:
+            continue
+        first = node.body[0]
+        if not (isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant)
+                and isinstance(first.value.value, str)):
+            continue
+
+        span = range(first.lineno, first.end_lineno + 1)
+        if any(row in other_rows for row in span):
+            continue
+
+        needs_placeholder = len(node.body) == 1 and not isinstance(node, ast.Module)
+        for row in span:
+            rows[row] = needs_placeholder and row == first.lineno
+
+    return rows
+
+
+def _minify_python(code: str) -> MinifiedCode:
+    """Python 코드 축소 (SyntaxError/TokenError 시 예외 전파)"""
+    tokens = list(tokenize.generate_tokens(io.StringIO(code).readline))
+    docstring_rows = _python_docstring_rows(code, tokens)
+
+    comment_cols: Dict[int, int] = {}
+    verbatim_rows: Set[int] = set()   # 여러 줄 문자열 내부 라인 (원문 유지)
+    string_tail_rows: Set[int] = set()  # 여러 줄 문자열이 시작되는 라인 (뒤 공백 유지)
+    logical_depth: Dict[int, int] = {}
+
+    depth = 0
+    at_line_start = True
+    for tok in tokens:
+        if tok.type == tokenize.INDENT:
+            depth += 1
+        elif tok.type == tokenize.DEDENT:
+            depth -= 1
+        elif tok.type == tokenize.COMMENT:
+            comment_cols[tok.start[0]] = tok.start[1]
+        elif tok.type == tokenize.NEWLINE:
+            at_line_start = True
+        elif tok.type not in (tokenize.NL, tokenize.ENDMARKER):
+            if at_line_start:
+                logical_depth[tok.start[0]] = depth
+                at_line_start = False
+            if tok.start[0] != tok.end[0]:
+                string_tail_rows.add(tok.start[0])
+                verbatim_rows.update(range(tok.start[0] + 1, tok.end[0] + 1))
+
+    lines = code.splitlines()
+    out_lines: List[str] = []
+    line_map: List[int] = []
+    current_depth = 0
+
+    for row, line in enumerate(lines, 1):
+        if row in docstring_rows:
+            if docstring_rows[row]:
+                out_lines.append(" " * logical_depth.get(row, 0) + "...")
+                line_map.append(row)
+            continue
+
+        if row in verbatim_rows:
+            out_lines.append(line)
+            line_map.append(row)
+            continue
+
+        if row in comment_cols:
+            line = line[:comment_cols[row]]
+        if row not in string_tail_rows:
+            line = line.rstrip()
+
+        stripped = line.lstrip()
+        if not stripped:
+            continue
+
+        # 논리 라인 시작은 블록 깊이로, 괄호 안 연속 라인은 깊이+1로 들여쓰기
+        if row in logical_depth:
+            current_depth = logical_depth[row]
+            indent = current_depth
+        else:
+            indent = current_depth + 1
+        out_lines.append(" " * indent + stripped)
+        line_map.append(row)
+
+    return MinifiedCode(code="\n".join(out_lines), line_map=line_map, language="python", method="python")
+
+
+# ============================================================================
+# JavaScript/TypeScript/Java/Go/Rust: 보수적 lexer
+# ============================================================================
+
+def _string_end(code: str, start: int, escapes: bool = True) -> int:
+    """
+    start의 따옴표로 시작하는 문자열 리터럴의 끝 (닫는 따옴표 다음 인덱스)
+
+    escapes=False는 Go raw string(`...`)처럼 역슬래시가 이스케이프가 아닌 리터럴.
+    줄바꿈이 나오면 닫히지 않은 문자열로 보고 그 앞에서 끝냄 (백틱 리터럴은 여러 줄 허용)
+    """
+    quote, n = code[start], len(code)
+    end = start + 1
+    while end < n and code[end] != quote:
+        if code[end] == "\\" and escapes:
+            end += 1
+        elif code[end] == "\n" and quote != "`":
+            return end
+        end += 1
+    return min(end + 1, n)
+
+
+def _template_end(code: str, start: int) -> int:
+    """
+    JavaScript/TypeScript 템플릿 리터럴의 끝 (닫는 백틱 다음 인덱스)
+
+    역슬래시 이스케이프(\\`, \\$)를 따르고, ${ ... } 안은 중괄호 깊이와
+    중첩 문자열/템플릿 리터럴을 따라가며 닫는 } 까지 건너뜀
+    """
+    n = len(code)
+    end = start + 1
+    while end < n:
+        ch = code[end]
+        if ch == "\\":
+            end += 2
+        elif ch == "`":
+            return end + 1
+        elif code.startswith("${", end):
+            end += 2
+            depth = 1
+            while end < n and depth:
+                ch = code[end]
+                if ch == "`":
+                    end = _template_end(code, end)
+                    continue
+                if ch in "\"'":
+                    end = _string_end(code, end)
+                    continue
+                if ch == "{":
+                    depth += 1
+                elif ch == "}":
+                    depth -= 1
+                end += 1
+        else:
+            end += 1
+    return n
+
+
+def _strip_comments(code: str, language: str, line_comment: str) -> Tuple[str, Set[int]]:
+    """
+    문자열/리터럴을 건드리지 않고 주석만 제거
+
+    Returns:
+        (주석이 제거된 코드, 문자열 내부에서 시작하는 라인 번호 집합)
+        줄 수는 원본과 동일하게 유지 (블록 주석 안의 줄바꿈 보존)
+    """
+    out: List[str] = []
+    verbatim_rows: Set[int] = set()
+    i, n, row = 0, len(code), 1
+    last_code_char = ""
+    if language in ("javascript", "typescript", "go"):
+        quotes = "\"'`"
+    elif language in ("java", "rust"):
+        quotes = "\""
+    else:
+        quotes = "\"'"
+
+    while i < n:
+        ch = code[i]
+
+        if ch == "\n":
+            out.append(ch)
+            row += 1
+            i += 1
+            continue
+
+        # 라인 주석
+        if code.startswith(line_comment, i):
+            end = code.find("\n", i)
+            i = n if end == -1 else end
+            continue
+
+        # 블록 주석 (C 계열) - 토큰이 붙지 않도록 공백 하나로 대체, 줄바꿈은 유지
+        if line_comment == "//" and code.startswith("/*", i):
+            end = code.find("*/", i + 2)
+            end = n if end == -1 else end + 2
+            newlines = code.count("\n", i, end)
+            out.append("\n" * newlines if newlines else " ")
+            row += newlines
+            i = end
+            continue
+
+        # 문자열 / 템플릿 리터럴 / Go raw string
+        if ch in quotes or (ch == "'" and language in ("java", "rust")):
+            if ch == "'" and language in ("java", "rust"):
+                # 문자 리터럴만 인식 (Rust 라이프타임 'a 는 코드로 취급)
+                match = re.match(r"'(\\.[^']*|[^\\'])'", code[i:])
+                if not match:
+                    out.append(ch)
+                    last_code_char = ch
+                    i += 1
+                    continue
+                end = i + match.end()
+            elif ch == "`" and language in ("javascript", "typescript"):
+                end = _template_end(code, i)
+            else:
+                end = _string_end(code, i, escapes=not (ch == "`" and language == "go"))
+            literal = code[i:end]
+            newlines = literal.count("\n")
+            verbatim_rows.update(range(row + 1, row + newlines + 1))
+            row += newlines
+            out.append(literal)
+            last_code_char = ch
+            i = end
+            continue
+
+        # 정규식 리터럴 (JavaScript/TypeScript): 내부의 // 를 주석으로 오인하지 않도록
+        if ch == "/" and language in ("javascript", "typescript") and \
+                (last_code_char == "" or last_code_char in _REGEX_PRECEDERS):
+            match = re.match(r"/(\\.|\[(\\.|[^\]\\\n])*\]|[^/\\\n\[])+/[a-z]*", code[i:])
+            if match:
+                out.append(match.group(0))
+                last_code_char = "/"
+                i += match.end()
+                continue
+
+        out.append(ch)
+        if not ch.isspace():
+            last_code_char = ch
+        i += 1
+
+    return "".join(out), verbatim_rows
+
+
+def _collapse_inline_spaces(line: str) -> str:
+    """문자열 리터럴 밖의 연속 공백을 하나로 축소"""
+    parts = re.split(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'|`(?:\\.|[^`\\])*`)", line)
+    for idx in range(0, len(parts), 2):
+        parts[idx] = re.sub(r"[ \t]{2,}", " ", parts[idx])
+    return "".join(parts)
+
+
+def _minify_lexer(code: str, language: str, line_comment: str) -> MinifiedCode:
+    """보수적 lexer 기반 축소 (들여쓰기는 감지된 단위당 1칸으로 정규화)"""
+    stripped_code, verbatim_rows = _strip_comments(code, language, line_comment)
+    lines = stripped_code.split("\n")
+
+    widths = [
+        len(line.expandtabs(4)) - len(line.expandtabs(4).lstrip())
+        for row, line in enumerate(lines, 1)
+        if line.strip() and row not in verbatim_rows
+    ]
+    unit = min((w for w in widths if w > 0), default=1)
+
+    out_lines: List[str] = []
+    line_map: List[int] = []
+    for row, line in enumerate(lines, 1):
+        if row in verbatim_rows:
+            out_lines.append(line)
+            line_map.append(row)
+            continue
+
+        line = line.rstrip()
+        if not line.strip():
+            continue
+
+        expanded = line.expandtabs(4)
+        depth = (len(expanded) - len(expanded.lstrip())) // unit
+        out_lines.append(" " * depth + _collapse_inline_spaces(line.strip()))
+        line_map.append(row)
+
+    return MinifiedCode(code="\n".join(out_lines), line_map=line_map, language=language, method="lexer")
+
+
+# ============================================================================
+# 공개 API
+# ============================================================================
+
+def minify_code(code: str, language: str) -> MinifiedCode:
+    """
+    언어에 맞는 방식으로 코드 스니펫 축소
+
+    Args:
+        code: 원본 코드 스니펫
+        language: 코드 언어 (python, javascript, typescript, java, go, rust)
+
+    Returns:
+        MinifiedCode: 축소된 코드와 원본 라인 매핑
+
+    Note:
+        Python 스니펫이 파싱되지 않으면 (YAML, Terraform 등이 섞인 경우)
+        `#` 주석을 인식하는 lexer로 대체 처리합니다.
+    """
+    language = (language or "").lower()
+
+    if language == "python":
+        try:
+            return _minify_python(code)
+        except (SyntaxError, tokenize.TokenError, IndentationError):
+            return _minify_lexer(code, language, "#")
+
+    if language in C_LIKE_LANGUAGES:
+        return _minify_lexer(code, language, "//")
+
+    return _minify_lexer(code, language, "#")
+
+
+def collapse_whitespace(code: str) -> MinifiedCode:
+    """
+    주석은 유지하고 빈 줄과 줄 끝 공백만 제거
+
+    문서화 프롬프트처럼 주석 자체가 정보인 스니펫
+    (예: 디렉토리 구조를 주석으로 설명한 아키텍처 케이스)에 사용합니다.
+    """
+    out_lines: List[str] = []
+    line_map: List[int] = []
+    for row, line in enumerate(code.splitlines(), 1):
+        if line.strip():
+            out_lines.append(line.rstrip())
+            line_map.append(row)
+    return MinifiedCode(code="\n".join(out_lines), line_map=line_map, method="whitespace")
+
+
+# lexer 왕복 확인용 스니펫 (원본, 기대 결과) - 리터럴 안의 // 와 이스케이프가 보존되어야 함
+LEXER_ROUND_TRIP_CASES = [
+    ("javascript",
+     "const s = `a \\` // not comment`;  // comment\n",
+     "const s = `a \\` // not comment`;"),
+    ("typescript",
+     "const url: string = `${base}/${path.join(\"a\", `b // c`)}//x`; /* c */\nlet t = `${ {k: '}'}.k } // y`;\n",
+     "const url: string = `${base}/${path.join(\"a\", `b // c`)}//x`;\nlet t = `${ {k: '}'}.k } // y`;"),
+    ("javascript",
+     "const msg = \"say \\\" // hi\";  // trailing\nconst re = /\\/\\//g;\n",
+     "const msg = \"say \\\" // hi\";\nconst re = /\\/\\//g;"),
+    ("go",
+     "path := `C:\\dir\\` // raw string ends at backtick\n",
+     "path := `C:\\dir\\`"),
+]
+
+
+def check_round_trip() -> List[str]:
+    """
+    축소 결과가 원본과 같은 코드인지 확인
+
+    - Python 스니펫: 축소 후에도 파싱되고 docstring을 뺀 AST가 원본과 같아야 함
+    - LEXER_ROUND_TRIP_CASES: 기대 결과와 정확히 같아야 함 (템플릿 리터럴, 이스케이프)
+
+    Returns:
+        List[str]: 실패 설명 (비어 있으면 통과)
+    """
+    from evaluation.development_test_cases import get_all_development_test_cases
+
+    def _python_ast(source: str) -> str:
+        tree = ast.parse(source)
+        for node in ast.walk(tree):
+            body = getattr(node, "body", None)
+            if isinstance(body, list) and body and isinstance(body[0], ast.Expr) and \
+                    isinstance(body[0].value, ast.Constant) and isinstance(body[0].value.value, str):
+                if len(body) > 1:
+                    del body[0]  # 다른 문장이 있으면 docstring 제거
+                else:
+                    body[0] = ast.Expr(ast.Constant(...))  # 본문이 docstring뿐이면 "..."으로 축약
+        return ast.dump(tree)
+
+    failures = []
+    for tc in get_all_development_test_cases():
+        if tc.language != "python":
+            continue
+        try:
+            expected = _python_ast(tc.code_snippet)
+        except SyntaxError:
+            continue  # 파싱되지 않는 스니펫은 lexer로 처리 (비교 대상 아님)
+        minified = minify_code(tc.code_snippet, "python")
+        try:
+            if _python_ast(minified.code) != expected:
+                failures.append(f"{tc.id}: AST가 원본과 다름")
+        except SyntaxError as e:
+            failures.append(f"{tc.id}: 축소 결과 파싱 실패 ({e})")
+
+    for language, source, expected in LEXER_ROUND_TRIP_CASES:
+        minified = minify_code(source, language)
+        if minified.code != expected:
+            failures.append(f"{language}: {source!r} → {minified.code!r} (기대: {expected!r})")
+    return failures
+
+
+def print_minify_stats():
+    """개발 테스트 케이스 전체에 대한 언어별 토큰 절감률 출력"""
+    import tiktoken
+    from evaluation.development_test_cases import get_all_development_test_cases
+
+    enc = tiktoken.encoding_for_model("gpt-3.5-turbo")
+    stats: Dict[str, Dict[str, int]] = {}
+
+    for tc in get_all_development_test_cases():
+        minified = minify_code(tc.code_snippet, tc.language)
+        lang = stats.setdefault(tc.language, {"count": 0, "raw": 0, "minified": 0})
+        lang["count"] += 1
+        lang["raw"] += len(enc.encode(tc.code_snippet))
+        lang["minified"] += len(enc.encode(minified.code))
+
+    print("=" * 60)
+    print("코드 스니펫 축소 - 언어별 토큰 절감")
+    print("=" * 60)
+    print(f"{'언어':<12}{'케이스':>6}{'원본':>10}{'축소':>10}{'절감률':>10}")
+    for language, s in sorted(stats.items(), key=lambda x: -x[1]["count"]):
+        saving = (1 - s["minified"] / s["raw"]) * 100 if s["raw"] else 0
+        print(f"{language:<12}{s['count']:>6}{s['raw']:>10,}{s['minified']:>10,}{saving:>9.1f}%")
+
+    raw = sum(s["raw"] for s in stats.values())
+    minified = sum(s["minified"] for s in stats.values())
+    print(f"{'전체':<12}{sum(s['count'] for s in stats.values()):>6}{raw:>10,}{minified:>10,}"
+          f"{(1 - minified / raw) * 100:>9.1f}%")
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="코드 스니펫 축소 - 언어별 토큰 절감 / 왕복 확인")
+    parser.add_argument("--check", action="store_true",
+                        help="축소 결과가 원본과 같은 코드인지 확인 (Python AST, JS/TS/Go 리터럴 케이스)")
+    args = parser.parse_args()
+
+    if args.check:
+        failures = check_round_trip()
+        for failure in failures:
+            print(f"실패: {failure}")
+        print("왕복 확인: " + ("통과" if not failures else f"{len(failures)}건 실패"))
+        sys.exit(1 if failures else 0)
+    print_minify_stats()
@@ -31,6 +31,12 @@
 - Go: GoDoc
 - Rust: Rustdoc
 
+### 5. 언어별 조각 조립 + 캐시
+- API 클라이언트 예시, README 설치 가이드, 주석 스타일 가이드, 아키텍처 구조 관례를 언어별 조각으로 분리
+- 케이스의 언어에 해당하는 조각만 템플릿에 삽입 (문서 유형 × 언어마다 최초 1회 조립 후 캐시)
+- language 미지정 시 기존 고정 블록 그대로 (하위 호환)
+- 언어별 토큰 비교: `python -m templates.development.documentation_v2`
+
 ## 평가 기준 최적화
 - issue_detection_rate * 4 (최대 4점) → 동적 섹션으로 극대화
 - has_code_block (2점) → 예시 코드 반드시 포함
@@ -40,6 +46,7 @@
 ================================================================================
 """
 
+from functools import lru_cache
 from typing import List, Optional
 
 
@@ -252,32 +259,7 @@ curl -X {http_method} '{endpoint}' \\
 | RATE_LIMITED | 429 | 요청 제한 초과 | 잠시 후 재시도 |
 
 ## 사용 예시
-
-### Python
-```python
-import requests
-
-response = requests.{http_method_lower}(
-    '{endpoint}',
-    headers={{'Authorization': 'Bearer YOUR_API_KEY'}},
-    json={{'param1': 'value1'}}
-)
-print(response.json())
-```
-
-### JavaScript
-```javascript
-const response = await fetch('{endpoint}', {{
-  method: '{http_method}',
-  headers: {{
-    'Authorization': 'Bearer YOUR_API_KEY',
-    'Content-Type': 'application/json'
-  }},
-  body: JSON.stringify({{ param1: 'value1' }})
-}});
-const data = await response.json();
-```
-
+{client_examples}
 ---
 
 ## STEP 5: 문서 검토
@@ -423,18 +405,7 @@ README 구조:
 - [요구 사항 1]
 - [요구 사항 2]
 
-### 패키지 매니저로 설치
-```bash
-[설치 명령어]
-```
-
-### 소스에서 빌드
-```bash
-git clone [repository]
-cd {project_name}
-[빌드 명령어]
-```
-
+{install_guide}
 ## 사용법
 
 ### 기본 사용법
@@ -721,7 +692,7 @@ ARCHITECTURE_DOC_V2_TEMPLATE = """## 역할: 소프트웨어 아키텍트 & 테
 3. 컴포넌트 (Components)
 4. 코드 (선택)
 5. 배포 (Deployment)
-6. 횡단 관심사 (Cross-cutting concerns)
+6. 횡단 관심사 (Cross-cutting concerns){language_conventions}
 
 ---
 
@@ -1027,6 +998,205 @@ def function_name(param1: str, param2: int = 0) -> bool:
 }
 
 
+# ============================================================================
+# 언어별 프롬프트 조각 (문서 유형 × 언어)
+# ============================================================================
+# 템플릿에는 해당 언어의 조각만 삽입합니다.
+# API/README 조각은 템플릿 문법({endpoint} 등)을 그대로 사용하고,
+# 스타일 가이드/아키텍처 관례는 문자 그대로 삽입됩니다.
+
+API_CLIENT_EXAMPLES = {
+    "python": """
+### Python
+```python
+import requests
+
+response = requests.{http_method_lower}(
+    '{endpoint}',
+    headers={{'Authorization': 'Bearer YOUR_API_KEY'}},
+    json={{'param1': 'value1'}}
+)
+print(response.json())
+```
+""",
+    "javascript": """
+### JavaScript
+```javascript
+const response = await fetch('{endpoint}', {{
+  method: '{http_method}',
+  headers: {{
+    'Authorization': 'Bearer YOUR_API_KEY',
+    'Content-Type': 'application/json'
+  }},
+  body: JSON.stringify({{ param1: 'value1' }})
+}});
+const data = await response.json();
+```
+""",
+    "typescript": """
+### TypeScript
+```typescript
+const response = await fetch('{endpoint}', {{
+  method: '{http_method}',
+  headers: {{ 'Authorization': 'Bearer YOUR_API_KEY', 'Content-Type': 'application/json' }},
+  body: JSON.stringify({{ param1: 'value1' }})
+}});
+const data: ApiResponse = await response.json();
+```
+""",
+    "java": """
+### Java
+```java
+HttpRequest request = HttpRequest.newBuilder(URI.create("{endpoint}"))
+    .header("Authorization", "Bearer YOUR_API_KEY")
+    .header("Content-Type", "application/json")
+    .method("{http_method}", HttpRequest.BodyPublishers.ofString("{{\\"param1\\": \\"value1\\"}}"))
+    .build();
+HttpResponse<String> response = HttpClient.newHttpClient().send(request, HttpResponse.BodyHandlers.ofString());
+```
+""",
+    "go": """
+### Go
+```go
+body := strings.NewReader(`{{"param1": "value1"}}`)
+req, _ := http.NewRequest("{http_method}", "{endpoint}", body)
+req.Header.Set("Authorization", "Bearer YOUR_API_KEY")
+req.Header.Set("Content-Type", "application/json")
+resp, err := http.DefaultClient.Do(req)
+```
+""",
+    "rust": """
+### Rust
+```rust
+let resp = reqwest::Client::new()
+    .request(reqwest::Method::{http_method}, "{endpoint}")
+    .bearer_auth("YOUR_API_KEY")
+    .json(&serde_json::json!({{ "param1": "value1" }}))
+    .send()
+    .await?;
+```
+""",
+}
+
+README_INSTALL_GUIDES = {
+    "python": """### 설치
+```bash
+pip install [패키지명]
+# 또는 소스에서 설치
+git clone [repository] && cd {project_name} && pip install -e .
+```
+""",
+    "javascript": """### 설치
+```bash
+npm install [패키지명]
+# 또는 소스에서 빌드
+git clone [repository] && cd {project_name} && npm install && npm run build
+```
+""",
+    "typescript": """### 설치
+```bash
+npm install [패키지명]
+# 타입 정의 포함, 소스에서 빌드 시
+git clone [repository] && cd {project_name} && npm install && npx tsc
+```
+""",
+    "java": """### 설치
+```xml
+<!-- Maven -->
+<dependency>
+  <groupId>[group]</groupId>
+  <artifactId>{project_name}</artifactId>
+  <version>[버전]</version>
+</dependency>
+```
+""",
+    "go": """### 설치
+```bash
+go get [모듈 경로]
+# 또는 소스에서 빌드
+git clone [repository] && cd {project_name} && go build ./...
+```
+""",
+    "rust": """### 설치
+```bash
+cargo add [크레이트명]
+# 또는 소스에서 빌드
+git clone [repository] && cd {project_name} && cargo build --release
+```
+""",
+}
+
+ARCHITECTURE_CONVENTIONS = {
+    "python": "패키지/모듈 단위 계층 분리, 의존성 주입은 생성자 인자로, 설정은 환경변수 + pydantic Settings",
+    "javascript": "모듈(ESM) 단위 분리, 서비스 간 통신은 이벤트/메시지 큐, 설정은 .env",
+    "typescript": "인터페이스로 계층 경계 정의, 타입 공유 패키지 분리, 설정은 .env",
+    "java": "Spring 계층 구조 (Controller → Service → Repository), 인터페이스 기반 포트/어댑터",
+    "go": "cmd/ · internal/ · pkg/ 디렉토리 구조, 인터페이스는 사용하는 쪽에서 정의, goroutine/channel 동시성",
+    "rust": "크레이트/모듈 단위 분리, trait 기반 추상화, 소유권 경계가 곧 컴포넌트 경계",
+}
+
+# 언어를 지정하지 않았을 때의 기존 고정 블록 (하위 호환)
+_DEFAULT_FRAGMENTS = {
+    "api": API_CLIENT_EXAMPLES["python"] + API_CLIENT_EXAMPLES["javascript"],
+    "readme": """### 패키지 매니저로 설치
+```bash
+[설치 명령어]
+```
+
+### 소스에서 빌드
+```bash
+git clone [repository]
+cd {project_name}
+[빌드 명령어]
+```
+""",
+    "architecture": "",
+}
+
+# 문서 유형별 (기본 템플릿, 조각 자리표시자, 조각 사전, 조각이 템플릿 문법인지 여부)
+_TEMPLATE_PARTS = {
+    "api": (API_DOCUMENTATION_V2_TEMPLATE, "{client_examples}", API_CLIENT_EXAMPLES, True),
+    "readme": (README_DOCUMENTATION_V2_TEMPLATE, "{install_guide}", README_INSTALL_GUIDES, True),
+    "comments": (CODE_COMMENTS_V2_TEMPLATE, "{style_guide}", STYLE_GUIDES, False),
+    "architecture": (ARCHITECTURE_DOC_V2_TEMPLATE, "{language_conventions}", ARCHITECTURE_CONVENTIONS, False),
+}
+
+
+def get_language_fragment(doc_type: str, language: Optional[str]) -> str:
+    """
+    문서 유형과 언어에 해당하는 조각 반환
+
+    language가 None이면 기존 고정 블록을, 조각이 없는 언어면
+    (주석 문서화는 Python 스타일, 나머지는 기존 고정 블록으로) 대체합니다.
+    """
+    fragments = _TEMPLATE_PARTS[doc_type][2]
+    if language is not None and language.lower() in fragments:
+        fragment = fragments[language.lower()]
+    elif doc_type == "comments":
+        fragment = STYLE_GUIDES["python"]
+    else:
+        fragment = _DEFAULT_FRAGMENTS[doc_type]
+
+    if doc_type == "architecture" and fragment:
+        fragment = f"\n\n**{language} 구조 관례**: {fragment}"
+    return fragment
+
+
+@lru_cache(maxsize=None)
+def get_language_template(doc_type: str, language: Optional[str] = None) -> str:
+    """
+    언어별 조각을 삽입한 템플릿 (문서 유형 × 언어마다 최초 1회만 조립)
+
+    Returns:
+        str: .format()으로 렌더링할 템플릿
+    """
+    template, placeholder, _, is_template_syntax = _TEMPLATE_PARTS[doc_type]
+    fragment = get_language_fragment(doc_type, language)
+    if not is_template_syntax:
+        fragment = fragment.replace("{", "{{").replace("}", "}}")
+    return template.replace(placeholder, fragment)
+
+
 # ============================================================================
 # 프롬프트 생성 함수
 # ============================================================================
@@ -1041,17 +1211,20 @@ def get_api_documentation_prompt_v2(
     response_format: str,
     auth_method: str = "Bearer Token",
     error_codes: str = "",
-    rate_limit: str = "1000 requests/hour"
+    rate_limit: str = "1000 requests/hour",
+    language: Optional[str] = None
 ) -> str:
     """
     API 문서화 프롬프트 V2.0 생성
 
     핵심 개선: expected_elements를 동적 섹션으로 변환
+    language 지정 시 해당 언어의 클라이언트 예시만 포함 (미지정 시 Python + JavaScript)
     """
     checklist = _build_doc_checklist(expected_elements)
     doc_sections = _build_doc_sections(expected_elements)
+    template = get_language_template("api", language.lower() if language else None)
 
-    return API_DOCUMENTATION_V2_TEMPLATE.format(
+    return template.format(
         api_name=api_name,
         endpoint=endpoint,
         http_method=http_method,
@@ -1076,17 +1249,19 @@ def get_readme_prompt_v2(
     code_snippet: str,
     installation: str = "",
     target_users: str = "개발자",
-    language: str = "python"
+    language: Optional[str] = None
 ) -> str:
     """
     README 문서 프롬프트 V2.0 생성
 
     핵심 개선: expected_elements를 동적 섹션으로 변환
+    language 지정 시 해당 언어의 설치 가이드만 포함 (미지정 시 Python 코드 블록 + 일반 설치 안내)
     """
     checklist = _build_doc_checklist(expected_elements)
     doc_sections = _build_doc_sections(expected_elements)
+    template = get_language_template("readme", language.lower() if language else None)
 
-    return README_DOCUMENTATION_V2_TEMPLATE.format(
+    return template.format(
         project_name=project_name,
         one_liner=one_liner,
         main_features=main_features,
@@ -1094,7 +1269,7 @@ def get_readme_prompt_v2(
         installation=installation or "pip install 또는 npm install",
         target_users=target_users,
         code_snippet=code_snippet,
-        language=language,
+        language=(language or "python").lower(),
         checklist=checklist,
         doc_sections=doc_sections
     )
@@ -1125,17 +1300,16 @@ def get_code_comments_prompt_v2(
     if not doc_style:
         doc_style = default_styles.get(language.lower(), "표준 스타일")
 
-    style_guide = STYLE_GUIDES.get(language.lower(), STYLE_GUIDES["python"])
     checklist = _build_doc_checklist(expected_elements)
     doc_sections = _build_doc_sections(expected_elements)
+    template = get_language_template("comments", language.lower())
 
-    return CODE_COMMENTS_V2_TEMPLATE.format(
+    return template.format(
         code=code,
         language=language,
         language_lower=language.lower(),
         code_purpose=code_purpose or "명시되지 않음",
         doc_style=doc_style,
-        style_guide=style_guide,
         checklist=checklist,
         doc_sections=doc_sections
     )
@@ -1151,17 +1325,20 @@ def get_architecture_doc_prompt_v2(
     external_systems: str = "",
     data_flow: str = "",
     target_audience: str = "개발팀, 아키텍트",
-    doc_level: str = "상세"
+    doc_level: str = "상세",
+    language: Optional[str] = None
 ) -> str:
     """
     아키텍처 문서 프롬프트 V2.0 생성
 
     핵심 개선: expected_elements를 동적 섹션으로 변환
+    language 지정 시 해당 언어의 구조 관례 한 줄을 추가
     """
     checklist = _build_doc_checklist(expected_elements)
     doc_sections = _build_doc_sections(expected_elements)
+    template = get_language_template("architecture", language.lower() if language else None)
 
-    return ARCHITECTURE_DOC_V2_TEMPLATE.format(
+    return template.format(
         system_name=system_name,
         system_purpose=system_purpose,
         main_features=main_features,
@@ -1174,3 +1351,63 @@ def get_architecture_doc_prompt_v2(
         checklist=checklist,
         doc_sections=doc_sections
     )
+
+
+# ============================================================================
+# 언어별 토큰 절감 리포트
+# ============================================================================
+
+def _render_for_report(test_case, language: Optional[str]) -> str:
+    """개발자 실험 실행기와 같은 인자로 문서화 프롬프트 렌더링 (language=None이면 기존 고정 블록)"""
+    if test_case.subcategory == "api":
+        return get_api_documentation_prompt_v2(
+            api_name="API 엔드포인트", endpoint="/api/example", http_method="POST",
+            api_purpose="데이터 처리", expected_elements=test_case.expected_issues,
+            request_params="JSON 본문", response_format="JSON 응답", language=language
+        )
+    if test_case.subcategory == "readme":
+        return get_readme_prompt_v2(
+            project_name="Example Project", one_liner="예제 프로젝트입니다", main_features="주요 기능",
+            tech_stack=test_case.language, expected_elements=test_case.expected_issues,
+            code_snippet=test_case.code_snippet, language=language
+        )
+    if test_case.subcategory == "comments":
+        return get_code_comments_prompt_v2(
+            code=test_case.code_snippet, language=test_case.language,
+            expected_elements=test_case.expected_issues
+        )
+    return get_architecture_doc_prompt_v2(
+        system_name="Example System", system_purpose="시스템 설명", main_features="주요 기능",
+        tech_stack=test_case.language, components=test_case.code_snippet,
+        expected_elements=test_case.expected_issues, language=language
+    )
+
+
+def print_language_fragment_stats():
+    """get_test_cases_by_language 그룹별로 언어 조각 적용 전/후 입력 토큰 비교"""
+    import tiktoken
+    from evaluation.development_test_cases import get_documentation_test_cases, get_test_cases_by_language
+
+    enc = tiktoken.encoding_for_model("gpt-3.5-turbo")
+    languages = sorted({tc.language for tc in get_documentation_test_cases()})
+
+    print("=" * 60)
+    print("문서화 프롬프트 V2.0 - 언어별 조각 적용 토큰 비교")
+    print("=" * 60)
+    print(f"{'언어':<12}{'케이스':>6}{'고정 블록':>12}{'언어 조각':>12}{'절감률':>10}")
+
+    total_fixed = total_scoped = 0
+    for language in languages:
+        cases = [tc for tc in get_test_cases_by_language(language) if tc.category == "documentation"]
+        fixed = sum(len(enc.encode(_render_for_report(tc, None))) for tc in cases)
+        scoped = sum(len(enc.encode(_render_for_report(tc, tc.language))) for tc in cases)
+        total_fixed += fixed
+        total_scoped += scoped
+        print(f"{language:<12}{len(cases):>6}{fixed:>12,}{scoped:>12,}{(1 - scoped / fixed) * 100:>9.1f}%")
+
+    print(f"{'전체':<12}{'':>6}{total_fixed:>12,}{total_scoped:>12,}{(1 - total_scoped / total_fixed) * 100:>9.1f}%")
+    print(f"템플릿 캐시: {get_language_template.cache_info()}")
+
+
+if __name__ == "__main__":
+    print_language_fragment_stats()